@@ -0,0 +1,62 @@
+"""
+Measures api daemon startup with the api modules imported eagerly against
+registered lazily: the time until the daemon object is ready, the time to the
+first served api_invoke call and the resident memory after startup and after
+the first call.  Each mode runs in a fresh interpreter; the daemon object is
+called directly, without Pyro.  The first call also imports the pybind package
+of the module.
+
+Usage: python benchmarks/bench_api_daemon_startup.py [module_name] [api_name]
+"""
+import subprocess
+import sys
+import time
+
+api_module_names = ['pyswitchlib.api.create', 'pyswitchlib.api.update', 'pyswitchlib.api.delete', 'pyswitchlib.api.get', 'pyswitchlib.api.rpc']
+
+
+def get_rss():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) // 1024
+
+    return 0
+
+
+def run_daemon(mode, module_name, api_name):
+    start = time.time()
+
+    from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+
+    for api_module_name in api_module_names:
+        if mode == 'lazy':
+            PySwitchLibApiDaemon.add_lazy_apis(api_module_name=api_module_name)
+        else:
+            try:
+                PySwitchLibApiDaemon.add_apis(api_module=__import__(api_module_name, fromlist=['*']))
+            except ImportError:
+                pass
+
+    daemon = PySwitchLibApiDaemon()
+    ready = time.time() - start
+    ready_rss = get_rss()
+
+    daemon.api_invoke(module_name=module_name, api_name=api_name, args=(), kwargs={})
+    first_call = time.time() - start
+
+    print('%-6s ready %.2f s (%d MB), first call %.2f s (%d MB)' % (mode + ':', ready, ready_rss, first_call, get_rss()))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] in ['eager', 'lazy']:
+        run_daemon(*sys.argv[1:4])
+        sys.exit(0)
+
+    module_name = sys.argv[1] if len(sys.argv) > 1 else 'pybind.slxos.v17r_1_01a'
+    api_name = sys.argv[2] if len(sys.argv) > 2 else 'show_firmware_version_rpc'
+
+    print('module: %s, api: %s' % (module_name, api_name))
+
+    for mode in ['eager', 'lazy']:
+        subprocess.check_call([sys.executable, __file__, mode, module_name, api_name])
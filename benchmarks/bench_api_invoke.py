@@ -0,0 +1,55 @@
+"""
+Measures the api daemon round trips of an Asset API call, comparing the
+api_acquire/module_name/<api>/api_release sequence with the single api_invoke
+call.  Only the daemon side is timed; no rest requests are sent.  A local
+stand-in rest server plays the device for the discovery of the Asset.  The
+pyswitchlib api daemon must be running or startable by Asset.
+
+Usage: python benchmarks/bench_api_invoke.py [calls] [api_name]
+"""
+import sys
+import time
+
+from bench_async_asset import start_server
+from pyswitchlib.asset import Asset
+
+
+def call_legacy(proxied, module_name, api_name):
+    proxied.api_acquire()
+
+    try:
+        proxied.module_name(module_name=module_name)
+
+        return getattr(proxied, api_name)()
+    finally:
+        proxied.api_release()
+
+
+def call_api_invoke(proxied, module_name, api_name):
+    return proxied.api_invoke(module_name=module_name, api_name=api_name, args=(), kwargs={})
+
+
+if __name__ == '__main__':
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    api_name = sys.argv[2] if len(sys.argv) > 2 else 'show_firmware_version_rpc'
+    server = start_server()
+    asset = Asset(ip_addr='127.0.0.1:%d' % server.server_address[1], rest_proto='http')
+    proxied = asset._proxied
+    module_name = asset._supported_module_name
+
+    # The first call imports the pybind package in the api daemon.
+    assert call_legacy(proxied, module_name, api_name) == call_api_invoke(proxied, module_name, api_name)
+
+    print('calls: %d, api: %s' % (calls, api_name))
+
+    for name, call in [('acquire/module/api/release', call_legacy), ('api_invoke', call_api_invoke)]:
+        start = time.time()
+
+        for _ in range(calls):
+            call(proxied, module_name, api_name)
+
+        elapsed = time.time() - start
+
+        print('%-27s %.2f s (%.0f calls/s)' % (name + ':', elapsed, calls / elapsed))
+
+    asset.close()
@@ -0,0 +1,55 @@
+"""
+Measures api daemon throughput for concurrent api_invoke calls, building the
+pybind objects in the daemon process against building them in api worker
+processes.  The daemon object is called directly, without Pyro.  The worker
+processes can only run in parallel on a host with several cores.
+
+Usage: python benchmarks/bench_api_workers.py [workers] [calls] [module_name]
+"""
+import sys
+import threading
+import time
+
+import pyswitchlib.api.rpc
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+from pyswitchlib.util.apiWorkerPool import ApiWorkerPoolUtil
+
+
+def run(daemon, clients, calls, module_name):
+    def client():
+        for _ in range(calls // clients):
+            daemon.api_invoke(module_name=module_name, api_name='show_firmware_version_rpc', args=(), kwargs={})
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.time()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 4000
+    module_name = sys.argv[3] if len(sys.argv) > 3 else 'pybind.slxos.v17r_1_01a'
+
+    PySwitchLibApiDaemon.add_apis(api_module=pyswitchlib.api.rpc)
+    __import__(module_name, fromlist=['*'])
+
+    in_process = PySwitchLibApiDaemon()
+    api_worker_pool = ApiWorkerPoolUtil(workers=workers, handler=PySwitchLibApiDaemon()._run_api_worker_task)
+    with_workers = PySwitchLibApiDaemon(api_worker_pool=api_worker_pool)
+
+    print('workers: %d, calls: %d, module: %s' % (workers, calls, module_name))
+
+    for name, daemon in [('in process', in_process), ('api workers', with_workers)]:
+        run(daemon, workers, workers * 10, module_name)
+        elapsed = run(daemon, workers, calls, module_name)
+
+        print('%-12s %.2f s (%.0f calls/s)' % (name + ':', elapsed, calls / elapsed))
+
+    api_worker_pool.close()
@@ -0,0 +1,105 @@
+"""
+Measures fanning show_firmware_version_rpc out over many devices with
+AsyncAsset against serial calls on Asset.  The devices are played by a local
+stand-in rest server which answers every request after a fixed delay.  The
+pyswitchlib api daemon must be running or startable by Asset.
+
+Usage: python benchmarks/bench_async_asset.py [devices] [delay] [serial_devices]
+"""
+import sys
+import threading
+import time
+import BaseHTTPServer
+import SocketServer
+
+from pyswitchlib.asset import Asset
+from pyswitchlib.async_asset import AsyncAsset
+
+
+DISCOVER_XML = (
+    '<rest xmlns="http://brocade.com/ns/rest" xmlns:y="http://brocade.com/ns/rest">'
+    '<config><running y:self="/rest/config/running"/></config>'
+    '<operational-state y:self="/rest/operational-state"/>'
+    '<operations y:self="/rest/operations"/></rest>'
+)
+
+FIRMWARE_XML = (
+    '<output xmlns="urn:brocade.com:mgmt:brocade-firmware-ext"><show-firmware-version>'
+    '<switchid>1</switchid><os-name>SLX Operating System</os-name><os-version>17r.1.01a</os-version>'
+    '<firmware-full-version>17r.1.01a</firmware-full-version></show-firmware-version></output>'
+)
+
+
+class StandInHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    delay = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def handle_request(self):
+        length = int(self.headers.get('Content-Length') or 0)
+
+        if length:
+            self.rfile.read(length)
+
+        if self.delay:
+            time.sleep(self.delay)
+
+        body = DISCOVER_XML if self.path == '/rest' else FIRMWARE_XML
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/vnd.operational-state.resource+xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = handle_request
+
+
+class StandInServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def start_server():
+    server = StandInServer(('127.0.0.1', 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    return server
+
+
+if __name__ == '__main__':
+    devices = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    StandInHandler.delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    serial_devices = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    server = start_server()
+    ip_addr = '127.0.0.1:%d' % server.server_address[1]
+
+    start = time.time()
+    assets = AsyncAsset.gather(*[AsyncAsset.create(ip_addr=ip_addr, rest_proto='http') for _ in range(devices)])
+    construct = time.time() - start
+
+    # The first call imports the pybind package in the api daemon.
+    assets[0].show_firmware_version_rpc().get()
+
+    start = time.time()
+    results = AsyncAsset.gather(*[asset.show_firmware_version_rpc() for asset in assets])
+    fan_out = time.time() - start
+
+    assert all(status for status, details in results)
+
+    asset = Asset(ip_addr=ip_addr, rest_proto='http')
+    start = time.time()
+
+    for _ in range(serial_devices):
+        asset.show_firmware_version_rpc()
+
+    serial = (time.time() - start) / serial_devices
+
+    print('devices: %d, server delay: %.3f s, pool size: %d' % (devices, StandInHandler.delay, AsyncAsset.get_pool()._processes))
+    print('AsyncAsset construction: %.2f s' % construct)
+    print('AsyncAsset fan-out:      %.2f s (%.0f calls/s)' % (fan_out, devices / fan_out))
+    print('Asset serial estimate:   %.2f s (%.0f calls/s)' % (serial * devices, 1 / serial))
@@ -0,0 +1,67 @@
+"""
+Compares the round trip latency of api daemon calls over Pyro TCP on localhost
+and over a unix domain socket.
+
+Usage: python benchmarks/bench_daemon_transport.py [calls] [repeat]
+"""
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+
+import Pyro4
+
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+
+
+def serve(pyro_daemon):
+    daemon_obj = Pyro4.expose(PySwitchLibApiDaemon)(pyro_daemon=pyro_daemon)
+    uri = pyro_daemon.register(daemon_obj, objectId='PySwitchLib.bench', force=True)
+    daemon_thread = threading.Thread(target=pyro_daemon.requestLoop)
+    daemon_thread.daemon = True
+    daemon_thread.start()
+
+    return uri
+
+
+def calls(uri, count):
+    with Pyro4.Proxy(uri) as pyro_proxy:
+        pyro_proxy._pyroBind()
+
+        for _ in range(count):
+            pyro_proxy.api_worker_stats()
+
+
+def best_of(repeat, func, *args):
+    best = None
+
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    tmpdir = tempfile.mkdtemp()
+
+    try:
+        tcp_uri = serve(Pyro4.Daemon(host='localhost'))
+        unix_uri = serve(Pyro4.Daemon(unixsocket=os.path.join(tmpdir, 'bench.sock')))
+
+        tcp = best_of(repeat, calls, tcp_uri, count)
+        unix = best_of(repeat, calls, unix_uri, count)
+
+        print('%d calls per run' % count)
+        print('Pyro TCP localhost:      %.1f us/call' % (tcp / count * 1e6))
+        print('Pyro unix domain socket: %.1f us/call (%.2fx)' % (unix / count * 1e6, tcp / unix))
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,85 @@
+"""
+Compares the legacy pybindJSON -> json.loads -> dicttoxml request serialization
+and regex fragment extraction with PybindXmlUtil on wide interface updates.
+
+Usage: python benchmarks/bench_pybind_xml.py [entries] [repeat]
+"""
+import json
+import re
+import sys
+import time
+from collections import OrderedDict
+
+import pyangbind.lib.pybindJSON as pybindJSON
+from dicttoxml import dicttoxml
+from pybind.slxos.v17r_1_01a import brocade_interface
+
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+from pyswitchlib.util.pybindXml import PybindXmlUtil
+
+
+def build_interfaces(entries):
+    pybind_obj = brocade_interface()
+
+    for index in range(entries):
+        ethernet = pybind_obj.interface.ethernet.add('0/%d' % (index + 1))
+        ethernet._set_description('server port %d' % index)
+        ethernet._set_mtu(9000)
+        ethernet._set_shutdown(index % 2 == 0)
+        ethernet.switchport.mode._set_vlan_mode('trunk')
+        ethernet.switchport.trunk.allowed.vlan._set_add_(str(index % 4094 + 1))
+
+    return pybind_obj
+
+
+def legacy_dumps(pybind_obj):
+    return dicttoxml(json.loads(pybindJSON.dumps(pybind_obj, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=lambda x: x)
+
+
+def legacy_fragments(pybind_obj, names):
+    rest_data = legacy_dumps(pybind_obj)
+
+    return [re.match(r'.*(<{0}>.*</{0}>).*'.format(name), rest_data) for name in names]
+
+
+def fragments(pybind_obj, names):
+    rest_data = PybindXmlUtil().dump_document(pybind_obj=pybind_obj)
+
+    return [rest_data.find_element(name=name) for name in names]
+
+
+def best_of(repeat, func, *args):
+    best = None
+
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+if __name__ == '__main__':
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    pybind_obj = build_interfaces(entries).interface
+    names = ['description', 'mtu', 'shutdown', 'switchport', 'name'] * 20
+    xml = legacy_dumps(pybind_obj)
+
+    assert xml == PybindXmlUtil().dumps(pybind_obj=pybind_obj)
+
+    legacy = best_of(repeat, legacy_dumps, pybind_obj)
+    single_walk = best_of(repeat, PybindXmlUtil().dumps, pybind_obj)
+    legacy_extract = best_of(repeat, legacy_fragments, pybind_obj, names)
+    indexed_extract = best_of(repeat, fragments, pybind_obj, names)
+    update = best_of(repeat, PySwitchLibApiDaemon()._config_worker, 'update_patch', pybind_obj.ethernet['0/1'], None, 1)
+
+    print('request size: %.1f KB, %d entries' % (len(xml) / 1024.0, entries))
+    print('pybindJSON + json + dicttoxml:       %.3f s' % legacy)
+    print('PybindXmlUtil.dumps:                 %.3f s (%.1fx)' % (single_walk, legacy / single_walk))
+    print('%d fragments, legacy regex:         %.3f s' % (len(names), legacy_extract))
+    print('%d fragments, PybindXmlDocument:    %.3f s (%.1fx)' % (len(names), indexed_extract, legacy_extract / indexed_extract))
+    print('_config_worker update_patch:         %.4f s' % update)
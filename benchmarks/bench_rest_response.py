@@ -0,0 +1,87 @@
+"""
+Compares the legacy response handling, which reads requests' Response.text
+for the xml check, the decode and the stored text, with RestResponse on a
+generated rpc response served without a charset.
+
+Usage: python benchmarks/bench_rest_response.py [size_mb] [repeat]
+"""
+import json
+import re
+import sys
+import time
+
+import xmltodict
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from pyswitchlib.util.restResponse import RestResponse
+
+
+def build_response(size_mb):
+    rows = []
+    size = 0
+    index = 0
+
+    while size < size_mb * 1048576:
+        row = ('<interface><interface-type>ethernet</interface-type>'
+               '<interface-name>0/%d</interface-name>'
+               '<description>port %d \xc3\xa9tage</description></interface>' % (index % 48 + 1, index))
+        rows.append(row)
+        size += len(row)
+        index += 1
+
+    response = Response()
+    response.status_code = 200
+    response.url = 'https://switch/rest/operations/get-interface-detail'
+    response.headers = CaseInsensitiveDict({'Content-Type': 'application/vnd.operational-state.resource+xml'})
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = ('<output xmlns="urn:brocade.com:mgmt:brocade-interface-ext">' + ''.join(rows) +
+                         '<has-more>false</has-more></output>')
+
+    return response
+
+
+def legacy_pipeline(response):
+    text_response = response.text
+
+    if re.match('^<', text_response):
+        json_output = json.loads(json.dumps(xmltodict.parse(text_response)))
+
+    return {'text': response.text, 'json': json_output}
+
+
+def bytes_pipeline(response):
+    rest_response = RestResponse.from_response(response=response, rest_type='rpc')
+
+    return {'text': rest_response['text'], 'json': rest_response['json']}
+
+
+def best_of(repeat, func, *args):
+    best = None
+
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+if __name__ == '__main__':
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    response = build_response(size_mb)
+
+    assert legacy_pipeline(response) == bytes_pipeline(response)
+
+    legacy = best_of(repeat, legacy_pipeline, response)
+    content = best_of(repeat, bytes_pipeline, response)
+
+    print('response size: %.1f MB, no charset' % (len(response.content) / 1048576.0))
+    print('Response.text pipeline: %.3f s' % legacy)
+    print('RestResponse pipeline:  %.3f s' % content)
+    print('speedup:                %.1fx' % (legacy / content))
@@ -0,0 +1,84 @@
+"""
+Compares the legacy xmltodict -> json.dumps -> json.loads response decoding
+with XmlDecoderUtil on generated multi-megabyte rpc responses.
+
+Usage: python benchmarks/bench_xml_decoder.py [entries] [repeat]
+"""
+import json
+import sys
+import time
+
+import xmltodict
+
+from pyswitchlib.util.xmlDecoder import XmlDecoderUtil
+
+
+def build_mac_table(entries):
+    rows = []
+
+    for index in range(entries):
+        rows.append(
+            '<mac-address-table><vlanid>%d</vlanid>'
+            '<mac-address>00:00:00:%02x:%02x:%02x</mac-address>'
+            '<mac-type>dynamic</mac-type><mac-state>active</mac-state>'
+            '<forwarding-interface><interface-type>ethernet</interface-type>'
+            '<interface-name>0/%d</interface-name></forwarding-interface>'
+            '</mac-address-table>' % (index % 4094 + 1, (index >> 16) & 0xff, (index >> 8) & 0xff, index & 0xff, index % 48 + 1))
+
+    return ('<output xmlns="urn:brocade.com:mgmt:brocade-mac-address-table">' + ''.join(rows) +
+            '<has-more>false</has-more></output>')
+
+
+def format_dict_output(container=None, keys=None):
+    if keys and container:
+        if isinstance(container, dict):
+            for k in container:
+                if isinstance(container[k], dict):
+                    if k.lower() in keys:
+                        keys.remove(k.lower())
+                        container[k] = [container[k]]
+                        format_dict_output(container=container[k], keys=keys)
+                    else:
+                        format_dict_output(container=container[k], keys=keys)
+                elif isinstance(container[k], list):
+                    for elem in container[k]:
+                        format_dict_output(container=elem, keys=keys)
+        elif isinstance(container, list):
+            for elem in container:
+                format_dict_output(container=elem, keys=keys)
+
+
+def legacy_decode(xml, yang_list):
+    json_output = json.loads(json.dumps(xmltodict.parse(xml)))
+    format_dict_output(container=json_output, keys=list(yang_list))
+    return json_output
+
+
+def best_of(repeat, func, *args):
+    best = None
+
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+if __name__ == '__main__':
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    yang_list = ['mac-address-table']
+    xml = build_mac_table(entries)
+    decoder = XmlDecoderUtil()
+
+    legacy = best_of(repeat, legacy_decode, xml, yang_list)
+    single_pass = best_of(repeat, decoder.decode, xml, None, yang_list)
+
+    print('response size: %.1f MB, %d entries' % (len(xml) / 1048576.0, entries))
+    print('xmltodict + json round trip: %.3f s' % legacy)
+    print('XmlDecoderUtil:              %.3f s' % single_pass)
+    print('speedup:                     %.1fx' % (legacy / single_pass))
@@ -23,18 +23,18 @@ import pyswitch.snmp.mlx.base.utils
 import pyswitch.snmp.mlx.base.acl.acl
 import pyswitch.snmp.mlx.base.services
 import Pyro4
+import Pyro4.errors
 
 from pyswitch.snmp.snmpconnector import SnmpConnector as SNMPDevice
 from pyswitch.snmp.snmpconnector import SNMPError as SNMPError
 from pyswitch.snmp.snmpconnector import SnmpUtils as SNMPUtils
 from pyswitch.AbstractDevice import AbstractDevice
-from pyswitchlib.util.configFile import ConfigFileUtil
+from pyswitchlib.util.daemonProxy import DaemonProxyUtil
 from pyswitchlib.exceptions import (InvalidAuthenticationCredentialsError)
 import re
 from pyswitch.AbstractDevice import DeviceCommError
 
 
-pyswitchlib_ns_daemon_file = '/etc/pyswitchlib/.pyswitchlib_ns_daemon.uri'
 pyswitchlib_daemon = 'api_daemon_virtualenv_packs'
 
 ROUTER_ATTRS = ['interface', 'system', 'acl', 'services', 'utils']
@@ -115,13 +115,12 @@ class SnmpCliDevice(AbstractDevice):
         self._privpass = snmpconfig['privpass']
         self._sysobj = sysobj
         self._proxied = None
-        ns_daemon_dict = ConfigFileUtil().read(filename=pyswitchlib_ns_daemon_file)
+        self._daemon_proxy = DaemonProxyUtil(daemon_id=pyswitchlib_daemon)
 
-        if pyswitchlib_daemon in ns_daemon_dict:
-            uri = ns_daemon_dict[pyswitchlib_daemon]
-            with Pyro4.Proxy(uri) as pyro_proxy:
-                pyro_proxy._pyroBind()
-                self._proxied = pyro_proxy
+        try:
+            self._proxied = self._daemon_proxy.get_proxy()
+        except Pyro4.errors.NamingError:
+            pass
 
         if self._callback is None:
             self._callback = self._callback_main
@@ -250,6 +249,15 @@ class SnmpCliDevice(AbstractDevice):
 
               'cli-get'  - Command string E.g 'show ip in brief'
 
+              'cli-batch' - List of (handler, call) tuples run in order on one
+                            cli session, handler being 'cli-get' or 'cli-set'.
+                            Returns a list of dicts with the handler, output
+                            and elapsed seconds of each step.  A failed step
+                            ends the list and its dict holds the error.
+                           E.g.
+                           [('cli-get', 'show ip in brief'),
+                            ('cli-set', ['int eth 0/1', 'enable'])]
+
               'snmp-walk' - Dict format:
                     config = {'oid': <oidval>,
                               'columns': {colid: colname, ...}
@@ -292,7 +300,9 @@ class SnmpCliDevice(AbstractDevice):
             elif handler == 'snmp-set-multiple':
                 value = self._mgr['snmp'].set_multiple(call)
             elif handler == 'cli-set' or handler == 'cli-get':
-                value = self._proxied.cli_execution(handler, self.host, call)
+                value = self._proxied.cli_execution(handler, self.host, call, self._mgr.get('cli'))
+            elif handler == 'cli-batch':
+                value = self._proxied.cli_batch_execution(self.host, call, self._mgr.get('cli'))
         except SNMPError:
             raise
         except Exception:
@@ -332,8 +342,8 @@ class SnmpCliDevice(AbstractDevice):
                 opt['global_delay_factor'] = 0.25
                 if self._enablepass:
                     opt['secret'] = self._enablepass
-                self._proxied.create_netmiko_connection(opt)
-                self._mgr['cli'] = True
+                platform = SNMPUtils.SNMP_DEVICE_MAP.get(self._sysobj, ('',))[0]
+                self._mgr['cli'] = self._proxied.create_netmiko_connection(opt, platform)
             except ValueError as error:
                 msg = error.message
                 if re.search(r'Netmiko Authentication Exception', msg):
@@ -356,6 +366,9 @@ class SnmpCliDevice(AbstractDevice):
             del self._mgr['snmp']
         if 'cli' in self._mgr:
             del self._mgr['cli']
+        if self._proxied:
+            self._daemon_proxy.put_proxy(pyro_proxy=self._proxied)
+            self._proxied = None
 
 
 if __name__ == '__main__':
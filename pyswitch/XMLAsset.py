@@ -1,7 +1,5 @@
-import json
-import re
-
 from pyswitchlib.asset import Asset
+from pyswitchlib.util.restResponse import RestResponse
 
 
 class XMLAsset(Asset):
@@ -32,9 +30,6 @@ class XMLAsset(Asset):
             if timeout == '':
                 timeout = self._session_timeout
 
-        self._cleanup_timer_handle()
-        self._create_timer_handle()
-
         while index < len(rest_commands):
             rest_cmd = rest_commands[index]
 
@@ -120,14 +115,12 @@ class XMLAsset(Asset):
 
             self._overall_status.append({self._ip_addr: {
                 'request': {'op_code': rest_cmd[0], 'uri': rest_cmd[1], 'data': rest_cmd[2]},
-                'response': {'status_code': self._response.status_code, 'url': self._response.url,
-                             'text': self._response.text}}})
+                'response': RestResponse.from_response(response=self._response,
+                                                       xml_decoder=self._xml_decoder,
+                                                       output_keys=('text',))}})
 
             index += 1
 
-        if not self._rest_session_timer_handle.is_alive():
-            self._rest_session_timer_handle.start()
-
         return self._get_results()
 
     def get_xml_output(self):
@@ -146,15 +139,12 @@ class XMLAsset(Asset):
         :rtype: *dict*
         :returns: Returns the json output response from the last api call.
         """
-        xml_output = self.get_xml_output()
-        print xml_output
+        response = self._overall_status[0][self._ip_addr]['response']
+        print response['text']
 
-        if not re.match('^<output', xml_output):
-            xml_output = '<output>\r\n' + xml_output + '</output>\r\n'
-
-        dict_output = json.loads(self._xml_to_json(xml_output))
-
-        if dict_output and self._yang_list:
-            self._format_dict_output(container=dict_output, keys=self._yang_list)
+        if not response.content_startswith('<output'):
+            dict_output = response.decode_xml(root_name='output', yang_list=self._yang_list)
+        else:
+            dict_output = response.decode_xml(yang_list=self._yang_list)
 
         return dict_output
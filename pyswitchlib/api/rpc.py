@@ -1,3 +1,18 @@
+from pyswitchlib.util.apiDescriptor import ApiDescriptorUtil
+
+
+_activate_status_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_firmware_rpc.activate_status.input', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.activate_status.input', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.activate_status', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.activate_status', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.activate_status', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17s_1_02.brocade_firmware_rpc.activate_status": {}, "pybind.nos.v6_0_2f.brocade_firmware_rpc.activate_status.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_1_01a.brocade_firmware_rpc.activate_status": {}, "pybind.slxos.v17r_2_00.brocade_firmware_rpc.activate_status": {}, "pybind.nos.v7_2_0.brocade_firmware_rpc.activate_status.input": {"rbridge_id": "rbridge_id"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def activate_status_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -32,21 +47,24 @@ def activate_status_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_firmware_rpc.activate_status.input', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.activate_status.input', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.activate_status', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.activate_status', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.activate_status', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17s_1_02.brocade_firmware_rpc.activate_status": {}, "pybind.nos.v6_0_2f.brocade_firmware_rpc.activate_status.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_1_01a.brocade_firmware_rpc.activate_status": {}, "pybind.slxos.v17r_2_00.brocade_firmware_rpc.activate_status": {}, "pybind.nos.v7_2_0.brocade_firmware_rpc.activate_status.input": {"rbridge_id": "rbridge_id"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _activate_status_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_bna_config_cmd_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_ras_rpc.bna_config_cmd.input', 'pybind.nos.v6_0_2f.brocade_ras_rpc.brocade_ras', 'pybind.nos.v6_0_2f.brocade_ras_rpc'), ('pybind.nos.v7_2_0.brocade_ras_rpc.bna_config_cmd.input', 'pybind.nos.v7_2_0.brocade_ras_rpc.brocade_ras', 'pybind.nos.v7_2_0.brocade_ras_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ras_rpc.bna_config_cmd.input', 'pybind.slxos.v17r_1_01a.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17r_1_01a.brocade_ras_rpc'), ('pybind.slxos.v17r_2_00.brocade_ras_rpc.bna_config_cmd.input', 'pybind.slxos.v17r_2_00.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17r_2_00.brocade_ras_rpc'), ('pybind.slxos.v17s_1_02.brocade_ras_rpc.bna_config_cmd.input', 'pybind.slxos.v17s_1_02.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17s_1_02.brocade_ras_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def bna_config_cmd_rpc(self, src=None, dest=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -80,21 +98,24 @@ def bna_config_cmd_rpc(self, src=None, dest=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_ras_rpc.bna_config_cmd.input', 'pybind.nos.v6_0_2f.brocade_ras_rpc.brocade_ras', 'pybind.nos.v6_0_2f.brocade_ras_rpc'), ('pybind.nos.v7_2_0.brocade_ras_rpc.bna_config_cmd.input', 'pybind.nos.v7_2_0.brocade_ras_rpc.brocade_ras', 'pybind.nos.v7_2_0.brocade_ras_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ras_rpc.bna_config_cmd.input', 'pybind.slxos.v17r_1_01a.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17r_1_01a.brocade_ras_rpc'), ('pybind.slxos.v17r_2_00.brocade_ras_rpc.bna_config_cmd.input', 'pybind.slxos.v17r_2_00.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17r_2_00.brocade_ras_rpc'), ('pybind.slxos.v17s_1_02.brocade_ras_rpc.bna_config_cmd.input', 'pybind.slxos.v17s_1_02.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17s_1_02.brocade_ras_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, src=src, dest=dest)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, src=src, dest=dest)
+    api_descriptor = _bna_config_cmd_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, src=src, dest=dest)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, src=src, dest=dest)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_bna_config_cmd_status_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_ras_rpc.bna_config_cmd_status.input', 'pybind.nos.v6_0_2f.brocade_ras_rpc.brocade_ras', 'pybind.nos.v6_0_2f.brocade_ras_rpc'), ('pybind.nos.v7_2_0.brocade_ras_rpc.bna_config_cmd_status.input', 'pybind.nos.v7_2_0.brocade_ras_rpc.brocade_ras', 'pybind.nos.v7_2_0.brocade_ras_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ras_rpc.bna_config_cmd_status.input', 'pybind.slxos.v17r_1_01a.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17r_1_01a.brocade_ras_rpc'), ('pybind.slxos.v17r_2_00.brocade_ras_rpc.bna_config_cmd_status.input', 'pybind.slxos.v17r_2_00.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17r_2_00.brocade_ras_rpc'), ('pybind.slxos.v17s_1_02.brocade_ras_rpc.bna_config_cmd_status.input', 'pybind.slxos.v17s_1_02.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17s_1_02.brocade_ras_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def bna_config_cmd_status_rpc(self, session_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -129,21 +150,24 @@ def bna_config_cmd_status_rpc(self, session_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_ras_rpc.bna_config_cmd_status.input', 'pybind.nos.v6_0_2f.brocade_ras_rpc.brocade_ras', 'pybind.nos.v6_0_2f.brocade_ras_rpc'), ('pybind.nos.v7_2_0.brocade_ras_rpc.bna_config_cmd_status.input', 'pybind.nos.v7_2_0.brocade_ras_rpc.brocade_ras', 'pybind.nos.v7_2_0.brocade_ras_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ras_rpc.bna_config_cmd_status.input', 'pybind.slxos.v17r_1_01a.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17r_1_01a.brocade_ras_rpc'), ('pybind.slxos.v17r_2_00.brocade_ras_rpc.bna_config_cmd_status.input', 'pybind.slxos.v17r_2_00.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17r_2_00.brocade_ras_rpc'), ('pybind.slxos.v17s_1_02.brocade_ras_rpc.bna_config_cmd_status.input', 'pybind.slxos.v17s_1_02.brocade_ras_rpc.brocade_ras', 'pybind.slxos.v17s_1_02.brocade_ras_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, session_id=session_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, session_id=session_id)
+    api_descriptor = _bna_config_cmd_status_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, session_id=session_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, session_id=session_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_auto_bandwidth_sample_history_all_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_auto_bandwidth_sample_history_all', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_auto_bandwidth_sample_history_all_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -168,21 +192,24 @@ def clear_mpls_auto_bandwidth_sample_history_all_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_auto_bandwidth_sample_history_all', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _clear_mpls_auto_bandwidth_sample_history_all_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_auto_bandwidth_sample_history_lsp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_auto_bandwidth_sample_history_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_auto_bandwidth_sample_history_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_auto_bandwidth_sample_history_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_auto_bandwidth_sample_history_lsp_rpc(self, lsp_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -216,21 +243,24 @@ def clear_mpls_auto_bandwidth_sample_history_lsp_rpc(self, lsp_name=None, api_ti
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_auto_bandwidth_sample_history_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_auto_bandwidth_sample_history_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_auto_bandwidth_sample_history_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, lsp_name=lsp_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, lsp_name=lsp_name)
+    api_descriptor = _clear_mpls_auto_bandwidth_sample_history_lsp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, lsp_name=lsp_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, lsp_name=lsp_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_auto_bandwidth_statistics_all_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_auto_bandwidth_statistics_all', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_auto_bandwidth_statistics_all_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -255,21 +285,24 @@ def clear_mpls_auto_bandwidth_statistics_all_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_auto_bandwidth_statistics_all', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _clear_mpls_auto_bandwidth_statistics_all_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_auto_bandwidth_statistics_lsp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_auto_bandwidth_statistics_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_auto_bandwidth_statistics_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_auto_bandwidth_statistics_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_auto_bandwidth_statistics_lsp_rpc(self, lsp_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -303,21 +336,24 @@ def clear_mpls_auto_bandwidth_statistics_lsp_rpc(self, lsp_name=None, api_timeou
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_auto_bandwidth_statistics_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_auto_bandwidth_statistics_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_auto_bandwidth_statistics_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, lsp_name=lsp_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, lsp_name=lsp_name)
+    api_descriptor = _clear_mpls_auto_bandwidth_statistics_lsp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, lsp_name=lsp_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, lsp_name=lsp_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_bypass_lsp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_bypass_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_bypass_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_bypass_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_bypass_lsp_rpc(self, mpls_clear_bypass_lsp_name_in=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -351,21 +387,24 @@ def clear_mpls_bypass_lsp_rpc(self, mpls_clear_bypass_lsp_name_in=None, api_time
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_bypass_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_bypass_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_bypass_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mpls_clear_bypass_lsp_name_in=mpls_clear_bypass_lsp_name_in)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mpls_clear_bypass_lsp_name_in=mpls_clear_bypass_lsp_name_in)
+    api_descriptor = _clear_mpls_bypass_lsp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mpls_clear_bypass_lsp_name_in=mpls_clear_bypass_lsp_name_in)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mpls_clear_bypass_lsp_name_in=mpls_clear_bypass_lsp_name_in)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_ldp_neighbor_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_ldp_neighbor.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_ldp_neighbor.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_ldp_neighbor.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_ldp_neighbor_rpc(self, mpls_clear_all_ldp_sessions=None, mpls_clear_one_ldp_sessions=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -404,21 +443,24 @@ def clear_mpls_ldp_neighbor_rpc(self, mpls_clear_all_ldp_sessions=None, mpls_cle
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_ldp_neighbor.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_ldp_neighbor.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_ldp_neighbor.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mpls_clear_all_ldp_sessions=mpls_clear_all_ldp_sessions, mpls_clear_one_ldp_sessions=mpls_clear_one_ldp_sessions)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mpls_clear_all_ldp_sessions=mpls_clear_all_ldp_sessions, mpls_clear_one_ldp_sessions=mpls_clear_one_ldp_sessions)
+    api_descriptor = _clear_mpls_ldp_neighbor_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mpls_clear_all_ldp_sessions=mpls_clear_all_ldp_sessions, mpls_clear_one_ldp_sessions=mpls_clear_one_ldp_sessions)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mpls_clear_all_ldp_sessions=mpls_clear_all_ldp_sessions, mpls_clear_one_ldp_sessions=mpls_clear_one_ldp_sessions)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_ldp_statistics_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_ldp_statistics', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_ldp_statistics', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_ldp_statistics', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_ldp_statistics_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -443,21 +485,24 @@ def clear_mpls_ldp_statistics_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_ldp_statistics', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_ldp_statistics', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_ldp_statistics', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _clear_mpls_ldp_statistics_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_lsp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_lsp.input', u'clear_mpls_lsp_option')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'mpls_clear_lsp_name_in, primary, secondary'}],
+    leafval_map={"pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_lsp.input": {}, "pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_lsp.input": {"mpls_clear_lsp_name_in": "mpls_clear_lsp_name_in"}, "pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_lsp.input": {"mpls_clear_lsp_name_in": "mpls_clear_lsp_name_in"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_lsp_rpc(self, mpls_clear_lsp_name_in=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -491,21 +536,24 @@ def clear_mpls_lsp_rpc(self, mpls_clear_lsp_name_in=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_lsp.input', u'clear_mpls_lsp_option')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'mpls_clear_lsp_name_in, primary, secondary'}]
-    leafval_map = {"pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_lsp.input": {}, "pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_lsp.input": {"mpls_clear_lsp_name_in": "mpls_clear_lsp_name_in"}, "pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_lsp.input": {"mpls_clear_lsp_name_in": "mpls_clear_lsp_name_in"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mpls_clear_lsp_name_in=mpls_clear_lsp_name_in)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mpls_clear_lsp_name_in=mpls_clear_lsp_name_in)
+    api_descriptor = _clear_mpls_lsp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mpls_clear_lsp_name_in=mpls_clear_lsp_name_in)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mpls_clear_lsp_name_in=mpls_clear_lsp_name_in)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_rsvp_statistics_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_rsvp_statistics', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_rsvp_statistics', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_rsvp_statistics', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_rsvp_statistics_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -530,21 +578,24 @@ def clear_mpls_rsvp_statistics_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_rsvp_statistics', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_rsvp_statistics', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_rsvp_statistics', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _clear_mpls_rsvp_statistics_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_rsvp_statistics_neighbor_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_rsvp_statistics_neighbor.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_rsvp_statistics_neighbor.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_rsvp_statistics_neighbor.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_rsvp_statistics_neighbor_rpc(self, clear_mpls_rsvp_statistics_neighbor_address=None, clear_mpls_rsvp_statistics_neighbor_all=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -583,21 +634,24 @@ def clear_mpls_rsvp_statistics_neighbor_rpc(self, clear_mpls_rsvp_statistics_nei
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_rsvp_statistics_neighbor.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_rsvp_statistics_neighbor.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_rsvp_statistics_neighbor.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, clear_mpls_rsvp_statistics_neighbor_address=clear_mpls_rsvp_statistics_neighbor_address, clear_mpls_rsvp_statistics_neighbor_all=clear_mpls_rsvp_statistics_neighbor_all)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, clear_mpls_rsvp_statistics_neighbor_address=clear_mpls_rsvp_statistics_neighbor_address, clear_mpls_rsvp_statistics_neighbor_all=clear_mpls_rsvp_statistics_neighbor_all)
+    api_descriptor = _clear_mpls_rsvp_statistics_neighbor_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, clear_mpls_rsvp_statistics_neighbor_address=clear_mpls_rsvp_statistics_neighbor_address, clear_mpls_rsvp_statistics_neighbor_all=clear_mpls_rsvp_statistics_neighbor_all)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, clear_mpls_rsvp_statistics_neighbor_address=clear_mpls_rsvp_statistics_neighbor_address, clear_mpls_rsvp_statistics_neighbor_all=clear_mpls_rsvp_statistics_neighbor_all)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_statistics_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_statistics.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_statistics.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_statistics.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_statistics.input": {}, "pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_statistics.input": {"in_label": "in_label", "fec_prefix": "fec_prefix", "protocol": "protocol", "mpls_clear_statistics_type": "mpls_clear_statistics_type", "tunnel_id_present": "tunnel_id_present", "label": "label", "tunnel_dest": "tunnel_dest", "prefix_address": "prefix_address", "bypass": "bypass", "tunnel_id": "tunnel_id", "prefix_mask": "prefix_mask", "tunnel_name": "tunnel_name"}, "pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_statistics.input": {"in_label": "in_label", "fec_prefix": "fec_prefix", "protocol": "protocol", "mpls_clear_statistics_type": "mpls_clear_statistics_type", "tunnel_id_present": "tunnel_id_present", "label": "label", "tunnel_dest": "tunnel_dest", "prefix_address": "prefix_address", "bypass": "bypass", "tunnel_id": "tunnel_id", "prefix_mask": "prefix_mask", "tunnel_name": "tunnel_name"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_statistics_rpc(self, mpls_clear_statistics_type=None, protocol=None, fec_prefix=None, prefix_address=None, prefix_mask=None, label=None, in_label=None, tunnel_id_present=None, tunnel_id=None, bypass=None, tunnel_name=None, tunnel_dest=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -708,21 +762,24 @@ def clear_mpls_statistics_rpc(self, mpls_clear_statistics_type=None, protocol=No
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_statistics.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_statistics.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_statistics.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_statistics.input": {}, "pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_statistics.input": {"in_label": "in_label", "fec_prefix": "fec_prefix", "protocol": "protocol", "mpls_clear_statistics_type": "mpls_clear_statistics_type", "tunnel_id_present": "tunnel_id_present", "label": "label", "tunnel_dest": "tunnel_dest", "prefix_address": "prefix_address", "bypass": "bypass", "tunnel_id": "tunnel_id", "prefix_mask": "prefix_mask", "tunnel_name": "tunnel_name"}, "pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_statistics.input": {"in_label": "in_label", "fec_prefix": "fec_prefix", "protocol": "protocol", "mpls_clear_statistics_type": "mpls_clear_statistics_type", "tunnel_id_present": "tunnel_id_present", "label": "label", "tunnel_dest": "tunnel_dest", "prefix_address": "prefix_address", "bypass": "bypass", "tunnel_id": "tunnel_id", "prefix_mask": "prefix_mask", "tunnel_name": "tunnel_name"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mpls_clear_statistics_type=mpls_clear_statistics_type, protocol=protocol, fec_prefix=fec_prefix, prefix_address=prefix_address, prefix_mask=prefix_mask, label=label, in_label=in_label, tunnel_id_present=tunnel_id_present, tunnel_id=tunnel_id, bypass=bypass, tunnel_name=tunnel_name, tunnel_dest=tunnel_dest)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mpls_clear_statistics_type=mpls_clear_statistics_type, protocol=protocol, fec_prefix=fec_prefix, prefix_address=prefix_address, prefix_mask=prefix_mask, label=label, in_label=in_label, tunnel_id_present=tunnel_id_present, tunnel_id=tunnel_id, bypass=bypass, tunnel_name=tunnel_name, tunnel_dest=tunnel_dest)
+    api_descriptor = _clear_mpls_statistics_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mpls_clear_statistics_type=mpls_clear_statistics_type, protocol=protocol, fec_prefix=fec_prefix, prefix_address=prefix_address, prefix_mask=prefix_mask, label=label, in_label=in_label, tunnel_id_present=tunnel_id_present, tunnel_id=tunnel_id, bypass=bypass, tunnel_name=tunnel_name, tunnel_dest=tunnel_dest)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mpls_clear_statistics_type=mpls_clear_statistics_type, protocol=protocol, fec_prefix=fec_prefix, prefix_address=prefix_address, prefix_mask=prefix_mask, label=label, in_label=in_label, tunnel_id_present=tunnel_id_present, tunnel_id=tunnel_id, bypass=bypass, tunnel_name=tunnel_name, tunnel_dest=tunnel_dest)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_statistics_ldp_transit_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_statistics_ldp_transit_rpc(self, clear_statistics_ldp_transit_fec_prefix=None, clear_statistics_ldp_transit_fec_prefix_address=None, clear_statistics_ldp_transit_fec_prefix_mask=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -776,21 +833,24 @@ def clear_mpls_statistics_ldp_transit_rpc(self, clear_statistics_ldp_transit_fec
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, clear_statistics_ldp_transit_fec_prefix=clear_statistics_ldp_transit_fec_prefix, clear_statistics_ldp_transit_fec_prefix_address=clear_statistics_ldp_transit_fec_prefix_address, clear_statistics_ldp_transit_fec_prefix_mask=clear_statistics_ldp_transit_fec_prefix_mask)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, clear_statistics_ldp_transit_fec_prefix=clear_statistics_ldp_transit_fec_prefix, clear_statistics_ldp_transit_fec_prefix_address=clear_statistics_ldp_transit_fec_prefix_address, clear_statistics_ldp_transit_fec_prefix_mask=clear_statistics_ldp_transit_fec_prefix_mask)
+    api_descriptor = _clear_mpls_statistics_ldp_transit_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, clear_statistics_ldp_transit_fec_prefix=clear_statistics_ldp_transit_fec_prefix, clear_statistics_ldp_transit_fec_prefix_address=clear_statistics_ldp_transit_fec_prefix_address, clear_statistics_ldp_transit_fec_prefix_mask=clear_statistics_ldp_transit_fec_prefix_mask)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, clear_statistics_ldp_transit_fec_prefix=clear_statistics_ldp_transit_fec_prefix, clear_statistics_ldp_transit_fec_prefix_address=clear_statistics_ldp_transit_fec_prefix_address, clear_statistics_ldp_transit_fec_prefix_mask=clear_statistics_ldp_transit_fec_prefix_mask)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_mpls_statistics_ldp_tunnel_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_mpls_statistics_ldp_tunnel_rpc(self, clear_statistics_ldp_tunnel_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -824,21 +884,24 @@ def clear_mpls_statistics_ldp_tunnel_rpc(self, clear_statistics_ldp_tunnel_id=No
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.clear_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.clear_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.clear_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, clear_statistics_ldp_tunnel_id=clear_statistics_ldp_tunnel_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, clear_statistics_ldp_tunnel_id=clear_statistics_ldp_tunnel_id)
+    api_descriptor = _clear_mpls_statistics_ldp_tunnel_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, clear_statistics_ldp_tunnel_id=clear_statistics_ldp_tunnel_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, clear_statistics_ldp_tunnel_id=clear_statistics_ldp_tunnel_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_tm_voq_slot_id_egress_port_name_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.clear_tm_voq_slot_id_egress_port_name.input', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc'), ('pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.clear_tm_voq_slot_id_egress_port_name.input', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_tm_voq_slot_id_egress_port_name_rpc(self, slot_id=None, clear_tm_voq_slot_egress_port_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -875,21 +938,24 @@ def clear_tm_voq_slot_id_egress_port_name_rpc(self, slot_id=None, clear_tm_voq_s
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.clear_tm_voq_slot_id_egress_port_name.input', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc'), ('pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.clear_tm_voq_slot_id_egress_port_name.input', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, slot_id=slot_id, clear_tm_voq_slot_egress_port_name=clear_tm_voq_slot_egress_port_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, slot_id=slot_id, clear_tm_voq_slot_egress_port_name=clear_tm_voq_slot_egress_port_name)
+    api_descriptor = _clear_tm_voq_slot_id_egress_port_name_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, slot_id=slot_id, clear_tm_voq_slot_egress_port_name=clear_tm_voq_slot_egress_port_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, slot_id=slot_id, clear_tm_voq_slot_egress_port_name=clear_tm_voq_slot_egress_port_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_tm_voq_stat_ing_all_egr_all_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.clear_tm_voq_stat_ing_all_egr_all.input', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc'), ('pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.clear_tm_voq_stat_ing_all_egr_all.input', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_tm_voq_stat_ing_all_egr_all_rpc(self, clear_tm_voq_ing_all_egress_port_all=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -919,21 +985,24 @@ def clear_tm_voq_stat_ing_all_egr_all_rpc(self, clear_tm_voq_ing_all_egress_port
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.clear_tm_voq_stat_ing_all_egr_all.input', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc'), ('pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.clear_tm_voq_stat_ing_all_egr_all.input', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, clear_tm_voq_ing_all_egress_port_all=clear_tm_voq_ing_all_egress_port_all)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, clear_tm_voq_ing_all_egress_port_all=clear_tm_voq_ing_all_egress_port_all)
+    api_descriptor = _clear_tm_voq_stat_ing_all_egr_all_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, clear_tm_voq_ing_all_egress_port_all=clear_tm_voq_ing_all_egress_port_all)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, clear_tm_voq_ing_all_egress_port_all=clear_tm_voq_ing_all_egress_port_all)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_tm_voq_stat_ing_all_egr_ifname_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.clear_tm_voq_stat_ing_all_egr_ifname.input', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc'), ('pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.clear_tm_voq_stat_ing_all_egr_ifname.input', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_tm_voq_stat_ing_all_egr_ifname_rpc(self, clear_tm_voq_ing_all_egress_port_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -963,21 +1032,24 @@ def clear_tm_voq_stat_ing_all_egr_ifname_rpc(self, clear_tm_voq_ing_all_egress_p
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.clear_tm_voq_stat_ing_all_egr_ifname.input', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc'), ('pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.clear_tm_voq_stat_ing_all_egr_ifname.input', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, clear_tm_voq_ing_all_egress_port_name=clear_tm_voq_ing_all_egress_port_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, clear_tm_voq_ing_all_egress_port_name=clear_tm_voq_ing_all_egress_port_name)
+    api_descriptor = _clear_tm_voq_stat_ing_all_egr_ifname_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, clear_tm_voq_ing_all_egress_port_name=clear_tm_voq_ing_all_egress_port_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, clear_tm_voq_ing_all_egress_port_name=clear_tm_voq_ing_all_egress_port_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_clear_tm_voq_stat_slot_id_egr_all_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.clear_tm_voq_stat_slot_id_egr_all.input', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc'), ('pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.clear_tm_voq_stat_slot_id_egr_all.input', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def clear_tm_voq_stat_slot_id_egr_all_rpc(self, slot_id=None, clear_tm_voq_slot_egress_port_all=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1014,21 +1086,24 @@ def clear_tm_voq_stat_slot_id_egr_all_rpc(self, slot_id=None, clear_tm_voq_slot_
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.clear_tm_voq_stat_slot_id_egr_all.input', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_1_01a.brocade_tm_stats_rpc'), ('pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.clear_tm_voq_stat_slot_id_egr_all.input', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc.brocade_tm_stats', 'pybind.slxos.v17r_2_00.brocade_tm_stats_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, slot_id=slot_id, clear_tm_voq_slot_egress_port_all=clear_tm_voq_slot_egress_port_all)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, slot_id=slot_id, clear_tm_voq_slot_egress_port_all=clear_tm_voq_slot_egress_port_all)
+    api_descriptor = _clear_tm_voq_stat_slot_id_egr_all_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, slot_id=slot_id, clear_tm_voq_slot_egress_port_all=clear_tm_voq_slot_egress_port_all)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, slot_id=slot_id, clear_tm_voq_slot_egress_port_all=clear_tm_voq_slot_egress_port_all)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_dad_status_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_firmware_rpc.dad_status', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.dad_status', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.dad_status', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.dad_status', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.dad_status', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def dad_status_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1054,21 +1129,24 @@ def dad_status_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_firmware_rpc.dad_status', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.dad_status', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.dad_status', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.dad_status', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.dad_status', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _dad_status_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_fcoe_get_interface_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc.fcoe_get_interface.input', 'pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc'), ('pybind.nos.v7_2_0.brocade_fcoe_ext_rpc.fcoe_get_interface.input', 'pybind.nos.v7_2_0.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.nos.v7_2_0.brocade_fcoe_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc.fcoe_get_interface.input', 'pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc.fcoe_get_interface.input', 'pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def fcoe_get_interface_rpc(self, fcoe_intf_name=None, fcoe_intf_rbridge_id=None, fcoe_intf_include_stats=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1113,21 +1191,24 @@ def fcoe_get_interface_rpc(self, fcoe_intf_name=None, fcoe_intf_rbridge_id=None,
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc.fcoe_get_interface.input', 'pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc'), ('pybind.nos.v7_2_0.brocade_fcoe_ext_rpc.fcoe_get_interface.input', 'pybind.nos.v7_2_0.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.nos.v7_2_0.brocade_fcoe_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc.fcoe_get_interface.input', 'pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc.fcoe_get_interface.input', 'pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, fcoe_intf_name=fcoe_intf_name, fcoe_intf_rbridge_id=fcoe_intf_rbridge_id, fcoe_intf_include_stats=fcoe_intf_include_stats)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, fcoe_intf_name=fcoe_intf_name, fcoe_intf_rbridge_id=fcoe_intf_rbridge_id, fcoe_intf_include_stats=fcoe_intf_include_stats)
+    api_descriptor = _fcoe_get_interface_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, fcoe_intf_name=fcoe_intf_name, fcoe_intf_rbridge_id=fcoe_intf_rbridge_id, fcoe_intf_include_stats=fcoe_intf_include_stats)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, fcoe_intf_name=fcoe_intf_name, fcoe_intf_rbridge_id=fcoe_intf_rbridge_id, fcoe_intf_include_stats=fcoe_intf_include_stats)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_fcoe_get_login_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc.fcoe_get_login.input', 'pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc'), ('pybind.nos.v7_2_0.brocade_fcoe_ext_rpc.fcoe_get_login.input', 'pybind.nos.v7_2_0.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.nos.v7_2_0.brocade_fcoe_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc.fcoe_get_login.input', 'pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc.fcoe_get_login.input', 'pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def fcoe_get_login_rpc(self, fcoe_login_interface=None, fcoe_login_vfid=None, fcoe_login_vlan=None, fcoe_login_rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1183,21 +1264,24 @@ def fcoe_get_login_rpc(self, fcoe_login_interface=None, fcoe_login_vfid=None, fc
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc.fcoe_get_login.input', 'pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.nos.v6_0_2f.brocade_fcoe_ext_rpc'), ('pybind.nos.v7_2_0.brocade_fcoe_ext_rpc.fcoe_get_login.input', 'pybind.nos.v7_2_0.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.nos.v7_2_0.brocade_fcoe_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc.fcoe_get_login.input', 'pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.slxos.v17r_1_01a.brocade_fcoe_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc.fcoe_get_login.input', 'pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc.brocade_fcoe_ext', 'pybind.slxos.v17s_1_02.brocade_fcoe_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, fcoe_login_interface=fcoe_login_interface, fcoe_login_vfid=fcoe_login_vfid, fcoe_login_vlan=fcoe_login_vlan, fcoe_login_rbridge_id=fcoe_login_rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, fcoe_login_interface=fcoe_login_interface, fcoe_login_vfid=fcoe_login_vfid, fcoe_login_vlan=fcoe_login_vlan, fcoe_login_rbridge_id=fcoe_login_rbridge_id)
+    api_descriptor = _fcoe_get_login_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, fcoe_login_interface=fcoe_login_interface, fcoe_login_vfid=fcoe_login_vfid, fcoe_login_vlan=fcoe_login_vlan, fcoe_login_rbridge_id=fcoe_login_rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, fcoe_login_interface=fcoe_login_interface, fcoe_login_vfid=fcoe_login_vfid, fcoe_login_vlan=fcoe_login_vlan, fcoe_login_rbridge_id=fcoe_login_rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_firmware_download_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc')],
+    composed_child_list=[('pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input', u'sftp'), ('pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input', u'ftp'), ('pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input', u'usb'), ('pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input', u'scp'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input', u'usb'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input', u'sftp'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input', u'ftp'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input', u'scp'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input', u'ftp'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input', u'usb'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input', u'scp'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input', u'sftp'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input', u'scp'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input', u'usb'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input', u'sftp'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input', u'ftp'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input', u'usb'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input', u'ftp'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input', u'scp'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input', u'sftp')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'user, password, host, directory, file, port, host_key_check'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'directory'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'directory'}, {'leafval': 'user, password, host, directory, file, port, host_key_check'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'directory'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'user, password, host, directory, file, port, host_key_check'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'directory'}, {'leafval': 'user, password, host, directory, file, port, host_key_check'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'directory'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'user, password, host, directory, file, port, host_key_check'}],
+    leafval_map={"pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input": {"coldboot": "coldboot", "rbridge_id": "rbridge_id", "auto_activate": "auto_activate"}, "pybind.slxos.v17r_2_00.firmware.download": {}, "pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input": {}, "pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input": {"coldboot": "coldboot", "rbridge_id": "rbridge_id", "auto_activate": "auto_activate"}, "pybind.nos.v6_0_2f.firmware.download": {}, "pybind.nos.v7_2_0.firmware.download": {}, "pybind.slxos.v17s_1_02.firmware.download": {}, "pybind.slxos.v17r_1_01a.firmware.download": {}, "pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input": {}, "pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input": {}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def firmware_download_rpc(self, rbridge_id=None, auto_activate=None, coldboot=None, sftp=None, ftp=None, usb=None, scp=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1307,21 +1391,24 @@ def firmware_download_rpc(self, rbridge_id=None, auto_activate=None, coldboot=No
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc')]
-    composed_child_list = [('pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input', u'sftp'), ('pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input', u'ftp'), ('pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input', u'usb'), ('pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input', u'scp'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input', u'usb'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input', u'sftp'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input', u'ftp'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input', u'scp'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input', u'ftp'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input', u'usb'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input', u'scp'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input', u'sftp'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input', u'scp'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input', u'usb'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input', u'sftp'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input', u'ftp'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input', u'usb'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input', u'ftp'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input', u'scp'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input', u'sftp')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'user, password, host, directory, file, port, host_key_check'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'directory'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'directory'}, {'leafval': 'user, password, host, directory, file, port, host_key_check'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'directory'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'user, password, host, directory, file, port, host_key_check'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'directory'}, {'leafval': 'user, password, host, directory, file, port, host_key_check'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'directory'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'user, password, host, directory, file'}, {'leafval': 'user, password, host, directory, file, port, host_key_check'}]
-    leafval_map = {"pybind.nos.v6_0_2f.brocade_firmware_rpc.firmware_download.input": {"coldboot": "coldboot", "rbridge_id": "rbridge_id", "auto_activate": "auto_activate"}, "pybind.slxos.v17r_2_00.firmware.download": {}, "pybind.slxos.v17s_1_02.brocade_firmware_rpc.firmware_download.input": {}, "pybind.nos.v7_2_0.brocade_firmware_rpc.firmware_download.input": {"coldboot": "coldboot", "rbridge_id": "rbridge_id", "auto_activate": "auto_activate"}, "pybind.nos.v6_0_2f.firmware.download": {}, "pybind.nos.v7_2_0.firmware.download": {}, "pybind.slxos.v17s_1_02.firmware.download": {}, "pybind.slxos.v17r_1_01a.firmware.download": {}, "pybind.slxos.v17r_2_00.brocade_firmware_rpc.firmware_download.input": {}, "pybind.slxos.v17r_1_01a.brocade_firmware_rpc.firmware_download.input": {}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id, auto_activate=auto_activate, coldboot=coldboot, sftp=sftp, ftp=ftp, usb=usb, scp=scp)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id, auto_activate=auto_activate, coldboot=coldboot, sftp=sftp, ftp=ftp, usb=usb, scp=scp)
+    api_descriptor = _firmware_download_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id, auto_activate=auto_activate, coldboot=coldboot, sftp=sftp, ftp=ftp, usb=usb, scp=scp)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id, auto_activate=auto_activate, coldboot=coldboot, sftp=sftp, ftp=ftp, usb=usb, scp=scp)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_fwdl_status_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_firmware_rpc.fwdl_status.input', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.fwdl_status', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.fwdl_status.input', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.fwdl_status.input', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.fwdl_status.input', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17s_1_02.brocade_firmware_rpc.fwdl_status.input": {"fwdl_tid": "fwdl_tid"}, "pybind.nos.v7_2_0.brocade_firmware_rpc.fwdl_status": {}, "pybind.slxos.v17r_1_01a.brocade_firmware_rpc.fwdl_status.input": {"fwdl_tid": "fwdl_tid"}, "pybind.slxos.v17r_2_00.brocade_firmware_rpc.fwdl_status.input": {"fwdl_tid": "fwdl_tid"}, "pybind.nos.v6_0_2f.brocade_firmware_rpc.fwdl_status.input": {"fwdl_tid": "fwdl_tid"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def fwdl_status_rpc(self, fwdl_tid=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1356,21 +1443,24 @@ def fwdl_status_rpc(self, fwdl_tid=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_firmware_rpc.fwdl_status.input', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.fwdl_status', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc'), ('pybind.slxos.v17r_1_01a.brocade_firmware_rpc.fwdl_status.input', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_1_01a.brocade_firmware_rpc'), ('pybind.slxos.v17r_2_00.brocade_firmware_rpc.fwdl_status.input', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17r_2_00.brocade_firmware_rpc'), ('pybind.slxos.v17s_1_02.brocade_firmware_rpc.fwdl_status.input', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc.brocade_firmware', 'pybind.slxos.v17s_1_02.brocade_firmware_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17s_1_02.brocade_firmware_rpc.fwdl_status.input": {"fwdl_tid": "fwdl_tid"}, "pybind.nos.v7_2_0.brocade_firmware_rpc.fwdl_status": {}, "pybind.slxos.v17r_1_01a.brocade_firmware_rpc.fwdl_status.input": {"fwdl_tid": "fwdl_tid"}, "pybind.slxos.v17r_2_00.brocade_firmware_rpc.fwdl_status.input": {"fwdl_tid": "fwdl_tid"}, "pybind.nos.v6_0_2f.brocade_firmware_rpc.fwdl_status.input": {"fwdl_tid": "fwdl_tid"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, fwdl_tid=fwdl_tid)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, fwdl_tid=fwdl_tid)
+    api_descriptor = _fwdl_status_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, fwdl_tid=fwdl_tid)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, fwdl_tid=fwdl_tid)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_arp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_arp_rpc.get_arp.input', 'pybind.nos.v6_0_2f.brocade_arp_rpc.brocade_arp', 'pybind.nos.v6_0_2f.brocade_arp_rpc'), ('pybind.nos.v7_2_0.brocade_arp_rpc.get_arp.input', 'pybind.nos.v7_2_0.brocade_arp_rpc.brocade_arp', 'pybind.nos.v7_2_0.brocade_arp_rpc'), ('pybind.slxos.v17r_1_01a.brocade_arp_rpc.get_arp.input', 'pybind.slxos.v17r_1_01a.brocade_arp_rpc.brocade_arp', 'pybind.slxos.v17r_1_01a.brocade_arp_rpc'), ('pybind.slxos.v17r_2_00.brocade_arp_rpc.get_arp.input', 'pybind.slxos.v17r_2_00.brocade_arp_rpc.brocade_arp', 'pybind.slxos.v17r_2_00.brocade_arp_rpc'), ('pybind.slxos.v17s_1_02.brocade_arp_rpc.get_arp.input', 'pybind.slxos.v17s_1_02.brocade_arp_rpc.brocade_arp', 'pybind.slxos.v17s_1_02.brocade_arp_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_arp_rpc(self, interface_type=None, interface_name=None, dynamic=None, static=None, ip_address=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1441,21 +1531,24 @@ def get_arp_rpc(self, interface_type=None, interface_name=None, dynamic=None, st
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_arp_rpc.get_arp.input', 'pybind.nos.v6_0_2f.brocade_arp_rpc.brocade_arp', 'pybind.nos.v6_0_2f.brocade_arp_rpc'), ('pybind.nos.v7_2_0.brocade_arp_rpc.get_arp.input', 'pybind.nos.v7_2_0.brocade_arp_rpc.brocade_arp', 'pybind.nos.v7_2_0.brocade_arp_rpc'), ('pybind.slxos.v17r_1_01a.brocade_arp_rpc.get_arp.input', 'pybind.slxos.v17r_1_01a.brocade_arp_rpc.brocade_arp', 'pybind.slxos.v17r_1_01a.brocade_arp_rpc'), ('pybind.slxos.v17r_2_00.brocade_arp_rpc.get_arp.input', 'pybind.slxos.v17r_2_00.brocade_arp_rpc.brocade_arp', 'pybind.slxos.v17r_2_00.brocade_arp_rpc'), ('pybind.slxos.v17s_1_02.brocade_arp_rpc.get_arp.input', 'pybind.slxos.v17s_1_02.brocade_arp_rpc.brocade_arp', 'pybind.slxos.v17s_1_02.brocade_arp_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, interface_type=interface_type, interface_name=interface_name, dynamic=dynamic, static=static, ip_address=ip_address)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, interface_type=interface_type, interface_name=interface_name, dynamic=dynamic, static=static, ip_address=ip_address)
+    api_descriptor = _get_arp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, dynamic=dynamic, static=static, ip_address=ip_address)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, dynamic=dynamic, static=static, ip_address=ip_address)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_contained_in_id_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_entity_rpc.get_contained_in_ID', 'pybind.nos.v6_0_2f.brocade_entity_rpc.brocade_entity', 'pybind.nos.v6_0_2f.brocade_entity_rpc'), ('pybind.nos.v7_2_0.brocade_entity_rpc.get_contained_in_ID', 'pybind.nos.v7_2_0.brocade_entity_rpc.brocade_entity', 'pybind.nos.v7_2_0.brocade_entity_rpc'), ('pybind.slxos.v17r_1_01a.brocade_entity_rpc.get_contained_in_ID', 'pybind.slxos.v17r_1_01a.brocade_entity_rpc.brocade_entity', 'pybind.slxos.v17r_1_01a.brocade_entity_rpc'), ('pybind.slxos.v17r_2_00.brocade_entity_rpc.get_contained_in_ID', 'pybind.slxos.v17r_2_00.brocade_entity_rpc.brocade_entity', 'pybind.slxos.v17r_2_00.brocade_entity_rpc'), ('pybind.slxos.v17s_1_02.brocade_entity_rpc.get_contained_in_ID', 'pybind.slxos.v17s_1_02.brocade_entity_rpc.brocade_entity', 'pybind.slxos.v17s_1_02.brocade_entity_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_contained_in_id_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1481,21 +1574,24 @@ def get_contained_in_id_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_entity_rpc.get_contained_in_ID', 'pybind.nos.v6_0_2f.brocade_entity_rpc.brocade_entity', 'pybind.nos.v6_0_2f.brocade_entity_rpc'), ('pybind.nos.v7_2_0.brocade_entity_rpc.get_contained_in_ID', 'pybind.nos.v7_2_0.brocade_entity_rpc.brocade_entity', 'pybind.nos.v7_2_0.brocade_entity_rpc'), ('pybind.slxos.v17r_1_01a.brocade_entity_rpc.get_contained_in_ID', 'pybind.slxos.v17r_1_01a.brocade_entity_rpc.brocade_entity', 'pybind.slxos.v17r_1_01a.brocade_entity_rpc'), ('pybind.slxos.v17r_2_00.brocade_entity_rpc.get_contained_in_ID', 'pybind.slxos.v17r_2_00.brocade_entity_rpc.brocade_entity', 'pybind.slxos.v17r_2_00.brocade_entity_rpc'), ('pybind.slxos.v17s_1_02.brocade_entity_rpc.get_contained_in_ID', 'pybind.slxos.v17s_1_02.brocade_entity_rpc.brocade_entity', 'pybind.slxos.v17s_1_02.brocade_entity_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_contained_in_id_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_flexports_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_hardware_rpc.get_flexports', 'pybind.nos.v6_0_2f.brocade_hardware_rpc.brocade_hardware', 'pybind.nos.v6_0_2f.brocade_hardware_rpc'), ('pybind.nos.v7_2_0.brocade_hardware_rpc.get_flexports', 'pybind.nos.v7_2_0.brocade_hardware_rpc.brocade_hardware', 'pybind.nos.v7_2_0.brocade_hardware_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_flexports_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1520,21 +1616,24 @@ def get_flexports_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_hardware_rpc.get_flexports', 'pybind.nos.v6_0_2f.brocade_hardware_rpc.brocade_hardware', 'pybind.nos.v6_0_2f.brocade_hardware_rpc'), ('pybind.nos.v7_2_0.brocade_hardware_rpc.get_flexports', 'pybind.nos.v7_2_0.brocade_hardware_rpc.brocade_hardware', 'pybind.nos.v7_2_0.brocade_hardware_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_flexports_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_interface_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_interface_detail.input', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_interface_detail.input', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_interface_detail.input', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_interface_detail.input', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_interface_detail.input', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc')],
+    composed_child_list=[('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_interface_detail.input', u'last_rcvd_interface'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_interface_detail.input', u'last_rcvd_interface'), ('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_interface_detail.input', u'last_rcvd_interface'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_interface_detail.input', u'last_rcvd_interface'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_interface_detail.input', u'last_rcvd_interface')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_interface_detail_rpc(self, interface_type=None, interface_name=None, last_rcvd_interface=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1623,21 +1722,24 @@ def get_interface_detail_rpc(self, interface_type=None, interface_name=None, las
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_interface_detail.input', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_interface_detail.input', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_interface_detail.input', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_interface_detail.input', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_interface_detail.input', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc')]
-    composed_child_list = [('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_interface_detail.input', u'last_rcvd_interface'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_interface_detail.input', u'last_rcvd_interface'), ('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_interface_detail.input', u'last_rcvd_interface'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_interface_detail.input', u'last_rcvd_interface'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_interface_detail.input', u'last_rcvd_interface')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, interface_type=interface_type, interface_name=interface_name, last_rcvd_interface=last_rcvd_interface)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, interface_type=interface_type, interface_name=interface_name, last_rcvd_interface=last_rcvd_interface)
+    api_descriptor = _get_interface_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, last_rcvd_interface=last_rcvd_interface)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, last_rcvd_interface=last_rcvd_interface)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_interface_switchport_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_interface_switchport', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_interface_switchport', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_interface_switchport', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_interface_switchport', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_interface_switchport.input', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc')],
+    composed_child_list=[('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_interface_switchport.input', u'last_rcvd_interface')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'interface_type, interface_name'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_interface_switchport_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1663,21 +1765,24 @@ def get_interface_switchport_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_interface_switchport', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_interface_switchport', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_interface_switchport', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_interface_switchport', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_interface_switchport.input', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc')]
-    composed_child_list = [('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_interface_switchport.input', u'last_rcvd_interface')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'interface_type, interface_name'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_interface_switchport_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_ip_interface_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_ip_interface.input', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_ip_interface.input', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_ip_interface.input', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_ip_interface.input', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_ip_interface.input', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc')],
+    composed_child_list=[('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_ip_interface.input', u'last_rcvd_interface')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'interface_type, interface_name'}],
+    leafval_map={"pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_ip_interface.input": {}, "pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_ip_interface.input": {}, "pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_ip_interface.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_ip_interface.input": {}, "pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_ip_interface.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_ip_interface_rpc(self, interface_type=None, interface_name=None, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1740,21 +1845,24 @@ def get_ip_interface_rpc(self, interface_type=None, interface_name=None, rbridge
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_ip_interface.input', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_ip_interface.input', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_ip_interface.input', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_ip_interface.input', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_ip_interface.input', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc')]
-    composed_child_list = [('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_ip_interface.input', u'last_rcvd_interface')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'interface_type, interface_name'}]
-    leafval_map = {"pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_ip_interface.input": {}, "pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_ip_interface.input": {}, "pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_ip_interface.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_ip_interface.input": {}, "pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_ip_interface.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, interface_type=interface_type, interface_name=interface_name, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, interface_type=interface_type, interface_name=interface_name, rbridge_id=rbridge_id)
+    api_descriptor = _get_ip_interface_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_last_config_update_time_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vcs_rpc.get_last_config_update_time', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.get_last_config_update_time', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.get_last_config_update_time', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.get_last_config_update_time', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.get_last_config_update_time', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_last_config_update_time_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1780,21 +1888,24 @@ def get_last_config_update_time_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vcs_rpc.get_last_config_update_time', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.get_last_config_update_time', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.get_last_config_update_time', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.get_last_config_update_time', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.get_last_config_update_time', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_last_config_update_time_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_last_config_update_time_for_xpaths_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')],
+    composed_child_list=[('pybind.slxos.v17s_1_02.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', u'xpath_strings'), ('pybind.nos.v6_0_2f.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', u'xpath_strings'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', u'xpath_strings'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', u'xpath_strings'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', u'xpath_strings')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'xpath_string'}, {'leafval': 'xpath_string'}, {'leafval': 'xpath_string'}, {'leafval': 'xpath_string'}, {'leafval': 'xpath_string'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_last_config_update_time_for_xpaths_rpc(self, xpath_strings=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1828,21 +1939,24 @@ def get_last_config_update_time_for_xpaths_rpc(self, xpath_strings=None, api_tim
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')]
-    composed_child_list = [('pybind.slxos.v17s_1_02.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', u'xpath_strings'), ('pybind.nos.v6_0_2f.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', u'xpath_strings'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', u'xpath_strings'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', u'xpath_strings'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.get_last_config_update_time_for_xpaths.input', u'xpath_strings')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'xpath_string'}, {'leafval': 'xpath_string'}, {'leafval': 'xpath_string'}, {'leafval': 'xpath_string'}, {'leafval': 'xpath_string'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, xpath_strings=xpath_strings)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, xpath_strings=xpath_strings)
+    api_descriptor = _get_last_config_update_time_for_xpaths_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, xpath_strings=xpath_strings)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, xpath_strings=xpath_strings)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_lldp_neighbor_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input', 'pybind.nos.v6_0_2f.brocade_lldp_ext_rpc.brocade_lldp_ext', 'pybind.nos.v6_0_2f.brocade_lldp_ext_rpc'), ('pybind.nos.v7_2_0.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input', 'pybind.nos.v7_2_0.brocade_lldp_ext_rpc.brocade_lldp_ext', 'pybind.nos.v7_2_0.brocade_lldp_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input', 'pybind.slxos.v17r_1_01a.brocade_lldp_ext_rpc.brocade_lldp_ext', 'pybind.slxos.v17r_1_01a.brocade_lldp_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input', 'pybind.slxos.v17r_2_00.brocade_lldp_ext_rpc.brocade_lldp_ext', 'pybind.slxos.v17r_2_00.brocade_lldp_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input', 'pybind.slxos.v17s_1_02.brocade_lldp_ext_rpc.brocade_lldp_ext', 'pybind.slxos.v17s_1_02.brocade_lldp_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17r_2_00.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input": {}, "pybind.nos.v7_2_0.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id", "last_rcvd_ifindex": "last_rcvd_ifindex"}, "pybind.slxos.v17s_1_02.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input": {}, "pybind.slxos.v17r_1_01a.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input": {}, "pybind.nos.v6_0_2f.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id", "last_rcvd_ifindex": "last_rcvd_ifindex"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_lldp_neighbor_detail_rpc(self, interface_type=None, interface_name=None, last_rcvd_ifindex=None, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1912,21 +2026,24 @@ def get_lldp_neighbor_detail_rpc(self, interface_type=None, interface_name=None,
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input', 'pybind.nos.v6_0_2f.brocade_lldp_ext_rpc.brocade_lldp_ext', 'pybind.nos.v6_0_2f.brocade_lldp_ext_rpc'), ('pybind.nos.v7_2_0.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input', 'pybind.nos.v7_2_0.brocade_lldp_ext_rpc.brocade_lldp_ext', 'pybind.nos.v7_2_0.brocade_lldp_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input', 'pybind.slxos.v17r_1_01a.brocade_lldp_ext_rpc.brocade_lldp_ext', 'pybind.slxos.v17r_1_01a.brocade_lldp_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input', 'pybind.slxos.v17r_2_00.brocade_lldp_ext_rpc.brocade_lldp_ext', 'pybind.slxos.v17r_2_00.brocade_lldp_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input', 'pybind.slxos.v17s_1_02.brocade_lldp_ext_rpc.brocade_lldp_ext', 'pybind.slxos.v17s_1_02.brocade_lldp_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17r_2_00.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input": {}, "pybind.nos.v7_2_0.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id", "last_rcvd_ifindex": "last_rcvd_ifindex"}, "pybind.slxos.v17s_1_02.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input": {}, "pybind.slxos.v17r_1_01a.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input": {}, "pybind.nos.v6_0_2f.brocade_lldp_ext_rpc.get_lldp_neighbor_detail.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id", "last_rcvd_ifindex": "last_rcvd_ifindex"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, interface_type=interface_type, interface_name=interface_name, last_rcvd_ifindex=last_rcvd_ifindex, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, interface_type=interface_type, interface_name=interface_name, last_rcvd_ifindex=last_rcvd_ifindex, rbridge_id=rbridge_id)
+    api_descriptor = _get_lldp_neighbor_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, last_rcvd_ifindex=last_rcvd_ifindex, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, last_rcvd_ifindex=last_rcvd_ifindex, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mac_acl_for_intf_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_mac_access_list_rpc.get_mac_acl_for_intf.input', 'pybind.nos.v6_0_2f.brocade_mac_access_list_rpc.brocade_mac_access_list', 'pybind.nos.v6_0_2f.brocade_mac_access_list_rpc'), ('pybind.nos.v7_2_0.brocade_mac_access_list_rpc.get_mac_acl_for_intf.input', 'pybind.nos.v7_2_0.brocade_mac_access_list_rpc.brocade_mac_access_list', 'pybind.nos.v7_2_0.brocade_mac_access_list_rpc'), ('pybind.slxos.v17r_1_01a.brocade_mac_access_list_rpc.get_mac_acl_for_intf.input', 'pybind.slxos.v17r_1_01a.brocade_mac_access_list_rpc.brocade_mac_access_list', 'pybind.slxos.v17r_1_01a.brocade_mac_access_list_rpc'), ('pybind.slxos.v17r_2_00.brocade_mac_access_list_rpc.get_mac_acl_for_intf.input', 'pybind.slxos.v17r_2_00.brocade_mac_access_list_rpc.brocade_mac_access_list', 'pybind.slxos.v17r_2_00.brocade_mac_access_list_rpc'), ('pybind.slxos.v17s_1_02.brocade_mac_access_list_rpc.get_mac_acl_for_intf.input', 'pybind.slxos.v17s_1_02.brocade_mac_access_list_rpc.brocade_mac_access_list', 'pybind.slxos.v17s_1_02.brocade_mac_access_list_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mac_acl_for_intf_rpc(self, interface_type=None, interface_name=None, direction=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -1989,21 +2106,24 @@ def get_mac_acl_for_intf_rpc(self, interface_type=None, interface_name=None, dir
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_mac_access_list_rpc.get_mac_acl_for_intf.input', 'pybind.nos.v6_0_2f.brocade_mac_access_list_rpc.brocade_mac_access_list', 'pybind.nos.v6_0_2f.brocade_mac_access_list_rpc'), ('pybind.nos.v7_2_0.brocade_mac_access_list_rpc.get_mac_acl_for_intf.input', 'pybind.nos.v7_2_0.brocade_mac_access_list_rpc.brocade_mac_access_list', 'pybind.nos.v7_2_0.brocade_mac_access_list_rpc'), ('pybind.slxos.v17r_1_01a.brocade_mac_access_list_rpc.get_mac_acl_for_intf.input', 'pybind.slxos.v17r_1_01a.brocade_mac_access_list_rpc.brocade_mac_access_list', 'pybind.slxos.v17r_1_01a.brocade_mac_access_list_rpc'), ('pybind.slxos.v17r_2_00.brocade_mac_access_list_rpc.get_mac_acl_for_intf.input', 'pybind.slxos.v17r_2_00.brocade_mac_access_list_rpc.brocade_mac_access_list', 'pybind.slxos.v17r_2_00.brocade_mac_access_list_rpc'), ('pybind.slxos.v17s_1_02.brocade_mac_access_list_rpc.get_mac_acl_for_intf.input', 'pybind.slxos.v17s_1_02.brocade_mac_access_list_rpc.brocade_mac_access_list', 'pybind.slxos.v17s_1_02.brocade_mac_access_list_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, interface_type=interface_type, interface_name=interface_name, direction=direction)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, interface_type=interface_type, interface_name=interface_name, direction=direction)
+    api_descriptor = _get_mac_acl_for_intf_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, direction=direction)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, direction=direction)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mac_address_table_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_mac_address_table_rpc.get_mac_address_table.input', 'pybind.nos.v6_0_2f.brocade_mac_address_table_rpc.brocade_mac_address_table', 'pybind.nos.v6_0_2f.brocade_mac_address_table_rpc'), ('pybind.nos.v7_2_0.brocade_mac_address_table_rpc.get_mac_address_table.input', 'pybind.nos.v7_2_0.brocade_mac_address_table_rpc.brocade_mac_address_table', 'pybind.nos.v7_2_0.brocade_mac_address_table_rpc'), ('pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc.get_mac_address_table.input', 'pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc.brocade_mac_address_table', 'pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc'), ('pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc.get_mac_address_table.input', 'pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc.brocade_mac_address_table', 'pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc'), ('pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc.get_mac_address_table.input', 'pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc.brocade_mac_address_table', 'pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc')],
+    composed_child_list=[('pybind.nos.v6_0_2f.brocade_mac_address_table_rpc.get_mac_address_table.input', u'last_mac_address_details'), ('pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc.get_mac_address_table.input', u'forwarding_interface'), ('pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc.get_mac_address_table.input', u'last_mac_address_details'), ('pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc.get_mac_address_table.input', u'forwarding_interface'), ('pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc.get_mac_address_table.input', u'last_mac_address_details'), ('pybind.nos.v7_2_0.brocade_mac_address_table_rpc.get_mac_address_table.input', u'forwarding_interface'), ('pybind.nos.v7_2_0.brocade_mac_address_table_rpc.get_mac_address_table.input', u'last_mac_address_details'), ('pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc.get_mac_address_table.input', u'forwarding_interface'), ('pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc.get_mac_address_table.input', u'last_mac_address_details')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'last_mac_address, last_vlan_id, last_mac_type'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'last_mac_address, last_vlan_id, last_mac_type'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'last_mac_address, last_vlan_id, last_mac_type'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'last_mac_address, last_vlan_id, last_mac_type'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'last_mac_address, last_vlan_id, last_mac_type'}],
+    leafval_map={"pybind.nos.v7_2_0.brocade_mac_address_table_rpc.get_mac_address_table.input": {}, "pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc.get_mac_address_table.input": {}, "pybind.nos.v6_0_2f.brocade_mac_address_table_rpc.get_mac_address_table.input": {"mac_address": "mac_address"}, "pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc.get_mac_address_table.input": {}, "pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc.get_mac_address_table.input": {}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mac_address_table_rpc(self, mac_address=None, last_mac_address_details=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2064,21 +2184,24 @@ def get_mac_address_table_rpc(self, mac_address=None, last_mac_address_details=N
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_mac_address_table_rpc.get_mac_address_table.input', 'pybind.nos.v6_0_2f.brocade_mac_address_table_rpc.brocade_mac_address_table', 'pybind.nos.v6_0_2f.brocade_mac_address_table_rpc'), ('pybind.nos.v7_2_0.brocade_mac_address_table_rpc.get_mac_address_table.input', 'pybind.nos.v7_2_0.brocade_mac_address_table_rpc.brocade_mac_address_table', 'pybind.nos.v7_2_0.brocade_mac_address_table_rpc'), ('pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc.get_mac_address_table.input', 'pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc.brocade_mac_address_table', 'pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc'), ('pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc.get_mac_address_table.input', 'pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc.brocade_mac_address_table', 'pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc'), ('pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc.get_mac_address_table.input', 'pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc.brocade_mac_address_table', 'pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc')]
-    composed_child_list = [('pybind.nos.v6_0_2f.brocade_mac_address_table_rpc.get_mac_address_table.input', u'last_mac_address_details'), ('pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc.get_mac_address_table.input', u'forwarding_interface'), ('pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc.get_mac_address_table.input', u'last_mac_address_details'), ('pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc.get_mac_address_table.input', u'forwarding_interface'), ('pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc.get_mac_address_table.input', u'last_mac_address_details'), ('pybind.nos.v7_2_0.brocade_mac_address_table_rpc.get_mac_address_table.input', u'forwarding_interface'), ('pybind.nos.v7_2_0.brocade_mac_address_table_rpc.get_mac_address_table.input', u'last_mac_address_details'), ('pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc.get_mac_address_table.input', u'forwarding_interface'), ('pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc.get_mac_address_table.input', u'last_mac_address_details')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'last_mac_address, last_vlan_id, last_mac_type'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'last_mac_address, last_vlan_id, last_mac_type'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'last_mac_address, last_vlan_id, last_mac_type'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'last_mac_address, last_vlan_id, last_mac_type'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'last_mac_address, last_vlan_id, last_mac_type'}]
-    leafval_map = {"pybind.nos.v7_2_0.brocade_mac_address_table_rpc.get_mac_address_table.input": {}, "pybind.slxos.v17r_2_00.brocade_mac_address_table_rpc.get_mac_address_table.input": {}, "pybind.nos.v6_0_2f.brocade_mac_address_table_rpc.get_mac_address_table.input": {"mac_address": "mac_address"}, "pybind.slxos.v17r_1_01a.brocade_mac_address_table_rpc.get_mac_address_table.input": {}, "pybind.slxos.v17s_1_02.brocade_mac_address_table_rpc.get_mac_address_table.input": {}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mac_address=mac_address, last_mac_address_details=last_mac_address_details)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mac_address=mac_address, last_mac_address_details=last_mac_address_details)
+    api_descriptor = _get_mac_address_table_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mac_address=mac_address, last_mac_address_details=last_mac_address_details)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mac_address=mac_address, last_mac_address_details=last_mac_address_details)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_media_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_media_detail.input', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_media_detail.input', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_media_detail.input', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_media_detail.input', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_media_detail.input', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_media_detail.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id"}, "pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_media_detail.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_media_detail.input": {}, "pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_media_detail.input": {}, "pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_media_detail.input": {}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_media_detail_rpc(self, interface_type=None, interface_name=None, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2141,21 +2264,24 @@ def get_media_detail_rpc(self, interface_type=None, interface_name=None, rbridge
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_media_detail.input', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_media_detail.input', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_media_detail.input', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_media_detail.input', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_media_detail.input', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_media_detail.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id"}, "pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_media_detail.input": {"interface_type": "interface_type", "interface_name": "interface_name", "rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_media_detail.input": {}, "pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_media_detail.input": {}, "pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_media_detail.input": {}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, interface_type=interface_type, interface_name=interface_name, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, interface_type=interface_type, interface_name=interface_name, rbridge_id=rbridge_id)
+    api_descriptor = _get_media_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mpls_autobw_template_brief_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_autobw_template_brief', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_autobw_template_brief', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_autobw_template_brief', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mpls_autobw_template_brief_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2180,21 +2306,24 @@ def get_mpls_autobw_template_brief_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_autobw_template_brief', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_autobw_template_brief', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_autobw_template_brief', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_mpls_autobw_template_brief_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mpls_autobw_template_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_autobw_template_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_autobw_template_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_autobw_template_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mpls_autobw_template_detail_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2219,21 +2348,24 @@ def get_mpls_autobw_template_detail_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_autobw_template_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_autobw_template_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_autobw_template_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_mpls_autobw_template_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mpls_autobw_template_one_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_autobw_template_one.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_autobw_template_one.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_autobw_template_one.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_autobw_template_one.input', u'mpls_autobw_template_one'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_autobw_template_one.input', u'mpls_autobw_template_one'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_autobw_template_one.input', u'mpls_autobw_template_one')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'autobwTemplateName'}, {'leafval': 'autobwTemplateName'}, {'leafval': 'autobwTemplateName'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mpls_autobw_template_one_rpc(self, mpls_autobw_template_one=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2266,21 +2398,24 @@ def get_mpls_autobw_template_one_rpc(self, mpls_autobw_template_one=None, api_ti
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_autobw_template_one.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_autobw_template_one.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_autobw_template_one.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_autobw_template_one.input', u'mpls_autobw_template_one'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_autobw_template_one.input', u'mpls_autobw_template_one'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_autobw_template_one.input', u'mpls_autobw_template_one')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'autobwTemplateName'}, {'leafval': 'autobwTemplateName'}, {'leafval': 'autobwTemplateName'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mpls_autobw_template_one=mpls_autobw_template_one)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mpls_autobw_template_one=mpls_autobw_template_one)
+    api_descriptor = _get_mpls_autobw_template_one_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mpls_autobw_template_one=mpls_autobw_template_one)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mpls_autobw_template_one=mpls_autobw_template_one)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mpls_ldp_neighbor_brief_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_neighbor_brief', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_neighbor_brief', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_neighbor_brief', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mpls_ldp_neighbor_brief_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2305,21 +2440,24 @@ def get_mpls_ldp_neighbor_brief_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_neighbor_brief', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_neighbor_brief', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_neighbor_brief', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_mpls_ldp_neighbor_brief_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mpls_ldp_neighbor_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_neighbor_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_neighbor_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_neighbor_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mpls_ldp_neighbor_detail_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2344,21 +2482,24 @@ def get_mpls_ldp_neighbor_detail_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_neighbor_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_neighbor_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_neighbor_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_mpls_ldp_neighbor_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mpls_ldp_neighbor_one_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', u'mpls_ldp_neighbor_one_input'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', u'mpls_ldp_neighbor_one_input'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', u'mpls_ldp_neighbor_one_input')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'ldpid, labelspaceId'}, {'leafval': 'ldpid, labelspaceId'}, {'leafval': 'ldpid, labelspaceId'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mpls_ldp_neighbor_one_rpc(self, mpls_ldp_neighbor_one_input=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2404,21 +2545,24 @@ def get_mpls_ldp_neighbor_one_rpc(self, mpls_ldp_neighbor_one_input=None, api_ti
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', u'mpls_ldp_neighbor_one_input'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', u'mpls_ldp_neighbor_one_input'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_neighbor_one.input', u'mpls_ldp_neighbor_one_input')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'ldpid, labelspaceId'}, {'leafval': 'ldpid, labelspaceId'}, {'leafval': 'ldpid, labelspaceId'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mpls_ldp_neighbor_one_input=mpls_ldp_neighbor_one_input)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mpls_ldp_neighbor_one_input=mpls_ldp_neighbor_one_input)
+    api_descriptor = _get_mpls_ldp_neighbor_one_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mpls_ldp_neighbor_one_input=mpls_ldp_neighbor_one_input)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mpls_ldp_neighbor_one_input=mpls_ldp_neighbor_one_input)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mpls_ldp_session_brief_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_session_brief', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_session_brief', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_session_brief', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mpls_ldp_session_brief_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2443,21 +2587,24 @@ def get_mpls_ldp_session_brief_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_session_brief', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_session_brief', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_session_brief', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_mpls_ldp_session_brief_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mpls_ldp_session_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_session_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_session_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_session_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mpls_ldp_session_detail_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2482,21 +2629,24 @@ def get_mpls_ldp_session_detail_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_session_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_session_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_session_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_mpls_ldp_session_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_mpls_ldp_session_one_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_session_one.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_session_one.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_session_one.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_session_one.input', u'mpls_ldp_session_one'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_session_one.input', u'mpls_ldp_session_one'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_session_one.input', u'mpls_ldp_session_one')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'ldpid, labelspaceId, debug, out, in_'}, {'leafval': 'ldpid, labelspaceId, debug, out, in_'}, {'leafval': 'ldpid, labelspaceId, debug, out, in_'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_mpls_ldp_session_one_rpc(self, mpls_ldp_session_one=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2551,21 +2701,24 @@ def get_mpls_ldp_session_one_rpc(self, mpls_ldp_session_one=None, api_timeout=''
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_session_one.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_session_one.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_session_one.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.get_mpls_ldp_session_one.input', u'mpls_ldp_session_one'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.get_mpls_ldp_session_one.input', u'mpls_ldp_session_one'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.get_mpls_ldp_session_one.input', u'mpls_ldp_session_one')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'ldpid, labelspaceId, debug, out, in_'}, {'leafval': 'ldpid, labelspaceId, debug, out, in_'}, {'leafval': 'ldpid, labelspaceId, debug, out, in_'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mpls_ldp_session_one=mpls_ldp_session_one)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mpls_ldp_session_one=mpls_ldp_session_one)
+    api_descriptor = _get_mpls_ldp_session_one_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mpls_ldp_session_one=mpls_ldp_session_one)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mpls_ldp_session_one=mpls_ldp_session_one)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_nameserver_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_nameserver_rpc.get_nameserver_detail.input', 'pybind.nos.v6_0_2f.brocade_nameserver_rpc.brocade_nameserver', 'pybind.nos.v6_0_2f.brocade_nameserver_rpc'), ('pybind.nos.v7_2_0.brocade_nameserver_rpc.get_nameserver_detail.input', 'pybind.nos.v7_2_0.brocade_nameserver_rpc.brocade_nameserver', 'pybind.nos.v7_2_0.brocade_nameserver_rpc'), ('pybind.slxos.v17r_1_01a.brocade_nameserver_rpc.get_nameserver_detail', 'pybind.slxos.v17r_1_01a.brocade_nameserver_rpc.brocade_nameserver', 'pybind.slxos.v17r_1_01a.brocade_nameserver_rpc'), ('pybind.slxos.v17r_2_00.brocade_nameserver_rpc.get_nameserver_detail', 'pybind.slxos.v17r_2_00.brocade_nameserver_rpc.brocade_nameserver', 'pybind.slxos.v17r_2_00.brocade_nameserver_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.nos.v6_0_2f.brocade_nameserver_rpc.get_nameserver_detail.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_1_01a.brocade_nameserver_rpc.get_nameserver_detail": {}, "pybind.slxos.v17r_2_00.brocade_nameserver_rpc.get_nameserver_detail": {}, "pybind.nos.v7_2_0.brocade_nameserver_rpc.get_nameserver_detail.input": {"rbridge_id": "rbridge_id"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_nameserver_detail_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2600,21 +2753,24 @@ def get_nameserver_detail_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_nameserver_rpc.get_nameserver_detail.input', 'pybind.nos.v6_0_2f.brocade_nameserver_rpc.brocade_nameserver', 'pybind.nos.v6_0_2f.brocade_nameserver_rpc'), ('pybind.nos.v7_2_0.brocade_nameserver_rpc.get_nameserver_detail.input', 'pybind.nos.v7_2_0.brocade_nameserver_rpc.brocade_nameserver', 'pybind.nos.v7_2_0.brocade_nameserver_rpc'), ('pybind.slxos.v17r_1_01a.brocade_nameserver_rpc.get_nameserver_detail', 'pybind.slxos.v17r_1_01a.brocade_nameserver_rpc.brocade_nameserver', 'pybind.slxos.v17r_1_01a.brocade_nameserver_rpc'), ('pybind.slxos.v17r_2_00.brocade_nameserver_rpc.get_nameserver_detail', 'pybind.slxos.v17r_2_00.brocade_nameserver_rpc.brocade_nameserver', 'pybind.slxos.v17r_2_00.brocade_nameserver_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.nos.v6_0_2f.brocade_nameserver_rpc.get_nameserver_detail.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_1_01a.brocade_nameserver_rpc.get_nameserver_detail": {}, "pybind.slxos.v17r_2_00.brocade_nameserver_rpc.get_nameserver_detail": {}, "pybind.nos.v7_2_0.brocade_nameserver_rpc.get_nameserver_detail.input": {"rbridge_id": "rbridge_id"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _get_nameserver_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_netconf_client_capabilities_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_netconf_ext_rpc.get_netconf_client_capabilities.input', 'pybind.nos.v6_0_2f.brocade_netconf_ext_rpc.brocade_netconf_ext', 'pybind.nos.v6_0_2f.brocade_netconf_ext_rpc'), ('pybind.nos.v7_2_0.brocade_netconf_ext_rpc.get_netconf_client_capabilities.input', 'pybind.nos.v7_2_0.brocade_netconf_ext_rpc.brocade_netconf_ext', 'pybind.nos.v7_2_0.brocade_netconf_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_netconf_ext_rpc.get_netconf_client_capabilities.input', 'pybind.slxos.v17r_1_01a.brocade_netconf_ext_rpc.brocade_netconf_ext', 'pybind.slxos.v17r_1_01a.brocade_netconf_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_netconf_ext_rpc.get_netconf_client_capabilities.input', 'pybind.slxos.v17r_2_00.brocade_netconf_ext_rpc.brocade_netconf_ext', 'pybind.slxos.v17r_2_00.brocade_netconf_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_netconf_ext_rpc.get_netconf_client_capabilities.input', 'pybind.slxos.v17s_1_02.brocade_netconf_ext_rpc.brocade_netconf_ext', 'pybind.slxos.v17s_1_02.brocade_netconf_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_netconf_client_capabilities_rpc(self, session_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2649,21 +2805,24 @@ def get_netconf_client_capabilities_rpc(self, session_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_netconf_ext_rpc.get_netconf_client_capabilities.input', 'pybind.nos.v6_0_2f.brocade_netconf_ext_rpc.brocade_netconf_ext', 'pybind.nos.v6_0_2f.brocade_netconf_ext_rpc'), ('pybind.nos.v7_2_0.brocade_netconf_ext_rpc.get_netconf_client_capabilities.input', 'pybind.nos.v7_2_0.brocade_netconf_ext_rpc.brocade_netconf_ext', 'pybind.nos.v7_2_0.brocade_netconf_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_netconf_ext_rpc.get_netconf_client_capabilities.input', 'pybind.slxos.v17r_1_01a.brocade_netconf_ext_rpc.brocade_netconf_ext', 'pybind.slxos.v17r_1_01a.brocade_netconf_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_netconf_ext_rpc.get_netconf_client_capabilities.input', 'pybind.slxos.v17r_2_00.brocade_netconf_ext_rpc.brocade_netconf_ext', 'pybind.slxos.v17r_2_00.brocade_netconf_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_netconf_ext_rpc.get_netconf_client_capabilities.input', 'pybind.slxos.v17s_1_02.brocade_netconf_ext_rpc.brocade_netconf_ext', 'pybind.slxos.v17s_1_02.brocade_netconf_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, session_id=session_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, session_id=session_id)
+    api_descriptor = _get_netconf_client_capabilities_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, session_id=session_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, session_id=session_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_port_channel_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_lag_rpc.get_port_channel_detail.input', 'pybind.nos.v6_0_2f.brocade_lag_rpc.brocade_lag', 'pybind.nos.v6_0_2f.brocade_lag_rpc'), ('pybind.nos.v7_2_0.brocade_lag_rpc.get_port_channel_detail.input', 'pybind.nos.v7_2_0.brocade_lag_rpc.brocade_lag', 'pybind.nos.v7_2_0.brocade_lag_rpc'), ('pybind.slxos.v17r_1_01a.brocade_lag_rpc.get_port_channel_detail.input', 'pybind.slxos.v17r_1_01a.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17r_1_01a.brocade_lag_rpc'), ('pybind.slxos.v17r_2_00.brocade_lag_rpc.get_port_channel_detail.input', 'pybind.slxos.v17r_2_00.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17r_2_00.brocade_lag_rpc'), ('pybind.slxos.v17s_1_02.brocade_lag_rpc.get_port_channel_detail.input', 'pybind.slxos.v17s_1_02.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17s_1_02.brocade_lag_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_port_channel_detail_rpc(self, aggregator_id=None, last_aggregator_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2705,21 +2864,24 @@ def get_port_channel_detail_rpc(self, aggregator_id=None, last_aggregator_id=Non
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_lag_rpc.get_port_channel_detail.input', 'pybind.nos.v6_0_2f.brocade_lag_rpc.brocade_lag', 'pybind.nos.v6_0_2f.brocade_lag_rpc'), ('pybind.nos.v7_2_0.brocade_lag_rpc.get_port_channel_detail.input', 'pybind.nos.v7_2_0.brocade_lag_rpc.brocade_lag', 'pybind.nos.v7_2_0.brocade_lag_rpc'), ('pybind.slxos.v17r_1_01a.brocade_lag_rpc.get_port_channel_detail.input', 'pybind.slxos.v17r_1_01a.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17r_1_01a.brocade_lag_rpc'), ('pybind.slxos.v17r_2_00.brocade_lag_rpc.get_port_channel_detail.input', 'pybind.slxos.v17r_2_00.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17r_2_00.brocade_lag_rpc'), ('pybind.slxos.v17s_1_02.brocade_lag_rpc.get_port_channel_detail.input', 'pybind.slxos.v17s_1_02.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17s_1_02.brocade_lag_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, aggregator_id=aggregator_id, last_aggregator_id=last_aggregator_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, aggregator_id=aggregator_id, last_aggregator_id=last_aggregator_id)
+    api_descriptor = _get_port_channel_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, aggregator_id=aggregator_id, last_aggregator_id=last_aggregator_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, aggregator_id=aggregator_id, last_aggregator_id=last_aggregator_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_port_profile_for_intf_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', 'pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc'), ('pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', 'pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.nos.v7_2_0.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', 'pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', 'pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', 'pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc')],
+    composed_child_list=[('pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', u'last_received_interface_info'), ('pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', u'last_received_interface_info'), ('pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', u'last_received_interface_info'), ('pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', u'last_received_interface_info'), ('pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', u'last_received_interface_info')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_port_profile_for_intf_rpc(self, rbridge_id=None, interface_type=None, interface_name=None, last_received_interface_info=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2815,21 +2977,24 @@ def get_port_profile_for_intf_rpc(self, rbridge_id=None, interface_type=None, in
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', 'pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc'), ('pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', 'pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.nos.v7_2_0.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', 'pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', 'pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', 'pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc')]
-    composed_child_list = [('pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', u'last_received_interface_info'), ('pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', u'last_received_interface_info'), ('pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', u'last_received_interface_info'), ('pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', u'last_received_interface_info'), ('pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.get_port_profile_for_intf.input', u'last_received_interface_info')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}, {'leafval': 'interface_type, interface_name'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id, interface_type=interface_type, interface_name=interface_name, last_received_interface_info=last_received_interface_info)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id, interface_type=interface_type, interface_name=interface_name, last_received_interface_info=last_received_interface_info)
+    api_descriptor = _get_port_profile_for_intf_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id, interface_type=interface_type, interface_name=interface_name, last_received_interface_info=last_received_interface_info)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id, interface_type=interface_type, interface_name=interface_name, last_received_interface_info=last_received_interface_info)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_port_profile_status_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.get_port_profile_status.input', 'pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc'), ('pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.get_port_profile_status.input', 'pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.nos.v7_2_0.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.get_port_profile_status.input', 'pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.get_port_profile_status.input', 'pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.get_port_profile_status.input', 'pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc')],
+    composed_child_list=[('pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.get_port_profile_status.input', u'last_received_port_profile_info'), ('pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.get_port_profile_status.input', u'last_received_port_profile_info'), ('pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.get_port_profile_status.input', u'last_received_port_profile_info'), ('pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.get_port_profile_status.input', u'last_received_port_profile_info'), ('pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.get_port_profile_status.input', u'last_received_port_profile_info')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'profile_name, profile_mac'}, {'leafval': 'profile_name, profile_mac'}, {'leafval': 'profile_name, profile_mac'}, {'leafval': 'profile_name, profile_mac'}, {'leafval': 'profile_name, profile_mac'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_port_profile_status_rpc(self, rbridge_id=None, port_profile_name=None, port_profile_status=None, last_received_port_profile_info=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2899,21 +3064,24 @@ def get_port_profile_status_rpc(self, rbridge_id=None, port_profile_name=None, p
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.get_port_profile_status.input', 'pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc'), ('pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.get_port_profile_status.input', 'pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.nos.v7_2_0.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.get_port_profile_status.input', 'pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.get_port_profile_status.input', 'pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.get_port_profile_status.input', 'pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.brocade_port_profile_ext', 'pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc')]
-    composed_child_list = [('pybind.slxos.v17r_2_00.brocade_port_profile_ext_rpc.get_port_profile_status.input', u'last_received_port_profile_info'), ('pybind.nos.v7_2_0.brocade_port_profile_ext_rpc.get_port_profile_status.input', u'last_received_port_profile_info'), ('pybind.slxos.v17r_1_01a.brocade_port_profile_ext_rpc.get_port_profile_status.input', u'last_received_port_profile_info'), ('pybind.nos.v6_0_2f.brocade_port_profile_ext_rpc.get_port_profile_status.input', u'last_received_port_profile_info'), ('pybind.slxos.v17s_1_02.brocade_port_profile_ext_rpc.get_port_profile_status.input', u'last_received_port_profile_info')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'profile_name, profile_mac'}, {'leafval': 'profile_name, profile_mac'}, {'leafval': 'profile_name, profile_mac'}, {'leafval': 'profile_name, profile_mac'}, {'leafval': 'profile_name, profile_mac'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id, port_profile_name=port_profile_name, port_profile_status=port_profile_status, last_received_port_profile_info=last_received_port_profile_info)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id, port_profile_name=port_profile_name, port_profile_status=port_profile_status, last_received_port_profile_info=last_received_port_profile_info)
+    api_descriptor = _get_port_profile_status_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id, port_profile_name=port_profile_name, port_profile_status=port_profile_status, last_received_port_profile_info=last_received_port_profile_info)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id, port_profile_name=port_profile_name, port_profile_status=port_profile_status, last_received_port_profile_info=last_received_port_profile_info)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_portchannel_info_by_intf_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_lag_rpc.get_portchannel_info_by_intf.input', 'pybind.nos.v6_0_2f.brocade_lag_rpc.brocade_lag', 'pybind.nos.v6_0_2f.brocade_lag_rpc'), ('pybind.nos.v7_2_0.brocade_lag_rpc.get_portchannel_info_by_intf.input', 'pybind.nos.v7_2_0.brocade_lag_rpc.brocade_lag', 'pybind.nos.v7_2_0.brocade_lag_rpc'), ('pybind.slxos.v17r_1_01a.brocade_lag_rpc.get_portchannel_info_by_intf.input', 'pybind.slxos.v17r_1_01a.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17r_1_01a.brocade_lag_rpc'), ('pybind.slxos.v17r_2_00.brocade_lag_rpc.get_portchannel_info_by_intf.input', 'pybind.slxos.v17r_2_00.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17r_2_00.brocade_lag_rpc'), ('pybind.slxos.v17s_1_02.brocade_lag_rpc.get_portchannel_info_by_intf.input', 'pybind.slxos.v17s_1_02.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17s_1_02.brocade_lag_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_portchannel_info_by_intf_rpc(self, interface_type=None, interface_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -2969,21 +3137,24 @@ def get_portchannel_info_by_intf_rpc(self, interface_type=None, interface_name=N
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_lag_rpc.get_portchannel_info_by_intf.input', 'pybind.nos.v6_0_2f.brocade_lag_rpc.brocade_lag', 'pybind.nos.v6_0_2f.brocade_lag_rpc'), ('pybind.nos.v7_2_0.brocade_lag_rpc.get_portchannel_info_by_intf.input', 'pybind.nos.v7_2_0.brocade_lag_rpc.brocade_lag', 'pybind.nos.v7_2_0.brocade_lag_rpc'), ('pybind.slxos.v17r_1_01a.brocade_lag_rpc.get_portchannel_info_by_intf.input', 'pybind.slxos.v17r_1_01a.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17r_1_01a.brocade_lag_rpc'), ('pybind.slxos.v17r_2_00.brocade_lag_rpc.get_portchannel_info_by_intf.input', 'pybind.slxos.v17r_2_00.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17r_2_00.brocade_lag_rpc'), ('pybind.slxos.v17s_1_02.brocade_lag_rpc.get_portchannel_info_by_intf.input', 'pybind.slxos.v17s_1_02.brocade_lag_rpc.brocade_lag', 'pybind.slxos.v17s_1_02.brocade_lag_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, interface_type=interface_type, interface_name=interface_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, interface_type=interface_type, interface_name=interface_name)
+    api_descriptor = _get_portchannel_info_by_intf_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_show_cfm_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17s_1_02.brocade_dot1ag_rpc.get_show_cfm', 'pybind.slxos.v17s_1_02.brocade_dot1ag_rpc.brocade_dot1ag', 'pybind.slxos.v17s_1_02.brocade_dot1ag_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_show_cfm_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3008,21 +3179,24 @@ def get_show_cfm_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17s_1_02.brocade_dot1ag_rpc.get_show_cfm', 'pybind.slxos.v17s_1_02.brocade_dot1ag_rpc.brocade_dot1ag', 'pybind.slxos.v17s_1_02.brocade_dot1ag_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_show_cfm_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_stp_brief_info_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.get_stp_brief_info.input', 'pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.nos.v6_0_2f.brocade_xstp_ext_rpc'), ('pybind.nos.v7_2_0.brocade_xstp_ext_rpc.get_stp_brief_info.input', 'pybind.nos.v7_2_0.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.nos.v7_2_0.brocade_xstp_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.get_stp_brief_info.input', 'pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.get_stp_brief_info.input', 'pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.get_stp_brief_info.input', 'pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc')],
+    composed_child_list=[('pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.get_stp_brief_info.input', u'last_rcvd_instance'), ('pybind.nos.v7_2_0.brocade_xstp_ext_rpc.get_stp_brief_info.input', u'last_rcvd_instance'), ('pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.get_stp_brief_info.input', u'last_rcvd_instance'), ('pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.get_stp_brief_info.input', u'last_rcvd_instance'), ('pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.get_stp_brief_info.input', u'last_rcvd_instance')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_stp_brief_info_rpc(self, last_rcvd_instance=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3060,21 +3234,24 @@ def get_stp_brief_info_rpc(self, last_rcvd_instance=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.get_stp_brief_info.input', 'pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.nos.v6_0_2f.brocade_xstp_ext_rpc'), ('pybind.nos.v7_2_0.brocade_xstp_ext_rpc.get_stp_brief_info.input', 'pybind.nos.v7_2_0.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.nos.v7_2_0.brocade_xstp_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.get_stp_brief_info.input', 'pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.get_stp_brief_info.input', 'pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.get_stp_brief_info.input', 'pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc')]
-    composed_child_list = [('pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.get_stp_brief_info.input', u'last_rcvd_instance'), ('pybind.nos.v7_2_0.brocade_xstp_ext_rpc.get_stp_brief_info.input', u'last_rcvd_instance'), ('pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.get_stp_brief_info.input', u'last_rcvd_instance'), ('pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.get_stp_brief_info.input', u'last_rcvd_instance'), ('pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.get_stp_brief_info.input', u'last_rcvd_instance')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, last_rcvd_instance=last_rcvd_instance)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, last_rcvd_instance=last_rcvd_instance)
+    api_descriptor = _get_stp_brief_info_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, last_rcvd_instance=last_rcvd_instance)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, last_rcvd_instance=last_rcvd_instance)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_stp_mst_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.get_stp_mst_detail.input', 'pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.nos.v6_0_2f.brocade_xstp_ext_rpc'), ('pybind.nos.v7_2_0.brocade_xstp_ext_rpc.get_stp_mst_detail.input', 'pybind.nos.v7_2_0.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.nos.v7_2_0.brocade_xstp_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.get_stp_mst_detail.input', 'pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.get_stp_mst_detail.input', 'pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.get_stp_mst_detail.input', 'pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc')],
+    composed_child_list=[('pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.get_stp_mst_detail.input', u'last_rcvd_instance'), ('pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.get_stp_mst_detail.input', u'last_rcvd_instance'), ('pybind.nos.v7_2_0.brocade_xstp_ext_rpc.get_stp_mst_detail.input', u'last_rcvd_instance'), ('pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.get_stp_mst_detail.input', u'last_rcvd_instance'), ('pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.get_stp_mst_detail.input', u'last_rcvd_instance')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_stp_mst_detail_rpc(self, last_rcvd_instance=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3112,21 +3289,24 @@ def get_stp_mst_detail_rpc(self, last_rcvd_instance=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.get_stp_mst_detail.input', 'pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.nos.v6_0_2f.brocade_xstp_ext_rpc'), ('pybind.nos.v7_2_0.brocade_xstp_ext_rpc.get_stp_mst_detail.input', 'pybind.nos.v7_2_0.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.nos.v7_2_0.brocade_xstp_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.get_stp_mst_detail.input', 'pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.get_stp_mst_detail.input', 'pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.get_stp_mst_detail.input', 'pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.brocade_xstp_ext', 'pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc')]
-    composed_child_list = [('pybind.slxos.v17r_2_00.brocade_xstp_ext_rpc.get_stp_mst_detail.input', u'last_rcvd_instance'), ('pybind.slxos.v17r_1_01a.brocade_xstp_ext_rpc.get_stp_mst_detail.input', u'last_rcvd_instance'), ('pybind.nos.v7_2_0.brocade_xstp_ext_rpc.get_stp_mst_detail.input', u'last_rcvd_instance'), ('pybind.slxos.v17s_1_02.brocade_xstp_ext_rpc.get_stp_mst_detail.input', u'last_rcvd_instance'), ('pybind.nos.v6_0_2f.brocade_xstp_ext_rpc.get_stp_mst_detail.input', u'last_rcvd_instance')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}, {'leafval': 'instance_id'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, last_rcvd_instance=last_rcvd_instance)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, last_rcvd_instance=last_rcvd_instance)
+    api_descriptor = _get_stp_mst_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, last_rcvd_instance=last_rcvd_instance)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, last_rcvd_instance=last_rcvd_instance)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_system_uptime_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_system_rpc.get_system_uptime.input', 'pybind.nos.v6_0_2f.brocade_system_rpc.brocade_system', 'pybind.nos.v6_0_2f.brocade_system_rpc'), ('pybind.nos.v7_2_0.brocade_system_rpc.get_system_uptime.input', 'pybind.nos.v7_2_0.brocade_system_rpc.brocade_system', 'pybind.nos.v7_2_0.brocade_system_rpc'), ('pybind.slxos.v17r_1_01a.brocade_system_rpc.get_system_uptime', 'pybind.slxos.v17r_1_01a.brocade_system_rpc.brocade_system', 'pybind.slxos.v17r_1_01a.brocade_system_rpc'), ('pybind.slxos.v17r_2_00.brocade_system_rpc.get_system_uptime', 'pybind.slxos.v17r_2_00.brocade_system_rpc.brocade_system', 'pybind.slxos.v17r_2_00.brocade_system_rpc'), ('pybind.slxos.v17s_1_02.brocade_system_rpc.get_system_uptime', 'pybind.slxos.v17s_1_02.brocade_system_rpc.brocade_system', 'pybind.slxos.v17s_1_02.brocade_system_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17r_1_01a.brocade_system_rpc.get_system_uptime": {}, "pybind.nos.v6_0_2f.brocade_system_rpc.get_system_uptime.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_system_rpc.get_system_uptime": {}, "pybind.nos.v7_2_0.brocade_system_rpc.get_system_uptime.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_2_00.brocade_system_rpc.get_system_uptime": {}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_system_uptime_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3161,21 +3341,24 @@ def get_system_uptime_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_system_rpc.get_system_uptime.input', 'pybind.nos.v6_0_2f.brocade_system_rpc.brocade_system', 'pybind.nos.v6_0_2f.brocade_system_rpc'), ('pybind.nos.v7_2_0.brocade_system_rpc.get_system_uptime.input', 'pybind.nos.v7_2_0.brocade_system_rpc.brocade_system', 'pybind.nos.v7_2_0.brocade_system_rpc'), ('pybind.slxos.v17r_1_01a.brocade_system_rpc.get_system_uptime', 'pybind.slxos.v17r_1_01a.brocade_system_rpc.brocade_system', 'pybind.slxos.v17r_1_01a.brocade_system_rpc'), ('pybind.slxos.v17r_2_00.brocade_system_rpc.get_system_uptime', 'pybind.slxos.v17r_2_00.brocade_system_rpc.brocade_system', 'pybind.slxos.v17r_2_00.brocade_system_rpc'), ('pybind.slxos.v17s_1_02.brocade_system_rpc.get_system_uptime', 'pybind.slxos.v17s_1_02.brocade_system_rpc.brocade_system', 'pybind.slxos.v17s_1_02.brocade_system_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17r_1_01a.brocade_system_rpc.get_system_uptime": {}, "pybind.nos.v6_0_2f.brocade_system_rpc.get_system_uptime.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_system_rpc.get_system_uptime": {}, "pybind.nos.v7_2_0.brocade_system_rpc.get_system_uptime.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_2_00.brocade_system_rpc.get_system_uptime": {}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _get_system_uptime_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_tunnel_info_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_tunnels_ext_rpc.get_tunnel_info.input', 'pybind.nos.v7_2_0.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.nos.v7_2_0.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc.get_tunnel_info.input', 'pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc.get_tunnel_info.input', 'pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc.get_tunnel_info.input', 'pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_tunnel_info_rpc(self, page_cursor=None, id=None, mode=None, gw_name=None, src_ip=None, dest_ip=None, config_src=None, site_name=None, admin_state=None, oper_state=None, bfd_state=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3280,21 +3463,24 @@ def get_tunnel_info_rpc(self, page_cursor=None, id=None, mode=None, gw_name=None
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_tunnels_ext_rpc.get_tunnel_info.input', 'pybind.nos.v7_2_0.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.nos.v7_2_0.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc.get_tunnel_info.input', 'pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc.get_tunnel_info.input', 'pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc.get_tunnel_info.input', 'pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, page_cursor=page_cursor, id=id, mode=mode, gw_name=gw_name, src_ip=src_ip, dest_ip=dest_ip, config_src=config_src, site_name=site_name, admin_state=admin_state, oper_state=oper_state, bfd_state=bfd_state)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, page_cursor=page_cursor, id=id, mode=mode, gw_name=gw_name, src_ip=src_ip, dest_ip=dest_ip, config_src=config_src, site_name=site_name, admin_state=admin_state, oper_state=oper_state, bfd_state=bfd_state)
+    api_descriptor = _get_tunnel_info_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, page_cursor=page_cursor, id=id, mode=mode, gw_name=gw_name, src_ip=src_ip, dest_ip=dest_ip, config_src=config_src, site_name=site_name, admin_state=admin_state, oper_state=oper_state, bfd_state=bfd_state)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, page_cursor=page_cursor, id=id, mode=mode, gw_name=gw_name, src_ip=src_ip, dest_ip=dest_ip, config_src=config_src, site_name=site_name, admin_state=admin_state, oper_state=oper_state, bfd_state=bfd_state)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_tunnel_statistics_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_tunnels_ext_rpc.get_tunnel_statistics.input', 'pybind.nos.v7_2_0.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.nos.v7_2_0.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc.get_tunnel_statistics.input', 'pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc.get_tunnel_statistics.input', 'pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc.get_tunnel_statistics.input', 'pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_tunnel_statistics_rpc(self, page_cursor=None, id=None, mode=None, gw_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3346,21 +3532,24 @@ def get_tunnel_statistics_rpc(self, page_cursor=None, id=None, mode=None, gw_nam
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_tunnels_ext_rpc.get_tunnel_statistics.input', 'pybind.nos.v7_2_0.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.nos.v7_2_0.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc.get_tunnel_statistics.input', 'pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17r_1_01a.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc.get_tunnel_statistics.input', 'pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17r_2_00.brocade_tunnels_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc.get_tunnel_statistics.input', 'pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc.brocade_tunnels_ext', 'pybind.slxos.v17s_1_02.brocade_tunnels_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, page_cursor=page_cursor, id=id, mode=mode, gw_name=gw_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, page_cursor=page_cursor, id=id, mode=mode, gw_name=gw_name)
+    api_descriptor = _get_tunnel_statistics_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, page_cursor=page_cursor, id=id, mode=mode, gw_name=gw_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, page_cursor=page_cursor, id=id, mode=mode, gw_name=gw_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_vcs_details_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vcs_rpc.get_vcs_details', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.get_vcs_details', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.get_vcs_details', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.get_vcs_details', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.get_vcs_details', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_vcs_details_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3386,21 +3575,24 @@ def get_vcs_details_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vcs_rpc.get_vcs_details', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.get_vcs_details', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.get_vcs_details', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.get_vcs_details', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.get_vcs_details', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _get_vcs_details_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_vlan_brief_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_vlan_brief.input', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_vlan_brief.input', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_vlan_brief.input', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_vlan_brief.input', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_vlan_brief.input', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_vlan_brief_rpc(self, vlan_id=None, last_rcvd_vlan_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3442,21 +3634,24 @@ def get_vlan_brief_rpc(self, vlan_id=None, last_rcvd_vlan_id=None, api_timeout='
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_interface_ext_rpc.get_vlan_brief.input', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v6_0_2f.brocade_interface_ext_rpc'), ('pybind.nos.v7_2_0.brocade_interface_ext_rpc.get_vlan_brief.input', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.nos.v7_2_0.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.get_vlan_brief.input', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_1_01a.brocade_interface_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.get_vlan_brief.input', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17r_2_00.brocade_interface_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.get_vlan_brief.input', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc.brocade_interface_ext', 'pybind.slxos.v17s_1_02.brocade_interface_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, vlan_id=vlan_id, last_rcvd_vlan_id=last_rcvd_vlan_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, vlan_id=vlan_id, last_rcvd_vlan_id=last_rcvd_vlan_id)
+    api_descriptor = _get_vlan_brief_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, vlan_id=vlan_id, last_rcvd_vlan_id=last_rcvd_vlan_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, vlan_id=vlan_id, last_rcvd_vlan_id=last_rcvd_vlan_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_vmpolicy_macaddr_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vmpolicy_macaddr.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vmpolicy_macaddr.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vmpolicy_macaddr.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vmpolicy_macaddr.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vmpolicy_macaddr.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_vmpolicy_macaddr_rpc(self, mac=None, vcenter=None, datacenter=None, last_rcvd_instance=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3512,21 +3707,24 @@ def get_vmpolicy_macaddr_rpc(self, mac=None, vcenter=None, datacenter=None, last
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vmpolicy_macaddr.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vmpolicy_macaddr.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vmpolicy_macaddr.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vmpolicy_macaddr.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vmpolicy_macaddr.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mac=mac, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mac=mac, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    api_descriptor = _get_vmpolicy_macaddr_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mac=mac, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mac=mac, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_vnetwork_dvpgs_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_dvpgs.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_dvpgs.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_dvpgs.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_dvpgs.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_dvpgs.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_vnetwork_dvpgs_rpc(self, name=None, vcenter=None, datacenter=None, last_rcvd_instance=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3582,21 +3780,24 @@ def get_vnetwork_dvpgs_rpc(self, name=None, vcenter=None, datacenter=None, last_
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_dvpgs.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_dvpgs.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_dvpgs.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_dvpgs.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_dvpgs.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    api_descriptor = _get_vnetwork_dvpgs_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_vnetwork_dvs_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_dvs.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_dvs.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_dvs.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_dvs.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_dvs.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_vnetwork_dvs_rpc(self, name=None, vcenter=None, datacenter=None, last_rcvd_instance=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3652,21 +3853,24 @@ def get_vnetwork_dvs_rpc(self, name=None, vcenter=None, datacenter=None, last_rc
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_dvs.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_dvs.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_dvs.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_dvs.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_dvs.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    api_descriptor = _get_vnetwork_dvs_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_vnetwork_hosts_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_hosts.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_hosts.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_hosts.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_hosts.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_hosts.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_vnetwork_hosts_rpc(self, vcenter=None, datacenter=None, name=None, last_rcvd_instance=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3722,21 +3926,24 @@ def get_vnetwork_hosts_rpc(self, vcenter=None, datacenter=None, name=None, last_
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_hosts.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_hosts.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_hosts.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_hosts.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_hosts.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, vcenter=vcenter, datacenter=datacenter, name=name, last_rcvd_instance=last_rcvd_instance)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, vcenter=vcenter, datacenter=datacenter, name=name, last_rcvd_instance=last_rcvd_instance)
+    api_descriptor = _get_vnetwork_hosts_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, vcenter=vcenter, datacenter=datacenter, name=name, last_rcvd_instance=last_rcvd_instance)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, vcenter=vcenter, datacenter=datacenter, name=name, last_rcvd_instance=last_rcvd_instance)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_vnetwork_portgroups_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_portgroups.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_portgroups.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_portgroups.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_portgroups.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_portgroups.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_vnetwork_portgroups_rpc(self, name=None, vcenter=None, datacenter=None, last_rcvd_instance=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3792,21 +3999,24 @@ def get_vnetwork_portgroups_rpc(self, name=None, vcenter=None, datacenter=None,
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_portgroups.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_portgroups.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_portgroups.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_portgroups.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_portgroups.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    api_descriptor = _get_vnetwork_portgroups_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_vnetwork_vms_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_vms.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_vms.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_vms.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_vms.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_vms.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_vnetwork_vms_rpc(self, name=None, vcenter=None, datacenter=None, last_rcvd_instance=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3862,21 +4072,24 @@ def get_vnetwork_vms_rpc(self, name=None, vcenter=None, datacenter=None, last_rc
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_vms.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_vms.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_vms.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_vms.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_vms.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    api_descriptor = _get_vnetwork_vms_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_get_vnetwork_vswitches_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_vswitches.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_vswitches.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_vswitches.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_vswitches.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_vswitches.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def get_vnetwork_vswitches_rpc(self, name=None, vcenter=None, datacenter=None, last_rcvd_instance=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3932,21 +4145,24 @@ def get_vnetwork_vswitches_rpc(self, name=None, vcenter=None, datacenter=None, l
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vswitch_rpc.get_vnetwork_vswitches.input', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v6_0_2f.brocade_vswitch_rpc'), ('pybind.nos.v7_2_0.brocade_vswitch_rpc.get_vnetwork_vswitches.input', 'pybind.nos.v7_2_0.brocade_vswitch_rpc.brocade_vswitch', 'pybind.nos.v7_2_0.brocade_vswitch_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.get_vnetwork_vswitches.input', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_1_01a.brocade_vswitch_rpc'), ('pybind.slxos.v17r_2_00.brocade_vswitch_rpc.get_vnetwork_vswitches.input', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17r_2_00.brocade_vswitch_rpc'), ('pybind.slxos.v17s_1_02.brocade_vswitch_rpc.get_vnetwork_vswitches.input', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc.brocade_vswitch', 'pybind.slxos.v17s_1_02.brocade_vswitch_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    api_descriptor = _get_vnetwork_vswitches_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, name=name, vcenter=vcenter, datacenter=datacenter, last_rcvd_instance=last_rcvd_instance)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_isns_get_device_brief_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_device_brief', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def isns_get_device_brief_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -3971,21 +4187,24 @@ def isns_get_device_brief_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_device_brief', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _isns_get_device_brief_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_isns_get_discovery_domain_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_discovery_domain.input', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def isns_get_discovery_domain_rpc(self, isns_dd_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4023,21 +4242,24 @@ def isns_get_discovery_domain_rpc(self, isns_dd_name=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_discovery_domain.input', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, isns_dd_name=isns_dd_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, isns_dd_name=isns_dd_name)
+    api_descriptor = _isns_get_discovery_domain_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, isns_dd_name=isns_dd_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, isns_dd_name=isns_dd_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_isns_get_discovery_domain_set_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_discovery_domain_set.input', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def isns_get_discovery_domain_set_rpc(self, isns_dds_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4075,21 +4297,24 @@ def isns_get_discovery_domain_set_rpc(self, isns_dds_name=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_discovery_domain_set.input', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, isns_dds_name=isns_dds_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, isns_dds_name=isns_dds_name)
+    api_descriptor = _isns_get_discovery_domain_set_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, isns_dds_name=isns_dds_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, isns_dds_name=isns_dds_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_isns_get_last_device_timestamp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_last_device_timestamp', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def isns_get_last_device_timestamp_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4114,21 +4339,24 @@ def isns_get_last_device_timestamp_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_last_device_timestamp', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _isns_get_last_device_timestamp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_isns_get_server_role_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_server_role', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def isns_get_server_role_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4153,21 +4381,24 @@ def isns_get_server_role_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_server_role', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _isns_get_server_role_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_isns_get_vrf_forwarding_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_vrf_forwarding.input', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def isns_get_vrf_forwarding_rpc(self, isns_vrf_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4201,21 +4432,24 @@ def isns_get_vrf_forwarding_rpc(self, isns_vrf_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_isns_ext_rpc.isns_get_vrf_forwarding.input', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc.brocade_isns_ext', 'pybind.nos.v7_2_0.brocade_isns_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, isns_vrf_id=isns_vrf_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, isns_vrf_id=isns_vrf_id)
+    api_descriptor = _isns_get_vrf_forwarding_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, isns_vrf_id=isns_vrf_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, isns_vrf_id=isns_vrf_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_l2traceroute_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_trilloam_rpc.l2traceroute.input', 'pybind.nos.v6_0_2f.brocade_trilloam_rpc.brocade_trilloam', 'pybind.nos.v6_0_2f.brocade_trilloam_rpc'), ('pybind.nos.v7_2_0.brocade_trilloam_rpc.l2traceroute.input', 'pybind.nos.v7_2_0.brocade_trilloam_rpc.brocade_trilloam', 'pybind.nos.v7_2_0.brocade_trilloam_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def l2traceroute_rpc(self, src_mac=None, dest_mac=None, vlan_id=None, rbridge_id=None, src_ip=None, dest_ip=None, l4protocol=None, l4_src_port=None, l4_dest_port=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4301,21 +4535,24 @@ def l2traceroute_rpc(self, src_mac=None, dest_mac=None, vlan_id=None, rbridge_id
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_trilloam_rpc.l2traceroute.input', 'pybind.nos.v6_0_2f.brocade_trilloam_rpc.brocade_trilloam', 'pybind.nos.v6_0_2f.brocade_trilloam_rpc'), ('pybind.nos.v7_2_0.brocade_trilloam_rpc.l2traceroute.input', 'pybind.nos.v7_2_0.brocade_trilloam_rpc.brocade_trilloam', 'pybind.nos.v7_2_0.brocade_trilloam_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, src_mac=src_mac, dest_mac=dest_mac, vlan_id=vlan_id, rbridge_id=rbridge_id, src_ip=src_ip, dest_ip=dest_ip, l4protocol=l4protocol, l4_src_port=l4_src_port, l4_dest_port=l4_dest_port)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, src_mac=src_mac, dest_mac=dest_mac, vlan_id=vlan_id, rbridge_id=rbridge_id, src_ip=src_ip, dest_ip=dest_ip, l4protocol=l4protocol, l4_src_port=l4_src_port, l4_dest_port=l4_dest_port)
+    api_descriptor = _l2traceroute_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, src_mac=src_mac, dest_mac=dest_mac, vlan_id=vlan_id, rbridge_id=rbridge_id, src_ip=src_ip, dest_ip=dest_ip, l4protocol=l4protocol, l4_src_port=l4_src_port, l4_dest_port=l4_dest_port)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, src_mac=src_mac, dest_mac=dest_mac, vlan_id=vlan_id, rbridge_id=rbridge_id, src_ip=src_ip, dest_ip=dest_ip, l4protocol=l4protocol, l4_src_port=l4_src_port, l4_dest_port=l4_dest_port)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_l2traceroute_result_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_trilloam_rpc.l2traceroute_result.input', 'pybind.nos.v6_0_2f.brocade_trilloam_rpc.brocade_trilloam', 'pybind.nos.v6_0_2f.brocade_trilloam_rpc'), ('pybind.nos.v7_2_0.brocade_trilloam_rpc.l2traceroute_result.input', 'pybind.nos.v7_2_0.brocade_trilloam_rpc.brocade_trilloam', 'pybind.nos.v7_2_0.brocade_trilloam_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def l2traceroute_result_rpc(self, session_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4349,21 +4586,24 @@ def l2traceroute_result_rpc(self, session_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_trilloam_rpc.l2traceroute_result.input', 'pybind.nos.v6_0_2f.brocade_trilloam_rpc.brocade_trilloam', 'pybind.nos.v6_0_2f.brocade_trilloam_rpc'), ('pybind.nos.v7_2_0.brocade_trilloam_rpc.l2traceroute_result.input', 'pybind.nos.v7_2_0.brocade_trilloam_rpc.brocade_trilloam', 'pybind.nos.v7_2_0.brocade_trilloam_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, session_id=session_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, session_id=session_id)
+    api_descriptor = _l2traceroute_result_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, session_id=session_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, session_id=session_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_logical_chassis_fwdl_sanity_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_firmware_rpc.logical_chassis_fwdl_sanity.input', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.logical_chassis_fwdl_sanity.input', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def logical_chassis_fwdl_sanity_rpc(self, user=None, password=None, host=None, directory=None, file=None, rbridge_id=None, auto_activate=None, coldboot=None, protocol=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4425,21 +4665,24 @@ def logical_chassis_fwdl_sanity_rpc(self, user=None, password=None, host=None, d
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_firmware_rpc.logical_chassis_fwdl_sanity.input', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.logical_chassis_fwdl_sanity.input', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, user=user, password=password, host=host, directory=directory, file=file, rbridge_id=rbridge_id, auto_activate=auto_activate, coldboot=coldboot, protocol=protocol)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, user=user, password=password, host=host, directory=directory, file=file, rbridge_id=rbridge_id, auto_activate=auto_activate, coldboot=coldboot, protocol=protocol)
+    api_descriptor = _logical_chassis_fwdl_sanity_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, user=user, password=password, host=host, directory=directory, file=file, rbridge_id=rbridge_id, auto_activate=auto_activate, coldboot=coldboot, protocol=protocol)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, user=user, password=password, host=host, directory=directory, file=file, rbridge_id=rbridge_id, auto_activate=auto_activate, coldboot=coldboot, protocol=protocol)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_logical_chassis_fwdl_status_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_firmware_rpc.logical_chassis_fwdl_status.input', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.logical_chassis_fwdl_status.input', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def logical_chassis_fwdl_status_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4473,21 +4716,24 @@ def logical_chassis_fwdl_status_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_firmware_rpc.logical_chassis_fwdl_status.input', 'pybind.nos.v6_0_2f.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v6_0_2f.brocade_firmware_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_rpc.logical_chassis_fwdl_status.input', 'pybind.nos.v7_2_0.brocade_firmware_rpc.brocade_firmware', 'pybind.nos.v7_2_0.brocade_firmware_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _logical_chassis_fwdl_status_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_maps_get_all_policy_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_maps_ext_rpc.maps_get_all_policy.input', 'pybind.nos.v6_0_2f.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.nos.v6_0_2f.brocade_maps_ext_rpc'), ('pybind.nos.v7_2_0.brocade_maps_ext_rpc.maps_get_all_policy.input', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc.maps_get_all_policy.input', 'pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_maps_ext_rpc.maps_get_all_policy.input', 'pybind.slxos.v17r_2_00.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17r_2_00.brocade_maps_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_maps_ext_rpc.maps_get_all_policy.input', 'pybind.slxos.v17s_1_02.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17s_1_02.brocade_maps_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def maps_get_all_policy_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4522,21 +4768,24 @@ def maps_get_all_policy_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_maps_ext_rpc.maps_get_all_policy.input', 'pybind.nos.v6_0_2f.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.nos.v6_0_2f.brocade_maps_ext_rpc'), ('pybind.nos.v7_2_0.brocade_maps_ext_rpc.maps_get_all_policy.input', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc.maps_get_all_policy.input', 'pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_maps_ext_rpc.maps_get_all_policy.input', 'pybind.slxos.v17r_2_00.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17r_2_00.brocade_maps_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_maps_ext_rpc.maps_get_all_policy.input', 'pybind.slxos.v17s_1_02.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17s_1_02.brocade_maps_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _maps_get_all_policy_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_maps_get_default_rules_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_maps_ext_rpc.maps_get_default_rules.input', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def maps_get_default_rules_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4570,21 +4819,24 @@ def maps_get_default_rules_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_maps_ext_rpc.maps_get_default_rules.input', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _maps_get_default_rules_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_maps_get_rules_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_maps_ext_rpc.maps_get_rules.input', 'pybind.nos.v6_0_2f.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.nos.v6_0_2f.brocade_maps_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc.maps_get_rules.input', 'pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_maps_ext_rpc.maps_get_rules.input', 'pybind.slxos.v17r_2_00.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17r_2_00.brocade_maps_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_maps_ext_rpc.maps_get_rules.input', 'pybind.slxos.v17s_1_02.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17s_1_02.brocade_maps_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def maps_get_rules_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4619,21 +4871,24 @@ def maps_get_rules_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_maps_ext_rpc.maps_get_rules.input', 'pybind.nos.v6_0_2f.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.nos.v6_0_2f.brocade_maps_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc.maps_get_rules.input', 'pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17r_1_01a.brocade_maps_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_maps_ext_rpc.maps_get_rules.input', 'pybind.slxos.v17r_2_00.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17r_2_00.brocade_maps_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_maps_ext_rpc.maps_get_rules.input', 'pybind.slxos.v17s_1_02.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.slxos.v17s_1_02.brocade_maps_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _maps_get_rules_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_maps_re_apply_policy_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_maps_ext_rpc.maps_re_apply_policy.input', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def maps_re_apply_policy_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4667,21 +4922,24 @@ def maps_re_apply_policy_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_maps_ext_rpc.maps_re_apply_policy.input', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc.brocade_maps_ext', 'pybind.nos.v7_2_0.brocade_maps_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _maps_re_apply_policy_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_mpls_adjust_bandwidth_lsp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.mpls_adjust_bandwidth_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.mpls_adjust_bandwidth_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.mpls_adjust_bandwidth_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def mpls_adjust_bandwidth_lsp_rpc(self, lsp_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4715,21 +4973,24 @@ def mpls_adjust_bandwidth_lsp_rpc(self, lsp_name=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.mpls_adjust_bandwidth_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.mpls_adjust_bandwidth_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.mpls_adjust_bandwidth_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, lsp_name=lsp_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, lsp_name=lsp_name)
+    api_descriptor = _mpls_adjust_bandwidth_lsp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, lsp_name=lsp_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, lsp_name=lsp_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_mpls_adjust_bandwidth_lsp_all_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17s_1_02.brocade_mpls_rpc.mpls_adjust_bandwidth_lsp_all', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def mpls_adjust_bandwidth_lsp_all_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4754,21 +5015,24 @@ def mpls_adjust_bandwidth_lsp_all_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17s_1_02.brocade_mpls_rpc.mpls_adjust_bandwidth_lsp_all', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _mpls_adjust_bandwidth_lsp_all_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_mpls_reopt_lsp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.mpls_reopt_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.mpls_reopt_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.mpls_reopt_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def mpls_reopt_lsp_rpc(self, mpls_reoptimize_lsp_name_in=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4802,21 +5066,24 @@ def mpls_reopt_lsp_rpc(self, mpls_reoptimize_lsp_name_in=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.mpls_reopt_lsp.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.mpls_reopt_lsp.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.mpls_reopt_lsp.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mpls_reoptimize_lsp_name_in=mpls_reoptimize_lsp_name_in)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mpls_reoptimize_lsp_name_in=mpls_reoptimize_lsp_name_in)
+    api_descriptor = _mpls_reopt_lsp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mpls_reoptimize_lsp_name_in=mpls_reoptimize_lsp_name_in)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mpls_reoptimize_lsp_name_in=mpls_reoptimize_lsp_name_in)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_no_vcs_rbridge_context_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vcs_rpc.no_vcs_rbridge_context', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.no_vcs_rbridge_context', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.no_vcs_rbridge_context', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.no_vcs_rbridge_context', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.no_vcs_rbridge_context', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def no_vcs_rbridge_context_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -4842,21 +5109,24 @@ def no_vcs_rbridge_context_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vcs_rpc.no_vcs_rbridge_context', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.no_vcs_rbridge_context', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.no_vcs_rbridge_context', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.no_vcs_rbridge_context', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.no_vcs_rbridge_context', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _no_vcs_rbridge_context_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_ping_mpls_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.ping_mpls.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.ping_mpls.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.ping_mpls.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17r_2_00.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'ping_params'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.ping_mpls.input', u'ping_mpls_input'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'traceroute_params'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'oam_params'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'ping_params'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'traceroute_params'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'oam_params'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.ping_mpls.input', u'ping_mpls_input'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'traceroute_params'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'oam_params'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'ping_params'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.ping_mpls.input', u'ping_mpls_input')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'count, detail, detour, standby'}, {'leafval': 'ping_mpls_rsvp_lsp, ping_mpls_rsvp_session_src, ping_mpls_rsvp_session_dst, ping_mpls_rsvp_session_id, ping_mpls_ldp_prefix, ping_mpls_ldp_prefix_address'}, {'leafval': 'dsmap, min_ttl, max_ttl, nexthop'}, {'leafval': 'destination, reply_mode, reply_tos, size, source, timeout'}, {'leafval': 'count, detail, detour, standby'}, {'leafval': 'dsmap, min_ttl, max_ttl, nexthop'}, {'leafval': 'destination, reply_mode, reply_tos, size, source, timeout'}, {'leafval': 'ping_mpls_rsvp_lsp, ping_mpls_rsvp_session_src, ping_mpls_rsvp_session_dst, ping_mpls_rsvp_session_id, ping_mpls_ldp_prefix, ping_mpls_ldp_prefix_address'}, {'leafval': 'dsmap, min_ttl, max_ttl, nexthop'}, {'leafval': 'destination, reply_mode, reply_tos, size, source, timeout'}, {'leafval': 'count, detail, detour, standby'}, {'leafval': 'ping_mpls_rsvp_lsp, ping_mpls_rsvp_session_src, ping_mpls_rsvp_session_dst, ping_mpls_rsvp_session_id, ping_mpls_ldp_prefix, ping_mpls_ldp_prefix_address'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def ping_mpls_rpc(self, ping_params=None, traceroute_params=None, oam_params=None, ping_mpls_input=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5030,21 +5300,24 @@ def ping_mpls_rpc(self, ping_params=None, traceroute_params=None, oam_params=Non
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.ping_mpls.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.ping_mpls.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.ping_mpls.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17r_2_00.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'ping_params'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.ping_mpls.input', u'ping_mpls_input'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'traceroute_params'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'oam_params'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'ping_params'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'traceroute_params'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'oam_params'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.ping_mpls.input', u'ping_mpls_input'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'traceroute_params'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'oam_params'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.ping_mpls.input.ping_mpls_input', u'ping_params'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.ping_mpls.input', u'ping_mpls_input')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'count, detail, detour, standby'}, {'leafval': 'ping_mpls_rsvp_lsp, ping_mpls_rsvp_session_src, ping_mpls_rsvp_session_dst, ping_mpls_rsvp_session_id, ping_mpls_ldp_prefix, ping_mpls_ldp_prefix_address'}, {'leafval': 'dsmap, min_ttl, max_ttl, nexthop'}, {'leafval': 'destination, reply_mode, reply_tos, size, source, timeout'}, {'leafval': 'count, detail, detour, standby'}, {'leafval': 'dsmap, min_ttl, max_ttl, nexthop'}, {'leafval': 'destination, reply_mode, reply_tos, size, source, timeout'}, {'leafval': 'ping_mpls_rsvp_lsp, ping_mpls_rsvp_session_src, ping_mpls_rsvp_session_dst, ping_mpls_rsvp_session_id, ping_mpls_ldp_prefix, ping_mpls_ldp_prefix_address'}, {'leafval': 'dsmap, min_ttl, max_ttl, nexthop'}, {'leafval': 'destination, reply_mode, reply_tos, size, source, timeout'}, {'leafval': 'count, detail, detour, standby'}, {'leafval': 'ping_mpls_rsvp_lsp, ping_mpls_rsvp_session_src, ping_mpls_rsvp_session_dst, ping_mpls_rsvp_session_id, ping_mpls_ldp_prefix, ping_mpls_ldp_prefix_address'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ping_params=ping_params, traceroute_params=traceroute_params, oam_params=oam_params, ping_mpls_input=ping_mpls_input)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ping_params=ping_params, traceroute_params=traceroute_params, oam_params=oam_params, ping_mpls_input=ping_mpls_input)
+    api_descriptor = _ping_mpls_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ping_params=ping_params, traceroute_params=traceroute_params, oam_params=oam_params, ping_mpls_input=ping_mpls_input)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ping_params=ping_params, traceroute_params=traceroute_params, oam_params=oam_params, ping_mpls_input=ping_mpls_input)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_redundancy_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v7_2_0.brocade_ha_rpc.redundancy.input', 'pybind.nos.v7_2_0.brocade_ha_rpc.brocade_ha', 'pybind.nos.v7_2_0.brocade_ha_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def redundancy_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5078,21 +5351,24 @@ def redundancy_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v7_2_0.brocade_ha_rpc.redundancy.input', 'pybind.nos.v7_2_0.brocade_ha_rpc.brocade_ha', 'pybind.nos.v7_2_0.brocade_ha_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _redundancy_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_reload_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_ha_rpc.reload.input', 'pybind.nos.v6_0_2f.brocade_ha_rpc.brocade_ha', 'pybind.nos.v6_0_2f.brocade_ha_rpc'), ('pybind.nos.v7_2_0.brocade_ha_rpc.reload.input', 'pybind.nos.v7_2_0.brocade_ha_rpc.brocade_ha', 'pybind.nos.v7_2_0.brocade_ha_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ha_rpc.reload.input', 'pybind.slxos.v17r_1_01a.brocade_ha_rpc.brocade_ha', 'pybind.slxos.v17r_1_01a.brocade_ha_rpc'), ('pybind.slxos.v17r_2_00.brocade_ha_rpc.reload.input', 'pybind.slxos.v17r_2_00.brocade_ha_rpc.brocade_ha', 'pybind.slxos.v17r_2_00.brocade_ha_rpc'), ('pybind.slxos.v17s_1_02.brocade_ha_rpc.reload.input', 'pybind.slxos.v17s_1_02.brocade_ha_rpc.brocade_ha', 'pybind.slxos.v17s_1_02.brocade_ha_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17r_2_00.brocade_ha_rpc.reload.input": {}, "pybind.nos.v7_2_0.brocade_ha_rpc.reload.input": {"standby": "standby", "rbridge_id": "rbridge_id", "system": "system"}, "pybind.slxos.v17s_1_02.brocade_ha_rpc.reload.input": {"standby": "standby", "system": "system"}, "pybind.slxos.v17r_1_01a.brocade_ha_rpc.reload.input": {}, "pybind.nos.v6_0_2f.brocade_ha_rpc.reload.input": {"standby": "standby", "rbridge_id": "rbridge_id", "system": "system"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def reload_rpc(self, rbridge_id=None, system=None, standby=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5133,21 +5409,24 @@ def reload_rpc(self, rbridge_id=None, system=None, standby=None, api_timeout='')
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_ha_rpc.reload.input', 'pybind.nos.v6_0_2f.brocade_ha_rpc.brocade_ha', 'pybind.nos.v6_0_2f.brocade_ha_rpc'), ('pybind.nos.v7_2_0.brocade_ha_rpc.reload.input', 'pybind.nos.v7_2_0.brocade_ha_rpc.brocade_ha', 'pybind.nos.v7_2_0.brocade_ha_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ha_rpc.reload.input', 'pybind.slxos.v17r_1_01a.brocade_ha_rpc.brocade_ha', 'pybind.slxos.v17r_1_01a.brocade_ha_rpc'), ('pybind.slxos.v17r_2_00.brocade_ha_rpc.reload.input', 'pybind.slxos.v17r_2_00.brocade_ha_rpc.brocade_ha', 'pybind.slxos.v17r_2_00.brocade_ha_rpc'), ('pybind.slxos.v17s_1_02.brocade_ha_rpc.reload.input', 'pybind.slxos.v17s_1_02.brocade_ha_rpc.brocade_ha', 'pybind.slxos.v17s_1_02.brocade_ha_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17r_2_00.brocade_ha_rpc.reload.input": {}, "pybind.nos.v7_2_0.brocade_ha_rpc.reload.input": {"standby": "standby", "rbridge_id": "rbridge_id", "system": "system"}, "pybind.slxos.v17s_1_02.brocade_ha_rpc.reload.input": {"standby": "standby", "system": "system"}, "pybind.slxos.v17r_1_01a.brocade_ha_rpc.reload.input": {}, "pybind.nos.v6_0_2f.brocade_ha_rpc.reload.input": {"standby": "standby", "rbridge_id": "rbridge_id", "system": "system"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id, system=system, standby=standby)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id, system=system, standby=standby)
+    api_descriptor = _reload_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id, system=system, standby=standby)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id, system=system, standby=standby)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_set_http_application_url_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_http_redirect_rpc.set_http_application_url.input', 'pybind.nos.v6_0_2f.brocade_http_redirect_rpc.brocade_http_redirect', 'pybind.nos.v6_0_2f.brocade_http_redirect_rpc'), ('pybind.nos.v7_2_0.brocade_http_redirect_rpc.set_http_application_url.input', 'pybind.nos.v7_2_0.brocade_http_redirect_rpc.brocade_http_redirect', 'pybind.nos.v7_2_0.brocade_http_redirect_rpc'), ('pybind.slxos.v17r_1_01a.brocade_http_redirect_rpc.set_http_application_url.input', 'pybind.slxos.v17r_1_01a.brocade_http_redirect_rpc.brocade_http_redirect', 'pybind.slxos.v17r_1_01a.brocade_http_redirect_rpc'), ('pybind.slxos.v17r_2_00.brocade_http_redirect_rpc.set_http_application_url.input', 'pybind.slxos.v17r_2_00.brocade_http_redirect_rpc.brocade_http_redirect', 'pybind.slxos.v17r_2_00.brocade_http_redirect_rpc'), ('pybind.slxos.v17s_1_02.brocade_http_redirect_rpc.set_http_application_url.input', 'pybind.slxos.v17s_1_02.brocade_http_redirect_rpc.brocade_http_redirect', 'pybind.slxos.v17s_1_02.brocade_http_redirect_rpc')],
+    composed_child_list=[('pybind.slxos.v17r_2_00.brocade_http_redirect_rpc.set_http_application_url.input', u'config_http_app_url'), ('pybind.nos.v7_2_0.brocade_http_redirect_rpc.set_http_application_url.input', u'config_http_app_url'), ('pybind.slxos.v17s_1_02.brocade_http_redirect_rpc.set_http_application_url.input', u'config_http_app_url'), ('pybind.nos.v6_0_2f.brocade_http_redirect_rpc.set_http_application_url.input', u'config_http_app_url'), ('pybind.slxos.v17r_1_01a.brocade_http_redirect_rpc.set_http_application_url.input', u'config_http_app_url')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'url, op_type'}, {'leafval': 'url, op_type'}, {'leafval': 'url, op_type'}, {'leafval': 'url, op_type'}, {'leafval': 'url, op_type'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def set_http_application_url_rpc(self, config_http_app_url=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5192,21 +5471,24 @@ def set_http_application_url_rpc(self, config_http_app_url=None, api_timeout='')
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_http_redirect_rpc.set_http_application_url.input', 'pybind.nos.v6_0_2f.brocade_http_redirect_rpc.brocade_http_redirect', 'pybind.nos.v6_0_2f.brocade_http_redirect_rpc'), ('pybind.nos.v7_2_0.brocade_http_redirect_rpc.set_http_application_url.input', 'pybind.nos.v7_2_0.brocade_http_redirect_rpc.brocade_http_redirect', 'pybind.nos.v7_2_0.brocade_http_redirect_rpc'), ('pybind.slxos.v17r_1_01a.brocade_http_redirect_rpc.set_http_application_url.input', 'pybind.slxos.v17r_1_01a.brocade_http_redirect_rpc.brocade_http_redirect', 'pybind.slxos.v17r_1_01a.brocade_http_redirect_rpc'), ('pybind.slxos.v17r_2_00.brocade_http_redirect_rpc.set_http_application_url.input', 'pybind.slxos.v17r_2_00.brocade_http_redirect_rpc.brocade_http_redirect', 'pybind.slxos.v17r_2_00.brocade_http_redirect_rpc'), ('pybind.slxos.v17s_1_02.brocade_http_redirect_rpc.set_http_application_url.input', 'pybind.slxos.v17s_1_02.brocade_http_redirect_rpc.brocade_http_redirect', 'pybind.slxos.v17s_1_02.brocade_http_redirect_rpc')]
-    composed_child_list = [('pybind.slxos.v17r_2_00.brocade_http_redirect_rpc.set_http_application_url.input', u'config_http_app_url'), ('pybind.nos.v7_2_0.brocade_http_redirect_rpc.set_http_application_url.input', u'config_http_app_url'), ('pybind.slxos.v17s_1_02.brocade_http_redirect_rpc.set_http_application_url.input', u'config_http_app_url'), ('pybind.nos.v6_0_2f.brocade_http_redirect_rpc.set_http_application_url.input', u'config_http_app_url'), ('pybind.slxos.v17r_1_01a.brocade_http_redirect_rpc.set_http_application_url.input', u'config_http_app_url')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'url, op_type'}, {'leafval': 'url, op_type'}, {'leafval': 'url, op_type'}, {'leafval': 'url, op_type'}, {'leafval': 'url, op_type'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, config_http_app_url=config_http_app_url)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, config_http_app_url=config_http_app_url)
+    api_descriptor = _set_http_application_url_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, config_http_app_url=config_http_app_url)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, config_http_app_url=config_http_app_url)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_bare_metal_state_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_preprovision_rpc.show_bare_metal_state', 'pybind.nos.v6_0_2f.brocade_preprovision_rpc.brocade_preprovision', 'pybind.nos.v6_0_2f.brocade_preprovision_rpc'), ('pybind.nos.v7_2_0.brocade_preprovision_rpc.show_bare_metal_state', 'pybind.nos.v7_2_0.brocade_preprovision_rpc.brocade_preprovision', 'pybind.nos.v7_2_0.brocade_preprovision_rpc'), ('pybind.slxos.v17r_1_01a.brocade_preprovision_rpc.show_bare_metal_state', 'pybind.slxos.v17r_1_01a.brocade_preprovision_rpc.brocade_preprovision', 'pybind.slxos.v17r_1_01a.brocade_preprovision_rpc'), ('pybind.slxos.v17r_2_00.brocade_preprovision_rpc.show_bare_metal_state', 'pybind.slxos.v17r_2_00.brocade_preprovision_rpc.brocade_preprovision', 'pybind.slxos.v17r_2_00.brocade_preprovision_rpc'), ('pybind.slxos.v17s_1_02.brocade_preprovision_rpc.show_bare_metal_state', 'pybind.slxos.v17s_1_02.brocade_preprovision_rpc.brocade_preprovision', 'pybind.slxos.v17s_1_02.brocade_preprovision_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_bare_metal_state_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5232,21 +5514,24 @@ def show_bare_metal_state_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_preprovision_rpc.show_bare_metal_state', 'pybind.nos.v6_0_2f.brocade_preprovision_rpc.brocade_preprovision', 'pybind.nos.v6_0_2f.brocade_preprovision_rpc'), ('pybind.nos.v7_2_0.brocade_preprovision_rpc.show_bare_metal_state', 'pybind.nos.v7_2_0.brocade_preprovision_rpc.brocade_preprovision', 'pybind.nos.v7_2_0.brocade_preprovision_rpc'), ('pybind.slxos.v17r_1_01a.brocade_preprovision_rpc.show_bare_metal_state', 'pybind.slxos.v17r_1_01a.brocade_preprovision_rpc.brocade_preprovision', 'pybind.slxos.v17r_1_01a.brocade_preprovision_rpc'), ('pybind.slxos.v17r_2_00.brocade_preprovision_rpc.show_bare_metal_state', 'pybind.slxos.v17r_2_00.brocade_preprovision_rpc.brocade_preprovision', 'pybind.slxos.v17r_2_00.brocade_preprovision_rpc'), ('pybind.slxos.v17s_1_02.brocade_preprovision_rpc.show_bare_metal_state', 'pybind.slxos.v17s_1_02.brocade_preprovision_rpc.brocade_preprovision', 'pybind.slxos.v17s_1_02.brocade_preprovision_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_bare_metal_state_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_clock_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_clock_rpc.show_clock.input', 'pybind.nos.v6_0_2f.brocade_clock_rpc.brocade_clock', 'pybind.nos.v6_0_2f.brocade_clock_rpc'), ('pybind.nos.v7_2_0.brocade_clock_rpc.show_clock.input', 'pybind.nos.v7_2_0.brocade_clock_rpc.brocade_clock', 'pybind.nos.v7_2_0.brocade_clock_rpc'), ('pybind.slxos.v17r_1_01a.brocade_clock_rpc.show_clock', 'pybind.slxos.v17r_1_01a.brocade_clock_rpc.brocade_clock', 'pybind.slxos.v17r_1_01a.brocade_clock_rpc'), ('pybind.slxos.v17r_2_00.brocade_clock_rpc.show_clock', 'pybind.slxos.v17r_2_00.brocade_clock_rpc.brocade_clock', 'pybind.slxos.v17r_2_00.brocade_clock_rpc'), ('pybind.slxos.v17s_1_02.brocade_clock_rpc.show_clock', 'pybind.slxos.v17s_1_02.brocade_clock_rpc.brocade_clock', 'pybind.slxos.v17s_1_02.brocade_clock_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.nos.v6_0_2f.brocade_clock_rpc.show_clock.input": {"rbridge_id": "rbridge_id"}, "pybind.nos.v7_2_0.brocade_clock_rpc.show_clock.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_clock_rpc.show_clock": {}, "pybind.slxos.v17r_2_00.brocade_clock_rpc.show_clock": {}, "pybind.slxos.v17r_1_01a.brocade_clock_rpc.show_clock": {}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_clock_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5281,21 +5566,24 @@ def show_clock_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_clock_rpc.show_clock.input', 'pybind.nos.v6_0_2f.brocade_clock_rpc.brocade_clock', 'pybind.nos.v6_0_2f.brocade_clock_rpc'), ('pybind.nos.v7_2_0.brocade_clock_rpc.show_clock.input', 'pybind.nos.v7_2_0.brocade_clock_rpc.brocade_clock', 'pybind.nos.v7_2_0.brocade_clock_rpc'), ('pybind.slxos.v17r_1_01a.brocade_clock_rpc.show_clock', 'pybind.slxos.v17r_1_01a.brocade_clock_rpc.brocade_clock', 'pybind.slxos.v17r_1_01a.brocade_clock_rpc'), ('pybind.slxos.v17r_2_00.brocade_clock_rpc.show_clock', 'pybind.slxos.v17r_2_00.brocade_clock_rpc.brocade_clock', 'pybind.slxos.v17r_2_00.brocade_clock_rpc'), ('pybind.slxos.v17s_1_02.brocade_clock_rpc.show_clock', 'pybind.slxos.v17s_1_02.brocade_clock_rpc.brocade_clock', 'pybind.slxos.v17s_1_02.brocade_clock_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.nos.v6_0_2f.brocade_clock_rpc.show_clock.input": {"rbridge_id": "rbridge_id"}, "pybind.nos.v7_2_0.brocade_clock_rpc.show_clock.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_clock_rpc.show_clock": {}, "pybind.slxos.v17r_2_00.brocade_clock_rpc.show_clock": {}, "pybind.slxos.v17r_1_01a.brocade_clock_rpc.show_clock": {}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _show_clock_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_cluster_management_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_2_00.brocade_cluster_rpc.show_cluster_management', 'pybind.slxos.v17r_2_00.brocade_cluster_rpc.brocade_cluster', 'pybind.slxos.v17r_2_00.brocade_cluster_rpc'), ('pybind.slxos.v17s_1_02.brocade_cluster_rpc.show_cluster_management', 'pybind.slxos.v17s_1_02.brocade_cluster_rpc.brocade_cluster', 'pybind.slxos.v17s_1_02.brocade_cluster_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_cluster_management_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5320,21 +5608,24 @@ def show_cluster_management_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_2_00.brocade_cluster_rpc.show_cluster_management', 'pybind.slxos.v17r_2_00.brocade_cluster_rpc.brocade_cluster', 'pybind.slxos.v17r_2_00.brocade_cluster_rpc'), ('pybind.slxos.v17s_1_02.brocade_cluster_rpc.show_cluster_management', 'pybind.slxos.v17s_1_02.brocade_cluster_rpc.brocade_cluster', 'pybind.slxos.v17s_1_02.brocade_cluster_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_cluster_management_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_fabric_trunk_info_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_fabric_service_rpc.show_fabric_trunk_info.input', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc'), ('pybind.nos.v7_2_0.brocade_fabric_service_rpc.show_fabric_trunk_info.input', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.show_fabric_trunk_info.input', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc'), ('pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.show_fabric_trunk_info.input', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.show_fabric_trunk_info.input": {"all": "all", "rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.show_fabric_trunk_info.input": {"all": "all", "rbridge_id": "rbridge_id"}, "pybind.nos.v6_0_2f.brocade_fabric_service_rpc.show_fabric_trunk_info.input": {"all": "all", "rbridge_id": "rbridge_id"}, "pybind.nos.v7_2_0.brocade_fabric_service_rpc.show_fabric_trunk_info.input": {}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_fabric_trunk_info_rpc(self, rbridge_id=None, all=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5372,21 +5663,24 @@ def show_fabric_trunk_info_rpc(self, rbridge_id=None, all=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_fabric_service_rpc.show_fabric_trunk_info.input', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc'), ('pybind.nos.v7_2_0.brocade_fabric_service_rpc.show_fabric_trunk_info.input', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.show_fabric_trunk_info.input', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc'), ('pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.show_fabric_trunk_info.input', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.show_fabric_trunk_info.input": {"all": "all", "rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.show_fabric_trunk_info.input": {"all": "all", "rbridge_id": "rbridge_id"}, "pybind.nos.v6_0_2f.brocade_fabric_service_rpc.show_fabric_trunk_info.input": {"all": "all", "rbridge_id": "rbridge_id"}, "pybind.nos.v7_2_0.brocade_fabric_service_rpc.show_fabric_trunk_info.input": {}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id, all=all)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id, all=all)
+    api_descriptor = _show_fabric_trunk_info_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id, all=all)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id, all=all)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_fibrechannel_interface_info_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_fabric_service_rpc.show_fibrechannel_interface_info.input', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc'), ('pybind.nos.v7_2_0.brocade_fabric_service_rpc.show_fibrechannel_interface_info.input', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.show_fibrechannel_interface_info.input', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc'), ('pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.show_fibrechannel_interface_info.input', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_fibrechannel_interface_info_rpc(self, all=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5417,21 +5711,24 @@ def show_fibrechannel_interface_info_rpc(self, all=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_fabric_service_rpc.show_fibrechannel_interface_info.input', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc'), ('pybind.nos.v7_2_0.brocade_fabric_service_rpc.show_fibrechannel_interface_info.input', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.show_fibrechannel_interface_info.input', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc'), ('pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.show_fibrechannel_interface_info.input', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, all=all)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, all=all)
+    api_descriptor = _show_fibrechannel_interface_info_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, all=all)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, all=all)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_firmware_version_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_firmware_ext_rpc.show_firmware_version.input', 'pybind.nos.v6_0_2f.brocade_firmware_ext_rpc.brocade_firmware_ext', 'pybind.nos.v6_0_2f.brocade_firmware_ext_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_ext_rpc.show_firmware_version.input', 'pybind.nos.v7_2_0.brocade_firmware_ext_rpc.brocade_firmware_ext', 'pybind.nos.v7_2_0.brocade_firmware_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_firmware_ext_rpc.show_firmware_version', 'pybind.slxos.v17r_1_01a.brocade_firmware_ext_rpc.brocade_firmware_ext', 'pybind.slxos.v17r_1_01a.brocade_firmware_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_firmware_ext_rpc.show_firmware_version', 'pybind.slxos.v17r_2_00.brocade_firmware_ext_rpc.brocade_firmware_ext', 'pybind.slxos.v17r_2_00.brocade_firmware_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_firmware_ext_rpc.show_firmware_version', 'pybind.slxos.v17s_1_02.brocade_firmware_ext_rpc.brocade_firmware_ext', 'pybind.slxos.v17s_1_02.brocade_firmware_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17r_2_00.brocade_firmware_ext_rpc.show_firmware_version": {}, "pybind.nos.v7_2_0.brocade_firmware_ext_rpc.show_firmware_version.input": {"switchid": "switchid"}, "pybind.slxos.v17r_1_01a.brocade_firmware_ext_rpc.show_firmware_version": {}, "pybind.slxos.v17s_1_02.brocade_firmware_ext_rpc.show_firmware_version": {}, "pybind.nos.v6_0_2f.brocade_firmware_ext_rpc.show_firmware_version.input": {"switchid": "switchid"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_firmware_version_rpc(self, switchid=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5466,21 +5763,24 @@ def show_firmware_version_rpc(self, switchid=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_firmware_ext_rpc.show_firmware_version.input', 'pybind.nos.v6_0_2f.brocade_firmware_ext_rpc.brocade_firmware_ext', 'pybind.nos.v6_0_2f.brocade_firmware_ext_rpc'), ('pybind.nos.v7_2_0.brocade_firmware_ext_rpc.show_firmware_version.input', 'pybind.nos.v7_2_0.brocade_firmware_ext_rpc.brocade_firmware_ext', 'pybind.nos.v7_2_0.brocade_firmware_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_firmware_ext_rpc.show_firmware_version', 'pybind.slxos.v17r_1_01a.brocade_firmware_ext_rpc.brocade_firmware_ext', 'pybind.slxos.v17r_1_01a.brocade_firmware_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_firmware_ext_rpc.show_firmware_version', 'pybind.slxos.v17r_2_00.brocade_firmware_ext_rpc.brocade_firmware_ext', 'pybind.slxos.v17r_2_00.brocade_firmware_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_firmware_ext_rpc.show_firmware_version', 'pybind.slxos.v17s_1_02.brocade_firmware_ext_rpc.brocade_firmware_ext', 'pybind.slxos.v17s_1_02.brocade_firmware_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17r_2_00.brocade_firmware_ext_rpc.show_firmware_version": {}, "pybind.nos.v7_2_0.brocade_firmware_ext_rpc.show_firmware_version.input": {"switchid": "switchid"}, "pybind.slxos.v17r_1_01a.brocade_firmware_ext_rpc.show_firmware_version": {}, "pybind.slxos.v17s_1_02.brocade_firmware_ext_rpc.show_firmware_version": {}, "pybind.nos.v6_0_2f.brocade_firmware_ext_rpc.show_firmware_version.input": {"switchid": "switchid"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, switchid=switchid)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, switchid=switchid)
+    api_descriptor = _show_firmware_version_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, switchid=switchid)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, switchid=switchid)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_linkinfo_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_fabric_service_rpc.show_linkinfo.input', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc'), ('pybind.nos.v7_2_0.brocade_fabric_service_rpc.show_linkinfo.input', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.show_linkinfo.input', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc'), ('pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.show_linkinfo.input', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_linkinfo_rpc(self, all=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5511,21 +5811,24 @@ def show_linkinfo_rpc(self, all=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_fabric_service_rpc.show_linkinfo.input', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc'), ('pybind.nos.v7_2_0.brocade_fabric_service_rpc.show_linkinfo.input', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.show_linkinfo.input', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc'), ('pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.show_linkinfo.input', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, all=all)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, all=all)
+    api_descriptor = _show_linkinfo_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, all=all)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, all=all)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_bfd_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bfd', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bfd', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bfd', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_bfd_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5550,21 +5853,24 @@ def show_mpls_bfd_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bfd', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bfd', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bfd', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_bfd_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_bypass_bypass_lsp_extensive_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_bypass_lsp_extensive', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_bypass_lsp_extensive', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_bypass_lsp_extensive', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_bypass_bypass_lsp_extensive_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5589,21 +5895,24 @@ def show_mpls_bypass_bypass_lsp_extensive_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_bypass_lsp_extensive', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_bypass_lsp_extensive', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_bypass_lsp_extensive', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_bypass_bypass_lsp_extensive_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_bypass_lsp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_bypass_lsp_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5628,21 +5937,24 @@ def show_mpls_bypass_lsp_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_bypass_lsp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_bypass_lsp_debug_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_debug', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_debug', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_debug', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_bypass_lsp_debug_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5667,21 +5979,24 @@ def show_mpls_bypass_lsp_debug_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_debug', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_debug', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_debug', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_bypass_lsp_debug_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_bypass_lsp_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_bypass_lsp_detail_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5706,21 +6021,24 @@ def show_mpls_bypass_lsp_detail_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_bypass_lsp_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_bypass_lsp_name_debug_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', u'show_lsp_input_info'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', u'show_lsp_input_info')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_bypass_lsp_name_debug_rpc(self, show_lsp_input_info=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -5879,21 +6197,24 @@ def show_mpls_bypass_lsp_name_debug_rpc(self, show_lsp_input_info=None, api_time
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', u'show_lsp_input_info'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_debug.input', u'show_lsp_input_info')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, show_lsp_input_info=show_lsp_input_info)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, show_lsp_input_info=show_lsp_input_info)
+    api_descriptor = _show_mpls_bypass_lsp_name_debug_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_bypass_lsp_name_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', u'show_lsp_input_info')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_bypass_lsp_name_detail_rpc(self, show_lsp_input_info=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6052,21 +6373,24 @@ def show_mpls_bypass_lsp_name_detail_rpc(self, show_lsp_input_info=None, api_tim
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_detail.input', u'show_lsp_input_info')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, show_lsp_input_info=show_lsp_input_info)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, show_lsp_input_info=show_lsp_input_info)
+    api_descriptor = _show_mpls_bypass_lsp_name_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_bypass_lsp_name_extensive_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', u'show_lsp_input_info')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_bypass_lsp_name_extensive_rpc(self, show_lsp_input_info=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6225,21 +6549,24 @@ def show_mpls_bypass_lsp_name_extensive_rpc(self, show_lsp_input_info=None, api_
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_bypass_lsp_name_extensive.input', u'show_lsp_input_info')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, show_lsp_input_info=show_lsp_input_info)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, show_lsp_input_info=show_lsp_input_info)
+    api_descriptor = _show_mpls_bypass_lsp_name_extensive_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_dynamic_bypass_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_dynamic_bypass', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_dynamic_bypass', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_dynamic_bypass', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_dynamic_bypass_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6264,21 +6591,24 @@ def show_mpls_dynamic_bypass_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_dynamic_bypass', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_dynamic_bypass', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_dynamic_bypass', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_dynamic_bypass_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_dynamic_bypass_interface_brief_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_dynamic_bypass_interface_brief', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_dynamic_bypass_interface_brief', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_dynamic_bypass_interface_brief', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_dynamic_bypass_interface_brief_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6303,21 +6633,24 @@ def show_mpls_dynamic_bypass_interface_brief_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_dynamic_bypass_interface_brief', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_dynamic_bypass_interface_brief', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_dynamic_bypass_interface_brief', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_dynamic_bypass_interface_brief_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_interface_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_interface', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_interface', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_interface', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_interface_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6342,21 +6675,24 @@ def show_mpls_interface_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_interface', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_interface', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_interface', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_interface_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_interface_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_interface_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_interface_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_interface_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_interface_detail_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6381,21 +6717,24 @@ def show_mpls_interface_detail_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_interface_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_interface_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_interface_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_interface_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_interface_one_interface_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_interface_one_interface.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_interface_one_interface.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_interface_one_interface.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_interface_one_interface_rpc(self, interface_type=None, interface_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6441,21 +6780,24 @@ def show_mpls_interface_one_interface_rpc(self, interface_type=None, interface_n
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_interface_one_interface.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_interface_one_interface.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_interface_one_interface.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, interface_type=interface_type, interface_name=interface_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, interface_type=interface_type, interface_name=interface_name)
+    api_descriptor = _show_mpls_interface_one_interface_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6480,21 +6822,24 @@ def show_mpls_ldp_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_ldp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_fec_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_fec_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6519,21 +6864,24 @@ def show_mpls_ldp_fec_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_ldp_fec_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_fec_prefix_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_prefix', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_prefix', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_prefix', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_fec_prefix_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6558,21 +6906,24 @@ def show_mpls_ldp_fec_prefix_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_prefix', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_prefix', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_prefix', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_ldp_fec_prefix_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_fec_prefix_filtered_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_filtered.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_filtered.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_filtered.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_fec_prefix_filtered_rpc(self, ldp_fec_prefix_filtered=None, ldp_fec_prefix_filtered_in=None, ldp_fec_prefix_filtered_out=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6608,21 +6959,24 @@ def show_mpls_ldp_fec_prefix_filtered_rpc(self, ldp_fec_prefix_filtered=None, ld
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_filtered.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_filtered.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_filtered.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_fec_prefix_filtered=ldp_fec_prefix_filtered, ldp_fec_prefix_filtered_in=ldp_fec_prefix_filtered_in, ldp_fec_prefix_filtered_out=ldp_fec_prefix_filtered_out)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_fec_prefix_filtered=ldp_fec_prefix_filtered, ldp_fec_prefix_filtered_in=ldp_fec_prefix_filtered_in, ldp_fec_prefix_filtered_out=ldp_fec_prefix_filtered_out)
+    api_descriptor = _show_mpls_ldp_fec_prefix_filtered_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_fec_prefix_filtered=ldp_fec_prefix_filtered, ldp_fec_prefix_filtered_in=ldp_fec_prefix_filtered_in, ldp_fec_prefix_filtered_out=ldp_fec_prefix_filtered_out)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_fec_prefix_filtered=ldp_fec_prefix_filtered, ldp_fec_prefix_filtered_in=ldp_fec_prefix_filtered_in, ldp_fec_prefix_filtered_out=ldp_fec_prefix_filtered_out)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_fec_prefix_prefix_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_fec_prefix_prefix_rpc(self, ldp_fec_prefix=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6658,21 +7012,24 @@ def show_mpls_ldp_fec_prefix_prefix_rpc(self, ldp_fec_prefix=None, api_timeout='
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_fec_prefix=ldp_fec_prefix)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_fec_prefix=ldp_fec_prefix)
+    api_descriptor = _show_mpls_ldp_fec_prefix_prefix_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_fec_prefix=ldp_fec_prefix)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_fec_prefix=ldp_fec_prefix)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_fec_prefix_prefix_filter_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_filter.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_filter.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_filter.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_fec_prefix_prefix_filter_rpc(self, ldp_fec_prefix_filter=None, ldp_fec_prefix_filter_string=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6705,21 +7062,24 @@ def show_mpls_ldp_fec_prefix_prefix_filter_rpc(self, ldp_fec_prefix_filter=None,
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_filter.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_filter.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_filter.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_fec_prefix_filter=ldp_fec_prefix_filter, ldp_fec_prefix_filter_string=ldp_fec_prefix_filter_string)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_fec_prefix_filter=ldp_fec_prefix_filter, ldp_fec_prefix_filter_string=ldp_fec_prefix_filter_string)
+    api_descriptor = _show_mpls_ldp_fec_prefix_prefix_filter_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_fec_prefix_filter=ldp_fec_prefix_filter, ldp_fec_prefix_filter_string=ldp_fec_prefix_filter_string)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_fec_prefix_filter=ldp_fec_prefix_filter, ldp_fec_prefix_filter_string=ldp_fec_prefix_filter_string)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_fec_prefix_prefix_longer_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_longer.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_longer.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_longer.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_fec_prefix_prefix_longer_rpc(self, ldp_fec_prefix=None, ldp_fec_prefix_longer=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6758,21 +7118,24 @@ def show_mpls_ldp_fec_prefix_prefix_longer_rpc(self, ldp_fec_prefix=None, ldp_fe
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_longer.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_longer.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_prefix_prefix_longer.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_fec_prefix=ldp_fec_prefix, ldp_fec_prefix_longer=ldp_fec_prefix_longer)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_fec_prefix=ldp_fec_prefix, ldp_fec_prefix_longer=ldp_fec_prefix_longer)
+    api_descriptor = _show_mpls_ldp_fec_prefix_prefix_longer_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_fec_prefix=ldp_fec_prefix, ldp_fec_prefix_longer=ldp_fec_prefix_longer)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_fec_prefix=ldp_fec_prefix, ldp_fec_prefix_longer=ldp_fec_prefix_longer)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_fec_summary_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_summary', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_summary', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_summary', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_fec_summary_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6797,21 +7160,24 @@ def show_mpls_ldp_fec_summary_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_summary', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_summary', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_summary', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_ldp_fec_summary_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_fec_vc_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_vc', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_vc', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_vc', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_fec_vc_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6836,21 +7202,24 @@ def show_mpls_ldp_fec_vc_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_vc', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_vc', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_vc', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_ldp_fec_vc_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_fec_vc_id_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_vc_id.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_vc_id.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_vc_id.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_fec_vc_id_rpc(self, ldp_fec_vc_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6884,21 +7253,24 @@ def show_mpls_ldp_fec_vc_id_rpc(self, ldp_fec_vc_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_fec_vc_id.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_fec_vc_id.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_fec_vc_id.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_fec_vc_id=ldp_fec_vc_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_fec_vc_id=ldp_fec_vc_id)
+    api_descriptor = _show_mpls_ldp_fec_vc_id_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_fec_vc_id=ldp_fec_vc_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_fec_vc_id=ldp_fec_vc_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_path_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_path', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_path', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_path', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_path_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6923,21 +7295,24 @@ def show_mpls_ldp_path_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_path', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_path', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_path', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_ldp_path_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_path_one_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_path_one.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_path_one.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_path_one.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_path_one_rpc(self, ldp_path_ip=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -6973,21 +7348,24 @@ def show_mpls_ldp_path_one_rpc(self, ldp_path_ip=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_path_one.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_path_one.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_path_one.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_path_ip=ldp_path_ip)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_path_ip=ldp_path_ip)
+    api_descriptor = _show_mpls_ldp_path_one_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_path_ip=ldp_path_ip)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_path_ip=ldp_path_ip)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_peer_br_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_peer_br.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_peer_br.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_peer_br.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_peer_br_rpc(self, ldp_peer_brief=None, ldp_peer_detail=None, ldp_peer_ip=None, ldp_peer_ip_lblspid=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7036,21 +7414,24 @@ def show_mpls_ldp_peer_br_rpc(self, ldp_peer_brief=None, ldp_peer_detail=None, l
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_peer_br.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_peer_br.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_peer_br.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
+    api_descriptor = _show_mpls_ldp_peer_br_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_peer_det_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_peer_det.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_peer_det.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_peer_det.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_peer_det_rpc(self, ldp_peer_brief=None, ldp_peer_detail=None, ldp_peer_ip=None, ldp_peer_ip_lblspid=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7099,21 +7480,24 @@ def show_mpls_ldp_peer_det_rpc(self, ldp_peer_brief=None, ldp_peer_detail=None,
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_peer_det.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_peer_det.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_peer_det.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
+    api_descriptor = _show_mpls_ldp_peer_det_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_peer_det_rec_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_peer_det_rec.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_peer_det_rec.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_peer_det_rec.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_peer_det_rec_rpc(self, ldp_peer_brief=None, ldp_peer_detail=None, ldp_peer_ip=None, ldp_peer_ip_lblspid=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7162,21 +7546,24 @@ def show_mpls_ldp_peer_det_rec_rpc(self, ldp_peer_brief=None, ldp_peer_detail=No
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_peer_det_rec.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_peer_det_rec.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_peer_det_rec.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
+    api_descriptor = _show_mpls_ldp_peer_det_rec_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_peer_brief=ldp_peer_brief, ldp_peer_detail=ldp_peer_detail, ldp_peer_ip=ldp_peer_ip, ldp_peer_ip_lblspid=ldp_peer_ip_lblspid)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_statistics_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_statistics', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_statistics', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_statistics', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_statistics_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7201,21 +7588,24 @@ def show_mpls_ldp_statistics_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_statistics', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_statistics', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_statistics', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_ldp_statistics_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_targeted_peer_all_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_all', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_all', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_all', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_targeted_peer_all_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7240,21 +7630,24 @@ def show_mpls_ldp_targeted_peer_all_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_all', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_all', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_all', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_ldp_targeted_peer_all_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_ldp_targeted_peer_one_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_one.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_one.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_one.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_ldp_targeted_peer_one_rpc(self, ldp_targeted_peer_ip=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7290,21 +7683,24 @@ def show_mpls_ldp_targeted_peer_one_rpc(self, ldp_targeted_peer_ip=None, api_tim
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_one.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_one.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_ldp_targeted_peer_one.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_targeted_peer_ip=ldp_targeted_peer_ip)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_targeted_peer_ip=ldp_targeted_peer_ip)
+    api_descriptor = _show_mpls_ldp_targeted_peer_one_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_targeted_peer_ip=ldp_targeted_peer_ip)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_targeted_peer_ip=ldp_targeted_peer_ip)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_lsp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_lsp_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7329,21 +7725,24 @@ def show_mpls_lsp_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_lsp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_lsp_debug_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_debug', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_debug', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_debug', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_lsp_debug_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7368,21 +7767,24 @@ def show_mpls_lsp_debug_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_debug', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_debug', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_debug', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_lsp_debug_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_lsp_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_lsp_detail_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7407,21 +7809,24 @@ def show_mpls_lsp_detail_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_lsp_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_lsp_extensive_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_extensive', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_extensive', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_extensive', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_lsp_extensive_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7446,21 +7851,24 @@ def show_mpls_lsp_extensive_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_extensive', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_extensive', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_extensive', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_lsp_extensive_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_lsp_name_debug_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', u'show_lsp_input_info')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_lsp_name_debug_rpc(self, show_lsp_input_info=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7619,21 +8027,24 @@ def show_mpls_lsp_name_debug_rpc(self, show_lsp_input_info=None, api_timeout='')
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_debug.input', u'show_lsp_input_info')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, show_lsp_input_info=show_lsp_input_info)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, show_lsp_input_info=show_lsp_input_info)
+    api_descriptor = _show_mpls_lsp_name_debug_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_lsp_name_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', u'show_lsp_input_info'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', u'show_lsp_input_info')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_lsp_name_detail_rpc(self, show_lsp_input_info=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7792,21 +8203,24 @@ def show_mpls_lsp_name_detail_rpc(self, show_lsp_input_info=None, api_timeout=''
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', u'show_lsp_input_info'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_detail.input', u'show_lsp_input_info')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, show_lsp_input_info=show_lsp_input_info)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, show_lsp_input_info=show_lsp_input_info)
+    api_descriptor = _show_mpls_lsp_name_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_lsp_name_extensive_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', u'show_lsp_input_info'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', u'show_lsp_input_info')],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_lsp_name_extensive_rpc(self, show_lsp_input_info=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -7965,21 +8379,24 @@ def show_mpls_lsp_name_extensive_rpc(self, show_lsp_input_info=None, api_timeout
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = [('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', u'show_lsp_input_info'), ('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', u'show_lsp_input_info'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_lsp_name_extensive.input', u'show_lsp_input_info')]
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = [{'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}, {'leafval': 'lsp, lsp_wide, lsp_detail, lsp_extensive, lsp_debug, lsp_name, lsp_name_extensive, lsp_name_debug, bypass_lsp, bypass_lsp_wide, bypass_lsp_detail, bypass_lsp_extensive, bypass_lsp_debug, bypass_lsp_name, bypass_lsp_name_extensive, bypass_lsp_name_debug, bypass_lsp_static, bypass_lsp_static_wide, bypass_lsp_static_detail, bypass_lsp_static_extensive, bypass_lsp_static_debug, bypass_lsp_static_name, bypass_lsp_static_name_extensive, bypass_lsp_static_name_debug, bypass_lsp_dynamic, bypass_lsp_dynamic_wide, bypass_lsp_dynamic_detail, bypass_lsp_dynamic_extensive, bypass_lsp_dynamic_debug, bypass_lsp_dynamic_name, bypass_lsp_dynamic_name_extensive, bypass_lsp_dynamic_name_debug, lsp_input_lsp_name, lsp_input_bypass, lsp_input_dynamic, lsp_input_brief, lsp_input_wide, lsp_input_detail, lsp_input_extensive, lsp_input_debug, lsp_input_one, lsp_input_all, lsp_input_more'}]
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, show_lsp_input_info=show_lsp_input_info)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, show_lsp_input_info=show_lsp_input_info)
+    api_descriptor = _show_mpls_lsp_name_extensive_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, show_lsp_input_info=show_lsp_input_info)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_policy_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_policy', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_policy', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_policy', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_policy_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8004,21 +8421,24 @@ def show_mpls_policy_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_policy', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_policy', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_policy', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_policy_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_route_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_route.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_route.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_route.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_route_rpc(self, prefix_address_and_len=None, prefix_address=None, subnet_mask=None, longer=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8075,21 +8495,24 @@ def show_mpls_route_rpc(self, prefix_address_and_len=None, prefix_address=None,
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_route.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_route.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_route.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, prefix_address_and_len=prefix_address_and_len, prefix_address=prefix_address, subnet_mask=subnet_mask, longer=longer)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, prefix_address_and_len=prefix_address_and_len, prefix_address=prefix_address, subnet_mask=subnet_mask, longer=longer)
+    api_descriptor = _show_mpls_route_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, prefix_address_and_len=prefix_address_and_len, prefix_address=prefix_address, subnet_mask=subnet_mask, longer=longer)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, prefix_address_and_len=prefix_address_and_len, prefix_address=prefix_address, subnet_mask=subnet_mask, longer=longer)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8114,21 +8537,24 @@ def show_mpls_rsvp_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_rsvp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_interface_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_interface', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_interface', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_interface', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_interface_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8153,21 +8579,24 @@ def show_mpls_rsvp_interface_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_interface', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_interface', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_interface', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_rsvp_interface_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_interface_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_interface_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_interface_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_interface_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_interface_detail_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8192,21 +8621,24 @@ def show_mpls_rsvp_interface_detail_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_interface_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_interface_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_interface_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_rsvp_interface_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_interface_one_interface_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_interface_one_interface.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_interface_one_interface.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_interface_one_interface.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_interface_one_interface_rpc(self, interface_type=None, interface_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8252,21 +8684,24 @@ def show_mpls_rsvp_interface_one_interface_rpc(self, interface_type=None, interf
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_interface_one_interface.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_interface_one_interface.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_interface_one_interface.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, interface_type=interface_type, interface_name=interface_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, interface_type=interface_type, interface_name=interface_name)
+    api_descriptor = _show_mpls_rsvp_interface_one_interface_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, interface_type=interface_type, interface_name=interface_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_neighbor_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_neighbor', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_neighbor', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_neighbor', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_neighbor_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8291,21 +8726,24 @@ def show_mpls_rsvp_neighbor_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_neighbor', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_neighbor', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_neighbor', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_rsvp_neighbor_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_neighbor_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_neighbor_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_neighbor_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_neighbor_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_neighbor_detail_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8330,21 +8768,24 @@ def show_mpls_rsvp_neighbor_detail_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_neighbor_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_neighbor_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_neighbor_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_rsvp_neighbor_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_neighbor_one_neighbor_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_neighbor_one_neighbor.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_neighbor_one_neighbor.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_neighbor_one_neighbor.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_neighbor_one_neighbor_rpc(self, mpls_rsvp_neighbor_peer_ip_addr=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8380,21 +8821,24 @@ def show_mpls_rsvp_neighbor_one_neighbor_rpc(self, mpls_rsvp_neighbor_peer_ip_ad
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_neighbor_one_neighbor.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_neighbor_one_neighbor.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_neighbor_one_neighbor.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, mpls_rsvp_neighbor_peer_ip_addr=mpls_rsvp_neighbor_peer_ip_addr)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, mpls_rsvp_neighbor_peer_ip_addr=mpls_rsvp_neighbor_peer_ip_addr)
+    api_descriptor = _show_mpls_rsvp_neighbor_one_neighbor_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, mpls_rsvp_neighbor_peer_ip_addr=mpls_rsvp_neighbor_peer_ip_addr)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, mpls_rsvp_neighbor_peer_ip_addr=mpls_rsvp_neighbor_peer_ip_addr)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_session_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_session', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_session', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_session', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_session_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8419,21 +8863,24 @@ def show_mpls_rsvp_session_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_session', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_session', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_session', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_rsvp_session_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_session_detail_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_session_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_session_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_session_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_session_detail_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8458,21 +8905,24 @@ def show_mpls_rsvp_session_detail_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_session_detail', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_session_detail', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_session_detail', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_rsvp_session_detail_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_session_extensive_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_session_extensive', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_session_extensive', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_session_extensive', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_session_extensive_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8497,21 +8947,24 @@ def show_mpls_rsvp_session_extensive_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_session_extensive', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_session_extensive', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_session_extensive', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_rsvp_session_extensive_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_session_name_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_session_name.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_session_name.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_session_name.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_session_name_rpc(self, session_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8541,21 +8994,24 @@ def show_mpls_rsvp_session_name_rpc(self, session_name=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_session_name.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_session_name.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_session_name.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, session_name=session_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, session_name=session_name)
+    api_descriptor = _show_mpls_rsvp_session_name_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, session_name=session_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, session_name=session_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_session_wide_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_session_wide', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_session_wide', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_session_wide', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_session_wide_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8580,21 +9036,24 @@ def show_mpls_rsvp_session_wide_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_session_wide', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_session_wide', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_session_wide', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_rsvp_session_wide_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_rsvp_statistics_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_statistics', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_statistics', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_statistics', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_rsvp_statistics_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8619,21 +9078,24 @@ def show_mpls_rsvp_statistics_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_rsvp_statistics', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_rsvp_statistics', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_rsvp_statistics', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_rsvp_statistics_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_statistics_ldp_transit_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_statistics_ldp_transit_rpc(self, ldp_transit_stats=None, ldp_transit_stats_fec_prefix=None, ldp_transit_stats_fec_prefix_longer=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8675,21 +9137,24 @@ def show_mpls_statistics_ldp_transit_rpc(self, ldp_transit_stats=None, ldp_trans
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_statistics_ldp_transit.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_transit_stats=ldp_transit_stats, ldp_transit_stats_fec_prefix=ldp_transit_stats_fec_prefix, ldp_transit_stats_fec_prefix_longer=ldp_transit_stats_fec_prefix_longer)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_transit_stats=ldp_transit_stats, ldp_transit_stats_fec_prefix=ldp_transit_stats_fec_prefix, ldp_transit_stats_fec_prefix_longer=ldp_transit_stats_fec_prefix_longer)
+    api_descriptor = _show_mpls_statistics_ldp_transit_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_transit_stats=ldp_transit_stats, ldp_transit_stats_fec_prefix=ldp_transit_stats_fec_prefix, ldp_transit_stats_fec_prefix_longer=ldp_transit_stats_fec_prefix_longer)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_transit_stats=ldp_transit_stats, ldp_transit_stats_fec_prefix=ldp_transit_stats_fec_prefix, ldp_transit_stats_fec_prefix_longer=ldp_transit_stats_fec_prefix_longer)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_statistics_ldp_tunnel_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_statistics_ldp_tunnel_rpc(self, ldp_tunnel_stats=None, ldp_tunnel_stats_vif=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8726,21 +9191,24 @@ def show_mpls_statistics_ldp_tunnel_rpc(self, ldp_tunnel_stats=None, ldp_tunnel_
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_statistics_ldp_tunnel.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ldp_tunnel_stats=ldp_tunnel_stats, ldp_tunnel_stats_vif=ldp_tunnel_stats_vif)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ldp_tunnel_stats=ldp_tunnel_stats, ldp_tunnel_stats_vif=ldp_tunnel_stats_vif)
+    api_descriptor = _show_mpls_statistics_ldp_tunnel_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ldp_tunnel_stats=ldp_tunnel_stats, ldp_tunnel_stats_vif=ldp_tunnel_stats_vif)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ldp_tunnel_stats=ldp_tunnel_stats, ldp_tunnel_stats_vif=ldp_tunnel_stats_vif)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_statistics_oam_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_statistics_oam', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_statistics_oam', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_statistics_oam', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_statistics_oam_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8765,21 +9233,24 @@ def show_mpls_statistics_oam_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_statistics_oam', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_statistics_oam', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_statistics_oam', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_statistics_oam_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_summary_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_summary', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_summary', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_summary', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_summary_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8804,21 +9275,24 @@ def show_mpls_summary_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_summary', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_summary', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_summary', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_mpls_summary_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_mpls_te_path_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_te_path.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_te_path.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_te_path.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_mpls_te_path_rpc(self, ipAddr=None, bandwidth=None, cspfCompMode=None, excludeAny=None, hopLimit=None, includeAny=None, includeAll=None, tePathName=None, priority=None, tieBreaking=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8901,21 +9375,24 @@ def show_mpls_te_path_rpc(self, ipAddr=None, bandwidth=None, cspfCompMode=None,
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.slxos.v17r_1_01a.brocade_mpls_rpc.show_mpls_te_path.input', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_1_01a.brocade_mpls_rpc'), ('pybind.slxos.v17r_2_00.brocade_mpls_rpc.show_mpls_te_path.input', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17r_2_00.brocade_mpls_rpc'), ('pybind.slxos.v17s_1_02.brocade_mpls_rpc.show_mpls_te_path.input', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc.brocade_mpls', 'pybind.slxos.v17s_1_02.brocade_mpls_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, ipAddr=ipAddr, bandwidth=bandwidth, cspfCompMode=cspfCompMode, excludeAny=excludeAny, hopLimit=hopLimit, includeAny=includeAny, includeAll=includeAll, tePathName=tePathName, priority=priority, tieBreaking=tieBreaking)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, ipAddr=ipAddr, bandwidth=bandwidth, cspfCompMode=cspfCompMode, excludeAny=excludeAny, hopLimit=hopLimit, includeAny=includeAny, includeAll=includeAll, tePathName=tePathName, priority=priority, tieBreaking=tieBreaking)
+    api_descriptor = _show_mpls_te_path_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, ipAddr=ipAddr, bandwidth=bandwidth, cspfCompMode=cspfCompMode, excludeAny=excludeAny, hopLimit=hopLimit, includeAny=includeAny, includeAll=includeAll, tePathName=tePathName, priority=priority, tieBreaking=tieBreaking)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, ipAddr=ipAddr, bandwidth=bandwidth, cspfCompMode=cspfCompMode, excludeAny=excludeAny, hopLimit=hopLimit, includeAny=includeAny, includeAll=includeAll, tePathName=tePathName, priority=priority, tieBreaking=tieBreaking)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_ntp_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_ntp_rpc.show_ntp.input', 'pybind.nos.v6_0_2f.brocade_ntp_rpc.brocade_ntp', 'pybind.nos.v6_0_2f.brocade_ntp_rpc'), ('pybind.nos.v7_2_0.brocade_ntp_rpc.show_ntp.input', 'pybind.nos.v7_2_0.brocade_ntp_rpc.brocade_ntp', 'pybind.nos.v7_2_0.brocade_ntp_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ntp_rpc.show_ntp', 'pybind.slxos.v17r_1_01a.brocade_ntp_rpc.brocade_ntp', 'pybind.slxos.v17r_1_01a.brocade_ntp_rpc'), ('pybind.slxos.v17r_2_00.brocade_ntp_rpc.show_ntp', 'pybind.slxos.v17r_2_00.brocade_ntp_rpc.brocade_ntp', 'pybind.slxos.v17r_2_00.brocade_ntp_rpc'), ('pybind.slxos.v17s_1_02.brocade_ntp_rpc.show_ntp', 'pybind.slxos.v17s_1_02.brocade_ntp_rpc.brocade_ntp', 'pybind.slxos.v17s_1_02.brocade_ntp_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.nos.v7_2_0.brocade_ntp_rpc.show_ntp.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_2_00.brocade_ntp_rpc.show_ntp": {}, "pybind.slxos.v17r_1_01a.brocade_ntp_rpc.show_ntp": {}, "pybind.nos.v6_0_2f.brocade_ntp_rpc.show_ntp.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_ntp_rpc.show_ntp": {}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_ntp_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8950,21 +9427,24 @@ def show_ntp_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_ntp_rpc.show_ntp.input', 'pybind.nos.v6_0_2f.brocade_ntp_rpc.brocade_ntp', 'pybind.nos.v6_0_2f.brocade_ntp_rpc'), ('pybind.nos.v7_2_0.brocade_ntp_rpc.show_ntp.input', 'pybind.nos.v7_2_0.brocade_ntp_rpc.brocade_ntp', 'pybind.nos.v7_2_0.brocade_ntp_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ntp_rpc.show_ntp', 'pybind.slxos.v17r_1_01a.brocade_ntp_rpc.brocade_ntp', 'pybind.slxos.v17r_1_01a.brocade_ntp_rpc'), ('pybind.slxos.v17r_2_00.brocade_ntp_rpc.show_ntp', 'pybind.slxos.v17r_2_00.brocade_ntp_rpc.brocade_ntp', 'pybind.slxos.v17r_2_00.brocade_ntp_rpc'), ('pybind.slxos.v17s_1_02.brocade_ntp_rpc.show_ntp', 'pybind.slxos.v17s_1_02.brocade_ntp_rpc.brocade_ntp', 'pybind.slxos.v17s_1_02.brocade_ntp_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.nos.v7_2_0.brocade_ntp_rpc.show_ntp.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_2_00.brocade_ntp_rpc.show_ntp": {}, "pybind.slxos.v17r_1_01a.brocade_ntp_rpc.show_ntp": {}, "pybind.nos.v6_0_2f.brocade_ntp_rpc.show_ntp.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_ntp_rpc.show_ntp": {}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _show_ntp_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_portindex_interface_info_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_fabric_service_rpc.show_portindex_interface_info.input', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc'), ('pybind.nos.v7_2_0.brocade_fabric_service_rpc.show_portindex_interface_info.input', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.show_portindex_interface_info.input', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc'), ('pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.show_portindex_interface_info.input', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_portindex_interface_info_rpc(self, all=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -8995,21 +9475,24 @@ def show_portindex_interface_info_rpc(self, all=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_fabric_service_rpc.show_portindex_interface_info.input', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v6_0_2f.brocade_fabric_service_rpc'), ('pybind.nos.v7_2_0.brocade_fabric_service_rpc.show_portindex_interface_info.input', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.nos.v7_2_0.brocade_fabric_service_rpc'), ('pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.show_portindex_interface_info.input', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17r_1_01a.brocade_fabric_service_rpc'), ('pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.show_portindex_interface_info.input', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc.brocade_fabric_service', 'pybind.slxos.v17s_1_02.brocade_fabric_service_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, all=all)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, all=all)
+    api_descriptor = _show_portindex_interface_info_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, all=all)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, all=all)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_raslog_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_raslog.input', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc'), ('pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_raslog.input', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_raslog.input', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_raslog.input', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_raslog.input', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_raslog.input": {"number_of_latest_events": "number_of_latest_events", "rbridge_id": "rbridge_id"}, "pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_raslog.input": {"number_of_latest_events": "number_of_latest_events", "rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_raslog.input": {}, "pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_raslog.input": {"number_of_latest_events": "number_of_latest_events", "rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_raslog.input": {"number_of_latest_events": "number_of_latest_events", "rbridge_id": "rbridge_id"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_raslog_rpc(self, rbridge_id=None, number_of_latest_events=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -9051,21 +9534,24 @@ def show_raslog_rpc(self, rbridge_id=None, number_of_latest_events=None, api_tim
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_raslog.input', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc'), ('pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_raslog.input', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_raslog.input', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_raslog.input', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_raslog.input', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_raslog.input": {"number_of_latest_events": "number_of_latest_events", "rbridge_id": "rbridge_id"}, "pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_raslog.input": {"number_of_latest_events": "number_of_latest_events", "rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_raslog.input": {}, "pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_raslog.input": {"number_of_latest_events": "number_of_latest_events", "rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_raslog.input": {"number_of_latest_events": "number_of_latest_events", "rbridge_id": "rbridge_id"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id, number_of_latest_events=number_of_latest_events)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id, number_of_latest_events=number_of_latest_events)
+    api_descriptor = _show_raslog_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id, number_of_latest_events=number_of_latest_events)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id, number_of_latest_events=number_of_latest_events)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_support_save_status_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_support_save_status.input', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc'), ('pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_support_save_status.input', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_support_save_status', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_support_save_status', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_support_save_status', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_support_save_status": {}, "pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_support_save_status": {}, "pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_support_save_status.input": {"rbridge_id": "rbridge_id"}, "pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_support_save_status.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_support_save_status": {}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_support_save_status_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -9100,21 +9586,24 @@ def show_support_save_status_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_support_save_status.input', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc'), ('pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_support_save_status.input', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_support_save_status', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_support_save_status', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_support_save_status', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_support_save_status": {}, "pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_support_save_status": {}, "pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_support_save_status.input": {"rbridge_id": "rbridge_id"}, "pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_support_save_status.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_support_save_status": {}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _show_support_save_status_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_system_info_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_system_info.input', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc'), ('pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_system_info.input', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_system_info', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_system_info', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_system_info.input', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_system_info.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_system_info": {}, "pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_system_info.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_system_info": {}, "pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_system_info.input": {"rbridge_id": "rbridge_id"}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_system_info_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -9149,21 +9638,24 @@ def show_system_info_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_system_info.input', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v6_0_2f.brocade_ras_ext_rpc'), ('pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_system_info.input', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.nos.v7_2_0.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_system_info', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_system_info', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17r_2_00.brocade_ras_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_system_info.input', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.brocade_ras_ext', 'pybind.slxos.v17s_1_02.brocade_ras_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.nos.v7_2_0.brocade_ras_ext_rpc.show_system_info.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_1_01a.brocade_ras_ext_rpc.show_system_info": {}, "pybind.nos.v6_0_2f.brocade_ras_ext_rpc.show_system_info.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17r_2_00.brocade_ras_ext_rpc.show_system_info": {}, "pybind.slxos.v17s_1_02.brocade_ras_ext_rpc.show_system_info.input": {"rbridge_id": "rbridge_id"}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _show_system_info_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_system_monitor_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_system_monitor_ext_rpc.show_system_monitor.input', 'pybind.nos.v6_0_2f.brocade_system_monitor_ext_rpc.brocade_system_monitor_ext', 'pybind.nos.v6_0_2f.brocade_system_monitor_ext_rpc'), ('pybind.nos.v7_2_0.brocade_system_monitor_ext_rpc.show_system_monitor.input', 'pybind.nos.v7_2_0.brocade_system_monitor_ext_rpc.brocade_system_monitor_ext', 'pybind.nos.v7_2_0.brocade_system_monitor_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_system_monitor_ext_rpc.show_system_monitor', 'pybind.slxos.v17r_1_01a.brocade_system_monitor_ext_rpc.brocade_system_monitor_ext', 'pybind.slxos.v17r_1_01a.brocade_system_monitor_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_system_monitor_ext_rpc.show_system_monitor', 'pybind.slxos.v17r_2_00.brocade_system_monitor_ext_rpc.brocade_system_monitor_ext', 'pybind.slxos.v17r_2_00.brocade_system_monitor_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_system_monitor_ext_rpc.show_system_monitor', 'pybind.slxos.v17s_1_02.brocade_system_monitor_ext_rpc.brocade_system_monitor_ext', 'pybind.slxos.v17s_1_02.brocade_system_monitor_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={"pybind.slxos.v17r_1_01a.brocade_system_monitor_ext_rpc.show_system_monitor": {}, "pybind.slxos.v17r_2_00.brocade_system_monitor_ext_rpc.show_system_monitor": {}, "pybind.nos.v7_2_0.brocade_system_monitor_ext_rpc.show_system_monitor.input": {"rbridge_id": "rbridge_id"}, "pybind.nos.v6_0_2f.brocade_system_monitor_ext_rpc.show_system_monitor.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_system_monitor_ext_rpc.show_system_monitor": {}},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_system_monitor_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -9198,21 +9690,24 @@ def show_system_monitor_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_system_monitor_ext_rpc.show_system_monitor.input', 'pybind.nos.v6_0_2f.brocade_system_monitor_ext_rpc.brocade_system_monitor_ext', 'pybind.nos.v6_0_2f.brocade_system_monitor_ext_rpc'), ('pybind.nos.v7_2_0.brocade_system_monitor_ext_rpc.show_system_monitor.input', 'pybind.nos.v7_2_0.brocade_system_monitor_ext_rpc.brocade_system_monitor_ext', 'pybind.nos.v7_2_0.brocade_system_monitor_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_system_monitor_ext_rpc.show_system_monitor', 'pybind.slxos.v17r_1_01a.brocade_system_monitor_ext_rpc.brocade_system_monitor_ext', 'pybind.slxos.v17r_1_01a.brocade_system_monitor_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_system_monitor_ext_rpc.show_system_monitor', 'pybind.slxos.v17r_2_00.brocade_system_monitor_ext_rpc.brocade_system_monitor_ext', 'pybind.slxos.v17r_2_00.brocade_system_monitor_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_system_monitor_ext_rpc.show_system_monitor', 'pybind.slxos.v17s_1_02.brocade_system_monitor_ext_rpc.brocade_system_monitor_ext', 'pybind.slxos.v17s_1_02.brocade_system_monitor_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {"pybind.slxos.v17r_1_01a.brocade_system_monitor_ext_rpc.show_system_monitor": {}, "pybind.slxos.v17r_2_00.brocade_system_monitor_ext_rpc.show_system_monitor": {}, "pybind.nos.v7_2_0.brocade_system_monitor_ext_rpc.show_system_monitor.input": {"rbridge_id": "rbridge_id"}, "pybind.nos.v6_0_2f.brocade_system_monitor_ext_rpc.show_system_monitor.input": {"rbridge_id": "rbridge_id"}, "pybind.slxos.v17s_1_02.brocade_system_monitor_ext_rpc.show_system_monitor": {}}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _show_system_monitor_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_vcs_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vcs_rpc.show_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.show_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.show_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.show_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.show_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_vcs_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -9238,21 +9733,24 @@ def show_vcs_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vcs_rpc.show_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.show_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.show_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.show_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.show_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _show_vcs_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_show_zoning_enabled_configuration_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_zone_rpc.show_zoning_enabled_configuration.input', 'pybind.nos.v6_0_2f.brocade_zone_rpc.brocade_zone', 'pybind.nos.v6_0_2f.brocade_zone_rpc'), ('pybind.nos.v7_2_0.brocade_zone_rpc.show_zoning_enabled_configuration.input', 'pybind.nos.v7_2_0.brocade_zone_rpc.brocade_zone', 'pybind.nos.v7_2_0.brocade_zone_rpc'), ('pybind.slxos.v17r_1_01a.brocade_zone_rpc.show_zoning_enabled_configuration.input', 'pybind.slxos.v17r_1_01a.brocade_zone_rpc.brocade_zone', 'pybind.slxos.v17r_1_01a.brocade_zone_rpc'), ('pybind.slxos.v17s_1_02.brocade_zone_rpc.show_zoning_enabled_configuration.input', 'pybind.slxos.v17s_1_02.brocade_zone_rpc.brocade_zone', 'pybind.slxos.v17s_1_02.brocade_zone_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def show_zoning_enabled_configuration_rpc(self, zone_name_pattern=None, last_rcvd_zone_name=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -9286,21 +9784,24 @@ def show_zoning_enabled_configuration_rpc(self, zone_name_pattern=None, last_rcv
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_zone_rpc.show_zoning_enabled_configuration.input', 'pybind.nos.v6_0_2f.brocade_zone_rpc.brocade_zone', 'pybind.nos.v6_0_2f.brocade_zone_rpc'), ('pybind.nos.v7_2_0.brocade_zone_rpc.show_zoning_enabled_configuration.input', 'pybind.nos.v7_2_0.brocade_zone_rpc.brocade_zone', 'pybind.nos.v7_2_0.brocade_zone_rpc'), ('pybind.slxos.v17r_1_01a.brocade_zone_rpc.show_zoning_enabled_configuration.input', 'pybind.slxos.v17r_1_01a.brocade_zone_rpc.brocade_zone', 'pybind.slxos.v17r_1_01a.brocade_zone_rpc'), ('pybind.slxos.v17s_1_02.brocade_zone_rpc.show_zoning_enabled_configuration.input', 'pybind.slxos.v17s_1_02.brocade_zone_rpc.brocade_zone', 'pybind.slxos.v17s_1_02.brocade_zone_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, zone_name_pattern=zone_name_pattern, last_rcvd_zone_name=last_rcvd_zone_name)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, zone_name_pattern=zone_name_pattern, last_rcvd_zone_name=last_rcvd_zone_name)
+    api_descriptor = _show_zoning_enabled_configuration_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, zone_name_pattern=zone_name_pattern, last_rcvd_zone_name=last_rcvd_zone_name)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, zone_name_pattern=zone_name_pattern, last_rcvd_zone_name=last_rcvd_zone_name)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_user_session_info_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_aaa_ext_rpc.user_session_info', 'pybind.nos.v6_0_2f.brocade_aaa_ext_rpc.brocade_aaa_ext', 'pybind.nos.v6_0_2f.brocade_aaa_ext_rpc'), ('pybind.nos.v7_2_0.brocade_aaa_ext_rpc.user_session_info', 'pybind.nos.v7_2_0.brocade_aaa_ext_rpc.brocade_aaa_ext', 'pybind.nos.v7_2_0.brocade_aaa_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_aaa_ext_rpc.user_session_info', 'pybind.slxos.v17r_1_01a.brocade_aaa_ext_rpc.brocade_aaa_ext', 'pybind.slxos.v17r_1_01a.brocade_aaa_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_aaa_ext_rpc.user_session_info', 'pybind.slxos.v17r_2_00.brocade_aaa_ext_rpc.brocade_aaa_ext', 'pybind.slxos.v17r_2_00.brocade_aaa_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_aaa_ext_rpc.user_session_info', 'pybind.slxos.v17s_1_02.brocade_aaa_ext_rpc.brocade_aaa_ext', 'pybind.slxos.v17s_1_02.brocade_aaa_ext_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def user_session_info_rpc(self, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -9326,21 +9827,24 @@ def user_session_info_rpc(self, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_aaa_ext_rpc.user_session_info', 'pybind.nos.v6_0_2f.brocade_aaa_ext_rpc.brocade_aaa_ext', 'pybind.nos.v6_0_2f.brocade_aaa_ext_rpc'), ('pybind.nos.v7_2_0.brocade_aaa_ext_rpc.user_session_info', 'pybind.nos.v7_2_0.brocade_aaa_ext_rpc.brocade_aaa_ext', 'pybind.nos.v7_2_0.brocade_aaa_ext_rpc'), ('pybind.slxos.v17r_1_01a.brocade_aaa_ext_rpc.user_session_info', 'pybind.slxos.v17r_1_01a.brocade_aaa_ext_rpc.brocade_aaa_ext', 'pybind.slxos.v17r_1_01a.brocade_aaa_ext_rpc'), ('pybind.slxos.v17r_2_00.brocade_aaa_ext_rpc.user_session_info', 'pybind.slxos.v17r_2_00.brocade_aaa_ext_rpc.brocade_aaa_ext', 'pybind.slxos.v17r_2_00.brocade_aaa_ext_rpc'), ('pybind.slxos.v17s_1_02.brocade_aaa_ext_rpc.user_session_info', 'pybind.slxos.v17s_1_02.brocade_aaa_ext_rpc.brocade_aaa_ext', 'pybind.slxos.v17s_1_02.brocade_aaa_ext_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map)
+    api_descriptor = _user_session_info_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_vcs_rbridge_config_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vcs_rpc.vcs_rbridge_config.input', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.vcs_rbridge_config.input', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.vcs_rbridge_config.input', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.vcs_rbridge_config.input', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.vcs_rbridge_config.input', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def vcs_rbridge_config_rpc(self, vcs_id=None, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -9382,21 +9886,24 @@ def vcs_rbridge_config_rpc(self, vcs_id=None, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vcs_rpc.vcs_rbridge_config.input', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.vcs_rbridge_config.input', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.vcs_rbridge_config.input', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.vcs_rbridge_config.input', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.vcs_rbridge_config.input', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, vcs_id=vcs_id, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, vcs_id=vcs_id, rbridge_id=rbridge_id)
+    api_descriptor = _vcs_rbridge_config_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, vcs_id=vcs_id, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, vcs_id=vcs_id, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
+_vcs_rbridge_context_rpc_descriptor = ApiDescriptorUtil(
+    compositions_list=[],
+    bindings_list=[('pybind.nos.v6_0_2f.brocade_vcs_rpc.vcs_rbridge_context.input', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.vcs_rbridge_context.input', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.vcs_rbridge_context.input', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.vcs_rbridge_context.input', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.vcs_rbridge_context.input', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')],
+    composed_child_list=[],
+    compositions_keyval_list=[],
+    bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+    composed_child_leafval_list=[],
+    leafval_map={},
+    rest_leaf_name='',
+    choices_kwargs_map={},
+    leaf_os_support_map={})
+
 def vcs_rbridge_context_rpc(self, rbridge_id=None, api_timeout=''):
     """
     This is an auto-generated method for the PySwitchLib.
@@ -9431,18 +9938,9 @@ def vcs_rbridge_context_rpc(self, rbridge_id=None, api_timeout=''):
     """
 
     operation_type = 'rpc'
-    compositions_list = []
-    bindings_list = [('pybind.nos.v6_0_2f.brocade_vcs_rpc.vcs_rbridge_context.input', 'pybind.nos.v6_0_2f.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v6_0_2f.brocade_vcs_rpc'), ('pybind.nos.v7_2_0.brocade_vcs_rpc.vcs_rbridge_context.input', 'pybind.nos.v7_2_0.brocade_vcs_rpc.brocade_vcs', 'pybind.nos.v7_2_0.brocade_vcs_rpc'), ('pybind.slxos.v17r_1_01a.brocade_vcs_rpc.vcs_rbridge_context.input', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_1_01a.brocade_vcs_rpc'), ('pybind.slxos.v17r_2_00.brocade_vcs_rpc.vcs_rbridge_context.input', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17r_2_00.brocade_vcs_rpc'), ('pybind.slxos.v17s_1_02.brocade_vcs_rpc.vcs_rbridge_context.input', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc.brocade_vcs', 'pybind.slxos.v17s_1_02.brocade_vcs_rpc')]
-    composed_child_list = []
-    compositions_keyval_list = []
-    bindings_keyval = {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
-    composed_child_leafval_list = []
-    leafval_map = {}
-    rest_leaf_name = ''
-    choices_kwargs_map = {}
-    leaf_os_support_map = {}
-    self._api_validation(choices_kwargs_map=choices_kwargs_map, leaf_os_support_map=leaf_os_support_map, rbridge_id=rbridge_id)
-    pybind_object = self._get_pybind_object(operation_type=operation_type, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, compositions_keyval_list=compositions_keyval_list, bindings_keyval=bindings_keyval, composed_child_leafval_list=composed_child_leafval_list, leafval_map=leafval_map, rbridge_id=rbridge_id)
+    api_descriptor = _vcs_rbridge_context_rpc_descriptor
+    self._api_validation(api_descriptor=api_descriptor, rbridge_id=rbridge_id)
+    pybind_object = self._get_pybind_object(operation_type=operation_type, api_descriptor=api_descriptor, rbridge_id=rbridge_id)
 
     return self._rpc_worker(operation_type=operation_type, pybind_object=pybind_object, resource_depth=1, timeout=api_timeout)
 
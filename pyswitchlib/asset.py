@@ -5,19 +5,25 @@ import os
 import sys
 import threading
 import xml.etree.ElementTree as ElementTree
-import xmltodict
-import json
-import atexit
 import Pyro4
 import Pyro4.util
 import Pyro4.errors
 from distutils.sysconfig import get_python_lib
 import time
+from multiprocessing.pool import ThreadPool
 
 from requests.packages.urllib3.exceptions import SubjectAltNameWarning
 requests.packages.urllib3.disable_warnings(SubjectAltNameWarning)
 
 from pyswitchlib.util.configFile import ConfigFileUtil
+from pyswitchlib.util.daemonProxy import DaemonProxyUtil
+from pyswitchlib.util.discoveryCache import DiscoveryCacheUtil
+from pyswitchlib.util.pybindIndex import PybindIndexUtil
+from pyswitchlib.util.xmlDecoder import XmlDecoderUtil
+from pyswitchlib.util.restResponse import RestResponse
+from pyswitchlib.util.transportRegistry import TransportRegistryUtil
+from pyswitchlib.util.authToken import AuthTokenUtil
+from pyswitchlib.util.restPolicy import RestPolicyUtil
 import pyswitchlib.exceptions
 locals().update(pyswitchlib.exceptions.__dict__)
 
@@ -30,13 +36,16 @@ class Asset(object):
     Asset provides connection information for PySwitchLib APIs.
     """
 
-    def __init__(self, ip_addr='', auth=('admin', 'password'), rest_proto=None, cacert=None, fw_ver='', timeout='', api_port=None):
+    _api_wrappers = {}
+    _rest_dispatch_pool = None
+    _rest_dispatch_pool_size = 32
+    _rest_dispatch_pool_lock = threading.Lock()
+
+    def __init__(self, ip_addr='', auth=('admin', 'password'), rest_proto=None, cacert=None, fw_ver='', timeout='', api_port=None, discovery_cache_ttl=None, rest_concurrency=None, rest_policy=None):
         def on_deletion (killed_ref):
-            self._cleanup_timer_handle()
             self._session.close()
             self._response.close()
 
-        atexit.register(self._cleanup_timer_handle)
         self._weakref = weakref.ref(self, on_deletion)
 
         self._ip_addr = ip_addr
@@ -53,7 +62,7 @@ class Asset(object):
         self._default_response_timeout = 1800
         self._default_session_verify = False
         self._session_timeout = (self._default_connection_timeout, self._default_response_timeout)
-        self._session = requests.Session()
+        self._session = None
         self._response = requests.Response()
         self._overall_success = True
         self._overall_status = []
@@ -62,24 +71,28 @@ class Asset(object):
         self._rest_session_auth_max_retries = 1
         self._rest_session_auth_token_expiration = 160
         self._rest_session_auth_token_expired = '_EXPIRED_'
-        self._rest_session_auth_token = self._rest_session_auth_token_expired
-        self._rest_session_timer_handle = None
+        self._rest_session_auth_token_manager = AuthTokenUtil(expiration=self._rest_session_auth_token_expiration)
+        self._rest_session_auth_token_key = self._rest_session_auth_token_manager.get_key(ip_addr=ip_addr, auth=auth)
         self._rest_config_path = '/rest/config/running'
         self._rest_operational_path = '/rest/operational-state'
         self._rest_rpc_path = '/rest/operational-state'
         self._rest_discover_path = '/rest'
         self._yang_list = None
         self._module_obj = None
+        self._xml_decoder = XmlDecoderUtil()
+        self._discovery_cache = None
+        self._discovery_cache_key = ''
+        self._rest_concurrency = 1
+        self._transport_pool_maxsize = 4
+        self._transport_idle_timeout = 300
+        self._rest_policy = rest_policy
+        rest_policy_kwargs = {}
 
         self._pyro_ns_port = None
-        self._pyro_proxy_name = ''
         self._pyro_daemon_id = 'default'
         self._pyro_bind_max_retries = 30
-        self._ns_pid_file = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_ns.pid')
         self._pyswitchlib_conf_filename = os.path.join(os.sep, 'etc', 'pyswitchlib', 'pyswitchlib.conf')
-        self._pyswitchlib_ns_daemon_filename = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_ns_daemon.uri')
         self._pyswitchlib_conf = ConfigFileUtil().read(filename=self._pyswitchlib_conf_filename)
-        self._pyswitchlib_ns_daemon = ConfigFileUtil().read(filename=self._pyswitchlib_ns_daemon_filename)
 
         for key in self._pyswitchlib_conf:
             if 'ns_port' == key:
@@ -90,19 +103,33 @@ class Asset(object):
             elif 'cacert' == key:
                 if cacert is None:
                     cacert = self._pyswitchlib_conf[key]
+            elif 'discovery_cache_ttl' == key:
+                if discovery_cache_ttl is None:
+                    discovery_cache_ttl = int(self._pyswitchlib_conf[key])
+            elif 'rest_concurrency' == key:
+                if rest_concurrency is None:
+                    rest_concurrency = int(self._pyswitchlib_conf[key])
+            elif 'transport_pool_size' == key:
+                self._transport_pool_maxsize = int(self._pyswitchlib_conf[key])
+            elif 'transport_idle_timeout' == key:
+                self._transport_idle_timeout = int(self._pyswitchlib_conf[key])
+            elif 'rest_max_retries' == key:
+                rest_policy_kwargs['max_retries'] = int(self._pyswitchlib_conf[key])
+            elif 'rest_retry_status_codes' == key:
+                rest_policy_kwargs['retry_status_codes'] = tuple(int(code) for code in self._pyswitchlib_conf[key].split(','))
+            elif 'rest_backoff_base' == key:
+                rest_policy_kwargs['backoff_base'] = float(self._pyswitchlib_conf[key])
+            elif 'rest_backoff_max' == key:
+                rest_policy_kwargs['backoff_max'] = float(self._pyswitchlib_conf[key])
+            elif 'rest_circuit_failure_threshold' == key:
+                rest_policy_kwargs['failure_threshold'] = int(self._pyswitchlib_conf[key])
+            elif 'rest_circuit_recovery_timeout' == key:
+                rest_policy_kwargs['recovery_timeout'] = float(self._pyswitchlib_conf[key])
 
         if api_port:
             self._pyro_ns_port = api_port
 
-        if os.path.exists(self._ns_pid_file):
-            self._pyro_proxy_name = 'PYRONAME:PySwitchLib.' + self._pyro_daemon_id
-
-            if self._pyro_ns_port:
-                self._pyro_proxy_name += '@localhost:' + str(self._pyro_ns_port)
-        else:
-            if self._pyswitchlib_ns_daemon:
-                if self._pyro_daemon_id in self._pyswitchlib_ns_daemon:
-                    self._pyro_proxy_name = self._pyswitchlib_ns_daemon[self._pyro_daemon_id]
+        self._daemon_proxy = DaemonProxyUtil(daemon_id=self._pyro_daemon_id, ns_port=self._pyro_ns_port)
 
         if rest_proto is not None:
             if rest_proto.lower() == 'http' or rest_proto.lower() == 'https' or rest_proto.lower() == 'auto':
@@ -134,64 +161,113 @@ class Asset(object):
         if timeout != '':
             self._session_timeout = timeout
 
-        self._create_timer_handle()
-        self._discover_rest_protocol_and_paths()
-        self._update_fw_version()
-        self._supported_module_name = self._get_supported_module()
+        if rest_concurrency and rest_concurrency > 1:
+            self._rest_concurrency = rest_concurrency
+            self._transport_pool_maxsize = max(self._transport_pool_maxsize, self._rest_concurrency)
 
-        with Pyro4.Proxy(self._pyro_proxy_name) as pyro_proxy:
-            for n in range(self._pyro_bind_max_retries):
-                try:
-                    pyro_proxy._pyroBind()
-                except (Pyro4.errors.NamingError, Pyro4.errors.CommunicationError) as e:
-                    if n == 0:
-                        if self._pyswitchlib_conf and 'ns_port' in self._pyswitchlib_conf:
-                            bound_api_port = int(self._pyswitchlib_conf['ns_port'])
+        self._session = self._create_session()
 
-                            if bound_api_port and self._pyro_ns_port and bound_api_port != self._pyro_ns_port:
-                                raise ExistingApiPortBound("API port: " + str(bound_api_port) + " is already bound.")
+        if self._rest_policy is None:
+            self._rest_policy = RestPolicyUtil(**rest_policy_kwargs)
 
-                        pyswitchlib_api_daemon = os.path.join(get_python_lib(), 'pyswitchlib', 'pyswitchlib_api_daemon.py')
-                        pyswitchlib_api_start_string = 'python ' + pyswitchlib_api_daemon + ' start'
+        if discovery_cache_ttl:
+            self._discovery_cache = DiscoveryCacheUtil(ttl=discovery_cache_ttl)
+            self._discovery_cache_key = self._discovery_cache.get_key(ip_addr=self._ip_addr, auth=self._auth, rest_proto=self._rest_proto_input)
 
-                        if self._pyro_ns_port:
-                            pyswitchlib_api_start_string += ' ' + str(self._pyro_ns_port)
+        if not self._load_discovery_cache():
+            self._discover_rest_protocol_and_paths()
+            self._update_fw_version()
+            self._supported_module_name = self._get_supported_module()
+            self._save_discovery_cache()
 
-                        os.system(pyswitchlib_api_start_string)
-                else:
-                    break
+        for n in range(self._pyro_bind_max_retries):
+            try:
+                pyro_proxy = self._daemon_proxy.get_proxy()
+            except (Pyro4.errors.NamingError, Pyro4.errors.CommunicationError) as e:
+                if n == 0:
+                    if self._pyswitchlib_conf and 'ns_port' in self._pyswitchlib_conf:
+                        bound_api_port = int(self._pyswitchlib_conf['ns_port'])
+
+                        if bound_api_port and self._pyro_ns_port and bound_api_port != self._pyro_ns_port:
+                            raise ExistingApiPortBound("API port: " + str(bound_api_port) + " is already bound.")
+
+                    pyswitchlib_api_daemon = os.path.join(get_python_lib(), 'pyswitchlib', 'pyswitchlib_api_daemon.py')
+                    pyswitchlib_api_start_string = 'python ' + pyswitchlib_api_daemon + ' start'
 
-                time.sleep(1)
+                    if self._pyro_ns_port:
+                        pyswitchlib_api_start_string += ' ' + str(self._pyro_ns_port)
 
+                    os.system(pyswitchlib_api_start_string)
             else:
-                raise ApiDaemonConnectionError("Cannot connect to pyswitchlib_api_daemon.py.")
+                break
 
-            self._proxied = pyro_proxy
+            time.sleep(1)
+
+        else:
+            raise ApiDaemonConnectionError("Cannot connect to pyswitchlib_api_daemon.py.")
+
+        self._proxied = pyro_proxy
 
     def __getattr__(self, name):
         if hasattr(self._proxied, name):
-            def getattr_wrapper(*args, **kwargs):
-                self._proxied.api_acquire()
-                self._proxied.module_name(module_name=self._supported_module_name)
-                rest_operation_tuple = ()
+            getattr_wrapper = Asset._api_wrappers.get(name)
 
-                try:
-                    rest_operation_tuple = getattr(self._proxied, name)(*args, **kwargs)
-                except Exception as e:
-                    raise e
-                finally:
-                    self._proxied.api_release()
-
-                return self._rest_operation(rest_commands=rest_operation_tuple[0], yang_list=rest_operation_tuple[1], timeout=rest_operation_tuple[2])
-            return getattr_wrapper
+            if getattr_wrapper is None:
+                getattr_wrapper = Asset._api_wrappers.setdefault(name, Asset._get_api_wrapper(name))
+
+            return getattr_wrapper.__get__(self, type(self))
         else:
             raise AttributeError(name)
 
+    @staticmethod
+    def _get_api_wrapper(name):
+        # The wrappers are shared by all assets and bound on each access, so an asset
+        # never holds a reference to itself and is freed as soon as it is unused.
+        def getattr_wrapper(self, *args, **kwargs):
+            rest_operation_tuple = ()
+
+            try:
+                rest_operation_tuple = self._invoke_api(name, args, kwargs)
+            except (AttributeError, ImportError) as e:
+                self._invalidate_discovery_cache()
+                raise e
+            except Exception as e:
+                raise e
+
+            return self._rest_operation(rest_commands=rest_operation_tuple[0], yang_list=rest_operation_tuple[1], timeout=rest_operation_tuple[2])
+
+        getattr_wrapper.__name__ = name
+
+        return getattr_wrapper
+
+    def _invoke_api(self, name, args, kwargs):
+        try:
+            return self._invoke_daemon_api(name, args, kwargs)
+        except Pyro4.errors.CommunicationError:
+            self._daemon_proxy.invalidate()
+            self._proxied = self._daemon_proxy.get_proxy()
+
+            return self._invoke_daemon_api(name, args, kwargs)
+
+    def _invoke_daemon_api(self, name, args, kwargs):
+        if hasattr(self._proxied, 'api_invoke'):
+            return self._proxied.api_invoke(module_name=self._supported_module_name, api_name=name, args=args, kwargs=kwargs)
+
+        self._proxied.api_acquire()
+
+        try:
+            self._proxied.module_name(module_name=self._supported_module_name)
+
+            return getattr(self._proxied, name)(*args, **kwargs)
+        finally:
+            self._proxied.api_release()
+
     def _rest_operation(self, rest_commands=None, yang_list=None, rest_proto=None, cacert=None, timeout=None):
         auth = self._auth
         auth_retries = 0
         index = 0
         rest_protocol = None
+        dispatched_responses = {}
         del self._overall_status[:]
 
         if rest_proto is not None:
@@ -208,27 +284,12 @@ class Asset(object):
             if timeout == '':
                 timeout = self._session_timeout
 
-        self._cleanup_timer_handle()
-        self._create_timer_handle()
-
         while index < len(rest_commands):
             rest_cmd = rest_commands[index]
 
             if len(rest_cmd) < 4:
                 rest_cmd.append ("config")
 
-            if rest_cmd[3] == "config":
-                uri_prefix_path = self._rest_config_path
-            elif rest_cmd[3] == "operational":
-                uri_prefix_path = self._rest_operational_path
-            elif rest_cmd[3] == "rpc":
-                uri_prefix_path = self._rest_rpc_path
-            elif rest_cmd[3] == "discover":
-                uri_prefix_path = self._rest_discover_path
-
-            header = {"Resource-Depth" : str(rest_cmd[4])}
-            url = rest_protocol+"://"+self._ip_addr+uri_prefix_path
-
             self._session.headers.update({'Content-Type': 'application/x-www-form-urlencoded'})
 
             if self._rest_session_auth_token != self._rest_session_auth_token_expired:
@@ -237,69 +298,48 @@ class Asset(object):
                 if 'Authentication-Token' in self._session.headers:
                     self._session.headers.pop('Authentication-Token')
 
-            if rest_cmd[0] == "GET":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.get(url + rest_cmd[1], headers=header, auth=auth, timeout=timeout)
-                else:
-                    self._response = self._session.get(url + rest_cmd[1], headers=header, timeout=timeout)
-            elif rest_cmd[0] == "POST":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.post(url + rest_cmd[1], auth=auth, data=rest_cmd[2], timeout=timeout)
-                else:
-                    self._response = self._session.post(url + rest_cmd[1], data=rest_cmd[2], timeout=timeout)
-            elif rest_cmd[0] == "PUT":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.put(url + rest_cmd[1], auth=auth, data=rest_cmd[2], timeout=timeout)
-                else:
-                    self._response = self._session.put(url + rest_cmd[1], data=rest_cmd[2], timeout=timeout)
-            elif rest_cmd[0] == "PATCH":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.patch(url + rest_cmd[1], auth=auth, data=rest_cmd[2], timeout=timeout)
-                else:
-                    self._response = self._session.patch(url + rest_cmd[1], data=rest_cmd[2], timeout=timeout)
-            elif rest_cmd[0] == "DELETE":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.delete(url + rest_cmd[1], auth=auth, timeout=timeout)
-                else:
-                    self._response = self._session.delete(url + rest_cmd[1], timeout=timeout)
+            if self._rest_concurrency > 1 and index not in dispatched_responses:
+                concurrent_indexes = [concurrent_index for concurrent_index in self._get_concurrent_rest_commands(rest_commands=rest_commands, index=index) if concurrent_index not in dispatched_responses]
 
-            if 'Authentication-Token' in self._response.headers:
-                self._rest_session_auth_token = self._response.headers['Authentication-Token']
+                if len(concurrent_indexes) > 1:
+                    responses = self._dispatch_rest_commands(rest_commands=[rest_commands[concurrent_index] for concurrent_index in concurrent_indexes], rest_protocol=rest_protocol, auth=auth, timeout=timeout)
+                    dispatched_responses.update(zip(concurrent_indexes, responses))
 
-            json_output = json.loads('{"output": ""}')
-            text_response = self._response.text
+            if index in dispatched_responses:
+                self._response = dispatched_responses.pop(index)
+            else:
+                self._response = self._send_rest_command(rest_cmd=rest_cmd, rest_protocol=rest_protocol, auth=auth, timeout=timeout)
 
-            if self._response.status_code >= 200 and self._response.status_code <= 299:
-                if re.match('^<', self._response.text):
-                    if rest_cmd[3] != "rpc":
-                        text_response = '<output>\r\n' + self._response.text + '</output>\r\n'
+            if 'Authentication-Token' in self._response.headers:
+                self._rest_session_auth_token = self._response.headers['Authentication-Token']
 
-                    json_output = json.loads(self._xml_to_json(text_response))
-            else:
-                self._auth_token_expiration()
+            if not (self._response.status_code >= 200 and self._response.status_code <= 299):
+                # The token is shared by every asset of the switch and the credentials,
+                # so it is only expired when the switch rejects it.
+                if self._response.status_code == 401:
+                    self._auth_token_expiration()
 
                 if self._response.status_code == 401 and auth_retries < self._rest_session_auth_max_retries:
                     auth_retries += 1
+
+                    # Only the dispatched commands rejected with a 401 are sent again, the
+                    # others of their group were already applied by the switch.
+                    for dispatched_index in [dispatched_index for dispatched_index in dispatched_responses if dispatched_responses[dispatched_index].status_code == 401]:
+                        dispatched_responses.pop(dispatched_index)
+
                     continue
 
-                if re.match('^<', self._response.text):
-                    if re.match('^<output', self._response.text):
-                        json_output = json.loads(self._xml_to_json(text_response))
-                    else:
-                        json_output = json.loads('{"output": ' + self._xml_to_json(text_response) + '}')
-                else:
-                    json_output = json.loads('{"output": ' + json.dumps(str(self._response.text)) + '}')
+                # A 404 on a config uri usually means the resource is absent, so only
+                # rpc and discover paths are treated as stale discovery information.
+                if self._response.status_code == 401 or (self._response.status_code == 404 and rest_cmd[3] in ('rpc', 'discover')):
+                    self._invalidate_discovery_cache()
 
-            if yang_list:
-                self._format_dict_output(container=json_output, keys=yang_list)
+            response = RestResponse.from_response(response=self._response, rest_type=rest_cmd[3], yang_list=yang_list, xml_decoder=self._xml_decoder)
 
-            self._overall_status.append({self._ip_addr : {'request': {'op_code': rest_cmd[0], 'uri': rest_cmd[1], 'data': rest_cmd[2]}, 'response': {'status_code': self._response.status_code, 'url': self._response.url, 'text': self._response.text, 'json': json_output}}})
+            self._overall_status.append({self._ip_addr : {'request': {'op_code': rest_cmd[0], 'uri': rest_cmd[1], 'data': rest_cmd[2]}, 'response': response}})
 
             index += 1
 
-        if not self._rest_session_timer_handle.is_alive():
-            self._rest_session_timer_handle.start()
-
         return self._get_results()
 
     def _get_results(self):
@@ -315,6 +355,177 @@ class Asset(object):
 
         return self._overall_success, self._overall_status
 
+    def _send_rest_command(self, rest_cmd=None, rest_protocol=None, auth=None, timeout=None):
+        request_kwargs = {'rest_cmd': rest_cmd, 'rest_protocol': rest_protocol, 'auth': auth, 'timeout': timeout}
+
+        if rest_cmd[3] == "discover":
+            return self._send_rest_request(**request_kwargs)
+
+        return self._rest_policy.execute(key=self._ip_addr, rest_cmd=rest_cmd, timeout=timeout, request_func=self._send_rest_request, request_kwargs=request_kwargs)
+
+    def _send_rest_request(self, rest_cmd=None, rest_protocol=None, auth=None, timeout=None):
+        if rest_cmd[3] == "config":
+            uri_prefix_path = self._rest_config_path
+        elif rest_cmd[3] == "operational":
+            uri_prefix_path = self._rest_operational_path
+        elif rest_cmd[3] == "rpc":
+            uri_prefix_path = self._rest_rpc_path
+        elif rest_cmd[3] == "discover":
+            uri_prefix_path = self._rest_discover_path
+
+        header = {"Resource-Depth" : str(rest_cmd[4])}
+        response = None
+        url = rest_protocol+"://"+self._ip_addr+uri_prefix_path
+
+        if rest_cmd[0] == "GET":
+            if self._rest_session_auth_token == self._rest_session_auth_token_expired:
+                response = self._session.get(url + rest_cmd[1], headers=header, auth=auth, timeout=timeout)
+            else:
+                response = self._session.get(url + rest_cmd[1], headers=header, timeout=timeout)
+        elif rest_cmd[0] == "POST":
+            if self._rest_session_auth_token == self._rest_session_auth_token_expired:
+                response = self._session.post(url + rest_cmd[1], auth=auth, data=rest_cmd[2], timeout=timeout)
+            else:
+                response = self._session.post(url + rest_cmd[1], data=rest_cmd[2], timeout=timeout)
+        elif rest_cmd[0] == "PUT":
+            if self._rest_session_auth_token == self._rest_session_auth_token_expired:
+                response = self._session.put(url + rest_cmd[1], auth=auth, data=rest_cmd[2], timeout=timeout)
+            else:
+                response = self._session.put(url + rest_cmd[1], data=rest_cmd[2], timeout=timeout)
+        elif rest_cmd[0] == "PATCH":
+            if self._rest_session_auth_token == self._rest_session_auth_token_expired:
+                response = self._session.patch(url + rest_cmd[1], auth=auth, data=rest_cmd[2], timeout=timeout)
+            else:
+                response = self._session.patch(url + rest_cmd[1], data=rest_cmd[2], timeout=timeout)
+        elif rest_cmd[0] == "DELETE":
+            if self._rest_session_auth_token == self._rest_session_auth_token_expired:
+                response = self._session.delete(url + rest_cmd[1], auth=auth, timeout=timeout)
+            else:
+                response = self._session.delete(url + rest_cmd[1], timeout=timeout)
+
+        return response
+
+    def _get_concurrent_rest_commands(self, rest_commands=None, index=0):
+        concurrent_indexes = []
+        concurrent_uris = []
+
+        for concurrent_index in range(index, len(rest_commands)):
+            rest_cmd = rest_commands[concurrent_index]
+
+            if len(rest_cmd) < 4:
+                rest_cmd.append ("config")
+
+            if rest_cmd[3] not in ['config', 'operational']:
+                break
+
+            # The config and operational trees address the same resources, so reads of
+            # either tree conflict with writes of the same uri.
+            uri = rest_cmd[1].split('?')[0].rstrip('/')
+            is_read = rest_cmd[0] == "GET"
+            overlapping = False
+
+            for concurrent_uri, concurrent_read in concurrent_uris:
+                if is_read and concurrent_read:
+                    continue
+
+                if uri == concurrent_uri or uri.startswith(concurrent_uri + '/') or concurrent_uri.startswith(uri + '/'):
+                    overlapping = True
+                    break
+
+            if overlapping:
+                break
+
+            concurrent_indexes.append(concurrent_index)
+            concurrent_uris.append((uri, is_read))
+
+        return concurrent_indexes
+
+    def _dispatch_rest_commands(self, rest_commands=None, rest_protocol=None, auth=None, timeout=None):
+        responses = [None] * len(rest_commands)
+        exc_infos = []
+        pending = iter(range(len(rest_commands)))
+        pending_lock = threading.Lock()
+
+        def dispatch_worker():
+            while not exc_infos:
+                with pending_lock:
+                    position = next(pending, None)
+
+                if position is None:
+                    break
+
+                try:
+                    responses[position] = self._send_rest_command(rest_cmd=rest_commands[position], rest_protocol=rest_protocol, auth=auth, timeout=timeout)
+                except Exception:
+                    exc_infos.append(sys.exc_info())
+
+        rest_dispatch_pool = Asset._get_rest_dispatch_pool()
+        workers = [rest_dispatch_pool.apply_async(dispatch_worker) for n in range(min(self._rest_concurrency, len(rest_commands)))]
+
+        for worker in workers:
+            worker.wait()
+
+        if exc_infos:
+            raise exc_infos[0][0], exc_infos[0][1], exc_infos[0][2]
+
+        return responses
+
+    @classmethod
+    def _get_rest_dispatch_pool(cls):
+        # One bounded pool serves the concurrent rest commands of every asset in the
+        # process, each call using at most rest_concurrency of its threads.
+        with cls._rest_dispatch_pool_lock:
+            if Asset._rest_dispatch_pool is None:
+                Asset._rest_dispatch_pool = ThreadPool(processes=cls._rest_dispatch_pool_size)
+
+            return Asset._rest_dispatch_pool
+
+    def _load_discovery_cache(self):
+        if self._discovery_cache is None:
+            return False
+
+        entry = self._discovery_cache.read(key=self._discovery_cache_key)
+
+        if not entry:
+            return False
+
+        try:
+            self._rest_protocol = entry['rest_protocol']
+            self._enabled_rest_protocols = list(entry['enabled_rest_protocols'])
+            self._attempted_rest_protocols = list(entry['enabled_rest_protocols'])
+            self._rest_config_path = entry['rest_config_path']
+            self._rest_operational_path = entry['rest_operational_path']
+            self._rest_rpc_path = entry['rest_rpc_path']
+            self._os_type = entry['os_type']
+            self._os_ver = entry['os_ver']
+            self._os_full_ver = entry['os_full_ver']
+            self._supported_module_name = entry['supported_module_name']
+        except KeyError:
+            self._invalidate_discovery_cache()
+            return False
+
+        return True
+
+    def _save_discovery_cache(self):
+        if self._discovery_cache is None:
+            return
+
+        self._discovery_cache.write(key=self._discovery_cache_key, entry={
+            'rest_protocol': self._rest_protocol,
+            'enabled_rest_protocols': self._enabled_rest_protocols,
+            'rest_config_path': self._rest_config_path,
+            'rest_operational_path': self._rest_operational_path,
+            'rest_rpc_path': self._rest_rpc_path,
+            'os_type': self._os_type,
+            'os_ver': self._os_ver,
+            'os_full_ver': self._os_full_ver,
+            'supported_module_name': self._supported_module_name,
+        })
+
+    def _invalidate_discovery_cache(self):
+        if self._discovery_cache is not None:
+            self._discovery_cache.invalidate(key=self._discovery_cache_key)
+
     def _discover_rest_protocol_and_paths(self):
         status, result = self._do_rest_protocol_discovery(self._rest_proto_input)
 
@@ -409,7 +620,7 @@ class Asset(object):
 
                 if (status == True):
                     self._session.close()
-                    self._session = requests.Session()
+                    self._session = self._create_session()
                     self._session.verify = self._default_session_verify
 
                     self._enabled_rest_protocols.append('https')
@@ -464,142 +675,34 @@ class Asset(object):
     def _update_max_keep_alive_requests(self, max_requests=0):
         return self.run_command(command="unhide foscmd;fibranne;foscmd sed \\'s/MaxKeepAliveRequests [0-9]*/MaxKeepAliveRequests " + str(max_requests) + "/\\' /fabos/webtools/bin/httpd.conf > /fabos/webtools/bin/httpd.conf.temp&&mv /fabos/webtools/bin/httpd.conf.temp /fabos/webtools/bin/httpd.conf&&/usr/apache/bin/apachectl -k restart &")
 
-    def _xml_to_json(self, xml=''):
-        return json.dumps(xmltodict.parse(xml))
-
     def _get_supported_module(self):
-        pybind_dir = ''
-        site_dir = sys.path
-
-        for site_path in site_dir:
-            pybind_dir = os.path.join(site_path, 'pybind')
-            if os.path.isdir(pybind_dir):
-                pybind_dir = os.path.join(pybind_dir, self._os_type)
-                break
-
-        pybind_ver_tree = {}
-
-        max_depth = 1
-        cur_depth = pybind_dir.count(os.sep)
-        max_os_walk_depth = cur_depth + max_depth
-
-        for (dirpath, dirs, files) in os.walk(pybind_dir):
-            if dirpath.count(os.sep) >= max_os_walk_depth:
-                del dirs[:]
-
-            submodule = dirpath.partition(pybind_dir)[2].lstrip('/').replace(os.sep, '.')
-
-            if submodule:
-                tuple = submodule.strip('v_').split('_')
-
-                for index, elem in enumerate(tuple):
-                    if index == 0:
-                        if elem not in pybind_ver_tree:
-                            pybind_ver_tree[elem] = {}
-                    elif index == 1:
-                        if elem not in pybind_ver_tree[tuple[0]]:
-                            pybind_ver_tree[tuple[0]][elem] = {}
-                    elif index == 2:
-                        if elem not in pybind_ver_tree[tuple[0]][tuple[1]]:
-                            pybind_ver_tree[tuple[0]][tuple[1]][elem] = {}
-                    elif index == 3:
-                        if elem not in pybind_ver_tree[tuple[0]][tuple[1]][tuple[2]]:
-                            pybind_ver_tree[tuple[0]][tuple[1]][tuple[2]][elem] = {}
-
-        os_version_tuple = self._os_ver.strip('.').split('.')
-        supported_os_version = []
-
-        if os_version_tuple[0] in pybind_ver_tree:
-            supported_os_version.append(os_version_tuple[0])
-        else:
-            for major in sorted(pybind_ver_tree, reverse=True):
-                if os_version_tuple[0] >= re.sub('\D', '', major):
-                    supported_os_version.append(major)
-                    break;
-
-        if len(supported_os_version) < 1:
-            raise UnsupportedOSError("OS Version: " + self._os_type + " " + self._os_ver + " is unsupported.")
-
-        if supported_os_version[0] == os_version_tuple[0] and os_version_tuple[1] in pybind_ver_tree[supported_os_version[0]]:
-            supported_os_version.append(os_version_tuple[1])
-        else:
-            for minor in sorted(pybind_ver_tree[supported_os_version[0]], reverse=True):
-                if supported_os_version[0] == os_version_tuple[0]:
-                    if os_version_tuple[1] >= minor:
-                        supported_os_version.append(minor)
-                        break;
-                else:
-                    supported_os_version.append(minor)
-                    break;
-
-        if len(supported_os_version) >= 2:
-            if supported_os_version[0] == os_version_tuple[0] and supported_os_version[1] == os_version_tuple[1] and os_version_tuple[2] in pybind_ver_tree[supported_os_version[0]][supported_os_version[1]]:
-                supported_os_version.append(os_version_tuple[2])
-            else:
-                for patch in sorted(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]], reverse=True):
-                    if supported_os_version[0] == os_version_tuple[0] and supported_os_version[1] == os_version_tuple[1]:
-                        if os_version_tuple[2] >= patch or len(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]]) == 1:
-                            supported_os_version.append(patch)
-                            break;
-                    else:
-                        supported_os_version.append(patch)
-                        break;
-        else:
-            for minor in sorted(pybind_ver_tree[supported_os_version[0]], reverse=True):
-                supported_os_version.append(minor)
-                break;
-
-            for patch in sorted(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]], reverse=True):
-                supported_os_version.append(patch)
-                break;
-
-        safe_os_version = 'v'+'_'.join(supported_os_version)
-        package_name = '.'.join(['pybind', self._os_type, safe_os_version])
-
-        return package_name
+        return PybindIndexUtil().resolve(os_type=self._os_type, os_ver=self._os_ver)
 
     def _load_module(self, supported_module_name=''):
         if supported_module_name:
             self._module_obj =  __import__(supported_module_name, fromlist=['*'])
 
+    @property
+    def _rest_session_auth_token(self):
+        return self._rest_session_auth_token_manager.get_token(key=self._rest_session_auth_token_key) or self._rest_session_auth_token_expired
+
+    @_rest_session_auth_token.setter
+    def _rest_session_auth_token(self, token):
+        if token == self._rest_session_auth_token_expired:
+            self._rest_session_auth_token_manager.expire_token(key=self._rest_session_auth_token_key)
+        else:
+            self._rest_session_auth_token_manager.update_token(key=self._rest_session_auth_token_key, token=token)
+
     def _auth_token_expiration(self):
         self._rest_session_auth_token = self._rest_session_auth_token_expired
-        self._cleanup_timer_handle()
-        self._create_timer_handle()
-
-    def _create_timer_handle(self):
-        self._rest_session_timer_handle = threading.Timer(self._rest_session_auth_token_expiration, self._auth_token_expiration)
-        self._rest_session_timer_handle.daemon = True
-
-    def _cleanup_timer_handle(self):
-        if self._rest_session_timer_handle:
-            if self._rest_session_timer_handle.is_alive():
-                self._rest_session_timer_handle.cancel()
-                self._rest_session_timer_handle = None
-
-    def _format_dict_output(self, container=None, keys=None):
-        if keys and container:
-            if isinstance(container, dict):
-                for k in container:
-                    if isinstance(container[k], dict):
-                        if k.lower() in keys:
-                            keys.remove(k.lower())
-                            container[k] = [container[k]]
-                            self._format_dict_output(container=container[k], keys=keys)
-                        else:
-                            self._format_dict_output(container=container[k], keys=keys)
-                    elif isinstance(container[k], list):
-                        for elem in container[k]:
-                            self._format_dict_output(container=elem, keys=keys)
-            elif isinstance(container, list):
-                for elem in container:
-                    self._format_dict_output(container=elem, keys=keys)
+
+    def _create_session(self):
+        return TransportRegistryUtil(pool_maxsize=self._transport_pool_maxsize, idle_timeout=self._transport_idle_timeout).get_session()
 
     def close(self):
-        self._cleanup_timer_handle()
         self._session.close()
         self._response.close()
-        self._proxied._pyroRelease()
+        self._daemon_proxy.put_proxy(pyro_proxy=self._proxied)
 
     def get_os_type(self):
         """
@@ -655,6 +758,24 @@ class Asset(object):
         """
         return self._supported_module_name
 
+    def get_transport_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *dict*
+        :returns: Returns the connection statistics of the shared transports to the asset's ip address, keyed by (protocol, ip, verify).
+        """
+        return TransportRegistryUtil().get_stats(ip_addr=self._ip_addr)
+
+    def get_rest_policy_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *dict*
+        :returns: Returns the process-wide request, retry, circuit open and fast failure counters, the number of open circuits and the circuit state of each device.
+        """
+        return self._rest_policy.get_stats()
+
     def get_enabled_rest_protocols(self):
         """
         This is an auto-generated method for the PySwitchLib.
@@ -664,6 +785,28 @@ class Asset(object):
         """
         return self._enabled_rest_protocols
 
+    def refresh_discovery(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *string*
+        :returns: Returns the path name of the selected pybind module after the asset's rest protocols, uri paths and firmware version are rediscovered.
+        """
+        self._invalidate_discovery_cache()
+
+        del self._attempted_rest_protocols[:]
+        del self._enabled_rest_protocols[:]
+
+        if self._rest_proto_input == 'auto' or not self._rest_proto_input:
+            self._rest_protocol = 'http'
+
+        self._discover_rest_protocol_and_paths()
+        self._update_fw_version()
+        self._supported_module_name = self._get_supported_module()
+        self._save_discovery_cache()
+
+        return self._supported_module_name
+
     def run_command(self, command=''):
         """
         This is an auto-generated method for the PySwitchLib.
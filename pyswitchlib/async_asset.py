@@ -0,0 +1,110 @@
+import os
+import threading
+from multiprocessing.pool import ThreadPool
+
+from pyswitchlib.asset import Asset
+from pyswitchlib.util.configFile import ConfigFileUtil
+
+pyswitchlib_conf_file = os.path.join(os.sep, 'etc', 'pyswitchlib', 'pyswitchlib.conf')
+
+class AsyncAsset(Asset):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    AsyncAsset runs PySwitchLib APIs on a shared worker pool and returns pending results.
+    """
+
+    _default_pool_size = 64
+    _pool = None
+    _pool_size = None
+    _pool_lock = threading.Lock()
+
+    def __init__(self, ip_addr='', auth=('admin', 'password'), rest_proto=None, cacert=None, fw_ver='', timeout='', api_port=None, discovery_cache_ttl=None, rest_concurrency=None, rest_policy=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Every API method of Asset is available on AsyncAsset.  Instead of the (status, details)
+        tuple, each call returns a pending result whose get() method returns that tuple once
+        the rest operations have completed.  Calls on the same asset run one at a time, calls
+        on different assets run concurrently on the shared worker pool.
+        """
+        self._operation_lock = threading.Lock()
+
+        super(AsyncAsset, self).__init__(ip_addr=ip_addr, auth=auth, rest_proto=rest_proto, cacert=cacert, fw_ver=fw_ver, timeout=timeout, api_port=api_port, discovery_cache_ttl=discovery_cache_ttl, rest_concurrency=rest_concurrency, rest_policy=rest_policy)
+
+    def __getattr__(self, name):
+        api = super(AsyncAsset, self).__getattr__(name)
+
+        def async_wrapper(*args, **kwargs):
+            return self.get_pool().apply_async(self._run_operation, (api, args, kwargs))
+
+        return async_wrapper
+
+    def _create_session(self):
+        self._transport_pool_maxsize = max(self._transport_pool_maxsize, self._get_pool_size())
+
+        return super(AsyncAsset, self)._create_session()
+
+    def _run_operation(self, api=None, args=(), kwargs=None):
+        with self._operation_lock:
+            status, details = api(*args, **(kwargs or {}))
+
+            return status, list(details)
+
+    @classmethod
+    def create(cls, **kwargs):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *multiprocessing.pool.AsyncResult*
+        :returns: Returns a pending result whose get() method returns the constructed AsyncAsset.
+        """
+        return cls.get_pool().apply_async(cls, (), kwargs)
+
+    @classmethod
+    def get_pool(cls):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *multiprocessing.pool.ThreadPool*
+        :returns: Returns the worker pool shared by every AsyncAsset in the process.
+        """
+        with cls._pool_lock:
+            if AsyncAsset._pool is None:
+                AsyncAsset._pool = ThreadPool(processes=cls._get_pool_size())
+
+            return AsyncAsset._pool
+
+    @classmethod
+    def _get_pool_size(cls):
+        if AsyncAsset._pool_size is None:
+            pyswitchlib_conf = ConfigFileUtil().read(filename=pyswitchlib_conf_file)
+            AsyncAsset._pool_size = int(pyswitchlib_conf.get('async_pool_size', cls._default_pool_size))
+
+        return AsyncAsset._pool_size
+
+    @staticmethod
+    def gather(*async_results, **kwargs):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Waits for the pending results in order.  Accepts the keyword arguments timeout, in
+        seconds for each result, and return_exceptions, to return a failed call's exception
+        in place of its result instead of raising it.
+
+        :rtype: *list*
+        :returns: Returns the results of the pending calls in the order they were given.
+        """
+        timeout = kwargs.get('timeout')
+        return_exceptions = kwargs.get('return_exceptions', False)
+        results = []
+
+        for async_result in async_results:
+            try:
+                results.append(async_result.get(timeout))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+
+                results.append(e)
+
+        return results
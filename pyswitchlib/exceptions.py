@@ -33,3 +33,5 @@ class CACertificateNotSpecifiedError(PyswitchlibException):
 class InvalidAuthenticationCredentialsError(PyswitchlibException):
     """If the provided authentication credentials are invalid."""
 
+class CircuitBreakerOpenError(PyswitchlibException):
+    """If rest requests to the asset fail fast because its rest interface is unhealthy."""
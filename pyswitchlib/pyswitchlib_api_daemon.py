@@ -6,14 +6,18 @@ import json
 import re
 import Pyro4
 import Pyro4.naming
-import uuid
-import hashlib
-import pyangbind.lib.pybindJSON as pybindJSON
+import types
+import pkgutil
+from pyangbind.lib.base import PybindBase
 from pyswitchlib.util.configFile import ConfigFileUtil
 from pyswitchlib.util.config import ConfigUtil
+from pyswitchlib.util.apiWorkerPool import ApiWorkerPoolUtil
+from pyswitchlib.util.cliPacing import CliPacingUtil
+from pyswitchlib.util.netmikoPool import NetmikoPoolUtil
+from pyswitchlib.util.pybindModuleCache import PybindModuleCacheUtil
+from pyswitchlib.util.pybindXml import PybindXmlUtil
+from pyswitchlib.util.requestPlanCache import RequestPlanCacheUtil
 from pyswitchlib.exceptions import (MultipleChoicesSetError)
-from collections import OrderedDict
-from dicttoxml import dicttoxml
 from daemon.runner import (DaemonRunner, DaemonRunnerStopFailureError)
 from lockfile import LockTimeout
 from netmiko import ConnectHandler
@@ -30,115 +34,146 @@ class PySwitchLibApiDaemon(object):
     Providing python bindings to configure a switch through the REST interface.
     """
 
-    def __init__(self, module_name='', module_obj=None, pyro_daemon=None):
+    _api_names = set()
+    _api_modules_lock = threading.Lock()
+
+    @classmethod
+    def add_apis(cls, api_module=None):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
-        self._module_name = module_name
-        self._module_obj = module_obj
-        self._api_lock = threading.Lock()
-        self._api_timer = None
-        self._api_timer_expiration = 10
-        self._pyro_daemon = pyro_daemon
-        self._netmiko_lock = threading.Lock()
-        self._netmiko_connection = {}
+        for api_name, api in api_module.__dict__.items():
+            if '__' not in api_name and isinstance(api, types.FunctionType):
+                setattr(cls, api_name, api)
+                cls._api_names.add(api_name)
 
-    def _api_timer_expiration_handler(self):
+    @classmethod
+    def add_lazy_apis(cls, api_module_name=''):
         """
         This is an auto-generated method for the PySwitchLib.
+
+        Registers the APIs of an api module without importing it.  The API names are read
+        from the module source, and each API is registered as a stub which imports the
+        module on its first call and replaces the stubs with the module's APIs.  Modules
+        without source are imported right away, and missing modules are skipped.
         """
 
-        try:
-            self._api_lock.release()
-        except:
-            pass
+        api_module_loader = pkgutil.get_loader(api_module_name)
 
-    def _hash_auth_string(self, auth_str):
+        if api_module_loader is None:
+            return
+
+        api_module_source = api_module_loader.get_source(api_module_name)
+
+        if api_module_source is None:
+            cls.add_apis(api_module=__import__(api_module_name, fromlist=['*']))
+            return
+
+        for api_name in re.findall(r'^def (\w+)\(', api_module_source, re.MULTILINE):
+            if '__' not in api_name and api_name not in cls._api_names:
+                setattr(cls, api_name, cls._get_lazy_api(api_module_name=api_module_name, api_name=api_name))
+                cls._api_names.add(api_name)
+
+    @classmethod
+    def _get_lazy_api(cls, api_module_name='', api_name=''):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
-        salt = uuid.uuid4().hex
-        user = auth_str[0]
-        passwd = auth_str[1]
-        encode_str = hashlib.sha256(salt.encode() + user.encode() + passwd.encode()).hexdigest()
-        return encode_str + ':' + salt
+        def lazy_api(self, *args, **kwargs):
+            with cls._api_modules_lock:
+                api_module = __import__(api_module_name, fromlist=['*'])
+
+                if cls.__dict__.get(api_name) is lazy_api:
+                    cls.add_apis(api_module=api_module)
+
+            if not isinstance(api_module.__dict__.get(api_name), types.FunctionType):
+                raise AttributeError("API " + api_name + " is not defined in " + api_module_name + ".")
+
+            return api_module.__dict__[api_name](self, *args, **kwargs)
+
+        lazy_api.__name__ = api_name
+
+        return lazy_api
+
+    def __init__(self, module_name='', module_obj=None, pyro_daemon=None, pyro_unix_daemon=None, api_worker_pool=None, api_prewarm=None, api_prewarm_file='', pybind_cache_max_packages=0, pybind_cache_max_rss=0, request_plan_cache_size=1024,
+                 netmiko_host_sessions=4, netmiko_max_sessions=64, netmiko_idle_timeout=300, netmiko_liveness_interval=30,
+                 cli_pacing=False, cli_pacing_file=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        The pybind modules in api_prewarm, and the ones learned from earlier API calls
+        in api_prewarm_file, are warmed up in a background thread.  The least recently
+        used pybind version packages are unloaded when more than pybind_cache_max_packages
+        are imported or the daemon's rss is above pybind_cache_max_rss bytes.  The rest
+        commands of up to request_plan_cache_size read-only API calls are cached.  The
+        cli calls share up to netmiko_max_sessions netmiko sessions, at most
+        netmiko_host_sessions per host and credentials.  With cli_pacing, the delay factor
+        and chunk size of cli config pushes are tuned per host, and the ones learned per
+        platform type are kept in cli_pacing_file.
+        """
 
-    def _check_auth_string(self, hashed_str, new_auth):
+        self._default_module_name = module_name
+        self._module_obj = module_obj
+        self._call_context = threading.local()
+        self._pyro_daemon = pyro_daemon
+        self._pyro_unix_daemon = pyro_unix_daemon
+        self._api_worker_pool = api_worker_pool
+        self._binding_plans = {}
+        self._binding_plans_lock = threading.Lock()
+        self._binding_plans_stats = {'hits': 0, 'misses': 0}
+        self._netmiko_lock = threading.Lock()
+        self._netmiko_pool = NetmikoPoolUtil(connect=self._establish_netmiko_handler, max_host_sessions=netmiko_host_sessions, max_sessions=netmiko_max_sessions,
+                                             idle_timeout=netmiko_idle_timeout, liveness_interval=netmiko_liveness_interval)
+        self._cli_pacing = CliPacingUtil(enabled=cli_pacing, state_file=cli_pacing_file)
+        self._api_prewarm_file = api_prewarm_file
+        self._api_prewarm_lock = threading.Lock()
+        self._api_prewarm_learned = set()
+        self._api_prewarm_stats = {'modules': [], 'warmed': [], 'failed': {}, 'current': '', 'done': True, 'elapsed': 0.0}
+        self._request_plan_cache = RequestPlanCacheUtil(size=request_plan_cache_size)
+        self._pybind_module_cache = PybindModuleCacheUtil(max_packages=pybind_cache_max_packages, max_rss=pybind_cache_max_rss, on_evict=self._drop_binding_plans)
+
+        if api_prewarm or api_prewarm_file:
+            self._start_prewarm(module_names=api_prewarm)
+
+    @property
+    def _module_name(self):
         """
         This is an auto-generated method for the PySwitchLib.
+
+        The pybind module name of the API call running in the current thread.
         """
 
-        auth_str, salt = hashed_str.split(':')
-        user = new_auth[0]
-        passwd = new_auth[1]
-        new_hash = hashlib.sha256(salt.encode() + user.encode() + passwd.encode()).hexdigest()
-        return auth_str == new_hash
+        return getattr(self._call_context, 'module_name', self._default_module_name)
 
-    def create_netmiko_connection(self, opt):
+    @_module_name.setter
+    def _module_name(self, module_name=''):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
-        key = opt['ip']
-        conn_list = ['None', 'None', 'None']
-        net_connect_dict = self._netmiko_connection
-        auth = (opt['username'], opt['password'])
-        if key not in net_connect_dict:
-            # case 1: No key create a connection
-            try:
-                net_connect = self._establish_netmiko_handler(opt, net_connect_dict)
-                if net_connect:
-                    hashed_auth = self._hash_auth_string(auth)
-                    conn_list[0] = net_connect
-                    conn_list[1] = hashed_auth
-                    conn_list[2] = threading.Lock()
-                    net_connect_dict[key] = conn_list
-            except ValueError as err:
-                raise
-            except Exception as err:
-                raise
+        self._call_context.module_name = module_name
 
-        else:
-            existing_hash = net_connect_dict[key][1]
-            conn_list = self._get_netmiko_connection(key)
-            conn_obj = conn_list[0]
-            if self._check_auth_string(existing_hash, auth):
-                # case 2: check if connection object is alive
-                if conn_obj.is_alive() is True:
-                    conn_obj.set_base_prompt()
-                    return
-            # case 3: Assume user value is new so delete existing
-            # and add new connection object for this
-            else:
-                #disconnect stale object
-                conn_list[2].acquire()
-                conn_obj.disconnect()
-                conn_list[2].release()
-
-            # Existing object is not valid so clear and create new
-            # connection
-            del net_connect_dict[key]
-            try:
-                net_connect = self._establish_netmiko_handler(opt, net_connect_dict)
-                if net_connect:
-                    new_hash = self._hash_auth_string(auth)
-                    conn_list[0] = net_connect
-                    conn_list[1] = new_hash
-                    conn_list[2] = threading.Lock()
-                    net_connect_dict[key] = conn_list
-            except ValueError as error:
-                raise
-            except Exception:
-                raise Exception
+    def create_netmiko_connection(self, opt, platform=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
 
-    def _establish_netmiko_handler(self, opt, net_connect_dict):
+        Registers the netmiko session pool of the host and credentials, opening its
+        first session when it has none, and returns the pool key.  The platform type
+        selects the learned cli pacing of the host.
+        """
+
+        if platform:
+            self._cli_pacing.set_platform(host=opt['ip'], platform=platform)
+
+        return self._netmiko_pool.register(opt=opt)
+
+    def _establish_netmiko_handler(self, opt):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
-        key = opt['ip']
         try:
             net_connect = ConnectHandler(**opt)
         except NetMikoTimeoutException as error:
@@ -155,45 +190,131 @@ class PySwitchLibApiDaemon(object):
             raise ValueError('Failed to connect to switch %s' % reason)
         return net_connect
 
-    def _get_netmiko_connection(self, key):
+    def cli_execution(self, handler, host, call, pool_key=None):
         """
         This is an auto-generated method for the PySwitchLib.
+
+        Runs the cli call on a pooled session of the host.  The pool_key returned by
+        create_netmiko_connection selects the credentials, otherwise the pool last
+        registered for the host is used.
         """
 
-        if key in self._netmiko_connection:
-            return self._netmiko_connection[key]
-        else:
-            return None
+        value = ''
+        key = pool_key or self._netmiko_pool.get_host_key(host=host)
+        if not self._netmiko_pool.has_pool(key=key):
+            return value
 
-    def cli_execution(self, handler, host, call):
+        try:
+            value = self._netmiko_pool.execute(key=key, func=lambda conn_obj: self._run_cli_step(conn_obj, handler, call, host))
+        except Exception as error:
+            reason = error.message or str(error)
+            raise ValueError('Failed to run the cli call on switch %s: %s' % (host, reason))
+
+        return value
+
+    def cli_batch_execution(self, host, steps, pool_key=None):
         """
         This is an auto-generated method for the PySwitchLib.
+
+        Runs the ordered (handler, call) steps on one pooled session of the host in a
+        single round trip, and returns a list of dicts with the handler, output and
+        elapsed seconds of each step.  When a step fails, the list ends with that step,
+        whose dict also holds the error, and the remaining steps are not run.
         """
 
-        value = ''
-        conn_list = self._get_netmiko_connection(host)
-        if not conn_list:
-            return value
-        conn_obj = conn_list[0]
-        conn_list[2].acquire()
+        key = pool_key or self._netmiko_pool.get_host_key(host=host)
+        if not self._netmiko_pool.has_pool(key=key):
+            return []
+
+        results = []
+
+        def run_steps(conn_obj):
+            for handler, call in steps:
+                start = time.time()
+                try:
+                    output = self._run_cli_step(conn_obj, handler, call, host)
+                except Exception as error:
+                    results.append({'handler': handler, 'output': '', 'elapsed': time.time() - start, 'error': error.message or str(error)})
+                    raise
+                results.append({'handler': handler, 'output': output, 'elapsed': time.time() - start})
+            return results
+
+        try:
+            return self._netmiko_pool.execute(key=key, func=run_steps)
+        except Exception as error:
+            if results and 'error' in results[-1]:
+                return results
+
+            reason = error.message or str(error)
+            raise ValueError('Failed to run the cli batch on switch %s: %s' % (host, reason))
+
+    def _run_cli_step(self, conn_obj, handler, call, host=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+
+        if handler == 'cli-set':
+            conn_obj.enable()
+            return self._send_config_set(conn_obj, call, host)
+        elif handler == 'cli-get':
+            return conn_obj.send_command(call)
+        return ''
+
+    def _send_config_set(self, conn_obj, call, host=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Pushes the config commands in chunks, paced with the delay factor of the host.
+        The chunks stay in config mode until the last one, and the delay factor is
+        picked again before each chunk.  The global delay factor of the session is only
+        lowered when cli pacing is enabled.
+        """
+
+        commands = [call] if isinstance(call, basestring) else list(call or [])
+        if not commands:
+            return conn_obj.send_config_set(config_commands=call, delay_factor=0.25)
+
+        delay_factor, chunk_size = self._cli_pacing.get_params(host=host)
+        chunk_size = chunk_size or len(commands)
+        global_delay_factor = conn_obj.global_delay_factor
+        output = ''
+
         try:
-            if handler == 'cli-set':
-                conn_obj.enable()
-                value = conn_obj.send_config_set(config_commands=call, delay_factor=0.25)
-            elif handler == 'cli-get':
-                value = conn_obj.send_command(call)
-        except Exception:
-            raise Exception
+            for index in range(0, len(commands), chunk_size):
+                chunk = commands[index:index + chunk_size]
+
+                if self._cli_pacing.is_enabled():
+                    conn_obj.global_delay_factor = min(global_delay_factor, delay_factor)
+
+                start = time.time()
+
+                try:
+                    chunk_output = conn_obj.send_config_set(config_commands=chunk, delay_factor=delay_factor, exit_config_mode=index + chunk_size >= len(commands))
+                except Exception:
+                    self._cli_pacing.record(host=host, commands=len(chunk), elapsed=time.time() - start, delay_factor=delay_factor, failed=True)
+                    raise
+
+                self._cli_pacing.record(host=host, commands=len(chunk), elapsed=time.time() - start, delay_factor=delay_factor, output=chunk_output)
+                output += chunk_output
+                delay_factor = self._cli_pacing.get_params(host=host)[0]
         finally:
-            conn_list[2].release()
+            conn_obj.global_delay_factor = global_delay_factor
 
-        return value
+        return output
 
     def shutdown(self):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
+        if self._api_worker_pool:
+            self._api_worker_pool.close()
+
+        self._netmiko_pool.close()
+
+        if self._pyro_unix_daemon:
+            self._pyro_unix_daemon.shutdown()
+
         if self._pyro_daemon:
             self._pyro_daemon.shutdown()
 
@@ -221,46 +342,240 @@ class PySwitchLibApiDaemon(object):
     def api_acquire(self):
         """
         This is an auto-generated method for the PySwitchLib.
+
+        Kept for clients of the acquire/module_name/release protocol.  The module name is
+        held per connection thread, so API calls no longer need to be serialized.
         """
 
-        self._api_acquire_lock_with_timer()
+        pass
 
     def api_release(self):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
-        self._api_release_lock_with_timer()
-       
-    def _api_acquire_lock_with_timer(self):
+        pass
+
+    def api_invoke(self, module_name='', api_name='', args=None, kwargs=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Runs the API for the pybind module in a single call, returning the rest command
+        tuple of the API.  The module name is only visible to the calling thread, so
+        calls from different clients run concurrently.  When the daemon has api workers,
+        the call runs in the next idle worker process.  The results of read-only APIs are
+        cached by module name, API name and arguments.
+        """
+
+        if api_name.startswith('_') or api_name not in self._api_names:
+            raise AttributeError("API " + str(api_name) + " is not supported by the api daemon.")
+
+        request_plan_key = None
+
+        if self._is_read_only_api(api_name=api_name):
+            request_plan_key = self._request_plan_cache.get_key(module_name=module_name, api_name=api_name, args=args, kwargs=kwargs)
+
+        if request_plan_key is not None:
+            request_plan = self._request_plan_cache.get(key=request_plan_key)
+
+            if request_plan is not None:
+                return request_plan
+
+        if self._api_worker_pool:
+            result = self._api_worker_pool.execute('invoke', module_name, api_name, args, kwargs)
+        else:
+            previous_module_name = self._module_name
+            self._module_name = module_name
+
+            try:
+                result = getattr(self, api_name)(*(args or ()), **(kwargs or {}))
+            finally:
+                self._module_name = previous_module_name
+
+        if self._api_prewarm_file and module_name and module_name not in self._api_prewarm_learned:
+            self._learn_prewarm_module(module_name=module_name)
+
+        if request_plan_key is not None and isinstance(result, tuple) and len(result) == 3:
+            self._request_plan_cache.put(key=request_plan_key, plan=result)
+
+        return result
+
+    def _is_read_only_api(self, api_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        The config get APIs and the get rpc APIs do not change the switch.
+        """
+
+        return api_name.endswith('_get') or (api_name.startswith('get_') and api_name.endswith('_rpc'))
+
+    def api_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the binding cache counters of the daemon and its api workers, the pybind
+        module cache and request plan cache counters, the api worker stats, the progress
+        of the pybind module warm-up, the netmiko session pool counters and the cli pacing
+        of each host.
+        """
+
+        with self._binding_plans_lock:
+            binding_cache = dict(self._binding_plans_stats)
+
+        binding_cache['size'] = len(self._binding_plans)
+
+        with self._api_prewarm_lock:
+            prewarm = dict(self._api_prewarm_stats)
+            prewarm['warmed'] = list(prewarm['warmed'])
+            prewarm['failed'] = dict(prewarm['failed'])
+
+        module_cache = self._pybind_module_cache.get_stats()
+        stats = {'binding_cache': binding_cache, 'module_cache': module_cache, 'request_plan_cache': self._request_plan_cache.get_stats(), 'prewarm': prewarm,
+                 'netmiko_pool': self._netmiko_pool.get_stats(), 'cli_pacing': self._cli_pacing.get_stats()}
+
+        if self._api_worker_pool:
+            for worker_stats in self._api_worker_pool.execute_all('stats'):
+                for key in ['hits', 'misses', 'size']:
+                    binding_cache[key] += worker_stats['binding_cache'][key]
+
+                for key in ['imports', 'reimports', 'evictions']:
+                    module_cache[key] += worker_stats['module_cache'][key]
+
+            stats['api_workers'] = self._api_worker_pool.get_stats()
+
+        lookups = binding_cache['hits'] + binding_cache['misses']
+        binding_cache['hit_rate'] = float(binding_cache['hits']) / lookups if lookups else 0.0
+
+        return stats
+
+    def api_worker_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+
+        if self._api_worker_pool:
+            return self._api_worker_pool.get_stats()
+
+        return {}
+
+    def _run_api_worker_task(self, task='', *args):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+
+        if task == 'stats':
+            return self.api_stats()
+
+        if task == 'prewarm':
+            return self._prewarm_module(*args)
+
+        return self.api_invoke(*args)
+
+    def _start_prewarm(self, module_names=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+
+        module_names = list(module_names or [])
+
+        if self._api_prewarm_file:
+            for module_name in ConfigFileUtil().read(filename=self._api_prewarm_file).get('api_prewarm', '').split(','):
+                if module_name:
+                    self._api_prewarm_learned.add(module_name)
+
+                    if module_name not in module_names:
+                        module_names.append(module_name)
+
+        with self._api_prewarm_lock:
+            self._api_prewarm_stats['modules'] = module_names
+            self._api_prewarm_stats['done'] = not module_names
+
+        if module_names:
+            prewarm_thread = threading.Thread(target=self._prewarm_loop, kwargs={'module_names': module_names})
+            prewarm_thread.daemon = True
+            prewarm_thread.start()
+
+    def _prewarm_loop(self, module_names=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Warms up the modules one at a time, in the daemon process or in every api worker.
+        """
+
+        start = time.time()
+
+        for module_name in module_names:
+            with self._api_prewarm_lock:
+                self._api_prewarm_stats['current'] = module_name
+
+            try:
+                if self._api_worker_pool:
+                    self._api_worker_pool.execute_all('prewarm', module_name)
+                else:
+                    self._prewarm_module(module_name=module_name)
+            except Exception as e:
+                with self._api_prewarm_lock:
+                    self._api_prewarm_stats['failed'][module_name] = str(e)
+            else:
+                with self._api_prewarm_lock:
+                    self._api_prewarm_stats['warmed'].append(module_name)
+
+        with self._api_prewarm_lock:
+            self._api_prewarm_stats['current'] = ''
+            self._api_prewarm_stats['done'] = True
+            self._api_prewarm_stats['elapsed'] = time.time() - start
+
+    def _prewarm_module(self, module_name=''):
         """
         This is an auto-generated method for the PySwitchLib.
+
+        Imports the pybind module and instantiates each of its root classes once, yielding
+        to the API calls after every class.
         """
 
-        self._api_lock.acquire()
+        module_obj = self._pybind_module_cache.import_module(module_name=module_name)
+        root_classes = 0
 
-        self._apt_timer = threading.Timer(self._api_timer_expiration, self._api_timer_expiration_handler)
-        self._apt_timer.start()
+        for value in module_obj.__dict__.values():
+            if isinstance(value, type) and issubclass(value, PybindBase) and value.__module__ == module_obj.__name__:
+                value()
+                root_classes += 1
+                time.sleep(0)
 
-    def _api_release_lock_with_timer(self):
+        return root_classes
+
+    def _learn_prewarm_module(self, module_name=''):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
-        if self._apt_timer.is_alive():
-            self._apt_timer.cancel()
+        with self._api_prewarm_lock:
+            if module_name in self._api_prewarm_learned:
+                return
+
+            self._api_prewarm_learned.add(module_name)
+            learned = ','.join(sorted(self._api_prewarm_learned))
 
-        if self._api_lock.locked():
-            self._api_lock.release()
+        try:
+            ConfigFileUtil().write(filename=self._api_prewarm_file, conf_dict={'api_prewarm': learned}, do_merge=False)
+        except (IOError, OSError):
+            pass
 
-    def _api_validation(self, choices_kwargs_map=None, leaf_os_support_map=None, **kwargs):
+    def _api_validation(self, choices_kwargs_map=None, leaf_os_support_map=None, module_context=None, api_descriptor=None, **kwargs):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
+        if module_context is None:
+            module_context = self._module_name
+
+        if api_descriptor is not None:
+            choices_kwargs_map = api_descriptor.get_module_index(module_name=module_context)['choices_kwargs_map']
+            leaf_os_support_map = api_descriptor.leaf_os_support_map
+
         if choices_kwargs_map:
             for choice_ver_key in choices_kwargs_map:
-                if self._module_name in choice_ver_key:
+                if module_context in choice_ver_key:
                     choice_kwargs_set_list = []
 
                     for kwarg in kwargs:
@@ -276,153 +591,218 @@ class PySwitchLibApiDaemon(object):
         if leaf_os_support_map:
             pass
 
-    def _get_pybind_object(self, operation_type=None, compositions_list=None, bindings_list=None, composed_child_list=None, compositions_keyval_list=None, bindings_keyval=None, composed_child_leafval_list=None, leafval_map=None, **kwargs):
+    def _get_pybind_object(self, operation_type=None, compositions_list=None, bindings_list=None, composed_child_list=None, compositions_keyval_list=None, bindings_keyval=None, composed_child_leafval_list=None, leafval_map=None, module_context=None, api_descriptor=None, **kwargs):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
-        pybind_obj = None
-        is_module_name_found = False
+        if module_context is None:
+            module_context = self._module_name
 
-        for index, value in enumerate(bindings_list):
-            if self._module_name in value[2]:
-                is_module_name_found = True
-                class_name = value[1].replace(value[2] + '.', '', 1)  
-                pybind_module_path = value[0].replace(value[2] + '.', '', 1)  
-                pybind_paths = pybind_module_path.split('.')
+        if api_descriptor is not None:
+            compositions_list = api_descriptor.compositions_list
+            bindings_list = api_descriptor.get_module_index(module_name=module_context)['bindings_list']
+            composed_child_list = api_descriptor.composed_child_list
+            compositions_keyval_list = api_descriptor.compositions_keyval_list
+            bindings_keyval = api_descriptor.bindings_keyval
+            composed_child_leafval_list = api_descriptor.composed_child_leafval_list
+            leafval_map = api_descriptor.leafval_map
 
-                module_name = value[2]
-                module_obj = None
+        binding_plan = self._get_binding_plan(module_context=module_context, compositions_list=compositions_list, bindings_list=bindings_list, composed_child_list=composed_child_list, api_descriptor=api_descriptor)
 
-                if self._module_obj is not None:
-                    module_obj = self._module_obj
+        if binding_plan is None:
+            raise AttributeError("API is unsupported for OS binding version: " + str(module_context))
+
+        pybind_obj = binding_plan['base_class']()
+        pybind_module = pybind_obj
+        pybind_class_module_name = binding_plan['class_module_name']
+        kwargs_exclusion_list = []
+
+        for module, pybind_path_module_name, composition_indexes in binding_plan['path']:
+            pybind_module = getattr(pybind_module, module)
+
+            for composition_index in composition_indexes:
+                composition_tuple = compositions_list[composition_index]
+                kwargs_exclusion_list.append(composition_tuple[1])
+
+                pybind_module = getattr(pybind_module, 'add')
+
+                if compositions_keyval_list[composition_index]['extra_keyval']:
+                    parent_kwargs_map = {}
+                    parent_key_instance = []
+
+                    for parent_key_index, parent_key in enumerate(compositions_keyval_list[composition_index]['extra_keyval'].split(', ')):
+                        if parent_key_index < len(kwargs[composition_tuple[1]]):
+                            parent_kwargs_map[parent_key] = kwargs[composition_tuple[1]][parent_key_index]
+
+                    for key in compositions_keyval_list[composition_index]['keyval'].split(', '):
+                        if key in parent_kwargs_map:
+                            parent_key_instance.append(parent_kwargs_map[key])
+                            parent_kwargs_map.pop(key)
+
+                    pybind_module = pybind_module(' '.join(map(str, parent_key_instance)))
+
+                    for key in parent_kwargs_map:
+                        if parent_kwargs_map[key] is not None:
+                            mapped_key = key
+
+                            if leafval_map and pybind_path_module_name in leafval_map and key in leafval_map[pybind_path_module_name]:
+                                mapped_key = leafval_map[pybind_path_module_name][key]
+
+                            pybind_parent_extra_key_assignment = getattr(pybind_parent_obj, '_set_' + mapped_key)
+                            pybind_parent_extra_key_assignment(parent_kwargs_map[key])
                 else:
-                    module_obj =  __import__(module_name, fromlist=[class_name])
+                    if isinstance(kwargs[composition_tuple[1]], tuple):
+                        pybind_module = pybind_module(' '.join(kwargs[composition_tuple[1]]))
+                    else:
+                        pybind_module = pybind_module(kwargs[composition_tuple[1]])
 
-                pybind_base_class = getattr(module_obj, class_name)
-                pybind_obj = pybind_base_class()
-                pybind_module = pybind_obj
-                pybind_class_module_name = value[2]
-                kwargs_exclusion_list = []
-                
-                for module in pybind_paths:
-                    pybind_class_module_name = pybind_class_module_name + '.' + module
-                    pybind_module = getattr(pybind_module, module)
-
-                    for composition_index, composition_tuple in enumerate(compositions_list):
-                        if pybind_class_module_name == composition_tuple[0]:
-                            kwargs_exclusion_list.append(composition_tuple[1])
-
-                            pybind_module = getattr(pybind_module, 'add')
-
-                            if compositions_keyval_list[composition_index]['extra_keyval']:
-                                parent_kwargs_map = {}
-                                parent_key_instance = []
-
-                                for parent_key_index, parent_key in enumerate(compositions_keyval_list[composition_index]['extra_keyval'].split(', ')):
-                                    if parent_key_index < len(kwargs[composition_tuple[1]]):
-                                        parent_kwargs_map[parent_key] = kwargs[composition_tuple[1]][parent_key_index]
-
-                                for key in compositions_keyval_list[composition_index]['keyval'].split(', '):
-                                    if key in parent_kwargs_map:
-                                        parent_key_instance.append(parent_kwargs_map[key])
-                                        parent_kwargs_map.pop(key)
-
-                                pybind_module = pybind_module(' '.join(map(str, parent_key_instance)))
-
-                                for key in parent_kwargs_map:
-                                    if parent_kwargs_map[key] is not None:
-                                        mapped_key = key
-
-                                        if leafval_map and pybind_class_module_name in leafval_map and key in leafval_map[pybind_class_module_name]:
-                                            mapped_key = leafval_map[pybind_class_module_name][key]
-
-                                        pybind_parent_extra_key_assignment = getattr(pybind_parent_obj, '_set_' + mapped_key)
-                                        pybind_parent_extra_key_assignment(parent_kwargs_map[key])
-                            else:
-                                if isinstance(kwargs[composition_tuple[1]], tuple):
-                                    pybind_module = pybind_module(' '.join(kwargs[composition_tuple[1]]))
-                                else:
-                                    pybind_module = pybind_module(kwargs[composition_tuple[1]])
-                                
-                if bindings_keyval['kwargs_key_name']:
-                    pybind_obj = getattr(pybind_module, 'add')
+        if bindings_keyval['kwargs_key_name']:
+            pybind_obj = getattr(pybind_module, 'add')
+        else:
+            pybind_obj = pybind_module
+
+        for kwarg in kwargs:
+            if kwarg == bindings_keyval['kwargs_key_name']:
+                if bindings_keyval['extra_keyval'] and kwargs[kwarg] is not None:
+                    kwargs_map = {}
+                    key_instance = []
+
+                    for key_index, key in enumerate(bindings_keyval['extra_keyval'].split(', ')):
+                        if key_index < len(kwargs[kwarg]):
+                            kwargs_map[key] = kwargs[kwarg][key_index]
+
+                    for key in bindings_keyval['keyval'].split(', '):
+                        if key in kwargs_map:
+                            key_instance.append(kwargs_map[key])
+                            kwargs_map.pop(key)
+
+                    pybind_obj = pybind_obj(' '.join(map(str, key_instance)))
+
+                    for key in kwargs_map:
+                        if kwargs_map[key] is not None:
+                            mapped_key = key
+
+                            if leafval_map and pybind_class_module_name in leafval_map and key in leafval_map[pybind_class_module_name]:
+                                mapped_key = leafval_map[pybind_class_module_name][key]
+
+                            pybind_extra_key_assignment = getattr(pybind_obj, '_set_' + mapped_key)
+                            pybind_extra_key_assignment(kwargs_map[key])
                 else:
-                    pybind_obj = pybind_module
+                    if isinstance(kwargs[kwarg], tuple):
+                        pybind_obj = pybind_obj(' '.join(kwargs[kwarg]))
+                    elif kwargs[kwarg] is not None:
+                        pybind_obj = pybind_obj(kwargs[kwarg])
+                    else:
+                        pybind_obj = pybind_module
 
-                for kwarg in kwargs:
-                    if kwarg == bindings_keyval['kwargs_key_name']:
-                        if bindings_keyval['extra_keyval'] and kwargs[kwarg] is not None:
-                            kwargs_map = {}
-                            key_instance = []
+        if operation_type != 'get':
+            for child_index, pybind_update_child_paths in binding_plan['children']:
+                child_tuple = composed_child_list[child_index]
 
-                            for key_index, key in enumerate(bindings_keyval['extra_keyval'].split(', ')):
-                                if key_index < len(kwargs[kwarg]):
-                                    kwargs_map[key] = kwargs[kwarg][key_index]
+                if child_tuple[1] in kwargs and kwargs[child_tuple[1]] != None:
+                    kwargs_exclusion_list.append(child_tuple[1])
+                    pybind_update_child_obj = pybind_obj
 
-                            for key in bindings_keyval['keyval'].split(', '):
-                                if key in kwargs_map:
-                                    key_instance.append(kwargs_map[key])
-                                    kwargs_map.pop(key)
+                    for module in pybind_update_child_paths:
+                        pybind_update_child_obj = getattr(pybind_update_child_obj, module)
 
-                            pybind_obj = pybind_obj(' '.join(map(str, key_instance)))
+                    pybind_update_child_obj = getattr(pybind_update_child_obj, child_tuple[1])
 
-                            for key in kwargs_map:
-                                if kwargs_map[key] is not None:
-                                    mapped_key = key
+                    for leaf_index, leaf_name in enumerate(composed_child_leafval_list[child_index]['leafval'].split(', ')):
+                        if kwargs[child_tuple[1]][leaf_index] is not None:
+                            pybind_update_child_assignment = getattr(pybind_update_child_obj, '_set_' + leaf_name) 
+                            pybind_update_child_assignment(kwargs[child_tuple[1]][leaf_index])
 
-                                    if leafval_map and pybind_class_module_name in leafval_map and key in leafval_map[pybind_class_module_name]:
-                                        mapped_key = leafval_map[pybind_class_module_name][key]
+        for kwarg in kwargs:
+            if kwarg not in kwargs_exclusion_list:
+                if kwarg != bindings_keyval['kwargs_key_name']:
+                    if kwargs[kwarg] is not None:
+                        mapped_kwarg = kwarg
 
-                                    pybind_extra_key_assignment = getattr(pybind_obj, '_set_' + mapped_key)
-                                    pybind_extra_key_assignment(kwargs_map[key])
-                        else:
-                            if isinstance(kwargs[kwarg], tuple):
-                                pybind_obj = pybind_obj(' '.join(kwargs[kwarg]))
-                            elif kwargs[kwarg] is not None:
-                                pybind_obj = pybind_obj(kwargs[kwarg])
-                            else:
-                                pybind_obj = pybind_module
+                        if leafval_map and pybind_class_module_name in leafval_map and kwarg in leafval_map[pybind_class_module_name]:
+                            mapped_kwarg = leafval_map[pybind_class_module_name][kwarg]
 
-                if operation_type != 'get':
-                    for child_index, child_tuple in enumerate(composed_child_list):
-                        if pybind_class_module_name in child_tuple[0]:
-                            if child_tuple[1] in kwargs and kwargs[child_tuple[1]] != None:
-                                kwargs_exclusion_list.append(child_tuple[1])
-                                pybind_update_child_obj = pybind_obj
+                        pybind_update_key_assignment = getattr(pybind_obj, '_set_' + mapped_kwarg)
+                        pybind_update_key_assignment(kwargs[kwarg])
 
-                                if pybind_class_module_name != child_tuple[0]:
-                                    pybind_update_child_path = child_tuple[0].replace(pybind_class_module_name + '.', '', 1)
-                                    pybind_update_child_paths = pybind_update_child_path.split('.')
+        return pybind_obj
 
-                                    for module in pybind_update_child_paths:
-                                        pybind_update_child_obj = getattr(pybind_update_child_obj, module)
+    def _get_binding_plan(self, module_context='', compositions_list=None, bindings_list=None, composed_child_list=None, api_descriptor=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
 
-                                pybind_update_child_obj = getattr(pybind_update_child_obj, child_tuple[1])
+        Resolves the pybind base class, the attribute path with the compositions of each
+        path element and the composed children of the API's binding for the module once,
+        and caches the result keyed by the module name and the API descriptor, or the
+        binding lists of the API.  Returns None when the API has no binding for the module.
+        """
 
-                                for leaf_index, leaf_name in enumerate(composed_child_leafval_list[child_index]['leafval'].split(', ')):
-                                    if kwargs[child_tuple[1]][leaf_index] is not None:
-                                        pybind_update_child_assignment = getattr(pybind_update_child_obj, '_set_' + leaf_name) 
-                                        pybind_update_child_assignment(kwargs[child_tuple[1]][leaf_index])
+        if api_descriptor is not None:
+            binding_plan_key = (module_context, api_descriptor)
+        else:
+            binding_plan_key = (module_context, tuple(bindings_list), tuple(compositions_list), tuple(composed_child_list))
 
-                for kwarg in kwargs:
-                    if kwarg not in kwargs_exclusion_list:
-                        if kwarg != bindings_keyval['kwargs_key_name']:
-                            if kwargs[kwarg] is not None:
-                                mapped_kwarg = kwarg
+        binding_plan = self._binding_plans.get(binding_plan_key)
 
-                                if leafval_map and pybind_class_module_name in leafval_map and kwarg in leafval_map[pybind_class_module_name]:
-                                    mapped_kwarg = leafval_map[pybind_class_module_name][kwarg]
+        with self._binding_plans_lock:
+            if binding_plan is not None:
+                self._binding_plans_stats['hits'] += 1
+            else:
+                self._binding_plans_stats['misses'] += 1
 
-                                pybind_update_key_assignment = getattr(pybind_obj, '_set_' + mapped_kwarg)
-                                pybind_update_key_assignment(kwargs[kwarg])
+        if binding_plan is not None:
+            self._pybind_module_cache.touch(module_name=module_context)
+            return binding_plan
 
-                break
+        for value in bindings_list:
+            if module_context in value[2]:
+                class_name = value[1].replace(value[2] + '.', '', 1)
+                pybind_module_path = value[0].replace(value[2] + '.', '', 1)
 
-        if not is_module_name_found:
-            raise AttributeError("API is unsupported for OS binding version: " + str(self._module_name))
+                if self._module_obj is not None:
+                    module_obj = self._module_obj
+                else:
+                    module_obj = self._pybind_module_cache.import_module(module_name=value[2], fromlist=[class_name])
 
-        return pybind_obj
+                pybind_class_module_name = value[2]
+                binding_plan = {'base_class': getattr(module_obj, class_name), 'path': [], 'children': []}
+
+                for module in pybind_module_path.split('.'):
+                    pybind_class_module_name = pybind_class_module_name + '.' + module
+                    composition_indexes = [composition_index for composition_index, composition_tuple in enumerate(compositions_list) if pybind_class_module_name == composition_tuple[0]]
+
+                    binding_plan['path'].append((module, pybind_class_module_name, composition_indexes))
+
+                binding_plan['class_module_name'] = pybind_class_module_name
+
+                for child_index, child_tuple in enumerate(composed_child_list):
+                    if pybind_class_module_name in child_tuple[0]:
+                        pybind_update_child_paths = []
+
+                        if pybind_class_module_name != child_tuple[0]:
+                            pybind_update_child_paths = child_tuple[0].replace(pybind_class_module_name + '.', '', 1).split('.')
+
+                        binding_plan['children'].append((child_index, pybind_update_child_paths))
+
+                self._binding_plans[binding_plan_key] = binding_plan
+
+                return binding_plan
+
+        return None
+
+    def _drop_binding_plans(self, package_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Drops the binding plans of an unloaded pybind version package, so its classes
+        can be freed.
+        """
+
+        with self._binding_plans_lock:
+            for binding_plan_key in list(self._binding_plans):
+                if binding_plan_key[0] == package_name or binding_plan_key[0].startswith(package_name + '.'):
+                    del self._binding_plans[binding_plan_key]
 
     def _config_worker(self, operation_type=None, pybind_object=None, rest_leaf_name=None, resource_depth=None, timeout=''):
         """
@@ -447,11 +827,12 @@ class PySwitchLibApiDaemon(object):
             rest_operation = 'DELETE'
             rest_uri = pybind_object._rest_uri()
 
-        label_list_items = lambda x: x
+        pybind_xml = PybindXmlUtil()
 
         if 'update' in operation_type:
             update_object_rest_data = ''
-            rest_data =  dicttoxml(json.loads(pybindJSON.dumps(pybind_object, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=label_list_items)
+            rest_data = pybind_xml.dump_document(pybind_obj=pybind_object)
+            rest_documents = {id(pybind_object): rest_data}
 
             for key in pybind_object.elements():
                 update_object_name = getattr(pybind_object, '_get_' + key)
@@ -470,14 +851,17 @@ class PySwitchLibApiDaemon(object):
                         temp_pybind_obj = temp_pybind_obj._parent
 
                     if hasattr(temp_pybind_obj, '_pyangbind_elements'):
-                        rest_data = dicttoxml(json.loads(pybindJSON.dumps(temp_pybind_obj, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=label_list_items)
+                        if id(temp_pybind_obj) not in rest_documents:
+                            rest_documents[id(temp_pybind_obj)] = pybind_xml.dump_document(pybind_obj=temp_pybind_obj)
+
+                        rest_data = rest_documents[id(temp_pybind_obj)]
                     elif update_object.default() and update_object == update_object.default():
-                        rest_data += '<{0}>{1}</{0}>'.format(rest_name, update_object)
+                        rest_data = rest_data.append('<{0}>{1}</{0}>'.format(rest_name, update_object))
 
-                    match = re.match(r'.*(<{0}>.*</{0}>).*'.format(rest_name), rest_data)
+                    rest_element_data = rest_data.find_element(name=rest_name)
 
-                    if match:
-                        update_object_rest_data = match.group(1)
+                    if rest_element_data is not None:
+                        update_object_rest_data = rest_element_data
 
                     if repr(temp_pybind_obj) is 'False':
                         rest_operation = 'DELETE'
@@ -511,7 +895,7 @@ class PySwitchLibApiDaemon(object):
 
             pybind_object = pybind_object._parent
             
-            rest_data = dicttoxml(json.loads(pybindJSON.dumps(pybind_object, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=label_list_items)
+            rest_data = pybind_xml.dumps(pybind_obj=pybind_object)
 
             if rest_data:
                 end_marker = rest_data.rsplit('<', 1)[1].strip('/')
@@ -538,7 +922,7 @@ class PySwitchLibApiDaemon(object):
 
         return(rest_commands, '', timeout)
 
-    def _config_get_worker(self, operation_type=None, pybind_object=None, bindings_list=None, composed_child_list=None, resource_depth=None, timeout=''):
+    def _config_get_worker(self, operation_type=None, pybind_object=None, bindings_list=None, composed_child_list=None, resource_depth=None, timeout='', module_context=None):
         """
         This is an auto-generated method for the PySwitchLib.
         """
@@ -551,8 +935,8 @@ class PySwitchLibApiDaemon(object):
 
         rest_commands.append([rest_operation, rest_uri, rest_data, 'config', resource_depth])
 
-        yang_list.extend(self._get_bindings_list_yang_name(bindings_list=bindings_list))
-        yang_list.extend(self._get_child_list_yang_name(composed_child_list=composed_child_list))
+        yang_list.extend(self._get_bindings_list_yang_name(bindings_list=bindings_list, module_context=module_context))
+        yang_list.extend(self._get_child_list_yang_name(composed_child_list=composed_child_list, module_context=module_context))
 
         return(rest_commands, yang_list, timeout)
 
@@ -569,38 +953,42 @@ class PySwitchLibApiDaemon(object):
         if rest_uri == '/':
             rest_uri = pybind_object._rest_uri()
 
-        label_list_items = lambda x: x
-
         pybind_object = pybind_object._parent
         
-        rest_data = dicttoxml(json.loads(pybindJSON.dumps(pybind_object, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=label_list_items)
+        rest_data = PybindXmlUtil().dumps(pybind_obj=pybind_object)
 
         rest_commands.append([rest_operation, rest_uri, rest_data, 'rpc', resource_depth])
 
         return(rest_commands, '', timeout)
 
-    def _get_bindings_list_yang_name(self, bindings_list=None):
+    def _get_bindings_list_yang_name(self, bindings_list=None, module_context=None):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
+        if module_context is None:
+            module_context = self._module_name
+
         yang_name_list = []
 
         for bindings_tuple in bindings_list:
-            if self._module_name == bindings_tuple[2]:
+            if module_context == bindings_tuple[2]:
                 yang_name_list.append(bindings_tuple[0].split('.')[-1].replace('_', '-'))
         
         return yang_name_list
 
-    def _get_child_list_yang_name(self, composed_child_list=None):
+    def _get_child_list_yang_name(self, composed_child_list=None, module_context=None):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
+        if module_context is None:
+            module_context = self._module_name
+
         yang_name_list = []
 
         for child_tuple in composed_child_list:
-            if self._module_name in child_tuple[0]:
+            if module_context in child_tuple[0]:
                 yang_name_list.append(child_tuple[1])
 
         return yang_name_list
@@ -622,11 +1010,67 @@ class PySwitchLibApiDaemonRunner(DaemonRunner):
         self._daemon_prefix = ConfigUtil().get_prefix_for_daemon_id(daemon_id=self._daemon_id, conf_dict=self._pyswitchlib_conf)
         self._daemon_thread = None
         self._pyro_ns_port = None
+        self._api_workers = 0
+        self._api_worker_timeout = 60
+        self._api_worker_preload = []
+        self._api_prewarm = []
+        self._api_prewarm_file = ''
+        self._pybind_cache_max_packages = 0
+        self._pybind_cache_max_rss = 0
+        self._request_plan_cache_size = 1024
+        self._netmiko_host_sessions = 4
+        self._netmiko_max_sessions = 64
+        self._netmiko_idle_timeout = 300
+        self._cli_pacing = False
+        self._cli_pacing_file = ''
+        self._api_unix_socket = ''
 
         if self._pyswitchlib_conf:
             if 'ns_port' in self._pyswitchlib_conf:
                 self._pyro_ns_port = int(self._pyswitchlib_conf['ns_port'])
 
+            if 'api_workers' in self._pyswitchlib_conf:
+                self._api_workers = int(self._pyswitchlib_conf['api_workers'])
+
+            if 'api_worker_timeout' in self._pyswitchlib_conf:
+                self._api_worker_timeout = float(self._pyswitchlib_conf['api_worker_timeout'])
+
+            if 'api_worker_preload' in self._pyswitchlib_conf:
+                self._api_worker_preload = [module_name.strip() for module_name in self._pyswitchlib_conf['api_worker_preload'].split(',') if module_name.strip()]
+
+            if 'api_prewarm' in self._pyswitchlib_conf:
+                self._api_prewarm = [module_name.strip() for module_name in self._pyswitchlib_conf['api_prewarm'].split(',') if module_name.strip()]
+
+            if self._pyswitchlib_conf.get('api_prewarm_learn', '').lower() == 'true':
+                self._api_prewarm_file = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_' + self._daemon_id + '.prewarm')
+
+            if 'pybind_cache_max_packages' in self._pyswitchlib_conf:
+                self._pybind_cache_max_packages = int(self._pyswitchlib_conf['pybind_cache_max_packages'])
+
+            if 'pybind_cache_max_rss' in self._pyswitchlib_conf:
+                self._pybind_cache_max_rss = int(self._pyswitchlib_conf['pybind_cache_max_rss']) * 1024 * 1024
+
+            if 'request_plan_cache_size' in self._pyswitchlib_conf:
+                self._request_plan_cache_size = int(self._pyswitchlib_conf['request_plan_cache_size'])
+
+            if 'netmiko_host_sessions' in self._pyswitchlib_conf:
+                self._netmiko_host_sessions = int(self._pyswitchlib_conf['netmiko_host_sessions'])
+
+            if 'netmiko_max_sessions' in self._pyswitchlib_conf:
+                self._netmiko_max_sessions = int(self._pyswitchlib_conf['netmiko_max_sessions'])
+
+            if 'netmiko_idle_timeout' in self._pyswitchlib_conf:
+                self._netmiko_idle_timeout = float(self._pyswitchlib_conf['netmiko_idle_timeout'])
+
+            if self._pyswitchlib_conf.get('cli_pacing', '').lower() == 'true':
+                self._cli_pacing = True
+
+            if self._pyswitchlib_conf.get('cli_pacing_learn', '').lower() == 'true':
+                self._cli_pacing_file = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_' + self._daemon_id + '.pacing')
+
+            if self._pyswitchlib_conf.get('api_unix_socket', '').lower() == 'true':
+                self._api_unix_socket = ConfigUtil().get_unix_socket_for_daemon_id(daemon_id=self._daemon_id)
+
         if self._daemon_thread == None:
             self._daemon_thread = threading.Thread(target=self._daemon_loop, kwargs={'daemon_id': self._daemon_id, 'daemon_prefix':self._daemon_prefix, 'pyro_ns_port': self._pyro_ns_port})
             self._daemon_thread.daemon = True
@@ -657,20 +1101,32 @@ class PySwitchLibApiDaemonRunner(DaemonRunner):
             sys.exec_prefix = daemon_prefix
             sys.path.insert(0, daemon_lib_path)
 
-        pyswitchlib_api_create = __import__('pyswitchlib.api.create', fromlist=['*'])
-        pyswitchlib_api_update = __import__('pyswitchlib.api.update', fromlist=['*'])
-        pyswitchlib_api_delete = __import__('pyswitchlib.api.delete', fromlist=['*'])
-        pyswitchlib_api_get = __import__('pyswitchlib.api.get', fromlist=['*'])
-        pyswitchlib_api_rpc = __import__('pyswitchlib.api.rpc', fromlist=['*'])
+        for api_module_name in ['pyswitchlib.api.create', 'pyswitchlib.api.update', 'pyswitchlib.api.delete', 'pyswitchlib.api.get', 'pyswitchlib.api.rpc']:
+            PySwitchLibApiDaemon.add_lazy_apis(api_module_name=api_module_name)
+
+        api_worker_pool = None
+
+        if self._api_workers > 0:
+            for module_name in self._api_worker_preload:
+                __import__(module_name, fromlist=['*'])
 
-        map(lambda filtered_api: setattr(PySwitchLibApiDaemon, filtered_api[0], filtered_api[1]), filter(lambda api: '__' not in api[0], pyswitchlib_api_create.__dict__.items()))
-        map(lambda filtered_api: setattr(PySwitchLibApiDaemon, filtered_api[0], filtered_api[1]), filter(lambda api: '__' not in api[0], pyswitchlib_api_update.__dict__.items()))
-        map(lambda filtered_api: setattr(PySwitchLibApiDaemon, filtered_api[0], filtered_api[1]), filter(lambda api: '__' not in api[0], pyswitchlib_api_delete.__dict__.items()))
-        map(lambda filtered_api: setattr(PySwitchLibApiDaemon, filtered_api[0], filtered_api[1]), filter(lambda api: '__' not in api[0], pyswitchlib_api_get.__dict__.items()))
-        map(lambda filtered_api: setattr(PySwitchLibApiDaemon, filtered_api[0], filtered_api[1]), filter(lambda api: '__' not in api[0], pyswitchlib_api_rpc.__dict__.items()))
+            # The request plans are cached by the daemon object serving the clients, so the
+            # workers do not keep a copy of their own.
+            api_worker_daemon_obj = PySwitchLibApiDaemon(pybind_cache_max_packages=self._pybind_cache_max_packages, pybind_cache_max_rss=self._pybind_cache_max_rss, request_plan_cache_size=0)
+            api_worker_pool = ApiWorkerPoolUtil(workers=self._api_workers, handler=api_worker_daemon_obj._run_api_worker_task, task_timeout=self._api_worker_timeout)
+
+        pyro_unix_daemon = None
+
+        if self._api_unix_socket:
+            pyro_unix_daemon = self._get_unix_socket_daemon(unix_socket=self._api_unix_socket)
+        else:
+            self._remove_unix_socket(unix_socket=ConfigUtil().get_unix_socket_for_daemon_id(daemon_id=daemon_id))
 
         api_exposed_class = Pyro4.expose(PySwitchLibApiDaemon)
-        daemon_obj = api_exposed_class(pyro_daemon=pyro_daemon)
+        daemon_obj = api_exposed_class(pyro_daemon=pyro_daemon, pyro_unix_daemon=pyro_unix_daemon, api_worker_pool=api_worker_pool, api_prewarm=self._api_prewarm, api_prewarm_file=self._api_prewarm_file,
+                                       pybind_cache_max_packages=self._pybind_cache_max_packages, pybind_cache_max_rss=self._pybind_cache_max_rss, request_plan_cache_size=self._request_plan_cache_size,
+                                       netmiko_host_sessions=self._netmiko_host_sessions, netmiko_max_sessions=self._netmiko_max_sessions, netmiko_idle_timeout=self._netmiko_idle_timeout,
+                                       cli_pacing=self._cli_pacing, cli_pacing_file=self._cli_pacing_file)
 
         uri = pyro_daemon.register(daemon_obj, force=True)
 
@@ -678,8 +1134,52 @@ class PySwitchLibApiDaemonRunner(DaemonRunner):
 
         ConfigFileUtil().write(filename=pyswitchlib_ns_daemon_file, conf_dict=daemon_uri_dict)
 
+        if pyro_unix_daemon:
+            pyro_unix_daemon.register(daemon_obj, objectId='PySwitchLib.' + daemon_id, force=True)
+
+            unix_daemon_thread = threading.Thread(target=self._unix_daemon_loop, kwargs={'pyro_unix_daemon': pyro_unix_daemon})
+            unix_daemon_thread.daemon = True
+            unix_daemon_thread.start()
+
         return pyro_daemon, uri
 
+    def _remove_unix_socket(self, unix_socket=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Removes the socket file left by an earlier run, so clients do not pick a socket
+        nobody listens on.
+        """
+
+        try:
+            os.unlink(unix_socket)
+        except OSError:
+            pass
+
+    def _get_unix_socket_daemon(self, unix_socket=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Listens on the unix domain socket, replacing the socket file left by an earlier
+        run.  Clients on the host connect to it when the socket file exists.
+        """
+
+        self._remove_unix_socket(unix_socket=unix_socket)
+        pyro_unix_daemon = Pyro4.Daemon(unixsocket=unix_socket)
+        os.chmod(unix_socket, 0o666)
+
+        return pyro_unix_daemon
+
+    def _unix_daemon_loop(self, pyro_unix_daemon=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+
+        try:
+            pyro_unix_daemon.requestLoop()
+        finally:
+            pyro_unix_daemon.close()
+
     def _daemon_loop(self, daemon_id='', daemon_prefix='', pyro_ns_port=None):
         """
         This is an auto-generated method for the PySwitchLib.
@@ -747,6 +1247,11 @@ class PySwitchLibApiDaemonRunner(DaemonRunner):
                     except:
                         pass
 
+                try:
+                    os.unlink(ConfigUtil().get_unix_socket_for_daemon_id(daemon_id=self._daemon_id))
+                except OSError:
+                    pass
+
         super(PySwitchLibApiDaemonRunner, self)._stop()
 
     def _restart(self):
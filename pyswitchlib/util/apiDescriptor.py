@@ -0,0 +1,56 @@
+class ApiDescriptorUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Pybind binding tables of an API, indexed by pybind module name.  The list tables
+    are tuples, while the maps are plain dicts shared by every call of the API, so
+    callers must not modify them.
+    """
+
+    __slots__ = ('compositions_list', 'bindings_list', 'composed_child_list', 'compositions_keyval_list', 'bindings_keyval',
+                 'composed_child_leafval_list', 'leafval_map', 'rest_leaf_name', 'choices_kwargs_map', 'leaf_os_support_map', '_module_indexes')
+
+    def __init__(self, compositions_list=(), bindings_list=(), composed_child_list=(), compositions_keyval_list=(), bindings_keyval=None, composed_child_leafval_list=(), leafval_map=None, rest_leaf_name='', choices_kwargs_map=None, leaf_os_support_map=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        The tables are built once when the api module is imported, instead of on every
+        API call.
+        """
+        self.compositions_list = tuple(compositions_list)
+        self.bindings_list = tuple(bindings_list)
+        self.composed_child_list = tuple(composed_child_list)
+        self.compositions_keyval_list = tuple(compositions_keyval_list)
+        self.bindings_keyval = bindings_keyval or {'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''}
+        self.composed_child_leafval_list = tuple(composed_child_leafval_list)
+        self.leafval_map = leafval_map or {}
+        self.rest_leaf_name = rest_leaf_name
+        self.choices_kwargs_map = choices_kwargs_map or {}
+        self.leaf_os_support_map = leaf_os_support_map or {}
+        self._module_indexes = {}
+
+    def get_module_index(self, module_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the binding and the choice kwargs of the API for the pybind module.  The
+        module name is matched against the tables the way the api daemon always has, once
+        per module name.
+        """
+        module_index = self._module_indexes.get(module_name)
+
+        if module_index is None:
+            module_index = {'bindings_list': (), 'choices_kwargs_map': {}}
+
+            for binding in self.bindings_list:
+                if module_name in binding[2]:
+                    module_index['bindings_list'] = (binding,)
+                    break
+
+            for choice_ver_key in self.choices_kwargs_map:
+                if module_name in choice_ver_key:
+                    module_index['choices_kwargs_map'] = {choice_ver_key: self.choices_kwargs_map[choice_ver_key]}
+                    break
+
+            self._module_indexes[module_name] = module_index
+
+        return module_index
@@ -0,0 +1,310 @@
+import os
+import time
+import errno
+import Queue
+import signal
+import threading
+import traceback
+import multiprocessing
+import multiprocessing.connection
+
+class ApiWorkerPoolUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Runs api daemon calls in worker processes, so pybind construction scales with cores.
+    """
+
+    def __init__(self, workers=1, handler=None, task_timeout=60, health_interval=30):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        The handler is called in the worker processes with the arguments given to
+        execute().  Workers are forked by a spawner process, which is forked while the
+        pool is created, so modules imported before the pool is created are shared with
+        every worker.  The pool must be created before the api daemon starts threads:
+        the spawner stays single threaded, so restarted workers never inherit a lock held
+        by a thread serving requests.  Exited workers are restarted every health_interval
+        seconds.
+        """
+        self._handler = handler
+        self._task_timeout = task_timeout
+        self._workers = []
+        self._idle_workers = Queue.Queue()
+        self._spawn_lock = threading.Lock()
+        self._waiting = 0
+        self._waiting_lock = threading.Lock()
+        self._closed = False
+        self._address = multiprocessing.connection.arbitrary_address('AF_UNIX')
+        self._authkey = os.urandom(20)
+        self._spawner_connection, spawner_connection = multiprocessing.Pipe()
+        self._spawner = multiprocessing.Process(target=self._spawner_loop, args=(spawner_connection, self._spawner_connection))
+        self._spawner.daemon = True
+        self._spawner.start()
+        spawner_connection.close()
+        self._listener = multiprocessing.connection.Listener(address=self._address, family='AF_UNIX', authkey=self._authkey)
+
+        for index in range(workers):
+            worker = {'index': index, 'pid': None, 'connection': None, 'lock': threading.Lock(), 'calls': 0, 'failures': 0, 'restarts': -1, 'started': None}
+
+            self._start_worker(worker=worker)
+            self._workers.append(worker)
+            self._idle_workers.put(worker)
+
+        if health_interval:
+            health_thread = threading.Thread(target=self._health_loop, kwargs={'health_interval': health_interval})
+            health_thread.daemon = True
+            health_thread.start()
+
+    def execute(self, *args):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Runs the handler with args in the next idle worker and returns its result or
+        raises its exception.  Callers are served in arrival order.  A worker which dies
+        during the call, or does not answer within the task timeout, is restarted and
+        RuntimeError is raised.  The call is not retried, since it may be what killed the
+        worker.
+        """
+        with self._waiting_lock:
+            self._waiting += 1
+
+        try:
+            worker = self._idle_workers.get()
+        finally:
+            with self._waiting_lock:
+                self._waiting -= 1
+
+        try:
+            with worker['lock']:
+                if not self._is_alive(worker=worker):
+                    worker['failures'] += 1
+                    self._restart_worker(worker=worker)
+
+                try:
+                    status, value = self._send_task(worker=worker, task=args)
+                except (EOFError, IOError, OSError):
+                    worker['failures'] += 1
+                    self._restart_worker(worker=worker)
+
+                    raise RuntimeError("API worker " + str(worker['index']) + " exited during the call.")
+
+                if status == 'error':
+                    raise value
+
+                return value
+        finally:
+            self._idle_workers.put(worker)
+
+    def execute_all(self, *args):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Runs the handler with args once in every live worker and returns the results in
+        worker order.
+        """
+        results = []
+
+        for worker in self._workers:
+            with worker['lock']:
+                if not self._is_alive(worker=worker):
+                    continue
+
+                try:
+                    status, value = self._send_task(worker=worker, task=args)
+                except (EOFError, IOError, OSError):
+                    worker['failures'] += 1
+                    self._restart_worker(worker=worker)
+                    continue
+
+                if status == 'error':
+                    raise value
+
+                results.append(value)
+
+        return results
+
+    def check_workers(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Restarts idle workers whose process has exited.
+        """
+        for worker in self._workers:
+            if worker['lock'].acquire(False):
+                try:
+                    if not self._closed and not self._is_alive(worker=worker):
+                        worker['failures'] += 1
+                        self._restart_worker(worker=worker)
+                finally:
+                    worker['lock'].release()
+
+    def get_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        stats = {'workers': [], 'waiting': self._waiting, 'idle': self._idle_workers.qsize()}
+
+        for worker in self._workers:
+            stats['workers'].append({'index': worker['index'], 'pid': worker['pid'], 'alive': self._is_alive(worker=worker), 'calls': worker['calls'], 'failures': worker['failures'], 'restarts': worker['restarts'], 'uptime': time.time() - worker['started']})
+
+        return stats
+
+    def close(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._closed = True
+
+        for worker in self._workers:
+            try:
+                worker['connection'].send(None)
+            except (IOError, OSError):
+                pass
+
+        for worker in self._workers:
+            self._stop_worker(worker=worker, timeout=1)
+
+        try:
+            self._spawner_connection.send(None)
+        except (IOError, OSError):
+            pass
+
+        self._spawner.join(1)
+
+        if self._spawner.is_alive():
+            self._spawner.terminate()
+
+        self._spawner_connection.close()
+        self._listener.close()
+
+    def _health_loop(self, health_interval=30):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        while not self._closed:
+            time.sleep(health_interval)
+            self.check_workers()
+
+    def _send_task(self, worker=None, task=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        worker['calls'] += 1
+        worker['connection'].send(task)
+
+        if self._task_timeout and not worker['connection'].poll(self._task_timeout):
+            worker['failures'] += 1
+            self._restart_worker(worker=worker)
+
+            raise RuntimeError("API worker " + str(worker['index']) + " did not answer within " + str(self._task_timeout) + " seconds.")
+
+        return worker['connection'].recv()
+
+    def _start_worker(self, worker=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Asks the spawner for a new worker, which connects back to the pool's listener.
+        """
+        with self._spawn_lock:
+            self._spawner_connection.send(worker['index'])
+            pid = self._spawner_connection.recv()
+            connection = self._listener.accept()
+
+        worker['pid'] = pid
+        worker['connection'] = connection
+        worker['restarts'] += 1
+        worker['started'] = time.time()
+
+    def _restart_worker(self, worker=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._stop_worker(worker=worker)
+        self._start_worker(worker=worker)
+
+    def _stop_worker(self, worker=None, timeout=0):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Waits up to timeout seconds for the worker to exit, then terminates it.
+        """
+        deadline = time.time() + timeout
+
+        while self._is_alive(worker=worker) and time.time() < deadline:
+            time.sleep(0.01)
+
+        if self._is_alive(worker=worker):
+            try:
+                os.kill(worker['pid'], signal.SIGTERM)
+            except OSError:
+                pass
+
+        worker['connection'].close()
+
+    def _is_alive(self, worker=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        The spawner reaps the exited workers, so a worker is alive while its pid exists.
+        """
+        try:
+            os.kill(worker['pid'], 0)
+        except OSError as e:
+            return e.errno == errno.EPERM
+
+        return True
+
+    def _spawner_loop(self, connection=None, pool_connection=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Forks a worker for each request of the pool and sends back its pid.  The spawner
+        exits when the pool closes or the api daemon goes away.
+        """
+        pool_connection.close()
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+        while True:
+            try:
+                index = connection.recv()
+            except (EOFError, IOError):
+                break
+
+            if index is None:
+                break
+
+            pid = os.fork()
+
+            if pid == 0:
+                try:
+                    connection.close()
+                    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                    self._worker_loop(connection=multiprocessing.connection.Client(address=self._address, family='AF_UNIX', authkey=self._authkey))
+                finally:
+                    os._exit(0)
+
+            connection.send(pid)
+
+    def _worker_loop(self, connection=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        while True:
+            try:
+                task = connection.recv()
+            except (EOFError, IOError):
+                break
+
+            if task is None:
+                break
+
+            try:
+                result = ('result', self._handler(*task))
+            except Exception as e:
+                result = ('error', e)
+
+            try:
+                connection.send(result)
+            except Exception as e:
+                connection.send(('error', RuntimeError(traceback.format_exc())))
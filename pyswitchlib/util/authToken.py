@@ -0,0 +1,89 @@
+import os
+import time
+import hashlib
+import threading
+
+class AuthTokenUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Shares rest authentication tokens between the assets of a device and tracks their expiry.
+    """
+
+    _tokens = {}
+    _tokens_lock = threading.Lock()
+
+    def __init__(self, expiration=160, refresh_margin=10):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._expiration = expiration
+        self._refresh_margin = refresh_margin
+
+    @staticmethod
+    def get_time():
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Monotonic clock in seconds.  Python 2 has no time.monotonic, so the elapsed real time
+        of os.times() is used there.
+        """
+        if hasattr(time, 'monotonic'):
+            return time.monotonic()
+
+        return os.times()[4]
+
+    def get_key(self, ip_addr='', auth=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        user = ''
+        passwd = ''
+
+        if auth:
+            user = auth[0] or ''
+            passwd = auth[1] or ''
+
+        return ip_addr + ':' + hashlib.sha256(user.encode() + b':' + passwd.encode()).hexdigest()
+
+    def get_token(self, key=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns None once the token is within the refresh margin of its expiry, so the next
+        request logs in again before the switch drops the token.
+        """
+        with self._tokens_lock:
+            entry = self._tokens.get(key)
+
+            if entry is None:
+                return None
+
+            if self.get_time() >= entry['expires'] - self._refresh_margin:
+                del self._tokens[key]
+                return None
+
+            return entry['token']
+
+    def update_token(self, key='', token=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if not token:
+            return
+
+        with self._tokens_lock:
+            self._tokens[key] = {'token': token, 'expires': self.get_time() + self._expiration}
+
+    def expire_token(self, key=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._tokens_lock:
+            self._tokens.pop(key, None)
+
+    def clear(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._tokens_lock:
+            self._tokens.clear()
@@ -0,0 +1,179 @@
+import re
+import threading
+from pyswitchlib.util.configFile import ConfigFileUtil
+
+overrun_pattern = re.compile(r'Invalid input|Unrecognized command|busy', re.IGNORECASE)
+
+class CliPacingUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Tunes the netmiko delay factor and chunk size of cli config pushes per host.
+    """
+
+    def __init__(self, enabled=False, delay_factor=0.25, min_delay_factor=0.1, max_delay_factor=2.0, chunk_size=20, max_chunk_size=100, state_file=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        When disabled, every push uses delay_factor in a single chunk and only the
+        throughput is tracked.  When enabled, hosts start from the parameters learned
+        for their platform type, which are kept in state_file when it is set.
+        """
+        self._enabled = enabled
+        self._delay_factor = delay_factor
+        self._min_delay_factor = min_delay_factor
+        self._max_delay_factor = max_delay_factor
+        self._chunk_size = chunk_size
+        self._max_chunk_size = max_chunk_size
+        self._state_file = state_file
+        self._hosts = {}
+        self._platforms = {}
+        self._lock = threading.Lock()
+
+        if enabled and state_file:
+            self._load()
+
+    def set_platform(self, host='', platform=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._lock:
+            host_state = self._get_host_state(host=host)
+
+            if host_state['platform'] != platform:
+                host_state['platform'] = platform
+
+                if self._enabled and platform in self._platforms:
+                    host_state['delay_factor'], host_state['chunk_size'] = self._platforms[platform]
+
+    def is_enabled(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        return self._enabled
+
+    def get_params(self, host=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the delay factor and the chunk size for the next push to the host.  A
+        chunk size of 0 sends all the commands at once.
+        """
+        if not self._enabled:
+            return self._delay_factor, 0
+
+        with self._lock:
+            host_state = self._get_host_state(host=host)
+
+            return host_state['delay_factor'], host_state['chunk_size']
+
+    def record(self, host='', commands=0, elapsed=0.0, delay_factor=0.0, output='', failed=False):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Records a push of commands that took elapsed seconds.  The time beyond netmiko's
+        paced sleeps is the prompt-return latency of the host.  A failed push or an
+        overrun message in the output backs off; a host answering well within the
+        current pacing is pushed to faster.
+        """
+        if not commands:
+            return
+
+        latency = max(elapsed - commands * delay_factor * 0.5, 0.0) / commands
+        overrun = failed or bool(overrun_pattern.search(output or ''))
+
+        with self._lock:
+            host_state = self._get_host_state(host=host)
+            host_state['commands'] += commands
+            host_state['elapsed'] += elapsed
+
+            if host_state['latency'] is None:
+                host_state['latency'] = latency
+            else:
+                host_state['latency'] = 0.7 * host_state['latency'] + 0.3 * latency
+
+            if overrun:
+                host_state['errors'] += 1
+
+            if not self._enabled:
+                return
+
+            params = (host_state['delay_factor'], host_state['chunk_size'])
+
+            if overrun:
+                host_state['delay_factor'] = min(host_state['delay_factor'] * 1.5, self._max_delay_factor)
+                host_state['chunk_size'] = max(host_state['chunk_size'] // 2, 1)
+            elif host_state['latency'] > host_state['delay_factor'] * 0.5:
+                host_state['delay_factor'] = min(host_state['delay_factor'] * 1.25, self._max_delay_factor)
+            elif host_state['latency'] < host_state['delay_factor'] * 0.125:
+                host_state['delay_factor'] = max(host_state['delay_factor'] * 0.9, self._min_delay_factor)
+                host_state['chunk_size'] = min(host_state['chunk_size'] + max(host_state['chunk_size'] // 4, 1), self._max_chunk_size)
+
+            new_params = (round(host_state['delay_factor'], 3), host_state['chunk_size'])
+
+            if not host_state['platform'] or (round(params[0], 3), params[1]) == new_params:
+                return
+
+            self._platforms[host_state['platform']] = new_params
+            platforms = dict(self._platforms)
+
+        self._save(platforms=platforms)
+
+    def get_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Reports the pacing of each host with its throughput in commands per second.
+        """
+        with self._lock:
+            hosts = {}
+
+            for host, host_state in self._hosts.items():
+                hosts[host] = dict(host_state)
+                hosts[host]['commands_per_sec'] = host_state['commands'] / host_state['elapsed'] if host_state['elapsed'] else 0.0
+
+            return {'enabled': self._enabled, 'hosts': hosts, 'platforms': dict(self._platforms)}
+
+    def _get_host_state(self, host=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        host_state = self._hosts.get(host)
+
+        if host_state is None:
+            host_state = self._hosts[host] = {'platform': '', 'delay_factor': self._delay_factor, 'chunk_size': self._chunk_size,
+                                              'latency': None, 'commands': 0, 'elapsed': 0.0, 'errors': 0}
+
+        return host_state
+
+    def _load(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        try:
+            conf_dict = ConfigFileUtil().read(filename=self._state_file)
+        except (IOError, OSError):
+            return
+
+        for platform, params in conf_dict.items():
+            try:
+                delay_factor, chunk_size = params.split(',')
+                delay_factor = min(max(float(delay_factor), self._min_delay_factor), self._max_delay_factor)
+                chunk_size = min(max(int(chunk_size), 1), self._max_chunk_size)
+            except ValueError:
+                continue
+
+            self._platforms[platform] = (delay_factor, chunk_size)
+
+    def _save(self, platforms=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if not self._state_file:
+            return
+
+        conf_dict = dict((platform, '%s,%d' % params) for platform, params in platforms.items())
+
+        try:
+            ConfigFileUtil().write(filename=self._state_file, conf_dict=conf_dict, do_merge=False)
+        except (IOError, OSError):
+            pass
@@ -72,4 +72,22 @@ class ConfigUtil(object):
 
         return pidfilename
 
+    def get_unix_socket_for_daemon_id(self, daemon_id=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        return os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_' + (daemon_id or 'default') + '.sock')
+
+    def get_unix_socket_uri_for_daemon_id(self, daemon_id=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the uri of the api daemon on its unix domain socket, or '' when the
+        daemon does not listen on one.
+        """
+        unix_socket = self.get_unix_socket_for_daemon_id(daemon_id=daemon_id)
+
+        if os.path.exists(unix_socket):
+            return 'PYRO:PySwitchLib.' + (daemon_id or 'default') + '@./u:' + unix_socket
 
+        return ''
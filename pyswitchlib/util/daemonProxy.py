@@ -0,0 +1,201 @@
+import os
+import threading
+import Pyro4
+import Pyro4.errors
+from pyswitchlib.util.config import ConfigUtil
+from pyswitchlib.util.configFile import ConfigFileUtil
+
+class DaemonProxyUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Resolves the api daemon uri once per process and shares warm Pyro proxies between assets.
+    """
+
+    _uris = {}
+    _proxies = {}
+    _stale_unix_sockets = {}
+    _lock = threading.Lock()
+    _stats = {'resolves': 0, 'hits': 0, 'revalidations': 0, 'created': 0, 'reused': 0}
+
+    def __init__(self, daemon_id='default', ns_port=None, pool_maxsize=8):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._daemon_id = daemon_id
+        self._ns_port = ns_port
+        self._pool_maxsize = pool_maxsize
+        self._key = (daemon_id, ns_port)
+
+    def get_proxy_name(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Prefers the daemon's unix domain socket, then the name server when it runs, then
+        the uri the daemon wrote to the ns daemon file.  A socket file that could not be
+        bound is skipped until the daemon creates a new one.
+        """
+        proxy_name = self.get_unix_socket_uri()
+
+        if proxy_name and self._get_unix_socket_id() != self._stale_unix_sockets.get(self._key):
+            return proxy_name
+
+        return self.get_ns_proxy_name()
+
+    def get_ns_proxy_name(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if os.path.exists(os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_ns.pid')):
+            proxy_name = 'PYRONAME:PySwitchLib.' + self._daemon_id
+
+            if self._ns_port:
+                proxy_name += '@localhost:' + str(self._ns_port)
+
+            return proxy_name
+
+        ns_daemon_dict = ConfigFileUtil().read(filename=os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_ns_daemon.uri'))
+
+        return ns_daemon_dict.get(self._daemon_id, '')
+
+    def get_unix_socket(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        return ConfigUtil().get_unix_socket_for_daemon_id(daemon_id=self._daemon_id)
+
+    def get_unix_socket_uri(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        return ConfigUtil().get_unix_socket_uri_for_daemon_id(daemon_id=self._daemon_id)
+
+    def get_uri(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the cached uri of the daemon, resolving it on the first use and after
+        invalidate().
+        """
+        with self._lock:
+            uri = self._uris.get(self._key)
+
+            if uri is not None:
+                DaemonProxyUtil._stats['hits'] += 1
+                return uri
+
+        proxy_name = self.get_proxy_name()
+
+        if not proxy_name:
+            raise Pyro4.errors.NamingError('No uri is known for the api daemon ' + self._daemon_id + '.')
+
+        uri = Pyro4.resolve(proxy_name)
+
+        with self._lock:
+            self._uris[self._key] = uri
+            DaemonProxyUtil._stats['resolves'] += 1
+
+        return uri
+
+    def get_proxy(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns an idle proxy of the pool, or a new proxy bound to the daemon.  A proxy
+        that cannot bind invalidates the cached uri.  When the unix domain socket cannot
+        be bound, the name server or the ns daemon file is tried instead.
+        """
+        with self._lock:
+            idle_proxies = self._proxies.get(self._key)
+
+            if idle_proxies:
+                DaemonProxyUtil._stats['reused'] += 1
+                return idle_proxies.pop()
+
+        uri = self.get_uri()
+        pyro_proxy = Pyro4.Proxy(uri)
+
+        try:
+            pyro_proxy._pyroBind()
+        except Pyro4.errors.CommunicationError:
+            pyro_proxy._pyroRelease()
+            self.invalidate()
+
+            if not uri.sockname:
+                raise
+
+            with self._lock:
+                self._stale_unix_sockets[self._key] = self._get_unix_socket_id()
+
+            return self.get_proxy()
+
+        with self._lock:
+            DaemonProxyUtil._stats['created'] += 1
+
+        return pyro_proxy
+
+    def put_proxy(self, pyro_proxy=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Keeps the proxy for the next asset, or releases it when the pool is full.
+        """
+        with self._lock:
+            idle_proxies = self._proxies.setdefault(self._key, [])
+
+            if len(idle_proxies) < self._pool_maxsize and pyro_proxy._pyroUri == self._uris.get(self._key):
+                idle_proxies.append(pyro_proxy)
+                return
+
+        pyro_proxy._pyroRelease()
+
+    def invalidate(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Forgets the uri and the idle proxies of the daemon, after the daemon could not
+        be reached.
+        """
+        with self._lock:
+            self._uris.pop(self._key, None)
+            idle_proxies = self._proxies.pop(self._key, [])
+            DaemonProxyUtil._stats['revalidations'] += 1
+
+        for pyro_proxy in idle_proxies:
+            pyro_proxy._pyroRelease()
+
+    def clear(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._lock:
+            idle_proxies = [pyro_proxy for key in self._proxies for pyro_proxy in self._proxies[key]]
+            self._uris.clear()
+            self._proxies.clear()
+            self._stale_unix_sockets.clear()
+
+        for pyro_proxy in idle_proxies:
+            pyro_proxy._pyroRelease()
+
+    def get_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['idle'] = len(self._proxies.get(self._key, []))
+            stats['uri'] = str(self._uris[self._key]) if self._key in self._uris else ''
+
+        return stats
+
+    def _get_unix_socket_id(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Identifies the current socket file of the daemon by its inode and change time.
+        """
+        try:
+            socket_stat = os.stat(self.get_unix_socket())
+        except OSError:
+            return None
+
+        return socket_stat.st_ino, socket_stat.st_ctime
@@ -0,0 +1,159 @@
+import os
+import time
+import json
+import hashlib
+import threading
+import fasteners
+
+discovery_cache_file = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_discovery.cache')
+discovery_cache_lock_file = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_discovery_cache.lock')
+
+class DiscoveryCacheUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Caches the rest discovery results of an asset in memory and on disk.
+    """
+
+    _memory_cache = {}
+    _memory_cache_lock = threading.Lock()
+
+    def __init__(self, ttl=0, filename=discovery_cache_file, lock_filename=discovery_cache_lock_file):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._ttl = ttl
+        self._filename = filename
+        self._lock_filename = lock_filename
+
+        if not os.path.exists(self._lock_filename):
+            original_mask = os.umask(0o111)
+
+            try:
+                with os.fdopen(os.open(self._lock_filename, os.O_WRONLY | os.O_CREAT, 0o666), 'w') as fd:
+                    pass
+            except:
+                pass
+            finally:
+                os.umask(original_mask)
+
+    def get_key(self, ip_addr='', auth=None, rest_proto=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        user = ''
+        passwd = ''
+
+        if auth:
+            user = auth[0] or ''
+            passwd = auth[1] or ''
+
+        auth_hash = hashlib.sha256(user.encode() + b':' + passwd.encode() + b':' + str(rest_proto).encode()).hexdigest()
+
+        return ip_addr + ':' + auth_hash
+
+    def read(self, key=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._memory_cache_lock:
+            entry = self._memory_cache.get(key)
+
+        if not self._is_valid(entry):
+            entry = self._read_file().get(key)
+
+            if not self._is_valid(entry):
+                return None
+
+            with self._memory_cache_lock:
+                self._memory_cache[key] = entry
+
+        return dict(entry)
+
+    def write(self, key='', entry=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if entry is None:
+            return
+
+        entry = dict(entry)
+        entry['timestamp'] = time.time()
+        entry['ttl'] = self._ttl
+
+        with self._memory_cache_lock:
+            self._memory_cache[key] = entry
+
+        self._update_file(key=key, entry=entry)
+
+    def invalidate(self, key=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._memory_cache_lock:
+            self._memory_cache.pop(key, None)
+
+        self._update_file(key=key, entry=None)
+
+    def _is_valid(self, entry=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if not entry or 'timestamp' not in entry:
+            return False
+
+        return (time.time() - entry['timestamp']) < self._ttl
+
+    def _read_file(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        cache_dict = {}
+
+        try:
+            with fasteners.InterProcessLock(self._lock_filename):
+                if os.path.exists(self._filename):
+                    with open(self._filename, 'r') as cache_file:
+                        cache_dict = json.load(cache_file)
+        except:
+            pass
+
+        return cache_dict
+
+    def _update_file(self, key='', entry=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Each entry of the file is purged with the ttl it was written with, since the
+        assets sharing the file may use different ttls.
+        """
+        try:
+            with fasteners.InterProcessLock(self._lock_filename):
+                cache_dict = {}
+
+                if os.path.exists(self._filename):
+                    try:
+                        with open(self._filename, 'r') as cache_file:
+                            cache_dict = json.load(cache_file)
+                    except ValueError:
+                        cache_dict = {}
+
+                if entry is None:
+                    if key not in cache_dict:
+                        return
+
+                    del cache_dict[key]
+                else:
+                    cache_dict[key] = entry
+
+                now = time.time()
+
+                for cached_key in list(cache_dict):
+                    cached_entry = cache_dict[cached_key]
+
+                    if now - cached_entry.get('timestamp', 0) >= cached_entry.get('ttl', self._ttl):
+                        del cache_dict[cached_key]
+
+                with os.fdopen(os.open(self._filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as cache_file:
+                    json.dump(cache_dict, cache_file)
+        except:
+            pass
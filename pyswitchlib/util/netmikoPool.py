@@ -0,0 +1,311 @@
+import time
+import hashlib
+import threading
+
+class NetmikoPoolUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Pools netmiko sessions per host and credentials, so cli calls to a host run concurrently.
+    """
+
+    def __init__(self, connect=None, max_host_sessions=4, max_sessions=64, idle_timeout=300, liveness_interval=30, wait_timeout=300):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        The connect callable opens a session for the netmiko options of a pool.  Each pool
+        holds up to max_host_sessions sessions and all pools together up to max_sessions.
+        Sessions idle for idle_timeout seconds are closed.  A session idle for less than
+        liveness_interval seconds is reused without a liveness check.
+        """
+        self._connect = connect
+        self._max_host_sessions = max_host_sessions
+        self._max_sessions = max_sessions
+        self._idle_timeout = idle_timeout
+        self._liveness_interval = liveness_interval
+        self._wait_timeout = wait_timeout
+        self._pools = {}
+        self._host_keys = {}
+        self._sessions = 0
+        self._condition = threading.Condition(threading.Lock())
+        self._stats = {'created': 0, 'reconnects': 0, 'evictions': 0, 'failures': 0, 'calls': 0, 'waits': 0, 'wait_time': 0.0}
+
+    def get_key(self, opt=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        secret = opt['username'] + ':' + opt['password'] + ':' + opt.get('secret', '')
+
+        return opt['ip'] + ':' + hashlib.sha256(secret.encode()).hexdigest()
+
+    def get_host_key(self, host=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the key of the pool last registered for the host, or None.
+        """
+        with self._condition:
+            return self._host_keys.get(host)
+
+    def has_pool(self, key=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._condition:
+            return key in self._pools
+
+    def register(self, opt=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Registers the netmiko options of a pool and makes it the host's default pool.
+        A pool without sessions opens one, so bad credentials are reported right away.
+        Returns the pool key.
+        """
+        key = self.get_key(opt=opt)
+
+        with self._condition:
+            pool = self._pools.get(key)
+
+            if pool is None:
+                pool = self._pools[key] = {'opt': dict(opt), 'idle': [], 'busy': 0, 'pending': 0}
+
+            self._host_keys[opt['ip']] = key
+            has_sessions = pool['idle'] or pool['busy'] or pool['pending']
+
+        if not has_sessions:
+            self.release(key=key, session=self.acquire(key=key))
+
+        return key
+
+    def execute(self, key='', func=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Calls func with a session of the pool.  A session whose call fails is closed
+        instead of being returned to the pool.
+        """
+        session = self.acquire(key=key)
+
+        try:
+            result = func(session)
+        except Exception:
+            self.discard(key=key, session=session, failed=True)
+            raise
+
+        self.release(key=key, session=session)
+
+        return result
+
+    def acquire(self, key=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns an idle session of the pool, a new session when the pool and the global
+        limit allow it, or waits for a session to be released.
+        """
+        start = time.time()
+        waited = False
+        acquired = False
+
+        while not acquired:
+            with self._condition:
+                pool = self._pools[key]
+                evicted = self._evict_idle(now=time.time())
+
+                if pool['idle']:
+                    session, last_used = pool['idle'].pop()
+                    pool['busy'] += 1
+                    acquired = True
+                elif pool['busy'] + pool['pending'] < self._max_host_sessions:
+                    if self._sessions >= self._max_sessions:
+                        evicted += self._evict_oldest_idle()
+
+                    if self._sessions < self._max_sessions:
+                        session, last_used = None, None
+                        pool['pending'] += 1
+                        self._sessions += 1
+                        acquired = True
+
+                if acquired:
+                    if waited:
+                        self._stats['wait_time'] += time.time() - start
+
+                    self._stats['calls'] += 1
+                else:
+                    if not waited:
+                        waited = True
+                        self._stats['waits'] += 1
+
+                    if not evicted and time.time() - start < self._wait_timeout:
+                        self._condition.wait(1)
+
+            for evicted_session in evicted:
+                self._disconnect(session=evicted_session)
+
+            if not acquired and time.time() - start >= self._wait_timeout:
+                raise RuntimeError('Timed out waiting for a cli session to ' + pool['opt']['ip'] + '.')
+
+        if session is None:
+            return self._open(key=key, pool=pool)
+
+        if time.time() - last_used >= self._liveness_interval and not self._is_alive(session=session):
+            self.discard(key=key, session=session)
+
+            with self._condition:
+                self._stats['reconnects'] += 1
+                pool['pending'] += 1
+                self._sessions += 1
+
+            return self._open(key=key, pool=pool)
+
+        return session
+
+    def release(self, key='', session=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._condition:
+            pool = self._pools[key]
+            pool['busy'] -= 1
+            pool['idle'].append((session, time.time()))
+            self._condition.notify()
+
+    def discard(self, key='', session=None, failed=False):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._disconnect(session=session)
+
+        with self._condition:
+            self._pools[key]['busy'] -= 1
+            self._sessions -= 1
+
+            if failed:
+                self._stats['failures'] += 1
+
+            self._condition.notify()
+
+    def evict_idle(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._condition:
+            evicted = self._evict_idle(now=time.time())
+
+        for session in evicted:
+            self._disconnect(session=session)
+
+    def close(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._condition:
+            evicted = []
+
+            for pool in self._pools.values():
+                evicted += [session for session, last_used in pool['idle']]
+                self._sessions -= len(pool['idle'])
+                pool['idle'] = []
+
+        for session in evicted:
+            self._disconnect(session=session)
+
+    def get_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Reports the pool counters and, per host, the idle and busy sessions.
+        """
+        with self._condition:
+            stats = dict(self._stats)
+            stats['sessions'] = self._sessions
+            stats['hosts'] = {}
+
+            for pool in self._pools.values():
+                host_stats = stats['hosts'].setdefault(pool['opt']['ip'], {'idle': 0, 'busy': 0})
+                host_stats['idle'] += len(pool['idle'])
+                host_stats['busy'] += pool['busy'] + pool['pending']
+
+        return stats
+
+    def _open(self, key='', pool=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        try:
+            session = self._connect(pool['opt'])
+        except Exception:
+            with self._condition:
+                pool['pending'] -= 1
+                self._sessions -= 1
+                self._condition.notify()
+
+            raise
+
+        with self._condition:
+            pool['pending'] -= 1
+            pool['busy'] += 1
+            self._stats['created'] += 1
+
+        return session
+
+    def _is_alive(self, session=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        try:
+            return session.is_alive()
+        except Exception:
+            return False
+
+    def _disconnect(self, session=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        try:
+            session.disconnect()
+        except Exception:
+            pass
+
+    def _evict_idle(self, now=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Takes the expired sessions out of the pools and returns them, so the caller
+        disconnects them after releasing the lock.
+        """
+        evicted = []
+
+        for pool in self._pools.values():
+            idle_sessions = [(session, last_used) for session, last_used in pool['idle'] if now - last_used < self._idle_timeout]
+
+            for session, last_used in pool['idle']:
+                if now - last_used >= self._idle_timeout:
+                    evicted.append(session)
+                    self._sessions -= 1
+                    self._stats['evictions'] += 1
+
+            pool['idle'] = idle_sessions
+
+        return evicted
+
+    def _evict_oldest_idle(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Takes the oldest idle session out of its pool and returns it in a list.
+        """
+        oldest_pool = None
+
+        for pool in self._pools.values():
+            if pool['idle'] and (oldest_pool is None or pool['idle'][0][1] < oldest_pool['idle'][0][1]):
+                oldest_pool = pool
+
+        if oldest_pool is not None:
+            session, last_used = oldest_pool['idle'].pop(0)
+            self._sessions -= 1
+            self._stats['evictions'] += 1
+
+            return [session]
+
+        return []
@@ -0,0 +1,253 @@
+import os
+import re
+import sys
+import json
+import threading
+import fasteners
+
+from pyswitchlib.exceptions import UnsupportedOSError
+
+pybind_index_file = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_pybind.index')
+pybind_index_lock_file = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_pybind_index.lock')
+
+class PybindIndexUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Indexes the installed pybind version packages once per process.
+    """
+
+    _pybind_dirs = {}
+    _version_trees = {}
+    _resolved_packages = {}
+    _index_lock = threading.Lock()
+
+    def __init__(self, filename=pybind_index_file, lock_filename=pybind_index_lock_file):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._filename = filename
+        self._lock_filename = lock_filename
+
+        if not os.path.exists(self._lock_filename):
+            original_mask = os.umask(0o111)
+
+            try:
+                with os.fdopen(os.open(self._lock_filename, os.O_WRONLY | os.O_CREAT, 0o666), 'w') as fd:
+                    pass
+            except:
+                pass
+            finally:
+                os.umask(original_mask)
+
+    def get_pybind_dir(self, os_type=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        pybind_dir_key = (os_type, tuple(sys.path))
+
+        if pybind_dir_key in self._pybind_dirs:
+            return self._pybind_dirs[pybind_dir_key]
+
+        pybind_dir = ''
+
+        for site_path in sys.path:
+            pybind_dir = os.path.join(site_path, 'pybind')
+            if os.path.isdir(pybind_dir):
+                pybind_dir = os.path.join(pybind_dir, os_type)
+                break
+
+        self._pybind_dirs[pybind_dir_key] = pybind_dir
+
+        return pybind_dir
+
+    def get_version_tree(self, os_type=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        pybind_dir = self.get_pybind_dir(os_type=os_type)
+
+        with self._index_lock:
+            if pybind_dir in self._version_trees:
+                return self._version_trees[pybind_dir]
+
+        try:
+            pybind_dir_mtime = os.stat(pybind_dir).st_mtime
+        except OSError:
+            pybind_dir_mtime = None
+
+        pybind_ver_tree = self._read_index(pybind_dir=pybind_dir, pybind_dir_mtime=pybind_dir_mtime)
+
+        if pybind_ver_tree is None:
+            pybind_ver_tree = self._walk_pybind_dir(pybind_dir=pybind_dir)
+
+            if pybind_dir_mtime is not None:
+                self._write_index(pybind_dir=pybind_dir, pybind_dir_mtime=pybind_dir_mtime, pybind_ver_tree=pybind_ver_tree)
+
+        with self._index_lock:
+            self._version_trees[pybind_dir] = pybind_ver_tree
+
+        return pybind_ver_tree
+
+    def resolve(self, os_type='', os_ver=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        resolved_key = (self.get_pybind_dir(os_type=os_type), os_type, os_ver)
+
+        with self._index_lock:
+            if resolved_key in self._resolved_packages:
+                return self._resolved_packages[resolved_key]
+
+        package_name = self._resolve_package_name(os_type=os_type, os_ver=os_ver, pybind_ver_tree=self.get_version_tree(os_type=os_type))
+
+        with self._index_lock:
+            self._resolved_packages[resolved_key] = package_name
+
+        return package_name
+
+    def clear(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._index_lock:
+            self._pybind_dirs.clear()
+            self._version_trees.clear()
+            self._resolved_packages.clear()
+
+    def _walk_pybind_dir(self, pybind_dir=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        pybind_ver_tree = {}
+
+        max_depth = 1
+        cur_depth = pybind_dir.count(os.sep)
+        max_os_walk_depth = cur_depth + max_depth
+
+        for (dirpath, dirs, files) in os.walk(pybind_dir):
+            if dirpath.count(os.sep) >= max_os_walk_depth:
+                del dirs[:]
+
+            submodule = dirpath.partition(pybind_dir)[2].lstrip('/').replace(os.sep, '.')
+
+            if submodule:
+                tuple = submodule.strip('v_').split('_')
+
+                for index, elem in enumerate(tuple):
+                    if index == 0:
+                        if elem not in pybind_ver_tree:
+                            pybind_ver_tree[elem] = {}
+                    elif index == 1:
+                        if elem not in pybind_ver_tree[tuple[0]]:
+                            pybind_ver_tree[tuple[0]][elem] = {}
+                    elif index == 2:
+                        if elem not in pybind_ver_tree[tuple[0]][tuple[1]]:
+                            pybind_ver_tree[tuple[0]][tuple[1]][elem] = {}
+                    elif index == 3:
+                        if elem not in pybind_ver_tree[tuple[0]][tuple[1]][tuple[2]]:
+                            pybind_ver_tree[tuple[0]][tuple[1]][tuple[2]][elem] = {}
+
+        return pybind_ver_tree
+
+    def _resolve_package_name(self, os_type='', os_ver='', pybind_ver_tree=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        os_version_tuple = os_ver.strip('.').split('.')
+        supported_os_version = []
+
+        if os_version_tuple[0] in pybind_ver_tree:
+            supported_os_version.append(os_version_tuple[0])
+        else:
+            for major in sorted(pybind_ver_tree, reverse=True):
+                if os_version_tuple[0] >= re.sub('\D', '', major):
+                    supported_os_version.append(major)
+                    break;
+
+        if len(supported_os_version) < 1:
+            raise UnsupportedOSError("OS Version: " + os_type + " " + os_ver + " is unsupported.")
+
+        if supported_os_version[0] == os_version_tuple[0] and os_version_tuple[1] in pybind_ver_tree[supported_os_version[0]]:
+            supported_os_version.append(os_version_tuple[1])
+        else:
+            for minor in sorted(pybind_ver_tree[supported_os_version[0]], reverse=True):
+                if supported_os_version[0] == os_version_tuple[0]:
+                    if os_version_tuple[1] >= minor:
+                        supported_os_version.append(minor)
+                        break;
+                else:
+                    supported_os_version.append(minor)
+                    break;
+
+        if len(supported_os_version) >= 2:
+            if supported_os_version[0] == os_version_tuple[0] and supported_os_version[1] == os_version_tuple[1] and os_version_tuple[2] in pybind_ver_tree[supported_os_version[0]][supported_os_version[1]]:
+                supported_os_version.append(os_version_tuple[2])
+            else:
+                for patch in sorted(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]], reverse=True):
+                    if supported_os_version[0] == os_version_tuple[0] and supported_os_version[1] == os_version_tuple[1]:
+                        if os_version_tuple[2] >= patch or len(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]]) == 1:
+                            supported_os_version.append(patch)
+                            break;
+                    else:
+                        supported_os_version.append(patch)
+                        break;
+        else:
+            for minor in sorted(pybind_ver_tree[supported_os_version[0]], reverse=True):
+                supported_os_version.append(minor)
+                break;
+
+            for patch in sorted(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]], reverse=True):
+                supported_os_version.append(patch)
+                break;
+
+        safe_os_version = 'v'+'_'.join(str(ver) for ver in supported_os_version)
+        package_name = '.'.join(['pybind', os_type, safe_os_version])
+
+        return package_name
+
+    def _read_index(self, pybind_dir='', pybind_dir_mtime=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if pybind_dir_mtime is None:
+            return None
+
+        try:
+            with fasteners.InterProcessLock(self._lock_filename):
+                if os.path.exists(self._filename):
+                    with open(self._filename, 'r') as index_file:
+                        index_dict = json.load(index_file)
+
+                    if pybind_dir in index_dict and index_dict[pybind_dir]['mtime'] == pybind_dir_mtime:
+                        return index_dict[pybind_dir]['tree']
+        except:
+            pass
+
+        return None
+
+    def _write_index(self, pybind_dir='', pybind_dir_mtime=None, pybind_ver_tree=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        try:
+            with fasteners.InterProcessLock(self._lock_filename):
+                index_dict = {}
+
+                if os.path.exists(self._filename):
+                    try:
+                        with open(self._filename, 'r') as index_file:
+                            index_dict = json.load(index_file)
+                    except ValueError:
+                        index_dict = {}
+
+                index_dict[pybind_dir] = {'mtime': pybind_dir_mtime, 'tree': pybind_ver_tree}
+
+                original_mask = os.umask(0o022)
+
+                try:
+                    with open(self._filename, 'w') as index_file:
+                        json.dump(index_dict, index_file)
+                finally:
+                    os.umask(original_mask)
+        except:
+            pass
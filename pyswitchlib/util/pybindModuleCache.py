@@ -0,0 +1,187 @@
+import os
+import gc
+import sys
+import threading
+from collections import OrderedDict
+
+class PybindModuleCacheUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Tracks the last use of the imported pybind version packages and unloads cold ones.
+    """
+
+    def __init__(self, max_packages=0, max_rss=0, on_evict=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        When more than max_packages pybind version packages are resident, the least
+        recently used packages are removed from sys.modules and on_evict is called with
+        each package name.  A package imported while the process rss is above max_rss
+        bytes unloads the least recently used package, at most one per import, since freed
+        memory is rarely returned to the system.  The package in use is never unloaded.
+        A budget of 0 is unlimited.
+        """
+        self._max_packages = max_packages
+        self._max_rss = max_rss
+        self._on_evict = on_evict
+        self._packages = OrderedDict()
+        self._evicted = set()
+        self._lock = threading.RLock()
+        self._stats = {'imports': 0, 'reimports': 0, 'evictions': 0}
+
+    def get_package_name(self, module_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the pybind version package of a pybind module name, for example
+        pybind.slxos.v17r_1_01a for pybind.slxos.v17r_1_01a.brocade_interface, or None.
+        """
+        module_path = module_name.split('.')
+
+        if len(module_path) < 3 or module_path[0] != 'pybind':
+            return None
+
+        return '.'.join(module_path[:3])
+
+    def import_module(self, module_name='', fromlist=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        package_name = self.get_package_name(module_name=module_name)
+
+        if package_name is None:
+            return __import__(module_name, fromlist=fromlist or ['*'])
+
+        with self._lock:
+            module_obj = __import__(module_name, fromlist=fromlist or ['*'])
+            imported = package_name not in self._packages
+
+            if imported:
+                self._stats['imports'] += 1
+
+                if package_name in self._evicted:
+                    self._stats['reimports'] += 1
+                    self._evicted.discard(package_name)
+
+            self._touch(package_name=package_name)
+            evicted = self._enforce_budget(imported=imported)
+
+        self._after_evict(package_names=evicted)
+
+        return module_obj
+
+    def touch(self, module_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Marks the pybind version package of the module as used, without importing it.
+        """
+        package_name = self.get_package_name(module_name=module_name)
+
+        if package_name is None:
+            return
+
+        with self._lock:
+            if package_name in self._packages:
+                self._touch(package_name=package_name)
+
+    def evict(self, package_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._lock:
+            if not self._unload(package_name=package_name):
+                return False
+
+        self._after_evict(package_names=[package_name])
+
+        return True
+
+    def get_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['packages'] = list(self._packages)
+
+        stats['max_packages'] = self._max_packages
+        stats['max_rss'] = self._max_rss
+        stats['rss'] = self.get_rss()
+
+        return stats
+
+    def get_rss(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the resident set size of the process in bytes, or 0 when it is unknown.
+        """
+        try:
+            with open(os.path.join(os.sep, 'proc', 'self', 'statm'), 'r') as statm:
+                return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (IOError, OSError, ValueError, IndexError):
+            return 0
+
+    def _touch(self, package_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._packages.pop(package_name, None)
+        self._packages[package_name] = True
+
+    def _unload(self, package_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if package_name not in self._packages:
+            return False
+
+        del self._packages[package_name]
+        self._evicted.add(package_name)
+        self._stats['evictions'] += 1
+
+        for module_name in [name for name in sys.modules if name == package_name or name.startswith(package_name + '.')]:
+            sys.modules.pop(module_name, None)
+
+        parent_name, _, child_name = package_name.rpartition('.')
+        parent_module = sys.modules.get(parent_name)
+
+        if parent_module is not None and hasattr(parent_module, child_name):
+            delattr(parent_module, child_name)
+
+        return True
+
+    def _after_evict(self, package_names=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Runs the on_evict callback and the collection outside the lock, so the imports
+        of other threads do not wait for them.
+        """
+        if not package_names:
+            return
+
+        if self._on_evict:
+            for package_name in package_names:
+                self._on_evict(package_name)
+
+        gc.collect()
+
+    def _enforce_budget(self, imported=False):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Unloads the packages over the budget and returns their names.
+        """
+        evicted = []
+
+        while self._max_packages and len(self._packages) > self._max_packages:
+            evicted.append(next(iter(self._packages)))
+            self._unload(package_name=evicted[-1])
+
+        if self._max_rss and imported and not evicted and len(self._packages) > 1 and self.get_rss() > self._max_rss:
+            evicted.append(next(iter(self._packages)))
+            self._unload(package_name=evicted[-1])
+
+        return evicted
@@ -0,0 +1,330 @@
+import re
+import json
+import bisect
+import numbers
+import pyangbind.lib.pybindJSON as pybindJSON
+from collections import OrderedDict
+from dicttoxml import dicttoxml, escape_xml, make_attrstring, make_valid_xml_name
+from pyangbind.lib.serialise import pybindJSONEncoder
+
+xml_name_pattern = re.compile(r'^[A-Za-z_][A-Za-z0-9_.-]*$')
+
+class PybindXmlUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Serializes pybind objects to the rest xml payload in a single walk of the pybind tree.
+    """
+
+    def __init__(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._encoder = pybindJSONEncoder()
+        self._element_names = {}
+
+    def dumps(self, pybind_obj=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Produces the same xml as dicttoxml(json.loads(pybindJSON.dumps(pybind_obj,
+        mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False,
+        item_func=lambda x: x).
+        """
+        return str(self.dump_document(pybind_obj=pybind_obj))
+
+    def dump_document(self, pybind_obj=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the xml of the pybind object as a PybindXmlDocument, which indexes the
+        position of each element while it is written.
+        """
+        if getattr(pybind_obj, '_pybind_generated_by', None) == 'YANGListType':
+            return PybindXmlDocument(xml=dicttoxml(json.loads(pybindJSON.dumps(pybind_obj, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=lambda x: x))
+
+        writer = _XmlWriter()
+
+        self._write_dict(writer=writer, tree=self._generate_element(pybind_obj=pybind_obj), parent='')
+
+        return writer.get_document()
+
+    def _generate_element(self, pybind_obj=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Follows pybindRESTJSONEncoder.generate_element with filtering, converting the
+        leaves to the values a json round trip of the rest encoding yields.
+        """
+        if getattr(pybind_obj, '_pybind_generated_by', None) == 'YANGListType':
+            return [self._generate_element(pybind_obj=list_entry) for list_entry in pybind_obj.itervalues()]
+
+        tree = _XmlTree()
+        tree_positions = {}
+        base_type = getattr(pybind_obj, '_base_type', None)
+
+        if base_type is not None and hasattr(base_type, '__slots__'):
+            elements = self._element_names.get(base_type)
+
+            if elements is None:
+                elements = self._element_names[base_type] = [x.lstrip('_') for x in base_type.__slots__ if '__' in x]
+        else:
+            elements = pybind_obj._pyangbind_elements
+
+        for element_name in elements:
+            element = getattr(pybind_obj, element_name, None)
+            rest_name = getattr(element, 'rest_name', None)
+            rname = rest_name() if rest_name is not None else element_name
+
+            if rname != '':
+                yname = rname
+            else:
+                yang_name = getattr(element, 'yang_name', None)
+                yname = yang_name() if yang_name is not None else element_name
+
+            generated_by = getattr(element, '_pybind_generated_by', None)
+            is_subtree = True
+
+            if generated_by == 'container' and rname:
+                value = self._generate_element(pybind_obj=element)
+            elif generated_by == 'YANGListType':
+                value = [self._generate_element(pybind_obj=list_entry) for list_entry in element._members.itervalues()]
+            elif element._changed():
+                is_subtree = False
+
+                if str(element) == 'True':
+                    value = u' '
+                elif str(element) == 'False':
+                    continue
+                else:
+                    value = self._get_leaf_value(element=element)
+            else:
+                continue
+
+            if is_subtree and not len(value):
+                if yname in tree_positions:
+                    del tree[tree_positions.pop(yname)]
+                    tree_positions = dict((key, position) for position, (key, _) in enumerate(tree))
+            elif yname in tree_positions:
+                tree[tree_positions[yname]] = (yname, value)
+            else:
+                tree_positions[yname] = len(tree)
+                tree.append((yname, value))
+
+        return tree
+
+    def _get_leaf_value(self, element=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        value = self._encoder.default(element, mode='rest')
+
+        if value is None or type(value) in (unicode, int, long, float, bool):
+            return value
+
+        if type(value) is str:
+            return value.decode('utf-8')
+
+        return json.loads(json.dumps(value, default=lambda obj: self._encoder.default(obj, mode='rest')), object_pairs_hook=OrderedDict)
+
+    def _get_xml_name(self, key='', attr=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if isinstance(key, str):
+            key = key.decode('utf-8')
+
+        if xml_name_pattern.match(key):
+            return key, attr
+
+        return make_valid_xml_name(key, attr)
+
+    def _write_dict(self, writer=None, tree=None, parent=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Follows dicttoxml's convert_dict for json values.
+        """
+        for key, value in (tree if isinstance(tree, _XmlTree) else tree.items()):
+            key, attr = self._get_xml_name(key=key, attr={})
+
+            if isinstance(value, numbers.Number) or type(value) in (str, unicode):
+                self._write_value(writer=writer, key=key, value=value, attr=attr)
+            elif isinstance(value, (dict, _XmlTree)):
+                writer.start(key, make_attrstring(attr))
+                self._write_dict(writer=writer, tree=value, parent=key)
+                writer.end(key)
+            elif isinstance(value, list):
+                writer.start(key, make_attrstring(attr))
+                self._write_list(writer=writer, items=value, parent=key)
+                writer.end(key)
+            elif value is None:
+                self._write_value(writer=writer, key=key, value=None, attr=attr)
+            else:
+                raise TypeError('Unsupported data type: %s (%s)' % (value, type(value).__name__))
+
+    def _write_list(self, writer=None, items=None, parent=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Follows dicttoxml's convert_list for json values.
+        """
+        for item in items:
+            if isinstance(item, numbers.Number) or type(item) in (str, unicode):
+                self._write_value(writer=writer, key=parent, value=item, attr={})
+            elif isinstance(item, (dict, _XmlTree)):
+                writer.start(parent, '')
+                self._write_dict(writer=writer, tree=item, parent=parent)
+                writer.end(parent)
+            elif isinstance(item, list):
+                writer.start(parent, ' ')
+                self._write_list(writer=writer, items=item, parent=parent)
+                writer.end(parent)
+            elif item is None:
+                self._write_value(writer=writer, key=parent, value=None, attr={})
+            else:
+                raise TypeError('Unsupported data type: %s (%s)' % (item, type(item).__name__))
+
+    def _write_value(self, writer=None, key='', value=None, attr=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        key, attr = self._get_xml_name(key=key, attr=attr)
+
+        writer.start(key, make_attrstring(attr))
+
+        if type(value) in (str, unicode):
+            writer.write(escape_xml(value))
+        elif value is not None:
+            writer.write(unicode(value))
+
+        writer.end(key)
+
+class _XmlTree(list):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Ordered (name, value) pairs of a pybind container.
+    """
+
+class PybindXmlDocument(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Rest xml payload with the positions of its elements.
+    """
+
+    def __init__(self, xml='', element_index=None, tail=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        The element_index maps element names to the sorted offsets of their start tags
+        without attributes and of their end tags in xml.  Text appended to the document
+        is kept in tail and is searched directly.
+        """
+        self._xml = xml
+        self._element_index = element_index
+        self._tail = tail
+
+    def __str__(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        return self._xml + self._tail
+
+    def append(self, xml=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        return PybindXmlDocument(xml=self._xml, element_index=self._element_index, tail=self._tail + xml)
+
+    def find_element(self, name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the same fragment as re.match(r'.*(<name>.*</name>).*', xml).group(1), from
+        the last start tag of the element before its last end tag through that end tag,
+        or None.
+        """
+        xml = str(self)
+
+        if '\n' in xml or self._element_index is None:
+            match = re.match(r'.*(<{0}>.*</{0}>).*'.format(name), xml)
+
+            return match.group(1) if match else None
+
+        start_tag = '<' + name + '>'
+        end_tag = '</' + name + '>'
+        start_offsets, end_offsets = self._element_index.get(name, ([], []))
+        tail_end = self._tail.rfind(end_tag)
+
+        if tail_end >= 0:
+            end = len(self._xml) + tail_end
+            tail_start = self._tail.rfind(start_tag, 0, tail_end)
+
+            if tail_start >= 0:
+                start = len(self._xml) + tail_start
+            elif start_offsets:
+                start = start_offsets[-1]
+            else:
+                return None
+        elif end_offsets:
+            end = end_offsets[-1]
+            start_index = bisect.bisect_right(start_offsets, end - len(start_tag))
+
+            if start_index == 0:
+                return None
+
+            start = start_offsets[start_index - 1]
+        else:
+            return None
+
+        return xml[start:end + len(end_tag)]
+
+class _XmlWriter(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Collects the xml text and the element index of a PybindXmlDocument.
+    """
+
+    def __init__(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._parts = []
+        self._length = 0
+        self._element_index = {}
+
+    def start(self, name='', attrstring=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if not attrstring:
+            self._element_index.setdefault(name, ([], []))[0].append(self._length)
+
+        self.write('<' + name + attrstring + '>')
+
+    def end(self, name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._element_index.setdefault(name, ([], []))[1].append(self._length)
+        self.write('</' + name + '>')
+
+    def write(self, text=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._parts.append(text)
+        self._length += len(text)
+
+    def get_document(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        The index holds character offsets, so it is dropped when the utf-8 encoding of
+        the xml has a different length.
+        """
+        xml = u''.join(self._parts).encode('utf-8')
+
+        if len(xml) != self._length:
+            return PybindXmlDocument(xml=xml)
+
+        return PybindXmlDocument(xml=xml, element_index=self._element_index)
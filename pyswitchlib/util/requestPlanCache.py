@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+
+class RequestPlanCacheUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Bounded LRU cache of the rest command tuples returned by read-only APIs.
+    """
+
+    def __init__(self, size=1024):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        A size of 0 disables the cache.
+        """
+        self._size = size
+        self._plans = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get_key(self, module_name='', api_name='', args=None, kwargs=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns the cache key of the call, or None when the cache is disabled or an
+        argument is not hashable.  Lists and tuples are keyed alike, as the api daemon
+        receives tuples as lists.
+        """
+        if not self._size:
+            return None
+
+        try:
+            frozen_args = self._freeze(args or ())
+            frozen_kwargs = self._freeze(kwargs or {})
+            key = (module_name, api_name, frozen_args, frozen_kwargs)
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def get(self, key=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Returns a copy of the cached rest command tuple, or None.
+        """
+        with self._lock:
+            plan = self._plans.pop(key, None)
+
+            if plan is None:
+                self._stats['misses'] += 1
+                return None
+
+            self._plans[key] = plan
+            self._stats['hits'] += 1
+
+        return self._copy(plan)
+
+    def put(self, key=None, plan=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        plan = self._copy(plan)
+
+        with self._lock:
+            self._plans.pop(key, None)
+            self._plans[key] = plan
+
+            while len(self._plans) > self._size:
+                self._plans.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def clear(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._lock:
+            self._plans.clear()
+
+    def get_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._plans)
+
+        stats['max_size'] = self._size
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = float(stats['hits']) / lookups if lookups else 0.0
+
+        return stats
+
+    def _freeze(self, value=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if isinstance(value, (list, tuple)):
+            return ('__sequence__',) + tuple(self._freeze(item) for item in value)
+
+        if isinstance(value, dict):
+            return ('__mapping__',) + tuple(sorted((key, self._freeze(item)) for key, item in value.items()))
+
+        return value
+
+    def _copy(self, plan=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Copies the command lists of the plan, so callers in the daemon process cannot
+        change the cached plan.
+        """
+        rest_commands, yang_list, timeout = plan
+
+        if isinstance(rest_commands, list):
+            rest_commands = [list(rest_command) if isinstance(rest_command, list) else rest_command for rest_command in rest_commands]
+
+        if isinstance(yang_list, list):
+            yang_list = list(yang_list)
+
+        return (rest_commands, yang_list, timeout)
@@ -0,0 +1,265 @@
+import sys
+import time
+import random
+import threading
+import requests
+from requests.packages.urllib3.exceptions import NewConnectionError
+
+from pyswitchlib.exceptions import CircuitBreakerOpenError
+from pyswitchlib.util.authToken import AuthTokenUtil
+
+class RestPolicyUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Retry, backoff and per-device circuit breaker policy for asset rest requests.
+    """
+
+    _circuits = {}
+    _counters = {'requests': 0, 'retries': 0, 'circuit_opens': 0, 'fast_failures': 0}
+    _policy_lock = threading.Lock()
+
+    get_time = staticmethod(AuthTokenUtil.get_time)
+
+    def __init__(self, max_retries=2, retry_status_codes=(429, 502, 503, 504), backoff_base=0.5, backoff_max=30, failure_threshold=5, recovery_timeout=30):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._max_retries = max_retries
+        self._retry_status_codes = retry_status_codes
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+
+    def execute(self, key='', rest_cmd=None, timeout=None, request_func=None, request_kwargs=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Sends the rest command through request_func, retrying retryable responses and
+        connection errors with jittered exponential backoff until the retries or the
+        call's deadline run out.  Raises CircuitBreakerOpenError while the device's
+        circuit is open.
+        """
+        deadline = self.get_deadline(timeout=timeout)
+        attempt = 0
+
+        while True:
+            self._before_request(key=key)
+
+            try:
+                response = request_func(**(request_kwargs or {}))
+            except requests.exceptions.RequestException as e:
+                exc_info = sys.exc_info()
+                retryable = self.is_retryable_exception(rest_cmd=rest_cmd, exception=e)
+
+                self._record_result(key=key, healthy=not isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)))
+
+                if not retryable or not self._wait_for_retry(key=key, attempt=attempt, deadline=deadline):
+                    raise exc_info[0], exc_info[1], exc_info[2]
+
+                attempt += 1
+                continue
+            except:
+                self._record_result(key=key, healthy=None)
+                raise
+
+            retryable = self.is_retryable_response(rest_cmd=rest_cmd, response=response)
+
+            self._record_result(key=key, healthy=response.status_code not in self._retry_status_codes)
+
+            if not retryable or not self._wait_for_retry(key=key, attempt=attempt, deadline=deadline, response=response):
+                return response
+
+            response.close()
+            attempt += 1
+
+    def is_retryable_response(self, rest_cmd=None, response=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        A POST is only retried when the switch refused it with 429 or 503.  A gateway
+        error such as 502 or 504 may follow a request the switch already applied.
+        """
+        if response.status_code not in self._retry_status_codes:
+            return False
+
+        if rest_cmd[0] in ['GET', 'PUT', 'PATCH', 'DELETE']:
+            return True
+
+        return response.status_code in [429, 503]
+
+    def is_retryable_exception(self, rest_cmd=None, exception=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Idempotent methods are retried after any connection error or read timeout.  A POST
+        is only retried when the connection could not be established, so the request never
+        reached the switch; an aborted connection or a read error may follow a request the
+        switch already applied.
+        """
+        if not isinstance(exception, (requests.exceptions.ConnectionError, requests.exceptions.ReadTimeout)):
+            return False
+
+        if rest_cmd[0] in ['GET', 'PUT', 'PATCH', 'DELETE']:
+            return True
+
+        return self.is_unsent_exception(exception=exception)
+
+    def is_unsent_exception(self, exception=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if isinstance(exception, requests.exceptions.ConnectTimeout):
+            return True
+
+        if not isinstance(exception, requests.exceptions.ConnectionError) or not exception.args:
+            return False
+
+        reason = getattr(exception.args[0], 'reason', exception.args[0])
+
+        return isinstance(reason, NewConnectionError)
+
+    def get_backoff(self, attempt=0, response=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        backoff = random.uniform(0, min(self._backoff_max, self._backoff_base * (2 ** attempt)))
+
+        if response is not None:
+            try:
+                backoff = max(backoff, min(self._backoff_max, float(response.headers.get('Retry-After'))))
+            except (TypeError, ValueError):
+                pass
+
+        return backoff
+
+    def get_deadline(self, timeout=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if isinstance(timeout, (list, tuple)):
+            timeout = sum(value for value in timeout if value)
+
+        if not timeout or isinstance(timeout, basestring):
+            return None
+
+        return self.get_time() + timeout
+
+    def get_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._policy_lock:
+            stats = dict(self._counters)
+            stats['open_circuits'] = 0
+            stats['devices'] = {}
+
+            for key, circuit in self._circuits.items():
+                state = self._get_state(circuit=circuit)
+
+                if state != 'closed':
+                    stats['open_circuits'] += 1
+
+                stats['devices'][key] = {'state': state, 'failures': circuit['failures'], 'retries': circuit['retries'], 'opens': circuit['opens']}
+
+        return stats
+
+    def reset(self, key=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._policy_lock:
+            if key is None:
+                self._circuits.clear()
+
+                for counter in self._counters:
+                    self._counters[counter] = 0
+            else:
+                self._circuits.pop(key, None)
+
+    def _get_circuit(self, key=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if key not in self._circuits:
+            self._circuits[key] = {'failures': 0, 'opened_at': None, 'trial': False, 'retries': 0, 'opens': 0}
+
+        return self._circuits[key]
+
+    def _get_state(self, circuit=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if circuit['opened_at'] is None:
+            return 'closed'
+
+        if self.get_time() - circuit['opened_at'] >= self._recovery_timeout:
+            return 'half-open'
+
+        return 'open'
+
+    def _before_request(self, key=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._policy_lock:
+            circuit = self._get_circuit(key=key)
+            state = self._get_state(circuit=circuit)
+
+            if state == 'open' or (state == 'half-open' and circuit['trial']):
+                self._counters['fast_failures'] += 1
+
+                raise CircuitBreakerOpenError("The rest circuit of " + key + " is open after " + str(circuit['failures']) + " consecutive failures.")
+
+            if state == 'half-open':
+                circuit['trial'] = True
+
+            self._counters['requests'] += 1
+
+    def _record_result(self, key='', healthy=True):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._policy_lock:
+            circuit = self._get_circuit(key=key)
+            circuit['trial'] = False
+
+            if healthy is None:
+                return
+
+            if healthy:
+                circuit['failures'] = 0
+                circuit['opened_at'] = None
+                return
+
+            circuit['failures'] += 1
+
+            if circuit['opened_at'] is not None or circuit['failures'] >= self._failure_threshold:
+                if circuit['opened_at'] is None:
+                    circuit['opens'] += 1
+                    self._counters['circuit_opens'] += 1
+
+                circuit['opened_at'] = self.get_time()
+
+    def _wait_for_retry(self, key='', attempt=0, deadline=None, response=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if attempt >= self._max_retries:
+            return False
+
+        backoff = self.get_backoff(attempt=attempt, response=response)
+
+        if deadline is not None and self.get_time() + backoff >= deadline:
+            return False
+
+        with self._policy_lock:
+            if self._get_state(circuit=self._get_circuit(key=key)) != 'closed':
+                return False
+
+            self._get_circuit(key=key)['retries'] += 1
+            self._counters['retries'] += 1
+
+        time.sleep(backoff)
+
+        return True
@@ -0,0 +1,162 @@
+import cgi
+import codecs
+import collections
+
+from xml.parsers import expat
+from pyswitchlib.util.xmlDecoder import XmlDecoderUtil
+
+default_rest_encoding = 'utf-8'
+expat_encodings = {'utf-8': 'utf-8', 'ascii': 'us-ascii', 'iso8859-1': 'iso-8859-1'}
+
+class RestResponse(collections.MutableMapping):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Rest response details whose 'text' and 'json' values are decoded from the response bytes
+    on first access.
+    """
+
+    def __init__(self, status_code=None, url='', content=b'', encoding=None, rest_type='config', yang_list=None, xml_decoder=None, output_keys=('text', 'json')):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        The response is a mapping rather than a dict subclass, so dict(), update() and
+        copy() go through its keys and decode the output_keys like any other access.
+        """
+        self._values = {'status_code': status_code, 'url': url}
+
+        try:
+            encoding = codecs.lookup(encoding or default_rest_encoding).name
+        except LookupError:
+            encoding = default_rest_encoding
+
+        self._content = content or b''
+        self._encoding = encoding
+        self._rest_type = rest_type
+        self._yang_list = yang_list
+        self._xml_decoder = xml_decoder or XmlDecoderUtil()
+        self._output_keys = tuple(output_keys)
+
+    @classmethod
+    def from_response(cls, response=None, rest_type='config', yang_list=None, xml_decoder=None, output_keys=('text', 'json')):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        The charset is taken from the Content-Type header when the switch sends one,
+        otherwise the body is treated as utf-8 instead of running character set
+        detection over it.
+        """
+        return cls(status_code=response.status_code, url=response.url, content=response.content, encoding=cls.get_content_encoding(headers=response.headers), rest_type=rest_type, yang_list=yang_list, xml_decoder=xml_decoder, output_keys=output_keys)
+
+    @staticmethod
+    def get_content_encoding(headers=None, default=default_rest_encoding):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if headers:
+            content_type = headers.get('Content-Type')
+
+            if content_type:
+                params = cgi.parse_header(content_type)[1]
+
+                if 'charset' in params:
+                    return params['charset'].strip('\'"')
+
+        return default
+
+    def content_startswith(self, prefix=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if self._encoding in expat_encodings:
+            return self._content.startswith(prefix)
+
+        return self._get_text().startswith(prefix)
+
+    def decode_xml(self, root_name=None, yang_list=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if self._encoding in expat_encodings:
+            try:
+                return self._xml_decoder.decode(xml=self._content, root_name=root_name, yang_list=yang_list, encoding=expat_encodings[self._encoding])
+            except expat.ExpatError:
+                pass
+
+        return self._xml_decoder.decode(xml=self._get_text(), root_name=root_name, yang_list=yang_list)
+
+    def copy(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        return dict(self)
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            if key == 'text' and key in self._output_keys:
+                self._values[key] = self._decode_text()
+            elif key == 'json' and key in self._output_keys:
+                self._values[key] = self._decode_json()
+            else:
+                raise KeyError(key)
+
+        return self._values[key]
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+
+        self._output_keys = tuple(output_key for output_key in self._output_keys if output_key != key)
+        self._values.pop(key, None)
+
+    def __iter__(self):
+        return iter(list(self._values) + [key for key in self._output_keys if key not in self._values])
+
+    def __len__(self):
+        return len(self._values) + len([key for key in self._output_keys if key not in self._values])
+
+    def __contains__(self, key):
+        return key in self._values or key in self._output_keys
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def _get_text(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if 'text' in self._values:
+            return self._values['text']
+
+        return self._decode_text()
+
+    def _decode_text(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        return self._content.decode(self._encoding, 'replace')
+
+    def _decode_json(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        json_output = {'output': ''}
+
+        if self['status_code'] >= 200 and self['status_code'] <= 299:
+            if self.content_startswith('<'):
+                if self._rest_type != "rpc":
+                    json_output = self.decode_xml(root_name='output', yang_list=self._yang_list)
+                else:
+                    json_output = self.decode_xml(yang_list=self._yang_list)
+        else:
+            if self.content_startswith('<'):
+                if self.content_startswith('<output'):
+                    json_output = self.decode_xml(yang_list=self._yang_list)
+                else:
+                    json_output = self.decode_xml(root_name='output', yang_list=self._yang_list)
+            else:
+                json_output = {'output': self._get_text()}
+
+        return json_output
@@ -0,0 +1,189 @@
+import time
+import threading
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+class TransportRegistryUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Shares bounded HTTP connection pools between the assets of a process.
+    """
+
+    _transports = {}
+    _retired_adapters = []
+    _transports_lock = threading.Lock()
+    _last_eviction = 0
+
+    def __init__(self, pool_maxsize=4, idle_timeout=300):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._pool_maxsize = pool_maxsize
+        self._idle_timeout = idle_timeout
+
+    def get_session(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        session = requests.Session()
+        adapter = _RegistryAdapter(registry=self)
+
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        return session
+
+    def get_adapter(self, protocol='http', ip_addr='', verify=False):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        A transport whose pool is too small is replaced by a larger one.  The replaced
+        adapter may still carry requests of other assets, so it is only closed once its
+        connections are all back in the pool.
+        """
+        key = self.get_key(protocol=protocol, ip_addr=ip_addr, verify=verify)
+        now = time.time()
+
+        self.evict_idle(now=now)
+
+        with self._transports_lock:
+            transport = self._transports.get(key)
+
+            if transport is None or transport['pool_maxsize'] < self._pool_maxsize:
+                if transport is not None:
+                    self._retired_adapters.append(transport['adapter'])
+
+                transport = {'adapter': HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_maxsize, pool_block=True), 'pool_maxsize': self._pool_maxsize, 'last_used': now}
+                self._transports[key] = transport
+
+            transport['last_used'] = now
+
+            return transport['adapter']
+
+    def get_key(self, protocol='http', ip_addr='', verify=False):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        protocol = protocol.lower()
+
+        if protocol != 'https':
+            verify = False
+        elif verify is not True and verify is not False:
+            verify = str(verify)
+
+        return (protocol, ip_addr, verify)
+
+    def evict_idle(self, now=None, idle_timeout=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if now is None:
+            now = time.time()
+
+        if idle_timeout is None:
+            idle_timeout = self._idle_timeout
+
+            if now - TransportRegistryUtil._last_eviction < min(idle_timeout, 30):
+                return
+
+        TransportRegistryUtil._last_eviction = now
+
+        with self._transports_lock:
+            for adapter in list(self._retired_adapters):
+                if self._get_pool_stats(adapter)['active'] == 0:
+                    adapter.close()
+                    self._retired_adapters.remove(adapter)
+
+            for key in list(self._transports):
+                transport = self._transports[key]
+
+                if now - transport['last_used'] >= idle_timeout:
+                    if self._get_pool_stats(transport['adapter'])['active'] == 0:
+                        transport['adapter'].close()
+                        del self._transports[key]
+
+    def clear(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._transports_lock:
+            for key in list(self._transports):
+                self._transports[key]['adapter'].close()
+                del self._transports[key]
+
+            for adapter in self._retired_adapters:
+                adapter.close()
+
+            del self._retired_adapters[:]
+
+    def get_stats(self, ip_addr=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Reports, for each (protocol, ip, verify) transport, the connections opened, currently
+        open, idle in the pool and in use, and how many requests reused a kept-alive connection.
+        """
+        stats = {}
+
+        with self._transports_lock:
+            for key, transport in self._transports.items():
+                if ip_addr is not None and key[1] != ip_addr:
+                    continue
+
+                stats[key] = self._get_pool_stats(transport['adapter'])
+
+        return stats
+
+    def _get_pool_stats(self, adapter=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        pool_stats = {'opened': 0, 'open': 0, 'idle': 0, 'active': 0, 'requests': 0, 'reused': 0}
+
+        for pool_key in adapter.poolmanager.pools.keys():
+            pool = adapter.poolmanager.pools.get(pool_key)
+
+            if pool is None:
+                continue
+
+            idle_connections = [conn for conn in list(pool.pool.queue) if conn is not None and conn.sock is not None]
+            active_connections = pool.pool.maxsize - pool.pool.qsize()
+
+            pool_stats['opened'] += pool.num_connections
+            pool_stats['idle'] += len(idle_connections)
+            pool_stats['active'] += active_connections
+            pool_stats['open'] += len(idle_connections) + active_connections
+            pool_stats['requests'] += pool.num_requests
+            pool_stats['reused'] += max(pool.num_requests - pool.num_connections, 0)
+
+        return pool_stats
+
+class _RegistryAdapter(BaseAdapter):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Session adapter sending each request through the registry's shared pool for its url.
+    """
+
+    def __init__(self, registry=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        super(_RegistryAdapter, self).__init__()
+
+        self._registry = registry
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        protocol, _, location = request.url.partition('://')
+        ip_addr = location.split('/', 1)[0].rpartition('@')[2]
+        adapter = self._registry.get_adapter(protocol=protocol, ip_addr=ip_addr, verify=verify)
+
+        return adapter.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+    def close(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        pass
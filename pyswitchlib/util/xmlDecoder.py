@@ -0,0 +1,157 @@
+from xml.parsers import expat
+
+class XmlDecoderUtil(object):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Decodes rest xml responses into the asset's dictionary output in a single pass.
+    """
+
+    def __init__(self, attr_prefix='@', cdata_key='#text'):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._attr_prefix = attr_prefix
+        self._cdata_key = cdata_key
+
+    def decode(self, xml='', root_name=None, yang_list=None, encoding=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        Produces the same dictionary as json.loads(json.dumps(xmltodict.parse(xml))),
+        optionally nested under a synthetic root_name element, with single yang list
+        entries promoted to lists as the former xmltodict based decoding of Asset did.
+        """
+        if isinstance(xml, unicode):
+            if not encoding:
+                encoding = 'utf-8'
+
+            xml = xml.encode(encoding)
+
+        handler = _XmlDictHandler(attr_prefix=self._attr_prefix, cdata_key=self._cdata_key, yang_list=yang_list)
+
+        parser = expat.ParserCreate(encoding)
+        parser.ordered_attributes = True
+        parser.buffer_text = True
+        parser.StartElementHandler = handler.start_element
+        parser.EndElementHandler = handler.end_element
+        parser.CharacterDataHandler = handler.characters
+
+        if root_name:
+            handler.start_element(root_name, [])
+
+        parser.Parse(xml, True)
+
+        if root_name:
+            handler.end_element(root_name)
+
+        return handler.get_result()
+
+class _XmlDictHandler(object):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Expat callbacks building the decoded dictionary.
+    """
+
+    def __init__(self, attr_prefix='@', cdata_key='#text', yang_list=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._attr_prefix = attr_prefix
+        self._cdata_key = cdata_key
+        self._yang_names = set(yang_list) if yang_list else None
+        self._yang_candidates = {}
+        self._sequence = 0
+        self._stack = []
+        self._item = None
+        self._data = None
+        self._result = None
+
+    def start_element(self, name, attrs):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._stack.append((self._item, self._data, self._sequence))
+        self._sequence += 1
+
+        if attrs:
+            attr_prefix = self._attr_prefix
+            self._item = dict((attr_prefix + attrs[index], attrs[index + 1]) for index in range(0, len(attrs), 2))
+        else:
+            self._item = None
+
+        self._data = None
+
+    def end_element(self, name):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        item = self._item
+        data = self._data
+
+        self._item, self._data, sequence = self._stack.pop()
+
+        if data:
+            data = ''.join(data).strip() or None
+
+        if item is not None:
+            if data:
+                self._push(item, self._cdata_key, data)
+
+            parent = self._push_parent(name, item)
+
+            if self._yang_names is not None and name.lower() in self._yang_names:
+                self._yang_candidates.setdefault(name.lower(), []).append((sequence, parent, name, item))
+        else:
+            self._push_parent(name, data)
+
+    def characters(self, data):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if self._data is None:
+            self._data = [data]
+        else:
+            self._data.append(data)
+
+    def get_result(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        for yang_name in self._yang_candidates:
+            for sequence, parent, name, item in sorted(self._yang_candidates[yang_name], key=lambda candidate: candidate[0]):
+                if parent.get(name) is item:
+                    parent[name] = [item]
+                    break
+
+        return self._result
+
+    def _push_parent(self, name, value):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if self._stack:
+            if self._item is None:
+                self._item = {}
+
+            return self._push(self._item, name, value)
+
+        if self._result is None:
+            self._result = {}
+
+        return self._push(self._result, name, value)
+
+    def _push(self, item, key, value):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if key in item:
+            existing = item[key]
+
+            if isinstance(existing, list):
+                existing.append(value)
+            else:
+                item[key] = [existing, value]
+        else:
+            item[key] = value
+
+        return item
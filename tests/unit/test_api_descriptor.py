@@ -0,0 +1,45 @@
+import unittest2 as unittest
+
+from pyswitchlib.util.apiDescriptor import ApiDescriptorUtil
+
+
+class TestApiDescriptor(unittest.TestCase):
+
+    def setUp(self):
+        self.descriptor = ApiDescriptorUtil(
+            compositions_list=[],
+            bindings_list=[('pybind.nos.v7_2_0.brocade_vlan_rpc.get_vlan_brief.input', 'pybind.nos.v7_2_0.brocade_vlan_rpc.brocade_vlan', 'pybind.nos.v7_2_0.brocade_vlan_rpc'),
+                           ('pybind.slxos.v17r_1_01a.brocade_vlan_rpc.get_vlan_brief.input', 'pybind.slxos.v17r_1_01a.brocade_vlan_rpc.brocade_vlan', 'pybind.slxos.v17r_1_01a.brocade_vlan_rpc')],
+            composed_child_list=[],
+            compositions_keyval_list=[],
+            bindings_keyval={'kwargs_key_name': '', 'keyval': '', 'extra_keyval': ''},
+            composed_child_leafval_list=[],
+            leafval_map={},
+            rest_leaf_name='',
+            choices_kwargs_map={'pybind.slxos.v17r_1_01a': ['vlan_id', 'vlan_name']},
+            leaf_os_support_map={})
+
+    def test_module_index(self):
+        module_index = self.descriptor.get_module_index(module_name='pybind.slxos.v17r_1_01a')
+
+        self.assertEqual(module_index['bindings_list'], (self.descriptor.bindings_list[1],))
+        self.assertEqual(module_index['choices_kwargs_map'], {'pybind.slxos.v17r_1_01a': ['vlan_id', 'vlan_name']})
+        self.assertIs(self.descriptor.get_module_index(module_name='pybind.slxos.v17r_1_01a'), module_index)
+
+        module_index = self.descriptor.get_module_index(module_name='pybind.nos.v7_2_0')
+
+        self.assertEqual(module_index['bindings_list'], (self.descriptor.bindings_list[0],))
+        self.assertEqual(module_index['choices_kwargs_map'], {})
+
+    def test_unsupported_module(self):
+        self.assertEqual(self.descriptor.get_module_index(module_name='pybind.slxos.v17s_1_02'), {'bindings_list': (), 'choices_kwargs_map': {}})
+
+    def test_descriptor_has_fixed_attributes(self):
+        self.assertIsInstance(self.descriptor.bindings_list, tuple)
+
+        with self.assertRaises(AttributeError):
+            self.descriptor.other_list = []
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import threading
+import time
+import types
+import weakref
+import unittest2 as unittest
+
+from pyswitchlib.asset import Asset
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+
+
+def show_module_rpc(self, name='', delay=0, **kwargs):
+    composed_child_list = [('pybind.slxos.v17r_1_01a.brocade_module_rpc.show_module', 'module-01a'), ('pybind.slxos.v17r_2_00.brocade_module_rpc.show_module', 'module-200')]
+
+    time.sleep(delay)
+
+    return [['POST', '/' + name, '', 'rpc', 0]], self._get_child_list_yang_name(composed_child_list=composed_child_list), self._module_name
+
+
+class TestApiInvoke(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        api_module = types.ModuleType('api_module')
+        api_module.show_module_rpc = show_module_rpc
+        api_module.__private__ = show_module_rpc
+
+        PySwitchLibApiDaemon.add_apis(api_module=api_module)
+
+    def setUp(self):
+        self.daemon = PySwitchLibApiDaemon(module_name='pybind.nos.v7_2_0')
+
+    def invoke(self, module_name='pybind.slxos.v17r_1_01a', **kwargs):
+        return self.daemon.api_invoke(module_name=module_name, api_name='show_module_rpc', args=(), kwargs=kwargs)
+
+    def test_api_invoke(self):
+        rest_commands, yang_list, module_name = self.invoke(name='module')
+
+        self.assertEqual(rest_commands, [['POST', '/module', '', 'rpc', 0]])
+        self.assertEqual(yang_list, ['module-01a'])
+        self.assertEqual(module_name, 'pybind.slxos.v17r_1_01a')
+        self.assertEqual(self.daemon._module_name, 'pybind.nos.v7_2_0')
+
+    def test_api_invoke_restores_context_on_error(self):
+        self.assertRaises(TypeError, self.daemon.api_invoke, module_name='pybind.slxos.v17r_1_01a', api_name='show_module_rpc', args=(1, 2, 3))
+        self.assertEqual(self.daemon._module_name, 'pybind.nos.v7_2_0')
+
+    def test_only_apis_are_invoked(self):
+        self.assertIn('show_module_rpc', PySwitchLibApiDaemon._api_names)
+        self.assertNotIn('__private__', PySwitchLibApiDaemon._api_names)
+
+        for api_name in ['__private__', '_get_pybind_object', 'api_release', 'unknown_rpc']:
+            self.assertRaises(AttributeError, self.daemon.api_invoke, module_name='', api_name=api_name)
+
+    def test_module_name_is_per_thread(self):
+        self.daemon.module_name(module_name='pybind.slxos.v17r_2_00')
+        module_names = []
+        thread = threading.Thread(target=lambda: module_names.append(self.daemon._module_name))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(self.daemon._module_name, 'pybind.slxos.v17r_2_00')
+        self.assertEqual(module_names, ['pybind.nos.v7_2_0'])
+
+    def test_concurrent_calls_scale(self):
+        delay = 0.2
+        module_names = ['pybind.slxos.v17r_1_01a', 'pybind.slxos.v17r_2_00']
+        yang_lists = [['module-01a'], ['module-200']]
+
+        for pool_size in [1, 4, 16, 64]:
+            results = [None] * pool_size
+
+            def call(index):
+                results[index] = self.invoke(module_name=module_names[index % 2], name=str(index), delay=delay)
+
+            threads = [threading.Thread(target=call, args=(index,)) for index in range(pool_size)]
+            start = time.time()
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            elapsed = time.time() - start
+
+            self.assertLess(elapsed, delay * 2.5)
+
+            for index, (rest_commands, yang_list, module_name) in enumerate(results):
+                self.assertEqual(rest_commands[0][1], '/' + str(index))
+                self.assertEqual(yang_list, yang_lists[index % 2])
+                self.assertEqual(module_name, module_names[index % 2])
+
+
+    def test_asset_api_wrappers_do_not_reference_the_asset(self):
+        asset = Asset.__new__(Asset)
+        asset._proxied = self.daemon
+        api = asset.show_module_rpc
+
+        self.assertEqual(api.__name__, 'show_module_rpc')
+        self.assertIs(asset.show_module_rpc.__func__, api.__func__)
+        self.assertNotIn('show_module_rpc', asset.__dict__)
+        self.assertRaises(AttributeError, getattr, asset, 'show_missing_rpc')
+
+        asset_ref = weakref.ref(asset)
+        del asset, api
+
+        self.assertIsNone(asset_ref())
+
+
+if __name__ == '__main__':
+    unittest.main()
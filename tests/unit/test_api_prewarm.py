@@ -0,0 +1,96 @@
+import os
+import sys
+import tempfile
+import time
+import types
+import unittest2 as unittest
+
+from pyangbind.lib.base import PybindBase
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+
+
+def show_prewarm_rpc(self):
+    return self._module_name
+
+
+class TestApiPrewarm(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        api_module = types.ModuleType('api_module')
+        api_module.show_prewarm_rpc = show_prewarm_rpc
+
+        PySwitchLibApiDaemon.add_apis(api_module=api_module)
+
+        cls.instances = []
+        pybind_module = types.ModuleType('pybind_prewarm_module')
+
+        for class_name in ['brocade_prewarm_one', 'brocade_prewarm_two']:
+            pybind_class = type(class_name, (PybindBase,), {'__module__': 'pybind_prewarm_module', '__init__': lambda self: cls.instances.append(self)})
+            setattr(pybind_module, class_name, pybind_class)
+
+        pybind_module.PybindBase = PybindBase
+        sys.modules['pybind_prewarm_module'] = pybind_module
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.modules.pop('pybind_prewarm_module', None)
+
+    def setUp(self):
+        del self.instances[:]
+
+    def wait_for_prewarm(self, daemon):
+        for _ in range(100):
+            prewarm = daemon.api_stats()['prewarm']
+
+            if prewarm['done']:
+                return prewarm
+
+            time.sleep(0.05)
+
+        self.fail('prewarm did not finish')
+
+    def test_prewarm_module(self):
+        daemon = PySwitchLibApiDaemon()
+
+        self.assertEqual(daemon._prewarm_module(module_name='pybind_prewarm_module'), 2)
+        self.assertEqual(len(self.instances), 2)
+
+    def test_prewarm_progress(self):
+        daemon = PySwitchLibApiDaemon(api_prewarm=['pybind_prewarm_module', 'pybind_prewarm_missing'])
+        prewarm = self.wait_for_prewarm(daemon)
+
+        self.assertEqual(prewarm['modules'], ['pybind_prewarm_module', 'pybind_prewarm_missing'])
+        self.assertEqual(prewarm['warmed'], ['pybind_prewarm_module'])
+        self.assertEqual(list(prewarm['failed']), ['pybind_prewarm_missing'])
+        self.assertEqual(prewarm['current'], '')
+        self.assertEqual(len(self.instances), 2)
+
+    def test_no_prewarm(self):
+        prewarm = PySwitchLibApiDaemon().api_stats()['prewarm']
+
+        self.assertTrue(prewarm['done'])
+        self.assertEqual(prewarm['modules'], [])
+
+    def test_prewarm_learned_from_api_calls(self):
+        prewarm_file = tempfile.mktemp()
+        self.addCleanup(lambda: os.path.exists(prewarm_file) and os.unlink(prewarm_file))
+
+        daemon = PySwitchLibApiDaemon(api_prewarm_file=prewarm_file)
+        daemon.api_invoke(module_name='pybind_prewarm_module', api_name='show_prewarm_rpc')
+        daemon.api_invoke(module_name='pybind_prewarm_module', api_name='show_prewarm_rpc')
+
+        with open(prewarm_file) as f:
+            self.assertEqual(f.read(), 'api_prewarm = pybind_prewarm_module\n')
+
+        self.assertEqual(self.instances, [])
+
+        daemon = PySwitchLibApiDaemon(api_prewarm_file=prewarm_file)
+        prewarm = self.wait_for_prewarm(daemon)
+
+        self.assertEqual(prewarm['warmed'], ['pybind_prewarm_module'])
+        self.assertEqual(len(self.instances), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import time
+import signal
+import threading
+import unittest2 as unittest
+
+from pyswitchlib.util.apiWorkerPool import ApiWorkerPoolUtil
+
+
+def handler(action='', value=None):
+    if action == 'pid':
+        return os.getpid()
+
+    if action == 'sleep':
+        time.sleep(value)
+        return value
+
+    if action == 'raise':
+        raise AttributeError(value)
+
+    if action == 'exit':
+        os._exit(1)
+
+    return value
+
+
+class TestApiWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ApiWorkerPoolUtil(workers=2, handler=handler, task_timeout=5, health_interval=0)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_execute(self):
+        self.assertEqual(self.pool.execute('echo', [['POST', '/rpc', '', 'rpc', 0]]), [['POST', '/rpc', '', 'rpc', 0]])
+        self.assertNotEqual(self.pool.execute('pid'), os.getpid())
+        self.assertRaisesRegexp(AttributeError, 'unsupported', self.pool.execute, 'raise', 'unsupported')
+
+    def test_calls_run_in_parallel_workers(self):
+        pids = []
+        threads = [threading.Thread(target=lambda: pids.append(self.pool.execute('sleep', 0.3))) for _ in range(2)]
+        start = time.time()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(time.time() - start, 0.55)
+        self.assertEqual(sum(worker['calls'] for worker in self.pool.get_stats()['workers']), 2)
+
+    def test_exited_worker_is_restarted(self):
+        pid = self.pool.execute('pid')
+
+        self.assertRaisesRegexp(RuntimeError, 'exited', self.pool.execute, 'exit')
+
+        stats = self.pool.get_stats()
+
+        self.assertTrue(all(worker['alive'] for worker in stats['workers']))
+        self.assertEqual(sum(worker['restarts'] for worker in stats['workers']), 1)
+        self.assertEqual(self.pool.execute('echo', 'ok'), 'ok')
+
+        for worker in self.pool._workers:
+            os.kill(worker['pid'], signal.SIGKILL)
+
+        for worker in self.pool._workers:
+            while self.pool._is_alive(worker=worker):
+                time.sleep(0.01)
+
+        self.pool.check_workers()
+
+        self.assertTrue(all(worker['alive'] for worker in self.pool.get_stats()['workers']))
+        self.assertNotIn(pid, [worker['pid'] for worker in self.pool.get_stats()['workers']])
+
+    def test_restarted_worker_does_not_inherit_held_locks(self):
+        lock = threading.Lock()
+        pool = ApiWorkerPoolUtil(workers=1, handler=lambda action='': lock.acquire(False), task_timeout=5, health_interval=0)
+
+        try:
+            with lock:
+                pool._restart_worker(worker=pool._workers[0])
+
+                self.assertTrue(pool.execute())
+        finally:
+            pool.close()
+
+    def test_task_timeout_restarts_worker(self):
+        self.pool._task_timeout = 0.2
+
+        self.assertRaisesRegexp(RuntimeError, 'did not answer', self.pool.execute, 'sleep', 5)
+        self.assertEqual(sum(worker['restarts'] for worker in self.pool.get_stats()['workers']), 1)
+        self.assertEqual(self.pool.execute('echo', 'ok'), 'ok')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import inspect
+import threading
+import time
+
+import unittest2 as unittest
+
+from pyswitchlib.asset import Asset
+from pyswitchlib.async_asset import AsyncAsset
+from pyswitchlib.util.configFile import ConfigFileUtil
+from pyswitchlib.util.restPolicy import RestPolicyUtil
+
+
+class ReleasedProxy(object):
+
+    def __init__(self):
+        self.released = 0
+
+    def _pyroRelease(self):
+        self.released += 1
+
+
+class TestAsyncAsset(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = AsyncAsset.get_pool()
+
+    def test_accepts_the_asset_arguments(self):
+        self.assertEqual(inspect.getargspec(AsyncAsset.__init__), inspect.getargspec(Asset.__init__))
+
+    def test_rest_policy_reaches_the_asset(self):
+        forwarded = {}
+        asset_init = Asset.__dict__['__init__']
+
+        def record_init(asset, **kwargs):
+            forwarded.update(kwargs)
+
+        rest_policy = RestPolicyUtil(max_retries=0)
+        Asset.__init__ = record_init
+
+        try:
+            AsyncAsset(ip_addr='10.0.0.1', rest_policy=rest_policy)
+        finally:
+            Asset.__init__ = asset_init
+
+        self.assertIs(forwarded['rest_policy'], rest_policy)
+
+    def test_gather_keeps_order(self):
+        def delayed(value, delay):
+            time.sleep(delay)
+            return value
+
+        results = [self.pool.apply_async(delayed, (index, 0.05 - index * 0.01)) for index in range(5)]
+
+        self.assertEqual(AsyncAsset.gather(*results), [0, 1, 2, 3, 4])
+
+    def test_gather_exceptions(self):
+        def fail():
+            raise ValueError('failed')
+
+        results = [self.pool.apply_async(fail), self.pool.apply_async(len, ('ok',))]
+
+        self.assertRaises(ValueError, AsyncAsset.gather, *results)
+
+        gathered = AsyncAsset.gather(*results, return_exceptions=True)
+
+        self.assertIsInstance(gathered[0], ValueError)
+        self.assertEqual(gathered[1], 2)
+
+    def test_operations_on_one_asset_are_serialized(self):
+        asset = AsyncAsset.__new__(AsyncAsset)
+        asset._operation_lock = threading.Lock()
+        asset._proxied = ReleasedProxy()
+        active = []
+        overlap = []
+        details = []
+
+        def api(index):
+            active.append(index)
+            overlap.append(len(active))
+            time.sleep(0.01)
+            active.remove(index)
+            del details[:]
+            details.append(index)
+            return True, details
+
+        results = [self.pool.apply_async(asset._run_operation, (api, (index,), {})) for index in range(8)]
+
+        self.assertEqual(AsyncAsset.gather(*results), [(True, [index]) for index in range(8)])
+        self.assertEqual(max(overlap), 1)
+        self.assertEqual(asset._proxied.released, 0)
+
+    def test_pool_size_is_read_once(self):
+        reads = []
+        config_file_read = ConfigFileUtil.__dict__['read']
+
+        def counting_read(config_file, filename=None):
+            reads.append(filename)
+            return {'async_pool_size': '8'}
+
+        pool_size = AsyncAsset._pool_size
+        AsyncAsset._pool_size = None
+        ConfigFileUtil.read = counting_read
+
+        try:
+            self.assertEqual([AsyncAsset._get_pool_size() for index in range(4)], [8] * 4)
+        finally:
+            ConfigFileUtil.read = config_file_read
+            AsyncAsset._pool_size = pool_size
+
+        self.assertEqual(len(reads), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest2 as unittest
+
+from pyswitchlib.util.authToken import AuthTokenUtil
+
+
+class ManualClockAuthTokenUtil(AuthTokenUtil):
+    now = 1000.0
+
+    @staticmethod
+    def get_time():
+        return ManualClockAuthTokenUtil.now
+
+
+class TestAuthToken(unittest.TestCase):
+
+    def setUp(self):
+        ManualClockAuthTokenUtil.now = 1000.0
+        self.tokens = ManualClockAuthTokenUtil(expiration=160, refresh_margin=10)
+        self.tokens.clear()
+        self.key = self.tokens.get_key(ip_addr='10.0.0.1', auth=('admin', 'password'))
+
+    def tearDown(self):
+        self.tokens.clear()
+
+    def test_keys(self):
+        self.assertEqual(self.key, AuthTokenUtil().get_key(ip_addr='10.0.0.1', auth=('admin', 'password')))
+        self.assertNotEqual(self.key, AuthTokenUtil().get_key(ip_addr='10.0.0.1', auth=('admin', 'other')))
+        self.assertNotEqual(self.key, AuthTokenUtil().get_key(ip_addr='10.0.0.2', auth=('admin', 'password')))
+        self.assertNotIn('password', self.key)
+
+    def test_token_is_shared(self):
+        self.assertIsNone(self.tokens.get_token(key=self.key))
+
+        self.tokens.update_token(key=self.key, token='token')
+
+        self.assertEqual(ManualClockAuthTokenUtil().get_token(key=self.key), 'token')
+
+    def test_token_is_refreshed_before_expiry(self):
+        self.tokens.update_token(key=self.key, token='token')
+
+        ManualClockAuthTokenUtil.now += 149
+        self.assertEqual(self.tokens.get_token(key=self.key), 'token')
+
+        self.tokens.update_token(key=self.key, token='token')
+
+        ManualClockAuthTokenUtil.now += 149
+        self.assertEqual(self.tokens.get_token(key=self.key), 'token')
+
+        ManualClockAuthTokenUtil.now += 1
+        self.assertIsNone(self.tokens.get_token(key=self.key))
+
+    def test_expire_token(self):
+        self.tokens.update_token(key=self.key, token='token')
+        self.tokens.update_token(key=self.key, token='')
+
+        self.assertEqual(self.tokens.get_token(key=self.key), 'token')
+
+        self.tokens.expire_token(key=self.key)
+
+        self.assertIsNone(self.tokens.get_token(key=self.key))
+
+    def test_clock_is_monotonic(self):
+        first = AuthTokenUtil.get_time()
+
+        self.assertGreaterEqual(AuthTokenUtil.get_time(), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import types
+import unittest2 as unittest
+
+from pyswitchlib.exceptions import MultipleChoicesSetError
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+from pyswitchlib.util.apiDescriptor import ApiDescriptorUtil
+
+
+class FakeContainer(object):
+
+    def __init__(self, key=None):
+        self.key = key
+        self.leaves = {}
+
+    def __getattr__(self, name):
+        if name.startswith('_set_'):
+            return lambda value: self.leaves.__setitem__(name[len('_set_'):], value)
+
+        raise AttributeError(name)
+
+
+class FakeList(object):
+
+    def __init__(self, entry_class=FakeContainer):
+        self.entry_class = entry_class
+        self.entries = []
+
+    def add(self, key):
+        entry = self.entry_class(key)
+        self.entries.append(entry)
+
+        return entry
+
+
+class FakeEthernet(FakeContainer):
+
+    def __init__(self, key=None):
+        super(FakeEthernet, self).__init__(key)
+        self.vlan = FakeList()
+
+
+class FakeInterface(FakeContainer):
+
+    def __init__(self, key=None):
+        super(FakeInterface, self).__init__(key)
+        self.ethernet = FakeList(entry_class=FakeEthernet)
+
+
+class brocade_interface(object):
+
+    def __init__(self):
+        self.interface = FakeInterface()
+
+
+class TestBindingPlan(unittest.TestCase):
+
+    module_name = 'pybind.slxos.v17r_1_01a'
+    bindings_list = [('pybind.nos.v7_2_0.brocade_interface.interface.ethernet.vlan', 'pybind.nos.v7_2_0.brocade_interface.brocade_interface', 'pybind.nos.v7_2_0.brocade_interface'),
+                     ('pybind.slxos.v17r_1_01a.brocade_interface.interface.ethernet.vlan', 'pybind.slxos.v17r_1_01a.brocade_interface.brocade_interface', 'pybind.slxos.v17r_1_01a.brocade_interface')]
+    compositions_list = [('pybind.slxos.v17r_1_01a.brocade_interface.interface.ethernet', 'name')]
+
+    def setUp(self):
+        module_obj = types.ModuleType('brocade_interface')
+        module_obj.brocade_interface = brocade_interface
+
+        self.daemon = PySwitchLibApiDaemon(module_name=self.module_name, module_obj=module_obj)
+
+    def get_pybind_object(self, **kwargs):
+        return self.daemon._get_pybind_object(operation_type='create', compositions_list=self.compositions_list, bindings_list=self.bindings_list, composed_child_list=[],
+                                              compositions_keyval_list=[{'keyval': 'name', 'extra_keyval': ''}], bindings_keyval={'kwargs_key_name': 'vlan', 'keyval': 'vlan', 'extra_keyval': ''},
+                                              composed_child_leafval_list=[], leafval_map={'pybind.slxos.v17r_1_01a.brocade_interface.interface.ethernet.vlan': {'tagged': 'tag'}}, **kwargs)
+
+    def test_pybind_object(self):
+        for name in ['0/1', '0/2']:
+            pybind_obj = self.get_pybind_object(name=name, vlan='10', tagged=True, description=None)
+
+            self.assertEqual(pybind_obj.key, '10')
+            self.assertEqual(pybind_obj.leaves, {'tag': True})
+
+        binding_plan = self.daemon._binding_plans.values()[0]
+
+        self.assertIs(binding_plan['base_class'], brocade_interface)
+        self.assertEqual(binding_plan['path'], [('interface', 'pybind.slxos.v17r_1_01a.brocade_interface.interface', []),
+                                                ('ethernet', 'pybind.slxos.v17r_1_01a.brocade_interface.interface.ethernet', [0]),
+                                                ('vlan', 'pybind.slxos.v17r_1_01a.brocade_interface.interface.ethernet.vlan', [])])
+
+    def test_stats(self):
+        for name in ['0/1', '0/2', '0/3', '0/4']:
+            self.get_pybind_object(name=name, vlan='10')
+
+        self.assertEqual(self.daemon.api_stats()['binding_cache'], {'hits': 3, 'misses': 1, 'size': 1, 'hit_rate': 0.75})
+
+    def test_api_descriptor(self):
+        api_descriptor = ApiDescriptorUtil(compositions_list=self.compositions_list, bindings_list=self.bindings_list, compositions_keyval_list=[{'keyval': 'name', 'extra_keyval': ''}],
+                                           bindings_keyval={'kwargs_key_name': 'vlan', 'keyval': 'vlan', 'extra_keyval': ''}, choices_kwargs_map={'pybind.slxos.v17r_1_01a': ['tagged', 'untagged']})
+
+        for name in ['0/1', '0/2']:
+            self.daemon._api_validation(api_descriptor=api_descriptor, name=name, vlan='10', tagged=True, untagged=None)
+            pybind_obj = self.daemon._get_pybind_object(operation_type='create', api_descriptor=api_descriptor, name=name, vlan='10', tagged=True)
+
+            self.assertEqual((pybind_obj.key, pybind_obj.leaves), ('10', {'tagged': True}))
+
+        self.assertEqual(self.daemon._binding_plans.keys(), [(self.module_name, api_descriptor)])
+        self.assertRaises(MultipleChoicesSetError, self.daemon._api_validation, api_descriptor=api_descriptor, tagged=True, untagged=True)
+
+    def test_drop_binding_plans(self):
+        self.get_pybind_object(name='0/1', vlan='10')
+        self.daemon._drop_binding_plans(package_name='pybind.nos.v7_2_0')
+
+        self.assertEqual(len(self.daemon._binding_plans), 1)
+
+        self.daemon._drop_binding_plans(package_name=self.module_name)
+
+        self.assertEqual(self.daemon._binding_plans, {})
+
+    def test_unsupported_module(self):
+        self.daemon._module_name = 'pybind.slxos.v17s_1_02'
+
+        self.assertRaisesRegexp(AttributeError, 'v17s_1_02', self.get_pybind_object, name='0/1', vlan='10')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest2 as unittest
+
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+from pyswitchlib.util.cliPacing import CliPacingUtil
+
+
+class FakeConnection(object):
+
+    def __init__(self, output=''):
+        self.global_delay_factor = 0.25
+        self.output = output
+        self.pushes = []
+
+    def enable(self):
+        pass
+
+    def send_config_set(self, config_commands=None, exit_config_mode=True, delay_factor=1):
+        self.pushes.append((list(config_commands), exit_config_mode, delay_factor, self.global_delay_factor))
+
+        return self.output
+
+
+class TestCliPacing(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.tmpdir, 'pacing')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_disabled(self):
+        pacing = CliPacingUtil()
+        pacing.record(host='10.0.0.1', commands=10, elapsed=2.0, delay_factor=0.25, output='Invalid input')
+
+        self.assertEqual(pacing.get_params(host='10.0.0.1'), (0.25, 0))
+
+        host_stats = pacing.get_stats()['hosts']['10.0.0.1']
+
+        self.assertEqual(host_stats['commands_per_sec'], 5.0)
+        self.assertEqual(host_stats['errors'], 1)
+
+    def test_fast_host_speeds_up(self):
+        pacing = CliPacingUtil(enabled=True)
+
+        for _ in range(20):
+            delay_factor, chunk_size = pacing.get_params(host='10.0.0.1')
+            pacing.record(host='10.0.0.1', commands=chunk_size, elapsed=chunk_size * delay_factor * 0.5, delay_factor=delay_factor)
+
+        self.assertEqual(pacing.get_params(host='10.0.0.1'), (0.1, 100))
+
+    def test_slow_host_backs_off(self):
+        pacing = CliPacingUtil(enabled=True)
+
+        for _ in range(20):
+            delay_factor, chunk_size = pacing.get_params(host='10.0.0.1')
+            pacing.record(host='10.0.0.1', commands=chunk_size, elapsed=chunk_size * 3.0, delay_factor=delay_factor)
+
+        self.assertEqual(pacing.get_params(host='10.0.0.1'), (2.0, 20))
+
+    def test_overrun_backs_off(self):
+        pacing = CliPacingUtil(enabled=True)
+        pacing.record(host='10.0.0.1', commands=20, elapsed=2.5, delay_factor=0.25, output='Error - Invalid input -> enable')
+
+        self.assertEqual(pacing.get_params(host='10.0.0.1'), (0.375, 10))
+
+        pacing.record(host='10.0.0.1', commands=10, elapsed=2.5, delay_factor=0.375, failed=True)
+
+        self.assertEqual(pacing.get_params(host='10.0.0.1'), (0.5625, 5))
+
+    def test_platform_parameters_are_persisted(self):
+        pacing = CliPacingUtil(enabled=True, state_file=self.state_file)
+        pacing.set_platform(host='10.0.0.1', platform='MLX8')
+        pacing.record(host='10.0.0.1', commands=20, elapsed=2.5, delay_factor=0.25, failed=True)
+
+        pacing = CliPacingUtil(enabled=True, state_file=self.state_file)
+        pacing.set_platform(host='10.0.0.2', platform='MLX8')
+        pacing.set_platform(host='10.0.0.3', platform='CER2024F')
+
+        self.assertEqual(pacing.get_params(host='10.0.0.2'), (0.375, 10))
+        self.assertEqual(pacing.get_params(host='10.0.0.3'), (0.25, 20))
+        self.assertEqual(pacing.get_stats()['platforms'], {'MLX8': (0.375, 10)})
+
+    def test_daemon_pushes_in_chunks(self):
+        daemon = PySwitchLibApiDaemon(cli_pacing=True)
+        conn_obj = FakeConnection(output='ok')
+        commands = ['int eth 0/%d' % index for index in range(45)]
+
+        self.assertEqual(daemon._run_cli_step(conn_obj, 'cli-set', commands, '10.0.0.1'), 'okokok')
+        self.assertEqual([push[0] for push in conn_obj.pushes], [commands[:20], commands[20:40], commands[40:]])
+        self.assertEqual([push[1] for push in conn_obj.pushes], [False, False, True])
+        self.assertEqual(conn_obj.global_delay_factor, 0.25)
+        self.assertEqual(daemon.api_stats()['cli_pacing']['hosts']['10.0.0.1']['commands'], 45)
+
+    def test_daemon_without_pacing(self):
+        daemon = PySwitchLibApiDaemon()
+        conn_obj = FakeConnection(output='ok')
+        commands = ['int eth 0/%d' % index for index in range(45)]
+
+        self.assertEqual(daemon._run_cli_step(conn_obj, 'cli-set', commands, '10.0.0.1'), 'ok')
+        self.assertEqual(conn_obj.pushes, [(commands, True, 0.25, 0.25)])
+
+        conn_obj = FakeConnection(output='ok')
+        conn_obj.global_delay_factor = 2
+
+        self.assertEqual(daemon._run_cli_step(conn_obj, 'cli-set', commands, '10.0.0.1'), 'ok')
+        self.assertEqual(conn_obj.pushes, [(commands, True, 0.25, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import Pyro4
+import Pyro4.errors
+import unittest2 as unittest
+
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+from pyswitchlib.util.daemonProxy import DaemonProxyUtil
+
+
+class TestDaemonProxyUtil(DaemonProxyUtil):
+
+    proxy_name = ''
+    proxy_name_lookups = 0
+
+    def get_proxy_name(self):
+        TestDaemonProxyUtil.proxy_name_lookups += 1
+
+        return self.proxy_name
+
+
+class UnixSocketDaemonProxyUtil(DaemonProxyUtil):
+
+    unix_socket = ''
+    ns_proxy_name = ''
+
+    def get_unix_socket(self):
+        return self.unix_socket
+
+    def get_unix_socket_uri(self):
+        if os.path.exists(self.unix_socket):
+            return 'PYRO:PySwitchLib.default@./u:' + self.unix_socket
+
+        return ''
+
+    def get_ns_proxy_name(self):
+        return self.ns_proxy_name
+
+
+class TestDaemonProxy(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.pyro_daemons = []
+        TestDaemonProxyUtil.proxy_name_lookups = 0
+        TestDaemonProxyUtil().clear()
+
+    def tearDown(self):
+        TestDaemonProxyUtil().clear()
+
+        for pyro_daemon, daemon_thread in self.pyro_daemons:
+            pyro_daemon.shutdown()
+            daemon_thread.join(10)
+
+        shutil.rmtree(self.tmpdir)
+
+    def serve(self, object_id='PySwitchLib.default', name='api.sock'):
+        pyro_daemon = Pyro4.Daemon(unixsocket=os.path.join(self.tmpdir, name))
+        uri = pyro_daemon.register(Pyro4.expose(PySwitchLibApiDaemon)(), objectId=object_id, force=True)
+        daemon_thread = threading.Thread(target=pyro_daemon.requestLoop)
+        daemon_thread.start()
+        self.pyro_daemons.append((pyro_daemon, daemon_thread))
+        TestDaemonProxyUtil.proxy_name = str(uri)
+
+        return uri
+
+    def test_uri_is_resolved_once(self):
+        uri = self.serve()
+        resolves = DaemonProxyUtil._stats['resolves']
+
+        self.assertEqual(TestDaemonProxyUtil().get_uri(), uri)
+        self.assertEqual(TestDaemonProxyUtil().get_uri(), uri)
+        self.assertEqual(TestDaemonProxyUtil.proxy_name_lookups, 1)
+        self.assertEqual(DaemonProxyUtil._stats['resolves'] - resolves, 1)
+        self.assertEqual(TestDaemonProxyUtil().get_stats()['uri'], str(uri))
+
+    def test_proxies_are_reused(self):
+        self.serve()
+        daemon_proxy = TestDaemonProxyUtil(pool_maxsize=1)
+        pyro_proxy = daemon_proxy.get_proxy()
+        other_proxy = daemon_proxy.get_proxy()
+
+        self.assertIsNot(pyro_proxy, other_proxy)
+        self.assertEqual(pyro_proxy.api_worker_stats(), {})
+
+        daemon_proxy.put_proxy(pyro_proxy=pyro_proxy)
+        daemon_proxy.put_proxy(pyro_proxy=other_proxy)
+
+        self.assertEqual(daemon_proxy.get_stats()['idle'], 1)
+        self.assertIs(TestDaemonProxyUtil().get_proxy(), pyro_proxy)
+
+    def test_uri_is_revalidated_after_a_connection_failure(self):
+        self.serve(object_id='PySwitchLib.old', name='old.sock')
+        daemon_proxy = TestDaemonProxyUtil()
+        daemon_proxy.put_proxy(pyro_proxy=daemon_proxy.get_proxy())
+        pyro_daemon, daemon_thread = self.pyro_daemons.pop()
+        pyro_daemon.shutdown()
+        daemon_thread.join(10)
+        pyro_daemon.close()
+        uri = self.serve(name='new.sock')
+        pyro_proxy = daemon_proxy.get_proxy()
+        pyro_proxy._pyroRelease()
+
+        with self.assertRaises(Pyro4.errors.CommunicationError):
+            pyro_proxy.api_worker_stats()
+
+        daemon_proxy.invalidate()
+
+        self.assertEqual(daemon_proxy.get_proxy().api_worker_stats(), {})
+        self.assertEqual(daemon_proxy.get_uri(), uri)
+        self.assertEqual(TestDaemonProxyUtil.proxy_name_lookups, 2)
+
+    def test_stale_unix_socket_falls_back(self):
+        UnixSocketDaemonProxyUtil.unix_socket = os.path.join(self.tmpdir, 'stale.sock')
+        UnixSocketDaemonProxyUtil.ns_proxy_name = str(self.serve(name='api.sock'))
+        stale_socket = socket.socket(socket.AF_UNIX)
+        stale_socket.bind(UnixSocketDaemonProxyUtil.unix_socket)
+        stale_socket.close()
+        daemon_proxy = UnixSocketDaemonProxyUtil()
+
+        self.assertEqual(daemon_proxy.get_proxy().api_worker_stats(), {})
+        self.assertEqual(daemon_proxy.get_uri(), Pyro4.URI(UnixSocketDaemonProxyUtil.ns_proxy_name))
+
+        os.unlink(UnixSocketDaemonProxyUtil.unix_socket)
+        UnixSocketDaemonProxyUtil.ns_proxy_name = ''
+        unix_uri = self.serve(name='stale.sock')
+        daemon_proxy.invalidate()
+
+        self.assertEqual(daemon_proxy.get_uri(), unix_uri)
+
+    def test_unknown_daemon(self):
+        TestDaemonProxyUtil.proxy_name = ''
+
+        with self.assertRaises(Pyro4.errors.NamingError):
+            TestDaemonProxyUtil().get_proxy()
+
+
+if __name__ == '__main__':
+    unittest.main()
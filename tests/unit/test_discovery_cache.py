@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+import time
+
+import unittest2 as unittest
+
+from pyswitchlib.util.discoveryCache import DiscoveryCacheUtil
+
+
+class TestDiscoveryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.tmp_dir, 'discovery.cache')
+        self.lock_file = os.path.join(self.tmp_dir, 'discovery.lock')
+        DiscoveryCacheUtil._memory_cache.clear()
+        self.cache = DiscoveryCacheUtil(ttl=60, filename=self.cache_file, lock_filename=self.lock_file)
+        self.key = self.cache.get_key(ip_addr='10.0.0.1', auth=('admin', 'password'), rest_proto='auto')
+        self.entry = {'rest_protocol': 'https', 'os_type': 'slxos', 'supported_module_name': 'pybind.slxos.v17r_1_01a'}
+
+    def test_key_depends_on_credentials(self):
+        other_key = self.cache.get_key(ip_addr='10.0.0.1', auth=('admin', 'other'), rest_proto='auto')
+        self.assertNotEqual(self.key, other_key)
+        self.assertNotIn('password', self.key)
+
+    def test_write_read(self):
+        self.cache.write(key=self.key, entry=self.entry)
+        self.assertEqual(self.cache.read(key=self.key)['os_type'], 'slxos')
+
+    def test_read_from_disk(self):
+        self.cache.write(key=self.key, entry=self.entry)
+        DiscoveryCacheUtil._memory_cache.clear()
+        self.assertEqual(self.cache.read(key=self.key)['rest_protocol'], 'https')
+
+    def test_expired_entry(self):
+        self.cache.write(key=self.key, entry=self.entry)
+        expired_cache = DiscoveryCacheUtil(ttl=0.01, filename=self.cache_file, lock_filename=self.lock_file)
+        time.sleep(0.02)
+        self.assertIsNone(expired_cache.read(key=self.key))
+
+    def test_write_keeps_entries_of_longer_ttls(self):
+        self.cache.write(key=self.key, entry=self.entry)
+        short_cache = DiscoveryCacheUtil(ttl=0.01, filename=self.cache_file, lock_filename=self.lock_file)
+        short_key = short_cache.get_key(ip_addr='10.0.0.2', auth=('admin', 'password'), rest_proto='auto')
+        short_cache.write(key=short_key, entry=self.entry)
+        time.sleep(0.02)
+        short_cache.write(key=short_key + ':new', entry=self.entry)
+        DiscoveryCacheUtil._memory_cache.clear()
+
+        self.assertEqual(self.cache.read(key=self.key)['os_type'], 'slxos')
+        self.assertNotIn(short_key, short_cache._read_file())
+
+    def test_invalidate(self):
+        self.cache.write(key=self.key, entry=self.entry)
+        self.cache.invalidate(key=self.key)
+        self.assertIsNone(self.cache.read(key=self.key))
+
+    def tearDown(self):
+        DiscoveryCacheUtil._memory_cache.clear()
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest2 as unittest
+
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+
+
+lazy_api_module_source = '''
+import time
+
+loaded_at = time.time()
+
+
+def show_lazy_one_rpc(self, name=''):
+    return 'one-' + name + '-' + self._module_name
+
+
+def show_lazy_two_rpc(self):
+    return 'two'
+
+
+def __private_rpc__(self):
+    return 'private'
+'''
+
+
+class TestLazyApis(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.path = tempfile.mkdtemp()
+
+        with open(os.path.join(cls.path, 'lazy_api_module.py'), 'w') as f:
+            f.write(lazy_api_module_source)
+
+        sys.path.insert(0, cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.path.remove(cls.path)
+        sys.modules.pop('lazy_api_module', None)
+        shutil.rmtree(cls.path)
+
+    def test_lazy_apis(self):
+        PySwitchLibApiDaemon.add_lazy_apis(api_module_name='lazy_api_module')
+
+        self.assertNotIn('lazy_api_module', sys.modules)
+        self.assertIn('show_lazy_one_rpc', PySwitchLibApiDaemon._api_names)
+        self.assertIn('show_lazy_two_rpc', PySwitchLibApiDaemon._api_names)
+        self.assertNotIn('__private_rpc__', PySwitchLibApiDaemon._api_names)
+        self.assertTrue(hasattr(PySwitchLibApiDaemon, 'show_lazy_two_rpc'))
+
+        daemon = PySwitchLibApiDaemon(module_name='pybind.nos.v7_2_0')
+        result = daemon.api_invoke(module_name='pybind.slxos.v17r_1_01a', api_name='show_lazy_one_rpc', args=(), kwargs={'name': 'x'})
+
+        self.assertEqual(result, 'one-x-pybind.slxos.v17r_1_01a')
+        self.assertIn('lazy_api_module', sys.modules)
+
+        lazy_api_module = sys.modules['lazy_api_module']
+
+        self.assertIs(PySwitchLibApiDaemon.__dict__['show_lazy_one_rpc'], lazy_api_module.show_lazy_one_rpc)
+        self.assertIs(PySwitchLibApiDaemon.__dict__['show_lazy_two_rpc'], lazy_api_module.show_lazy_two_rpc)
+        self.assertEqual(daemon.show_lazy_two_rpc(), 'two')
+
+    def test_missing_api_module(self):
+        api_names = set(PySwitchLibApiDaemon._api_names)
+
+        PySwitchLibApiDaemon.add_lazy_apis(api_module_name='pyswitchlib.api.missing')
+
+        self.assertEqual(PySwitchLibApiDaemon._api_names, api_names)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,234 @@
+import threading
+import time
+import unittest2 as unittest
+
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+from pyswitchlib.util.netmikoPool import NetmikoPoolUtil
+
+
+class FakeConnection(object):
+
+    def __init__(self, opt):
+        self.opt = opt
+        self.global_delay_factor = 0.25
+        self.alive = True
+        self.alive_checks = 0
+        self.disconnected = False
+        self.commands = []
+
+    def is_alive(self):
+        self.alive_checks += 1
+
+        return self.alive
+
+    def disconnect(self):
+        self.disconnected = True
+
+    def enable(self):
+        pass
+
+    def send_command(self, call):
+        if call == 'fail':
+            raise IOError('Socket is closed')
+
+        self.commands.append(call)
+
+        return self.opt['ip'] + ':' + call
+
+    def send_config_set(self, config_commands=None, exit_config_mode=True, delay_factor=1):
+        self.commands.append(config_commands)
+
+        return 'config'
+
+
+class TestNetmikoPool(unittest.TestCase):
+
+    def setUp(self):
+        self.connections = []
+
+    def connect(self, opt):
+        if opt['password'] == 'bad':
+            raise ValueError('[Netmiko Authentication Exception:] bad password')
+
+        connection = FakeConnection(opt)
+        self.connections.append(connection)
+
+        return connection
+
+    def get_opt(self, ip='10.0.0.1', password='password'):
+        return {'device_type': 'brocade_netiron', 'ip': ip, 'username': 'admin', 'password': password}
+
+    def test_register_opens_one_session(self):
+        pool = NetmikoPoolUtil(connect=self.connect)
+        key = pool.register(opt=self.get_opt())
+
+        self.assertEqual(pool.register(opt=self.get_opt()), key)
+        self.assertEqual(len(self.connections), 1)
+        self.assertEqual(pool.get_host_key(host='10.0.0.1'), key)
+        self.assertEqual(pool.get_stats()['hosts'], {'10.0.0.1': {'idle': 1, 'busy': 0}})
+
+    def test_register_failure(self):
+        pool = NetmikoPoolUtil(connect=self.connect)
+
+        with self.assertRaises(ValueError):
+            pool.register(opt=self.get_opt(password='bad'))
+
+        self.assertEqual(pool.get_stats()['sessions'], 0)
+
+    def test_credentials_get_their_own_pool(self):
+        pool = NetmikoPoolUtil(connect=self.connect)
+        key = pool.register(opt=self.get_opt())
+        new_key = pool.register(opt=self.get_opt(password='new'))
+
+        self.assertNotEqual(key, new_key)
+        self.assertEqual(pool.get_host_key(host='10.0.0.1'), new_key)
+        self.assertEqual(pool.execute(key=new_key, func=lambda session: session.opt['password']), 'new')
+
+    def test_concurrent_calls_use_separate_sessions(self):
+        pool = NetmikoPoolUtil(connect=self.connect, max_host_sessions=2)
+        key = pool.register(opt=self.get_opt())
+        started = threading.Event()
+        release = threading.Event()
+        sessions = []
+
+        def slow_call(session):
+            sessions.append(session)
+            started.set()
+            release.wait(5)
+
+        thread = threading.Thread(target=pool.execute, kwargs={'key': key, 'func': slow_call})
+        thread.start()
+        started.wait(5)
+        pool.execute(key=key, func=sessions.append)
+        release.set()
+        thread.join()
+
+        self.assertEqual(len(self.connections), 2)
+        self.assertIsNot(sessions[0], sessions[1])
+
+    def test_waits_for_a_session(self):
+        pool = NetmikoPoolUtil(connect=self.connect, max_host_sessions=1)
+        key = pool.register(opt=self.get_opt())
+        session = pool.acquire(key=key)
+        timer = threading.Timer(0.1, pool.release, kwargs={'key': key, 'session': session})
+        timer.start()
+
+        self.assertIs(pool.acquire(key=key), session)
+
+        timer.join()
+        stats = pool.get_stats()
+
+        self.assertEqual(stats['waits'], 1)
+        self.assertGreater(stats['wait_time'], 0)
+        self.assertEqual(len(self.connections), 1)
+
+    def test_global_limit_evicts_idle_sessions(self):
+        pool = NetmikoPoolUtil(connect=self.connect, max_sessions=1)
+        pool.register(opt=self.get_opt())
+        pool.register(opt=self.get_opt(ip='10.0.0.2'))
+
+        self.assertTrue(self.connections[0].disconnected)
+        self.assertEqual(pool.get_stats()['sessions'], 1)
+        self.assertEqual(pool.get_stats()['evictions'], 1)
+
+    def test_liveness_check(self):
+        pool = NetmikoPoolUtil(connect=self.connect, liveness_interval=0.05)
+        key = pool.register(opt=self.get_opt())
+
+        pool.execute(key=key, func=lambda session: session.send_command('show version'))
+        self.assertEqual(self.connections[0].alive_checks, 0)
+
+        time.sleep(0.1)
+        self.connections[0].alive = False
+        pool.execute(key=key, func=lambda session: session.send_command('show version'))
+
+        self.assertTrue(self.connections[0].disconnected)
+        self.assertEqual(self.connections[1].commands, ['show version'])
+        self.assertEqual(pool.get_stats()['reconnects'], 1)
+
+    def test_failed_session_is_dropped(self):
+        pool = NetmikoPoolUtil(connect=self.connect)
+        key = pool.register(opt=self.get_opt())
+
+        with self.assertRaises(IOError):
+            pool.execute(key=key, func=lambda session: session.send_command('fail'))
+
+        self.assertTrue(self.connections[0].disconnected)
+        self.assertEqual(pool.get_stats()['failures'], 1)
+        self.assertEqual(pool.execute(key=key, func=lambda session: session.send_command('show version')), '10.0.0.1:show version')
+        self.assertEqual(len(self.connections), 2)
+
+    def test_idle_eviction(self):
+        pool = NetmikoPoolUtil(connect=self.connect, idle_timeout=0.05)
+        pool.register(opt=self.get_opt())
+        time.sleep(0.1)
+        pool.evict_idle()
+
+        self.assertTrue(self.connections[0].disconnected)
+        self.assertEqual(pool.get_stats()['sessions'], 0)
+
+    def test_eviction_disconnects_outside_the_lock(self):
+        pool = NetmikoPoolUtil(connect=self.connect, idle_timeout=0.05)
+        pool.register(opt=self.get_opt())
+        key = pool.register(opt=self.get_opt(ip='10.0.0.2'))
+        disconnecting = threading.Event()
+        unblock = threading.Event()
+
+        def disconnect():
+            disconnecting.set()
+            unblock.wait(10)
+
+        self.connections[0].disconnect = disconnect
+        time.sleep(0.1)
+        evict_thread = threading.Thread(target=pool.evict_idle)
+        evict_thread.start()
+        disconnecting.wait(10)
+
+        try:
+            self.assertEqual(pool.get_stats()['sessions'], 0)
+            self.assertEqual(pool.execute(key=key, func=lambda session: session.send_command('show version')), '10.0.0.2:show version')
+            self.assertEqual(len(self.connections), 3)
+        finally:
+            unblock.set()
+            evict_thread.join(10)
+
+    def test_daemon_cli_execution(self):
+        daemon = PySwitchLibApiDaemon()
+        daemon._netmiko_pool = NetmikoPoolUtil(connect=self.connect)
+
+        self.assertEqual(daemon.cli_execution('cli-get', '10.0.0.1', 'show version'), '')
+
+        key = daemon.create_netmiko_connection(self.get_opt())
+
+        self.assertEqual(daemon.cli_execution('cli-get', '10.0.0.1', 'show version'), '10.0.0.1:show version')
+        self.assertEqual(daemon.cli_execution('cli-set', '10.0.0.1', ['vlan 10'], key), 'config')
+        self.assertEqual(daemon.api_stats()['netmiko_pool']['calls'], 3)
+
+        with self.assertRaisesRegexp(ValueError, '10.0.0.1: Socket is closed'):
+            daemon.cli_execution('cli-get', '10.0.0.1', 'fail')
+
+    def test_daemon_cli_batch_execution(self):
+        daemon = PySwitchLibApiDaemon()
+        daemon._netmiko_pool = NetmikoPoolUtil(connect=self.connect)
+
+        self.assertEqual(daemon.cli_batch_execution('10.0.0.1', [('cli-get', 'show version')]), [])
+
+        daemon.create_netmiko_connection(self.get_opt())
+        results = daemon.cli_batch_execution('10.0.0.1', [['cli-get', 'show version'], ['cli-set', ['vlan 10']], ['cli-get', 'show vlan']])
+
+        self.assertEqual([(result['handler'], result['output']) for result in results],
+                         [('cli-get', '10.0.0.1:show version'), ('cli-set', 'config'), ('cli-get', '10.0.0.1:show vlan')])
+        self.assertTrue(all(result['elapsed'] >= 0 for result in results))
+        self.assertEqual(self.connections[0].commands, ['show version', ['vlan 10'], 'show vlan'])
+        self.assertEqual(daemon.api_stats()['netmiko_pool']['calls'], 2)
+
+        results = daemon.cli_batch_execution('10.0.0.1', [('cli-get', 'show version'), ('cli-get', 'fail'), ('cli-get', 'show vlan')])
+
+        self.assertEqual([(result['handler'], result['output'], result.get('error')) for result in results],
+                         [('cli-get', '10.0.0.1:show version', None), ('cli-get', '', 'Socket is closed')])
+        self.assertTrue(self.connections[0].disconnected)
+        self.assertEqual(daemon.api_stats()['netmiko_pool']['failures'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
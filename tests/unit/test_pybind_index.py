@@ -0,0 +1,56 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import unittest2 as unittest
+
+from pyswitchlib.exceptions import UnsupportedOSError
+from pyswitchlib.util.pybindIndex import PybindIndexUtil
+
+
+class TestPybindIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.site_dir = os.path.join(self.tmp_dir, 'site-packages')
+
+        for version in ['v6_0_2f', 'v7_2_0']:
+            os.makedirs(os.path.join(self.site_dir, 'pybind', 'nos', version))
+
+        for version in ['v17r_1_01a', 'v17r_2_00', 'v17s_1_02']:
+            os.makedirs(os.path.join(self.site_dir, 'pybind', 'slxos', version))
+
+        sys.path.insert(0, self.site_dir)
+        PybindIndexUtil().clear()
+        self.index_file = os.path.join(self.tmp_dir, 'pybind.index')
+        self.index = PybindIndexUtil(filename=self.index_file, lock_filename=os.path.join(self.tmp_dir, 'pybind.lock'))
+
+    def test_resolve(self):
+        self.assertEqual(self.index.resolve(os_type='nos', os_ver='7.2.0'), 'pybind.nos.v7_2_0')
+        self.assertEqual(self.index.resolve(os_type='nos', os_ver='6.0.2f'), 'pybind.nos.v6_0_2f')
+        self.assertEqual(self.index.resolve(os_type='slxos', os_ver='17r.1.02'), 'pybind.slxos.v17r_1_01a')
+        self.assertEqual(self.index.resolve(os_type='slxos', os_ver='17s.1.02'), 'pybind.slxos.v17s_1_02')
+
+    def test_unsupported(self):
+        with self.assertRaises(UnsupportedOSError):
+            self.index.resolve(os_type='nos', os_ver='5.0.0')
+
+    def test_index_file_invalidated_by_mtime(self):
+        self.index.resolve(os_type='nos', os_ver='7.2.0')
+        self.assertTrue(os.path.exists(self.index_file))
+
+        PybindIndexUtil().clear()
+        os.makedirs(os.path.join(self.site_dir, 'pybind', 'nos', 'v7_3_0'))
+        os.utime(os.path.join(self.site_dir, 'pybind', 'nos'), (0, 0))
+
+        self.assertEqual(self.index.resolve(os_type='nos', os_ver='7.3.0'), 'pybind.nos.v7_3_0')
+
+    def tearDown(self):
+        sys.path.remove(self.site_dir)
+        PybindIndexUtil().clear()
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
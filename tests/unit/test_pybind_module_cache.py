@@ -0,0 +1,130 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+import unittest2 as unittest
+
+from pyswitchlib.util.pybindModuleCache import PybindModuleCacheUtil
+
+
+class TestPybindModuleCache(unittest.TestCase):
+
+    versions = ['v1_0_0', 'v2_0_0', 'v3_0_0']
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.saved_modules = dict((name, module) for name, module in sys.modules.items() if name == 'pybind' or name.startswith('pybind.'))
+
+        for name in self.saved_modules:
+            del sys.modules[name]
+
+        for version in self.versions:
+            version_dir = os.path.join(self.tmp_dir, 'pybind', 'testos', version)
+            os.makedirs(version_dir)
+
+            with open(os.path.join(version_dir, 'brocade_test.py'), 'w') as module_file:
+                module_file.write('class brocade_test(object):\n    pass\n')
+
+        for package_dir in ['pybind', os.path.join('pybind', 'testos')] + [os.path.join('pybind', 'testos', version) for version in self.versions]:
+            open(os.path.join(self.tmp_dir, package_dir, '__init__.py'), 'w').close()
+
+        sys.path.insert(0, self.tmp_dir)
+        self.evicted = []
+        self.cache = PybindModuleCacheUtil(max_packages=2, on_evict=self.evicted.append)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp_dir)
+
+        for name in [name for name in sys.modules if name == 'pybind' or name.startswith('pybind.')]:
+            del sys.modules[name]
+
+        sys.modules.update(self.saved_modules)
+        shutil.rmtree(self.tmp_dir)
+
+    def import_version(self, version):
+        return self.cache.import_module(module_name='pybind.testos.' + version + '.brocade_test', fromlist=['brocade_test'])
+
+    def test_package_name(self):
+        self.assertEqual(self.cache.get_package_name(module_name='pybind.slxos.v17r_1_01a.brocade_interface'), 'pybind.slxos.v17r_1_01a')
+        self.assertEqual(self.cache.get_package_name(module_name='pybind.slxos.v17r_1_01a'), 'pybind.slxos.v17r_1_01a')
+        self.assertIsNone(self.cache.get_package_name(module_name='pyswitchlib.api.rpc'))
+
+    def test_lru_eviction(self):
+        self.import_version('v1_0_0')
+        self.import_version('v2_0_0')
+        self.cache.touch(module_name='pybind.testos.v1_0_0')
+        self.import_version('v3_0_0')
+
+        self.assertEqual(self.evicted, ['pybind.testos.v2_0_0'])
+        self.assertNotIn('pybind.testos.v2_0_0', sys.modules)
+        self.assertNotIn('pybind.testos.v2_0_0.brocade_test', sys.modules)
+        self.assertFalse(hasattr(sys.modules['pybind.testos'], 'v2_0_0'))
+        self.assertIn('pybind.testos.v1_0_0.brocade_test', sys.modules)
+
+        stats = self.cache.get_stats()
+
+        self.assertEqual(stats['packages'], ['pybind.testos.v1_0_0', 'pybind.testos.v3_0_0'])
+        self.assertEqual((stats['imports'], stats['reimports'], stats['evictions']), (3, 0, 1))
+
+    def test_reimport(self):
+        for version in ['v1_0_0', 'v2_0_0', 'v3_0_0', 'v1_0_0']:
+            module_obj = self.import_version(version)
+
+        self.assertTrue(hasattr(module_obj, 'brocade_test'))
+
+        stats = self.cache.get_stats()
+
+        self.assertEqual(stats['packages'], ['pybind.testos.v3_0_0', 'pybind.testos.v1_0_0'])
+        self.assertEqual((stats['imports'], stats['reimports'], stats['evictions']), (4, 1, 2))
+
+    def test_rss_budget_keeps_package_in_use(self):
+        self.cache = PybindModuleCacheUtil(max_rss=1, on_evict=self.evicted.append)
+
+        self.import_version('v1_0_0')
+        self.import_version('v2_0_0')
+
+        self.assertEqual(self.evicted, ['pybind.testos.v1_0_0'])
+        self.assertEqual(self.cache.get_stats()['packages'], ['pybind.testos.v2_0_0'])
+
+    def test_rss_budget_evicts_one_package_per_import(self):
+        self.cache = PybindModuleCacheUtil(on_evict=self.evicted.append)
+        self.import_version('v1_0_0')
+        self.import_version('v2_0_0')
+        self.cache._max_rss = 1
+        self.import_version('v3_0_0')
+        self.import_version('v3_0_0')
+        self.import_version('v2_0_0')
+
+        self.assertEqual(self.evicted, ['pybind.testos.v1_0_0'])
+        self.assertEqual(self.cache.get_stats()['packages'], ['pybind.testos.v3_0_0', 'pybind.testos.v2_0_0'])
+
+    def test_on_evict_runs_outside_the_lock(self):
+        lock_free = []
+
+        def on_evict(package_name):
+            thread = threading.Thread(target=lambda: lock_free.append(self.cache._lock.acquire(False) and self.cache._lock.release() is None))
+            thread.start()
+            thread.join()
+
+        self.cache._on_evict = on_evict
+
+        for version in self.versions:
+            self.import_version(version)
+
+        self.cache.evict(package_name='pybind.testos.v3_0_0')
+
+        self.assertEqual(lock_free, [True, True])
+
+    def test_unlimited(self):
+        self.cache = PybindModuleCacheUtil()
+
+        for version in self.versions:
+            self.import_version(version)
+
+        self.assertEqual(self.cache.get_stats()['evictions'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
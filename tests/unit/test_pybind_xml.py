@@ -0,0 +1,77 @@
+import json
+import re
+from collections import OrderedDict
+
+import unittest2 as unittest
+
+import pyangbind.lib.pybindJSON as pybindJSON
+from dicttoxml import dicttoxml
+from pybind.slxos.v17r_1_01a import brocade_interface
+
+from pyswitchlib.util.pybindXml import PybindXmlUtil
+
+
+def legacy_dumps(pybind_obj):
+    return dicttoxml(json.loads(pybindJSON.dumps(pybind_obj, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=lambda x: x)
+
+
+def legacy_find_element(rest_data, name):
+    match = re.match(r'.*(<{0}>.*</{0}>).*'.format(name), rest_data)
+
+    return match.group(1) if match else None
+
+
+class TestPybindXml(unittest.TestCase):
+
+    names = ['Ethernet', 'name', 'description', 'mtu', 'shutdown', 'switchport', 'vlan', 'add', 'mode', 'vlan-mode', 'access', 'missing']
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pybind_obj = brocade_interface()
+
+        for index, description in enumerate(['uplink', 'server <a> & "b"', 'line\nbreak']):
+            ethernet = cls.pybind_obj.interface.ethernet.add('0/%d' % (index + 1))
+            ethernet._set_description(description)
+            ethernet._set_mtu(9000 + index)
+            ethernet._set_shutdown(index % 2 == 0)
+            ethernet.switchport.mode._set_vlan_mode('trunk')
+            ethernet.switchport.trunk.allowed.vlan._set_add_(str(index + 10))
+
+        cls.ethernet = cls.pybind_obj.interface.ethernet
+
+    def assertEquivalent(self, pybind_obj):
+        rest_data = legacy_dumps(pybind_obj)
+        rest_document = PybindXmlUtil().dump_document(pybind_obj=pybind_obj)
+
+        self.assertEqual(PybindXmlUtil().dumps(pybind_obj=pybind_obj), rest_data)
+        self.assertEqual(str(rest_document), rest_data)
+
+        for name in self.names:
+            self.assertEqual(rest_document.find_element(name=name), legacy_find_element(rest_data, name), name)
+
+        appended_data = '<mtu>1500</mtu><shutdown>false</shutdown>'
+        rest_document = rest_document.append(xml=appended_data)
+
+        for name in self.names:
+            self.assertEqual(rest_document.find_element(name=name), legacy_find_element(rest_data + appended_data, name), name)
+
+    def test_containers(self):
+        for pybind_obj in [self.pybind_obj, self.pybind_obj.interface, self.ethernet['0/2'].switchport, self.ethernet['0/2'].switchport.trunk.allowed.vlan]:
+            self.assertEquivalent(pybind_obj)
+
+    def test_list_entries(self):
+        for key in ['0/1', '0/2', '0/3']:
+            self.assertEquivalent(self.ethernet[key])
+
+    def test_list(self):
+        self.assertEquivalent(self.ethernet)
+
+    def test_unchanged(self):
+        self.assertEqual(PybindXmlUtil().dumps(pybind_obj=brocade_interface()), legacy_dumps(brocade_interface()))
+
+    def test_escaped_values(self):
+        self.assertIn('<description>server &lt;a&gt; &amp; &quot;b&quot;</description>', PybindXmlUtil().dumps(pybind_obj=self.ethernet['0/2']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import types
+import unittest2 as unittest
+
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+from pyswitchlib.util.requestPlanCache import RequestPlanCacheUtil
+
+
+def get_plan_rpc(self, name='', last_rcvd_interface=None, api_timeout=''):
+    self.plan_calls.append(name)
+
+    return [['POST', '/' + name, '<name>' + name + '</name>', 'rpc', 1]], '', api_timeout
+
+
+def plan_get(self, name='', api_timeout=''):
+    self.plan_calls.append(name)
+
+    return [['GET', '/' + name, '', 'config', 1]], ['plan'], api_timeout
+
+
+def plan_update(self, name='', api_timeout=''):
+    self.plan_calls.append(name)
+
+    return [['PATCH', '/' + name, '', 'config', 1]], '', api_timeout
+
+
+class TestRequestPlanCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        api_module = types.ModuleType('api_module')
+        api_module.get_plan_rpc = get_plan_rpc
+        api_module.plan_get = plan_get
+        api_module.plan_update = plan_update
+
+        PySwitchLibApiDaemon.add_apis(api_module=api_module)
+
+    def setUp(self):
+        self.daemon = PySwitchLibApiDaemon(request_plan_cache_size=2)
+        self.daemon.plan_calls = []
+
+    def invoke(self, api_name='get_plan_rpc', module_name='pybind.slxos.v17r_1_01a', **kwargs):
+        return self.daemon.api_invoke(module_name=module_name, api_name=api_name, args=(), kwargs=kwargs)
+
+    def test_read_only_apis_are_cached(self):
+        for _ in range(3):
+            self.assertEqual(self.invoke(name='a', last_rcvd_interface=['ethernet', '0/1']), ([['POST', '/a', '<name>a</name>', 'rpc', 1]], '', ''))
+            self.assertEqual(self.invoke(api_name='plan_get', name='a'), ([['GET', '/a', '', 'config', 1]], ['plan'], ''))
+
+        self.assertEqual(self.daemon.plan_calls, ['a', 'a'])
+        self.assertEqual(self.daemon.api_stats()['request_plan_cache'], {'hits': 4, 'misses': 2, 'evictions': 0, 'size': 2, 'max_size': 2, 'hit_rate': 4 / 6.0})
+
+    def test_key(self):
+        self.invoke(name='a', last_rcvd_interface=['ethernet', '0/1'])
+        self.invoke(name='a', last_rcvd_interface=('ethernet', '0/1'))
+        self.invoke(name='a', last_rcvd_interface=('ethernet', '0/2'))
+        self.invoke(name='a', api_timeout=30)
+        self.invoke(name='a', module_name='pybind.nos.v7_2_0')
+
+        self.assertEqual(self.daemon.plan_calls, ['a', 'a', 'a', 'a'])
+
+    def test_write_apis_are_not_cached(self):
+        self.invoke(api_name='plan_update', name='a')
+        self.invoke(api_name='plan_update', name='a')
+
+        self.assertEqual(self.daemon.plan_calls, ['a', 'a'])
+        self.assertEqual(self.daemon.api_stats()['request_plan_cache']['size'], 0)
+
+    def test_lru_eviction(self):
+        for name in ['a', 'b', 'a', 'c', 'a', 'b']:
+            self.invoke(name=name)
+
+        self.assertEqual(self.daemon.plan_calls, ['a', 'b', 'c', 'b'])
+        self.assertEqual(self.daemon.api_stats()['request_plan_cache']['evictions'], 2)
+
+    def test_cached_plan_is_copied(self):
+        self.invoke(name='a')[0][0][1] = '/changed'
+
+        self.assertEqual(self.invoke(name='a')[0][0][1], '/a')
+
+    def test_disabled(self):
+        self.daemon = PySwitchLibApiDaemon(request_plan_cache_size=0)
+        self.daemon.plan_calls = []
+
+        self.invoke(name='a')
+        self.invoke(name='a')
+
+        self.assertEqual(self.daemon.plan_calls, ['a', 'a'])
+
+    def test_unhashable_arguments(self):
+        cache = RequestPlanCacheUtil()
+
+        self.assertIsNone(cache.get_key(module_name='', api_name='get_plan_rpc', kwargs={'name': set()}))
+        self.assertEqual(cache.get_key(module_name='', api_name='get_plan_rpc', kwargs={'name': {'b': [1], 'a': 2}}),
+                         cache.get_key(module_name='', api_name='get_plan_rpc', kwargs={'name': {'a': 2, 'b': (1,)}}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import threading
+import unittest2 as unittest
+
+from pyswitchlib.asset import Asset
+from pyswitchlib.util.authToken import AuthTokenUtil
+from pyswitchlib.util.xmlDecoder import XmlDecoderUtil
+
+
+class ScriptedResponse(object):
+
+    def __init__(self, status_code=200, url=''):
+        self.status_code = status_code
+        self.url = url
+        self.headers = {}
+        self.content = b''
+
+
+class ScriptedSession(object):
+
+    def __init__(self):
+        self.headers = {}
+        self.verify = False
+
+
+class ScriptedAsset(Asset):
+
+    def __init__(self, statuses=None):
+        self._ip_addr = '10.0.0.1'
+        self._auth = ('admin', 'password')
+        self._rest_protocol = 'http'
+        self._session = ScriptedSession()
+        self._default_session_verify = False
+        self._session_timeout = (60, 1800)
+        self._overall_status = []
+        self._rest_session_auth_max_retries = 1
+        self._rest_session_auth_token_expired = '_EXPIRED_'
+        self._rest_session_auth_token_manager = AuthTokenUtil()
+        self._rest_session_auth_token_key = self._rest_session_auth_token_manager.get_key(ip_addr=self._ip_addr, auth=self._auth)
+        self._rest_session_auth_token = 'token'
+        self._rest_concurrency = 4
+        self._xml_decoder = XmlDecoderUtil()
+        self._statuses = statuses
+        self._sent = []
+        self._sent_threads = set()
+        self._sent_lock = threading.Lock()
+
+    def _send_rest_command(self, rest_cmd=None, rest_protocol=None, auth=None, timeout=None):
+        with self._sent_lock:
+            self._sent.append(rest_cmd[1])
+            self._sent_threads.add(threading.current_thread())
+
+            return ScriptedResponse(status_code=self._statuses[rest_cmd[1]].pop(0), url=rest_cmd[1])
+
+
+class TestRestConcurrency(unittest.TestCase):
+
+    def setUp(self):
+        self.asset = Asset.__new__(Asset)
+        self.asset._rest_concurrency = 4
+
+    def tearDown(self):
+        AuthTokenUtil().expire_token(key=AuthTokenUtil().get_key(ip_addr='10.0.0.1', auth=('admin', 'password')))
+
+    def get_groups(self, rest_commands):
+        groups = []
+        index = 0
+
+        while index < len(rest_commands):
+            group = self.asset._get_concurrent_rest_commands(rest_commands=rest_commands, index=index) or [index]
+            groups.append(group)
+            index = group[-1] + 1
+
+        return groups
+
+    def test_independent_leaf_updates_are_grouped(self):
+        rest_commands = [['PATCH', '/interface/ethernet/0%%2F%d/description' % n, '', 'config', 0] for n in range(5)]
+
+        self.assertEqual(self.get_groups(rest_commands), [[0, 1, 2, 3, 4]])
+
+    def test_overlapping_writes_keep_their_order(self):
+        rest_commands = [
+            ['PUT', '/interface-vlan/vlan/10', '', 'config', 0],
+            ['PATCH', '/interface-vlan/vlan/20/description', '', 'config', 0],
+            ['PATCH', '/interface-vlan/vlan/10/description', '', 'config', 0],
+            ['DELETE', '/interface-vlan/vlan/20/description', '', 'config', 0],
+        ]
+
+        self.assertEqual(self.get_groups(rest_commands), [[0, 1], [2, 3]])
+
+    def test_reads(self):
+        rest_commands = [
+            ['GET', '/interface-vlan/vlan', '', 'config', 1],
+            ['GET', '/interface-vlan/vlan/10', '', 'config', 1],
+            ['PATCH', '/router/bgp', '', 'config', 0],
+            ['PATCH', '/interface-vlan/vlan/10/description', '', 'config', 0],
+            ['GET', '/interface-vlan/vlan/10?depth=2', '', 'operational', 1],
+        ]
+
+        self.assertEqual(self.get_groups(rest_commands), [[0, 1, 2], [3], [4]])
+
+    def test_operational_reads_conflict_with_config_writes(self):
+        rest_commands = [
+            ['PATCH', '/interface-vlan/vlan/10', '', 'config', 0],
+            ['GET', '/interface-vlan/vlan/10', '', 'operational', 1],
+            ['GET', '/interface-vlan/vlan', '', 'operational', 1],
+        ]
+
+        self.assertEqual(self.get_groups(rest_commands), [[0], [1, 2]])
+
+    def test_rpc_commands_are_sent_alone(self):
+        rest_commands = [
+            ['GET', '/interface-vlan/vlan', '', 'config', 1],
+            ['POST', '/show-firmware-version', '', 'rpc', 0],
+            ['GET', '/interface-vlan/vlan', '', 'config', 1],
+            ['GET', '/router/bgp', '', 'config', 1],
+            ['POST', '/router/ospf', ''],
+        ]
+
+        self.assertEqual(self.get_groups(rest_commands), [[0], [1], [2, 3, 4]])
+        self.assertEqual(rest_commands[4][3], 'config')
+
+
+    def test_responses_keep_the_command_order(self):
+        uris = ['/interface/ethernet/0%%2F%d/description' % n for n in range(6)]
+        asset = ScriptedAsset(statuses=dict((uri, [204]) for uri in uris))
+        success, status = asset._rest_operation(rest_commands=[['PATCH', uri, '', 'config', 0] for uri in uris])
+
+        self.assertTrue(success)
+        self.assertEqual([result['10.0.0.1']['request']['uri'] for result in status], uris)
+        self.assertEqual([result['10.0.0.1']['response']['url'] for result in status], uris)
+        self.assertEqual(sorted(asset._sent), sorted(uris))
+
+    def test_workers_are_shared_and_bounded(self):
+        uris = ['/interface/ethernet/0%%2F%d/description' % n for n in range(8)]
+
+        for n in range(3):
+            asset = ScriptedAsset(statuses=dict((uri, [204]) for uri in uris))
+            asset._rest_operation(rest_commands=[['PATCH', uri, '', 'config', 0] for uri in uris])
+
+            self.assertLessEqual(len(asset._sent_threads), asset._rest_concurrency)
+            self.assertTrue(asset._sent_threads.issubset(set(Asset._get_rest_dispatch_pool()._pool)))
+
+        self.assertIs(Asset._get_rest_dispatch_pool(), Asset._get_rest_dispatch_pool())
+
+    def test_only_unauthorized_commands_are_sent_again(self):
+        uris = ['/interface/ethernet/0%%2F%d/description' % n for n in range(4)]
+        asset = ScriptedAsset(statuses={uris[0]: [204], uris[1]: [401, 204], uris[2]: [204], uris[3]: [401, 204]})
+        success, status = asset._rest_operation(rest_commands=[['PATCH', uri, '', 'config', 0] for uri in uris])
+
+        self.assertTrue(success)
+        self.assertEqual([result['10.0.0.1']['request']['uri'] for result in status], uris)
+        self.assertEqual([result['10.0.0.1']['response']['status_code'] for result in status], [204] * 4)
+        self.assertEqual([asset._sent.count(uri) for uri in uris], [1, 2, 1, 2])
+        self.assertEqual(asset._rest_session_auth_token, '_EXPIRED_')
+
+    def test_errors_keep_the_shared_token(self):
+        uris = ['/interface/ethernet/0%%2F%d/description' % n for n in range(2)]
+        asset = ScriptedAsset(statuses={uris[0]: [500], uris[1]: [404]})
+        success, status = asset._rest_operation(rest_commands=[['PATCH', uri, '', 'config', 0] for uri in uris])
+
+        self.assertFalse(success)
+        self.assertEqual([result['10.0.0.1']['response']['status_code'] for result in status], [500, 404])
+        self.assertEqual(asset._rest_session_auth_token, 'token')
+
+
+if __name__ == '__main__':
+    unittest.main()
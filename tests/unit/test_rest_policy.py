@@ -0,0 +1,178 @@
+import requests
+import unittest2 as unittest
+from requests.packages.urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from pyswitchlib.exceptions import CircuitBreakerOpenError
+from pyswitchlib.util.restPolicy import RestPolicyUtil
+
+
+class ManualClockRestPolicyUtil(RestPolicyUtil):
+    now = 1000.0
+
+    @staticmethod
+    def get_time():
+        return ManualClockRestPolicyUtil.now
+
+
+class StatusResponse(object):
+
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ScriptedRequests(object):
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.sent = 0
+
+    def send(self):
+        self.sent += 1
+        outcome = self.outcomes.pop(0)
+
+        if isinstance(outcome, Exception):
+            raise outcome
+
+        return StatusResponse(status_code=outcome)
+
+
+class TestRestPolicy(unittest.TestCase):
+
+    def setUp(self):
+        ManualClockRestPolicyUtil.now = 1000.0
+        self.policy = ManualClockRestPolicyUtil(max_retries=2, backoff_base=0, failure_threshold=3, recovery_timeout=30)
+        self.policy.reset()
+
+    def tearDown(self):
+        self.policy.reset()
+
+    def execute(self, scripted, rest_cmd=None, timeout=None):
+        return self.policy.execute(key='10.0.0.1', rest_cmd=rest_cmd or ['GET', '/vlan', '', 'config', 1], timeout=timeout, request_func=scripted.send)
+
+    def test_retryable_status_codes_are_retried(self):
+        scripted = ScriptedRequests([503, 503, 200])
+
+        self.assertEqual(self.execute(scripted).status_code, 200)
+        self.assertEqual(scripted.sent, 3)
+        self.assertEqual(self.policy.get_stats()['retries'], 2)
+
+        scripted = ScriptedRequests([503, 503, 503])
+
+        self.assertEqual(self.execute(scripted).status_code, 503)
+        self.assertEqual(scripted.sent, 3)
+        self.assertEqual(self.policy.get_stats()['open_circuits'], 1)
+
+        self.policy.reset(key='10.0.0.1')
+        scripted = ScriptedRequests([500])
+
+        self.assertEqual(self.execute(scripted).status_code, 500)
+        self.assertEqual(scripted.sent, 1)
+
+    def test_post_is_not_replayed_after_a_gateway_error(self):
+        rest_cmd = ['POST', '/vlan', '<vlan><name>10</name></vlan>', 'config', 0]
+
+        for status_code in [502, 504]:
+            scripted = ScriptedRequests([status_code, 201])
+
+            self.assertEqual(self.execute(scripted, rest_cmd=rest_cmd).status_code, status_code)
+            self.assertEqual(scripted.sent, 1)
+
+        self.policy.reset(key='10.0.0.1')
+
+        for status_code in [429, 503]:
+            scripted = ScriptedRequests([status_code, 201])
+
+            self.assertEqual(self.execute(scripted, rest_cmd=rest_cmd).status_code, 201)
+            self.assertEqual(scripted.sent, 2)
+
+        scripted = ScriptedRequests([502, 200])
+
+        self.assertEqual(self.execute(scripted, rest_cmd=['PUT', '/vlan/10', '', 'config', 0]).status_code, 200)
+
+    def test_exceptions(self):
+        refused = requests.exceptions.ConnectionError(MaxRetryError(None, '/', NewConnectionError(None, 'Connection refused')))
+        scripted = ScriptedRequests([refused, requests.exceptions.ConnectTimeout(), 200])
+
+        self.assertEqual(self.execute(scripted, rest_cmd=['POST', '/show-firmware-version', '', 'rpc', 0]).status_code, 200)
+        self.assertEqual(scripted.sent, 3)
+
+        scripted = ScriptedRequests([requests.exceptions.ReadTimeout(), 200])
+
+        self.assertRaises(requests.exceptions.ReadTimeout, self.execute, scripted, ['POST', '/show-firmware-version', '', 'rpc', 0])
+
+        scripted = ScriptedRequests([requests.exceptions.ReadTimeout(), 200])
+
+        self.assertEqual(self.execute(scripted, rest_cmd=['PATCH', '/vlan/10', '', 'config', 0]).status_code, 200)
+
+    def test_post_is_not_replayed_after_an_aborted_connection(self):
+        aborted = requests.exceptions.ConnectionError(ProtocolError('Connection aborted.', IOError(104, 'Connection reset by peer')))
+        scripted = ScriptedRequests([aborted, 200])
+
+        self.assertRaises(requests.exceptions.ConnectionError, self.execute, scripted, ['POST', '/vlan', '<vlan><name>10</name></vlan>', 'config', 0])
+        self.assertEqual(scripted.sent, 1)
+        self.assertEqual(self.policy.get_stats()['devices']['10.0.0.1']['failures'], 1)
+
+        scripted = ScriptedRequests([aborted, 200])
+
+        self.assertEqual(self.execute(scripted, rest_cmd=['GET', '/vlan', '', 'config', 0]).status_code, 200)
+        self.assertEqual(scripted.sent, 2)
+
+    def test_deadline_stops_retries(self):
+        self.policy._backoff_base = 10
+        scripted = ScriptedRequests([503, 200])
+
+        self.assertEqual(self.execute(scripted, timeout=(0.001, 0.001)).status_code, 503)
+        self.assertEqual(scripted.sent, 1)
+        self.assertIsNone(self.policy.get_deadline(timeout=''))
+        self.assertEqual(self.policy.get_deadline(timeout=(60, 1800)), 2860.0)
+
+    def test_backoff(self):
+        self.policy._backoff_base = 1
+
+        for attempt in range(10):
+            self.assertLessEqual(self.policy.get_backoff(attempt=attempt), min(30, 2 ** attempt))
+
+        self.assertEqual(self.policy.get_backoff(attempt=0, response=StatusResponse(503, {'Retry-After': '7'})), 7)
+
+    def test_circuit_breaker(self):
+        scripted = ScriptedRequests([requests.exceptions.ConnectionError()] * 3)
+
+        self.assertRaises(requests.exceptions.ConnectionError, self.execute, scripted)
+        self.assertEqual(self.policy.get_stats()['devices']['10.0.0.1']['state'], 'open')
+
+        scripted = ScriptedRequests([200, 200])
+
+        self.assertRaises(CircuitBreakerOpenError, self.execute, scripted)
+        self.assertEqual(scripted.sent, 0)
+
+        stats = self.policy.get_stats()
+
+        self.assertEqual(stats['circuit_opens'], 1)
+        self.assertEqual(stats['open_circuits'], 1)
+        self.assertEqual(stats['fast_failures'], 1)
+
+        ManualClockRestPolicyUtil.now += 30
+
+        self.assertEqual(self.policy.get_stats()['devices']['10.0.0.1']['state'], 'half-open')
+        self.assertEqual(self.execute(scripted).status_code, 200)
+        self.assertEqual(self.policy.get_stats()['devices']['10.0.0.1']['state'], 'closed')
+
+    def test_failed_trial_reopens_circuit(self):
+        self.assertRaises(requests.exceptions.ConnectionError, self.execute, ScriptedRequests([requests.exceptions.ConnectionError()] * 3))
+
+        ManualClockRestPolicyUtil.now += 30
+        scripted = ScriptedRequests([requests.exceptions.ConnectionError(), 200])
+
+        self.assertRaises(requests.exceptions.ConnectionError, self.execute, scripted)
+        self.assertEqual(scripted.sent, 1)
+        self.assertEqual(self.policy.get_stats()['devices']['10.0.0.1']['state'], 'open')
+        self.assertEqual(self.policy.get_stats()['circuit_opens'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
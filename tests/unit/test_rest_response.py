@@ -0,0 +1,138 @@
+import copy
+import json
+import pickle
+
+import unittest2 as unittest
+
+from pyswitchlib.asset import Asset
+from pyswitchlib.util.restResponse import RestResponse
+from pyswitchlib.util.xmlDecoder import XmlDecoderUtil
+
+
+RPC_XML = (
+    b'<output xmlns="urn:brocade.com:mgmt:brocade-firmware-ext">'
+    b'<show-firmware-version><os-version>17r.1.01a</os-version></show-firmware-version>'
+    b'</output>'
+)
+
+CONFIG_XML = b'<vlan xmlns="urn:brocade.com:mgmt:brocade-interface"><name>10</name></vlan>'
+
+
+class CountingXmlDecoderUtil(XmlDecoderUtil):
+
+    def __init__(self):
+        super(CountingXmlDecoderUtil, self).__init__()
+        self.decodes = 0
+
+    def decode(self, *args, **kwargs):
+        self.decodes += 1
+
+        return super(CountingXmlDecoderUtil, self).decode(*args, **kwargs)
+
+
+class TestRestResponse(unittest.TestCase):
+
+    def get_response(self):
+        return RestResponse(status_code=200, url='url', content=RPC_XML, encoding='utf-8', rest_type='rpc')
+
+    def test_values_are_decoded(self):
+        response = RestResponse(status_code=200, url='http://switch/rest/operations/show-firmware-version',
+                                content=RPC_XML, encoding='utf-8', rest_type='rpc')
+
+        self.assertEqual(response['json']['output']['show-firmware-version']['os-version'], u'17r.1.01a')
+        self.assertEqual(response['text'], RPC_XML.decode('utf-8'))
+
+    def test_config_output_is_wrapped(self):
+        response = RestResponse(status_code=200, content=CONFIG_XML, encoding='utf-8', rest_type='config', yang_list=['vlan'])
+
+        self.assertEqual(response['json'], {'output': {'vlan': [{'@xmlns': 'urn:brocade.com:mgmt:brocade-interface', 'name': '10'}]}})
+
+    def test_error_output(self):
+        response = RestResponse(status_code=404, content=b'Not Found', encoding='utf-8', rest_type='rpc')
+
+        self.assertEqual(response['json'], {'output': u'Not Found'})
+
+        response = RestResponse(status_code=204, content=b'', encoding=None)
+
+        self.assertEqual(response['text'], u'')
+        self.assertEqual(response['json'], {'output': ''})
+
+    def test_content_encoding(self):
+        self.assertEqual(RestResponse.get_content_encoding(headers={'Content-Type': 'application/xml'}), 'utf-8')
+        self.assertEqual(RestResponse.get_content_encoding(headers={'Content-Type': 'text/xml; charset="ISO-8859-1"'}), 'ISO-8859-1')
+        self.assertEqual(RestResponse.get_content_encoding(headers={}), 'utf-8')
+
+        response = RestResponse(status_code=200, content=u'<name>caf\xe9</name>'.encode('latin-1'), encoding='ISO-8859-1')
+
+        self.assertEqual(response['text'], u'<name>caf\xe9</name>')
+        self.assertEqual(response['json'], {'output': {'name': u'caf\xe9'}})
+
+        response = RestResponse(status_code=200, content=u'<name>caf\xe9</name>'.encode('utf-16'), encoding='utf-16')
+
+        self.assertEqual(response['json'], {'output': {'name': u'caf\xe9'}})
+
+        response = RestResponse(status_code=200, content=b'<name>caf\xe9</name>', encoding=None)
+
+        self.assertEqual(response['text'], u'<name>caf\ufffd</name>')
+        self.assertEqual(response['json'], {'output': {'name': u'caf\ufffd'}})
+
+    def test_dictionary_behaviour(self):
+        response = RestResponse(status_code=200, url='url', content=RPC_XML, encoding='utf-8', rest_type='rpc')
+        expected = {'status_code': 200, 'url': 'url', 'text': RPC_XML.decode('utf-8'),
+                    'json': RestResponse(status_code=200, content=RPC_XML, encoding='utf-8', rest_type='rpc')['json']}
+
+        self.assertEqual(len(response), 4)
+        self.assertEqual(sorted(response.keys()), ['json', 'status_code', 'text', 'url'])
+        self.assertEqual(response, expected)
+        self.assertEqual(expected, response)
+        self.assertEqual(dict(self.get_response()), expected)
+        self.assertEqual(dict(**self.get_response()), expected)
+        self.assertEqual(copy.copy(self.get_response()), expected)
+        self.assertEqual(copy.deepcopy(self.get_response()), expected)
+        self.assertEqual(self.get_response().copy(), expected)
+        self.assertEqual(pickle.loads(pickle.dumps(self.get_response(), 2)), expected)
+        self.assertEqual(self.get_response().get('text'), expected['text'])
+        self.assertEqual(self.get_response().get('json'), expected['json'])
+        self.assertEqual(self.get_response().setdefault('json', None), expected['json'])
+        self.assertEqual(self.get_response().pop('text'), expected['text'])
+        self.assertEqual(json.loads(json.dumps(dict(self.get_response()))), json.loads(json.dumps(expected)))
+
+        merged = {}
+        merged.update(self.get_response())
+
+        self.assertEqual(merged, expected)
+
+        response = self.get_response()
+        del response['json']
+
+        self.assertEqual(sorted(response), ['status_code', 'text', 'url'])
+
+    def test_status_only_call_never_decodes(self):
+        xml_decoder = CountingXmlDecoderUtil()
+        response = RestResponse(status_code=200, url='url', content=RPC_XML, encoding='utf-8', rest_type='rpc', xml_decoder=xml_decoder)
+        asset = Asset.__new__(Asset)
+        asset._ip_addr = '10.0.0.1'
+        asset._overall_status = [{'10.0.0.1': {'request': {'op_code': 'POST', 'uri': '/show-firmware-version', 'data': ''}, 'response': response}}]
+        api_success, details = asset._get_results()
+
+        self.assertTrue(api_success)
+        self.assertEqual(details[0]['10.0.0.1']['response']['status_code'], 200)
+        self.assertEqual(xml_decoder.decodes, 0)
+        self.assertNotIn('json', response._values)
+
+        copied = dict(response)
+
+        self.assertEqual(xml_decoder.decodes, 1)
+        self.assertEqual(copied['json']['output']['show-firmware-version']['os-version'], u'17r.1.01a')
+
+    def test_text_only_response(self):
+        response = RestResponse(status_code=200, content=CONFIG_XML, encoding='utf-8', output_keys=('text',))
+
+        self.assertNotIn('json', response)
+        self.assertIsNone(response.get('json'))
+        self.assertEqual(sorted(response), ['status_code', 'text', 'url'])
+        self.assertEqual(response.decode_xml(root_name='output'), {'output': {'vlan': {'@xmlns': 'urn:brocade.com:mgmt:brocade-interface', 'name': '10'}}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import threading
+import BaseHTTPServer
+import SocketServer
+
+import unittest2 as unittest
+
+from pyswitchlib.util.transportRegistry import TransportRegistryUtil
+
+
+class KeepAliveHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '4')
+        self.end_headers()
+        self.wfile.write('<ok>')
+
+
+class KeepAliveServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class TestTransportRegistry(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = KeepAliveServer(('127.0.0.1', 0), KeepAliveHandler)
+        cls.ip_addr = '127.0.0.1:%d' % cls.server.server_address[1]
+        thread = threading.Thread(target=cls.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.registry = TransportRegistryUtil(pool_maxsize=2, idle_timeout=300)
+        self.registry.clear()
+
+    def tearDown(self):
+        self.registry.clear()
+
+    def test_sessions_share_connections(self):
+        sessions = [self.registry.get_session() for n in range(3)]
+
+        for session in sessions:
+            self.assertEqual(session.get('http://' + self.ip_addr + '/rest', verify=False).text, '<ok>')
+            session.close()
+
+        stats = self.registry.get_stats(ip_addr=self.ip_addr)
+
+        self.assertEqual(list(stats), [('http', self.ip_addr, False)])
+        self.assertEqual(stats[('http', self.ip_addr, False)]['opened'], 1)
+        self.assertEqual(stats[('http', self.ip_addr, False)]['reused'], 2)
+        self.assertEqual(stats[('http', self.ip_addr, False)]['idle'], 1)
+
+    def test_keys(self):
+        self.assertEqual(self.registry.get_key(protocol='HTTP', ip_addr='10.0.0.1', verify='/ca.pem'), ('http', '10.0.0.1', False))
+        self.assertEqual(self.registry.get_key(protocol='https', ip_addr='10.0.0.1', verify='/ca.pem'), ('https', '10.0.0.1', '/ca.pem'))
+        self.assertIsNot(self.registry.get_adapter(protocol='https', ip_addr='10.0.0.1', verify=False),
+                         self.registry.get_adapter(protocol='https', ip_addr='10.0.0.1', verify=True))
+
+    def test_larger_pool_replaces_transport(self):
+        adapter = self.registry.get_adapter(protocol='http', ip_addr=self.ip_addr)
+
+        self.assertIs(TransportRegistryUtil(pool_maxsize=1).get_adapter(protocol='http', ip_addr=self.ip_addr), adapter)
+        self.assertIsNot(TransportRegistryUtil(pool_maxsize=8).get_adapter(protocol='http', ip_addr=self.ip_addr), adapter)
+
+    def test_replaced_transport_is_closed_once_idle(self):
+        adapter = self.registry.get_adapter(protocol='http', ip_addr=self.ip_addr)
+        pool = adapter.poolmanager.connection_from_url('http://' + self.ip_addr + '/rest')
+        connection = pool._get_conn()
+
+        self.assertIsNot(TransportRegistryUtil(pool_maxsize=8).get_adapter(protocol='http', ip_addr=self.ip_addr), adapter)
+
+        self.registry.evict_idle(idle_timeout=300)
+        self.assertEqual(len(adapter.poolmanager.pools), 1)
+
+        pool._put_conn(connection)
+        self.registry.evict_idle(idle_timeout=300)
+        self.assertEqual(len(adapter.poolmanager.pools), 0)
+        self.assertEqual(TransportRegistryUtil._retired_adapters, [])
+
+    def test_idle_transports_are_evicted(self):
+        self.registry.get_session().get('http://' + self.ip_addr + '/rest')
+
+        self.registry.evict_idle(idle_timeout=300)
+        self.assertEqual(len(self.registry.get_stats()), 1)
+
+        self.registry.evict_idle(idle_timeout=0)
+        self.assertEqual(self.registry.get_stats(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+import threading
+import Pyro4
+import unittest2 as unittest
+
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+from pyswitchlib.util.config import ConfigUtil
+
+
+class TestUnixSocket(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.unix_socket = os.path.join(self.tmpdir, 'api.sock')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_unix_socket_uri(self):
+        self.assertEqual(ConfigUtil().get_unix_socket_for_daemon_id(), os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_default.sock'))
+        self.assertEqual(ConfigUtil().get_unix_socket_for_daemon_id(daemon_id='api_daemon_venv'), os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_api_daemon_venv.sock'))
+        self.assertEqual(ConfigUtil().get_unix_socket_uri_for_daemon_id(daemon_id='api_daemon_not_running'), '')
+
+    def test_api_daemon_on_unix_socket(self):
+        pyro_unix_daemon = Pyro4.Daemon(unixsocket=self.unix_socket)
+        daemon_obj = Pyro4.expose(PySwitchLibApiDaemon)(pyro_unix_daemon=pyro_unix_daemon)
+        uri = pyro_unix_daemon.register(daemon_obj, objectId='PySwitchLib.default', force=True)
+
+        def unix_daemon_loop():
+            try:
+                pyro_unix_daemon.requestLoop()
+            finally:
+                pyro_unix_daemon.close()
+
+        unix_daemon_thread = threading.Thread(target=unix_daemon_loop)
+        unix_daemon_thread.start()
+
+        try:
+            self.assertEqual(str(uri), 'PYRO:PySwitchLib.default@./u:' + self.unix_socket)
+
+            with Pyro4.Proxy(uri) as pyro_proxy:
+                pyro_proxy._pyroBind()
+
+                self.assertEqual(pyro_proxy.api_worker_stats(), {})
+        finally:
+            daemon_obj.shutdown()
+            unix_daemon_thread.join(10)
+
+        self.assertFalse(unix_daemon_thread.is_alive())
+        self.assertFalse(os.path.exists(self.unix_socket))
+
+
+if __name__ == '__main__':
+    unittest.main()
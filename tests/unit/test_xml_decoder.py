@@ -0,0 +1,106 @@
+import json
+
+import unittest2 as unittest
+import xmltodict
+
+from pyswitchlib.util.xmlDecoder import XmlDecoderUtil
+
+
+CONFIG_XML = (
+    '<vlan xmlns="urn:brocade.com:mgmt:brocade-interface" y:self="/rest/config/running/interface-vlan/vlan/10">'
+    '<name>10</name><description>vlan ten</description><private-vlan/>'
+    '</vlan>'
+)
+
+RPC_XML = (
+    '<output xmlns="urn:brocade.com:mgmt:brocade-mac-address-table">'
+    '<mac-address-table><vlanid>1</vlanid><mac-address>00:00:00:00:00:01</mac-address>'
+    '<forwarding-interface><interface-type>ethernet</interface-type><interface-name>0/1</interface-name></forwarding-interface>'
+    '</mac-address-table>'
+    '<has-more>false</has-more>'
+    '</output>'
+)
+
+MIXED_XML = (
+    '<errors xmlns="http://brocade.com/ns/rest">\n'
+    '  <error><error-type>application</error-type>'
+    '<error-message a="1">Object &amp; already exists</error-message>'
+    '<error-path>  </error-path></error>\n'
+    '  <error><error-type>protocol</error-type>text<b/>tail</error>\n'
+    '</errors>'
+)
+
+
+def format_dict_output(container=None, keys=None):
+    if keys and container:
+        if isinstance(container, dict):
+            for k in container:
+                if isinstance(container[k], dict):
+                    if k.lower() in keys:
+                        keys.remove(k.lower())
+                        container[k] = [container[k]]
+                        format_dict_output(container=container[k], keys=keys)
+                    else:
+                        format_dict_output(container=container[k], keys=keys)
+                elif isinstance(container[k], list):
+                    for elem in container[k]:
+                        format_dict_output(container=elem, keys=keys)
+        elif isinstance(container, list):
+            for elem in container:
+                format_dict_output(container=elem, keys=keys)
+
+
+class TestXmlDecoder(unittest.TestCase):
+
+    def setUp(self):
+        self.decoder = XmlDecoderUtil()
+
+    def _legacy_decode(self, xml, wrap=False, yang_list=None):
+        if wrap:
+            xml = '<output>\r\n' + xml + '</output>\r\n'
+
+        json_output = json.loads(json.dumps(xmltodict.parse(xml)))
+
+        if yang_list:
+            format_dict_output(container=json_output, keys=list(yang_list))
+
+        return json_output
+
+    def test_config_response(self):
+        self.assertEqual(self.decoder.decode(xml=CONFIG_XML, root_name='output'),
+                         self._legacy_decode(CONFIG_XML, wrap=True))
+
+    def test_rpc_response(self):
+        self.assertEqual(self.decoder.decode(xml=RPC_XML), self._legacy_decode(RPC_XML))
+
+    def test_repeated_and_mixed_elements(self):
+        self.assertEqual(self.decoder.decode(xml=MIXED_XML, root_name='output'),
+                         self._legacy_decode(MIXED_XML, wrap=True))
+
+    def test_unicode_input(self):
+        xml = u'<output><name>caf\xe9</name></output>'
+        self.assertEqual(self.decoder.decode(xml=xml), self._legacy_decode(xml))
+
+    def test_yang_list_single_entry(self):
+        yang_list = ['mac-address-table', 'vlan']
+        output = self.decoder.decode(xml=RPC_XML, yang_list=yang_list)
+
+        self.assertIsInstance(output['output']['mac-address-table'], list)
+        self.assertEqual(output, self._legacy_decode(RPC_XML, yang_list=yang_list))
+        self.assertEqual(yang_list, ['mac-address-table', 'vlan'])
+
+    def test_yang_list_multiple_entries(self):
+        xml = '<output><vlan><name>1</name></vlan><vlan><name>2</name></vlan></output>'
+        output = self.decoder.decode(xml=xml, yang_list=['vlan'])
+
+        self.assertEqual(output, {'output': {'vlan': [{'name': '1'}, {'name': '2'}]}})
+
+    def test_yang_list_first_entry_only(self):
+        xml = '<output><vlan><vlan><name>1</name></vlan></vlan></output>'
+        output = self.decoder.decode(xml=xml, yang_list=['vlan'])
+
+        self.assertEqual(output, {'output': {'vlan': [{'vlan': {'name': '1'}}]}})
+
+
+if __name__ == '__main__':
+    unittest.main()